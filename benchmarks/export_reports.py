@@ -0,0 +1,83 @@
+"""
+BENCHMARK - génération des rapports Word / PDF sur des analyses accumulées d'environ 200 pages
+
+    python benchmarks/export_reports.py [--columns 1000] [--output-dir /tmp/bench_exports]
+
+Mesures de référence (1 cœur, ~13 600 lignes, 192 pages PDF) :
+    avant  : Word 8.7 s, PDF 4.7 s (un paragraphe stylé par ligne, styles recréés à chaque appel)
+    après  : Word 1.3 s, PDF 0.45 s (styles construits une fois, un paragraphe par bloc)
+    résultats structurés : Word 1.3 s, PDF 1.3 s (~5 000 lignes de vrais tableaux, rangées Word en un fragment XML)
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eda_desk.analyses import classify_columns, compute_missing_values, compute_outliers  # noqa: E402
+from eda_desk.column_profiler import profile_columns  # noqa: E402
+from eda_desk.export_jobs import ExportJob, run_export  # noqa: E402
+from eda_desk.reports import global_stats_result, missing_result, outliers_result  # noqa: E402
+
+
+def synthetic_report(n_columns: int, n_rows: int = 2_000, seed: int = 0):
+    """Analyses accumulées réalistes : manquants, outliers puis statistiques globales par lots de 10 variables"""
+    rng = np.random.default_rng(seed)
+    numeric = pd.DataFrame(rng.normal(size=(n_rows, n_columns)), columns=[f"num_{i}" for i in range(n_columns)])
+    categorical = pd.DataFrame({f"cat_{i}": rng.choice(['a&b', '<x>', 'z'], n_rows) for i in range(n_columns // 2)})
+    data = pd.concat([numeric, categorical], axis=1)
+
+    profile = profile_columns(data)
+    _, numeric_vars, categorical_vars, _ = classify_columns(profile, n_rows)
+    missing_values, _ = compute_missing_values(profile)
+    entries = [
+        missing_result(missing_values, data.size),
+        outliers_result(compute_outliers(data[numeric_vars]))
+    ]
+    for start in range(0, len(numeric_vars), 10):
+        entries.append(global_stats_result(data, numeric_vars[start:start + 10],
+                                           categorical_vars[start // 2:start // 2 + 10],
+                                           analysis_type=f"Statistiques {start // 10 + 1}"))
+
+    data_info = {
+        'filename': 'benchmark.csv', 'rows': n_rows, 'columns': data.shape[1],
+        'numeric_vars': len(numeric_vars), 'categorical_vars': len(categorical_vars), 'boolean_vars': 0,
+        'quality_score': 95.0, 'missing_pct': 0.0, 'outliers_count': 0, 'constant_vars': 0,
+        'analyses_count': len(entries)
+    }
+    return data_info, [entry.to_dict() for entry in entries]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--columns', type=int, default=1000, help="variables numériques (1000 ≈ 200 pages)")
+    parser.add_argument('--output-dir', default=None)
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or tempfile.mkdtemp(prefix="bench_exports_")
+    os.makedirs(output_dir, exist_ok=True)
+    data_info, results = synthetic_report(args.columns)
+    print(f"Rapport : {sum(result['text'].count(chr(10)) for result in results):,} lignes de texte, "
+          f"{sum(len(table['rows']) for result in results for table in result['tables']):,} lignes de tableaux")
+
+    targets = {'word': os.path.join(output_dir, 'rapport.docx'), 'pdf': os.path.join(output_dir, 'rapport.pdf')}
+    for export_format, path in targets.items():
+        start = time.perf_counter()
+        run_export(export_format, data_info, {}, path, results)
+        print(f"{export_format:<5} : {time.perf_counter() - start:6.2f} s  ({os.path.getsize(path) / 1024:,.0f} Ko)")
+
+    for use_processes in (False, True):  # le mode automatique choisit selon la taille et les cœurs
+        start = time.perf_counter()
+        outputs = ExportJob(targets, data_info, {}, results, use_processes=use_processes).run()
+        mode = "processus" if use_processes else "séquentiel"
+        print(f"Word + PDF ({mode}) : {time.perf_counter() - start:6.2f} s  ({len(outputs)} export(s))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+BENCHMARK - démarrage de l'interface : import de eda_desk.app puis première fenêtre, dans un processus neuf
+
+    python benchmarks/startup.py [--runs 5] [--budget 1.5]
+
+Sans affichage (serveur, CI), seul l'import est mesuré et comparé à ``--import-budget``.
+Le script échoue aussi si une bibliothèque chargée à la demande est importée au démarrage.
+
+Mesures de référence (1 cœur, import du module, sans fenêtre) :
+    avant  : 2.7 s (cellule du notebook : scipy.stats, seaborn, pyplot, openpyxl, docx, reportlab)
+    après  : 0.6 s (tkinter, ttkbootstrap, pandas et moteurs légers uniquement)
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Temps jusqu'à la première fenêtre affichée (import compris)
+STARTUP_BUDGET = 1.5
+IMPORT_BUDGET = 1.0
+
+# Chargées au premier graphique / export / classeur Excel, jamais au démarrage
+LAZY_MODULES = ('scipy', 'matplotlib', 'seaborn', 'docx', 'reportlab', 'openpyxl', 'xlsxwriter',
+                'export_templates_masterclass')
+
+_PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import eda_desk.app as app_module
+result = {'import': time.perf_counter() - start, 'window': None}
+try:
+    root = app_module.ttk.Window(themename="flatly")
+except Exception as e:  # pas d'affichage
+    result['error'] = str(e)
+else:
+    app = app_module.EDADeskHybrid(root)
+    root.update()
+    result['window'] = time.perf_counter() - start
+    root.destroy()
+result['modules'] = [name for name in LAZY_MODULES if name in sys.modules]
+print(json.dumps(result))
+'''
+
+
+def probe() -> dict:
+    """Un démarrage dans un interpréteur neuf (dossier temporaire : pas d'historique créé dans le dépôt)"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    code = f"LAZY_MODULES = {LAZY_MODULES!r}\n{_PROBE}"
+    with tempfile.TemporaryDirectory(prefix="bench_startup_") as cwd:
+        output = subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, capture_output=True,
+                                text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET, help="secondes jusqu'à la fenêtre")
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET, help="secondes pour l'import seul")
+    args = parser.parse_args(argv)
+
+    runs = [probe() for _ in range(args.runs)]
+    imports = [run['import'] for run in runs]
+    print(f"Import de eda_desk.app : médiane {statistics.median(imports):.2f} s "
+          f"(min {min(imports):.2f}, max {max(imports):.2f})")
+
+    failures = []
+    windows = [run['window'] for run in runs if run['window'] is not None]
+    if windows:
+        median = statistics.median(windows)
+        print(f"Première fenêtre       : médiane {median:.2f} s (budget {args.budget:.2f} s)")
+        if median > args.budget:
+            failures.append(f"fenêtre en {median:.2f} s > {args.budget:.2f} s")
+    else:
+        print(f"Pas d'affichage ({runs[0].get('error', '?')}) : import seul (budget {args.import_budget:.2f} s)")
+        if statistics.median(imports) > args.import_budget:
+            failures.append(f"import en {statistics.median(imports):.2f} s > {args.import_budget:.2f} s")
+
+    eager = sorted({name for run in runs for name in run['modules']})
+    if eager:
+        failures.append(f"importé(s) au démarrage : {', '.join(eager)}")
+
+    for failure in failures:
+        print(f"✗ {failure}")
+    if not failures:
+        print("✓ Démarrage dans le budget")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
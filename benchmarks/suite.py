@@ -0,0 +1,316 @@
+"""
+BENCHMARK - chargement, analyses, graphiques et exports sur un jeu synthétique, sans affichage
+
+    python benchmarks/suite.py [--rows 200000] [--numeric 8] [--categorical 4] [--missing 0.05]
+                               [--cardinality 50] [--only chargement analyses] [--baseline REF]
+
+Chaque étape est chronométrée (meilleur de ``--repeat`` passages) puis rejouée
+une fois sous tracemalloc (pic d'allocations Python / numpy). Les résultats
+sont écrits dans ``benchmarks/results/<commit>.json`` ; ils sont comparés au
+dernier résultat d'un autre commit obtenu sur le même jeu (ou à ``--baseline``)
+et le script sort en erreur si une étape dépasse les seuils de régression.
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import matplotlib
+matplotlib.use('Agg')  # noqa: E402 - aucun affichage requis
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from eda_desk.analyses import (classify_columns, compute_missing_values, compute_outliers,  # noqa: E402
+                               compute_quasi_constant, describe_numeric)
+from eda_desk.categorical import categorical_stats  # noqa: E402
+from eda_desk.chunked_loader import ChunkedCSVLoader  # noqa: E402
+from eda_desk.column_profiler import profile_columns  # noqa: E402
+from eda_desk.correlation import correlation_matrix  # noqa: E402
+from eda_desk.csv_dialect import detect_dialect  # noqa: E402
+from eda_desk.data_export import write_excel  # noqa: E402
+from eda_desk.export_jobs import run_export  # noqa: E402
+from eda_desk.plot_aggregation import AGGREGATION_THRESHOLD  # noqa: E402
+from eda_desk.plots import draw_plot, prepare_plot  # noqa: E402
+from eda_desk.reports import (constant_result, global_stats_report, global_stats_result,  # noqa: E402
+                              missing_result, outliers_result)
+
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+GROUPS = ('chargement', 'analyses', 'graphiques', 'exports')
+
+# Régression : plus lent / plus gourmand de ce ratio ET d'au moins ce seuil absolu (bruit des petites étapes)
+TIME_THRESHOLD = 0.25
+MEMORY_THRESHOLD = 0.25
+MIN_SECONDS = 0.05
+MIN_PEAK_MB = 2.0
+
+
+def synthetic_frame(rows: int, numeric: int = 8, categorical: int = 4, booleans: int = 1, dates: int = 1,
+                    missing: float = 0.05, cardinality: int = 50, seed: int = 0) -> pd.DataFrame:
+    """Jeu de données réaliste : numériques (entiers, gaussiennes, queues lourdes), catégorielles,
+    booléens et dates, avec ``missing`` de cellules manquantes par colonne.
+
+    ``cardinality`` : modalités distinctes des catégorielles (la dernière est
+    à forte cardinalité, ~``rows / 10`` valeurs, comme un identifiant).
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for i in range(numeric):
+        kind = i % 3
+        if kind == 0:
+            values = rng.normal(100.0, 15.0, rows)
+        elif kind == 1:
+            values = rng.lognormal(0.0, 1.5, rows)  # outliers
+        else:
+            values = rng.integers(0, 1_000, rows).astype('float64')
+        columns[f"num_{i}"] = values
+    for i in range(categorical):
+        n_levels = max(2, rows // 10) if i == categorical - 1 and categorical > 1 else max(2, cardinality)
+        levels = np.array([f"cat{i}_{j}" for j in range(n_levels)], dtype=object)
+        columns[f"cat_{i}"] = levels[rng.zipf(1.3, rows) % n_levels]
+    for i in range(booleans):
+        columns[f"bool_{i}"] = rng.random(rows) < 0.3
+    for i in range(dates):
+        columns[f"date_{i}"] = pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 5 * 365 * 86_400, rows),
+                                                                            unit='s')
+
+    data = pd.DataFrame(columns)
+    if missing > 0:
+        for name in data.columns:
+            if name.startswith('bool_'):
+                continue
+            mask = rng.random(rows) < missing
+            data[name] = data[name].mask(mask)
+    return data
+
+
+def measure(func: Callable, repeat: int = 3, memory: bool = True) -> Dict:
+    """Meilleur temps sur ``repeat`` passages, puis pic tracemalloc sur un passage supplémentaire"""
+    times = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    result = {'seconds': min(times), 'median_seconds': float(np.median(times))}
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            result['peak_mb'] = tracemalloc.get_traced_memory()[1] / 1024**2
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def _render(viz_type: str, variables: Tuple, data: pd.DataFrame, numeric_vars: List[str], aggregate: bool):
+    """Même chemin que l'onglet Visualisations : préparation, tracé puis rendu Agg (10 x 6 pouces, 100 dpi)"""
+    spec = prepare_plot(viz_type, variables, data, numeric_vars, aggregate, log=lambda *_: None)
+    fig = Figure(figsize=(10, 6), facecolor='white', dpi=100)
+    ax = fig.add_subplot(111)
+    draw_plot(fig, ax, spec)
+    fig.tight_layout()
+    FigureCanvasAgg(fig).draw()
+
+
+def build_cases(csv_path: str, output_dir: str, groups: Tuple[str, ...],
+                aggregation_threshold: int = AGGREGATION_THRESHOLD) -> List[Tuple[str, Callable]]:
+    """Étapes mesurées (nom, fonction), dans l'ordre de l'interface : ouverture, analyses, graphiques, exports"""
+    dialect = detect_dialect(csv_path)
+    data = ChunkedCSVLoader(csv_path, read_kwargs=dialect.read_kwargs()).load()
+    n_rows, n_columns = data.shape
+    profile = profile_columns(data)
+    _, numeric_vars, categorical_vars, _ = classify_columns(profile, n_rows)
+    missing_values, _ = compute_missing_values(profile)
+    quasi_constant = compute_quasi_constant(profile, n_rows)
+    outliers_info = compute_outliers(data[numeric_vars], n_rows) if numeric_vars else {}
+    stats = {var: describe_numeric(data[var]) for var in numeric_vars}
+    results = [result.to_dict() for result in (
+        missing_result(missing_values, data.size),
+        constant_result(quasi_constant),
+        outliers_result(outliers_info),
+        global_stats_result(data, numeric_vars, categorical_vars)
+    )]
+    data_info = {
+        'filename': os.path.basename(csv_path), 'filepath': csv_path, 'rows': n_rows, 'columns': n_columns,
+        'numeric_vars': len(numeric_vars), 'categorical_vars': len(categorical_vars), 'boolean_vars': 0,
+        'quality_score': 90.0, 'missing_pct': 0.0, 'outliers_count': len(outliers_info),
+        'constant_vars': len(quasi_constant), 'analyses_count': 4
+    }
+
+    cases = []
+    if 'chargement' in groups:
+        cases += [
+            ('chargement.dialecte', lambda: detect_dialect(csv_path)),
+            ('chargement.csv', lambda: ChunkedCSVLoader(csv_path, read_kwargs=dialect.read_kwargs()).load()),
+            ('chargement.csv_compact',
+             lambda: ChunkedCSVLoader(csv_path, read_kwargs=dialect.read_kwargs(), compact=True).load())
+        ]
+    if 'analyses' in groups:
+        cases += [
+            ('analyses.profil', lambda: profile_columns(data)),
+            ('analyses.manquants', lambda: compute_missing_values(profile_columns(data))),
+            ('analyses.constantes', lambda: compute_quasi_constant(profile_columns(data), n_rows)),
+            ('analyses.outliers', lambda: compute_outliers(data[numeric_vars], n_rows)),
+            ('analyses.statistiques', lambda: {var: describe_numeric(data[var]) for var in numeric_vars}),
+            ('analyses.categorielles', lambda: {var: categorical_stats(data[var]) for var in categorical_vars}),
+            ('analyses.correlation', lambda: correlation_matrix(data, numeric_vars)),
+            ('analyses.stats_globales', lambda: global_stats_report(data, numeric_vars, categorical_vars))
+        ]
+    if 'graphiques' in groups and numeric_vars:
+        aggregate = n_rows > aggregation_threshold
+        first, second = numeric_vars[0], numeric_vars[min(1, len(numeric_vars) - 1)]
+        plots = [
+            ('histogramme', "Histogramme", (first,)),
+            ('boxplot', "Boxplot", (first,)),
+            ('nuage', "Nuage de points", (first, second)),
+            ('correlation', "Matrice de corrélation", tuple(numeric_vars))
+        ]
+        for name, viz_type, variables in plots:
+            cases.append((f"graphiques.{name}",
+                          lambda v=viz_type, var=variables: _render(v, var, data, numeric_vars, aggregate)))
+    if 'exports' in groups:
+        cases += [
+            ('exports.word', lambda: run_export('word', data_info, stats, os.path.join(output_dir, 'rapport.docx'),
+                                                results)),
+            ('exports.pdf', lambda: run_export('pdf', data_info, stats, os.path.join(output_dir, 'rapport.pdf'),
+                                               results)),
+            ('exports.excel', lambda: write_excel(data, os.path.join(output_dir, 'export.xlsx'), stats))
+        ]
+    return cases
+
+
+def git_revision() -> Tuple[str, bool]:
+    """(commit court, copie de travail modifiée ?) ; 'local' hors dépôt git"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        return commit, bool(status.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return 'local', True
+
+
+def save_results(run: Dict, results_dir: str = RESULTS_DIR) -> str:
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, f"{run['commit']}{'-modifie' if run['dirty'] else ''}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(run, f, indent=1, ensure_ascii=False)
+    return path
+
+
+def load_baseline(dataset: Dict, commit: str, reference: Optional[str] = None,
+                  results_dir: str = RESULTS_DIR) -> Optional[Dict]:
+    """Résultat de référence : fichier ou commit ``reference``, sinon le plus récent d'un autre commit
+    mesuré sur le même jeu de données"""
+    if reference:
+        path = reference if os.path.isfile(reference) else os.path.join(results_dir, f"{reference}.json")
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"aucun résultat pour {reference}")
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    candidates = []
+    for path in glob.glob(os.path.join(results_dir, '*.json')):
+        with open(path, encoding='utf-8') as f:
+            run = json.load(f)
+        if run.get('dataset') == dataset and run.get('commit') != commit:
+            candidates.append(run)
+    return max(candidates, key=lambda run: run['date']) if candidates else None
+
+
+def compare(current: Dict, baseline: Dict, time_threshold: float = TIME_THRESHOLD,
+            memory_threshold: float = MEMORY_THRESHOLD) -> List[str]:
+    """Régressions de ``current`` par rapport à ``baseline`` (étapes communes uniquement)"""
+    regressions = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        seconds, base_seconds = result['seconds'], base['seconds']
+        if seconds > base_seconds * (1 + time_threshold) and seconds - base_seconds >= MIN_SECONDS:
+            regressions.append(f"{name} : {base_seconds:.3f} s → {seconds:.3f} s "
+                               f"(+{(seconds / base_seconds - 1) * 100:.0f} %)")
+        peak, base_peak = result.get('peak_mb'), base.get('peak_mb')
+        if peak is not None and base_peak is not None and peak > base_peak * (1 + memory_threshold) \
+                and peak - base_peak >= MIN_PEAK_MB:
+            regressions.append(f"{name} : pic {base_peak:.1f} Mo → {peak:.1f} Mo "
+                               f"(+{(peak / base_peak - 1) * 100:.0f} %)")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--numeric', type=int, default=8, help="colonnes numériques")
+    parser.add_argument('--categorical', type=int, default=4, help="colonnes catégorielles")
+    parser.add_argument('--booleans', type=int, default=1)
+    parser.add_argument('--dates', type=int, default=1)
+    parser.add_argument('--missing', type=float, default=0.05, help="taux de manquants par colonne (0-1)")
+    parser.add_argument('--cardinality', type=int, default=50, help="modalités des catégorielles")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', nargs='*', choices=GROUPS, default=list(GROUPS), help="groupes d'étapes mesurés")
+    parser.add_argument('--repeat', type=int, default=3, help="passages chronométrés par étape")
+    parser.add_argument('--no-memory', action='store_true', help="sans passage tracemalloc")
+    parser.add_argument('--baseline', default=None, help="commit ou fichier JSON de référence")
+    parser.add_argument('--time-threshold', type=float, default=TIME_THRESHOLD)
+    parser.add_argument('--memory-threshold', type=float, default=MEMORY_THRESHOLD)
+    parser.add_argument('--results-dir', default=RESULTS_DIR)
+    parser.add_argument('--no-save', action='store_true', help="ne pas enregistrer les résultats")
+    args = parser.parse_args(argv)
+
+    dataset = {key: getattr(args, key) for key in
+               ('rows', 'numeric', 'categorical', 'booleans', 'dates', 'missing', 'cardinality', 'seed')}
+    # Dossier de travail (CSV synthétique, instantanés, exports) supprimé à la fin
+    with tempfile.TemporaryDirectory(prefix="bench_suite_") as work_dir:
+        csv_path = os.path.join(work_dir, 'synthetique.csv')
+        synthetic_frame(**dataset).to_csv(csv_path, index=False)
+        print(f"Jeu synthétique : {args.rows:,} lignes, {os.path.getsize(csv_path) / 1024**2:.1f} Mo ({csv_path})")
+
+        commit, dirty = git_revision()
+        run = {
+            'commit': commit, 'dirty': dirty, 'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(), 'pandas': pd.__version__, 'machine': platform.machine(),
+            'cpus': os.cpu_count(), 'dataset': dataset, 'results': {}
+        }
+        for name, func in build_cases(csv_path, work_dir, tuple(args.only)):
+            result = measure(func, args.repeat, memory=not args.no_memory)
+            run['results'][name] = result
+            peak = f"  pic {result['peak_mb']:8.1f} Mo" if 'peak_mb' in result else ""
+            print(f"{name:<28} {result['seconds']:8.3f} s{peak}")
+
+    baseline = load_baseline(dataset, commit, args.baseline, args.results_dir)
+    if not args.no_save:
+        print(f"Résultats : {save_results(run, args.results_dir)}")
+    if baseline is None:
+        print("Aucune référence sur ce jeu de données : comparaison ignorée")
+        return 0
+
+    regressions = compare(run, baseline, args.time_threshold, args.memory_threshold)
+    print(f"Référence : {baseline['commit']} du {baseline['date']}")
+    for line in regressions:
+        print(f"✗ {line}")
+    if regressions:
+        return 1
+    print("✓ Aucune régression au-delà des seuils")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+"""
+EDA-Desk PRO - Moteurs de calcul (chargement, analyses) utilisés par l'interface
+
+``EDADeskHybrid`` (interface tkinter) et ``HistoryManager`` sont importés à la
+première utilisation : ``import eda_desk`` ne charge ni tkinter ni pandas.
+"""
+
+_LAZY_EXPORTS = {
+    'EDADeskHybrid': 'eda_desk.app',
+    'main': 'eda_desk.app',
+    'HistoryManager': 'eda_desk.history',
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module 'eda_desk' has no attribute {name!r}")
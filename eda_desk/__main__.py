@@ -0,0 +1,9 @@
+"""
+EDA-Desk PRO - lancement de l'interface : python -m eda_desk
+"""
+
+from eda_desk.app import main
+
+
+if __name__ == "__main__":
+    main()
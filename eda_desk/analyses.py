@@ -0,0 +1,129 @@
+"""
+ANALYSES DE QUALITÉ - fonctions pures (sans Tk), exécutables dans un pool
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+HIGH_MISSING_PCT = 30
+QUASI_CONSTANT_RATIO = 0.95
+IQR_FACTOR = 1.5
+
+
+def compute_missing_values(profile: pd.DataFrame) -> Tuple[Dict[str, Tuple[int, float]], List[str]]:
+    """Valeurs manquantes par variable, et variables au-delà du seuil critique"""
+    missing_values = {
+        col: (int(count), float(pct))
+        for col, count, pct in zip(profile.index, profile['null_count'], profile['null_pct'])
+    }
+    high_missing_vars = profile.index[profile['null_pct'] > HIGH_MISSING_PCT].tolist()
+    return missing_values, high_missing_vars
+
+
+def compute_quasi_constant(profile: pd.DataFrame, n_rows: int) -> List[str]:
+    """Variables dont la modalité dominante dépasse 95 % des lignes"""
+    if n_rows <= 0:
+        return []
+    return profile.index[profile['top_count'] / n_rows > QUASI_CONSTANT_RATIO].tolist()
+
+
+def compute_outliers(data: pd.DataFrame, n_rows: int = None,
+                     quartiles: Optional[pd.DataFrame] = None) -> Dict[str, Dict]:
+    """Outliers IQR pour un bloc de colonnes numériques (quantiles calculés en un appel).
+
+    ``quartiles`` : lignes 0.25 et 0.75 de ``data.quantile`` si elles sont déjà calculées.
+    """
+    if data.shape[1] == 0:
+        return {}
+    n_rows = len(data) if n_rows is None else n_rows
+
+    if quartiles is None:
+        quartiles = data.quantile([0.25, 0.75])
+    q1 = quartiles.loc[0.25]
+    q3 = quartiles.loc[0.75]
+    iqr = q3 - q1
+    lower = q1 - IQR_FACTOR * iqr
+    upper = q3 + IQR_FACTOR * iqr
+
+    counts = ((data < lower) | (data > upper)).sum()
+
+    outliers_info = {}
+    for col, count in counts.items():
+        count = int(count)
+        if count > 0:
+            outliers_info[col] = {
+                'count': count,
+                'percentage': (count / n_rows) * 100
+            }
+    return outliers_info
+
+
+def describe_numeric(series: pd.Series) -> Dict[str, float]:
+    """Statistiques descriptives d'une variable numérique (manquants exclus)"""
+    values = series.dropna()
+    return {
+        'Moyenne': values.mean(),
+        'Médiane': values.median(),
+        'Écart-type': values.std(),
+        'Variance': values.var(),
+        'Min': values.min(),
+        'Max': values.max(),
+        'Q1': values.quantile(0.25),
+        'Q3': values.quantile(0.75),
+        'Skewness': values.skew(),
+        'Kurtosis': values.kurtosis()
+    }
+
+
+def classify_columns(profile: pd.DataFrame, n_rows: int) -> Tuple[Dict[str, str], List[str], List[str], List[str]]:
+    """Type de chaque variable d'après le profil : (types, numériques, catégorielles, booléennes)"""
+    variable_types = {}
+    numeric_vars, categorical_vars, boolean_vars = [], [], []
+
+    for col, info in profile.iterrows():
+        if info['bool_like']:
+            variable_types[col] = 'Booléenne'
+            boolean_vars.append(col)
+        elif info['is_numeric']:
+            variable_types[col] = 'Numérique'
+            numeric_vars.append(col)
+        elif info['dtype'] in ('object', 'category') or info['n_unique'] < n_rows * 0.05:
+            variable_types[col] = 'Catégorielle'
+            categorical_vars.append(col)
+    return variable_types, numeric_vars, categorical_vars, boolean_vars
+
+
+def quality_score(total_missing: Optional[int], total_cells: int, n_columns: int, n_constant: int,
+                  outliers_info: Dict[str, Dict], n_numeric: int) -> float:
+    """Score qualité sur 100 : complétude (40), variables non constantes (30), outliers (30).
+
+    ``total_missing`` à None : valeurs manquantes pas encore analysées (40 points).
+    """
+    score = 0.0
+
+    if total_missing is not None and total_cells > 0:
+        score += (1 - total_missing / total_cells) * 40
+    else:
+        score += 40
+
+    if n_columns > 0:
+        score += (1 - n_constant / n_columns) * 30
+    else:
+        score += 30
+
+    if n_numeric > 0 and outliers_info:
+        avg_outliers = sum(info['percentage'] for info in outliers_info.values()) / n_numeric
+        score += max(0, 30 - avg_outliers * 2)
+    else:
+        score += 30
+
+    return score
+
+
+def split_columns(columns: List[str], n_blocks: int) -> List[List[str]]:
+    """Découper une liste de colonnes en blocs de taille proche"""
+    n_blocks = max(1, min(n_blocks, len(columns)))
+    return [list(block) for block in np.array_split(np.array(columns, dtype=object), n_blocks) if len(block)]
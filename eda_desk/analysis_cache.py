@@ -0,0 +1,188 @@
+"""
+CACHE DES RÉSULTATS D'ANALYSE - adressé par empreinte de fichier + paramètres
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+from datetime import datetime
+from typing import Dict, Optional
+
+
+# Au-delà de cette taille, l'empreinte de contenu est calculée sur un échantillon
+FULL_HASH_MAX_BYTES = 64 * 1024 ** 2
+SAMPLE_BYTES = 1024 ** 2
+
+
+def file_fingerprint(filepath: str, length: Optional[int] = None) -> Dict:
+    """Empreinte d'un fichier : chemin, taille, date de modification, hash du contenu.
+
+    Le hash couvre tout le fichier jusqu'à 64 Mo ; au-delà, le début, le milieu
+    et la fin (1 Mo chacun), ce qui reste instantané sur des fichiers de plusieurs Go.
+    ``length`` : empreinte des seuls ``length`` premiers octets (identique à
+    celle du fichier entier tant qu'il n'avait que cette taille).
+    """
+    stat = os.stat(filepath)
+    size = stat.st_size if length is None else min(length, stat.st_size)
+    digest = hashlib.blake2b(digest_size=20)
+
+    with open(filepath, 'rb') as f:
+        if size <= FULL_HASH_MAX_BYTES:
+            remaining = size
+            while remaining > 0:
+                block = f.read(min(SAMPLE_BYTES, remaining))
+                if not block:
+                    break
+                digest.update(block)
+                remaining -= len(block)
+        else:
+            for offset in (0, size // 2, max(0, size - SAMPLE_BYTES)):
+                f.seek(offset)
+                digest.update(f.read(min(SAMPLE_BYTES, size - offset)))
+
+    return {
+        'path': os.path.abspath(filepath),
+        'size': size,
+        'mtime': stat.st_mtime,
+        'content_hash': digest.hexdigest()
+    }
+
+
+def cache_key(fingerprint: Dict, params: Optional[Dict] = None) -> str:
+    """Clé de cache : empreinte + paramètres d'analyse"""
+    payload = json.dumps({'file': fingerprint, 'params': params or {}}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class AnalysisCache:
+    """Cache persistant des résultats (table dans la base SQLite de l'historique).
+
+    Éviction LRU bornée en nombre d'entrées et en octets ; compteurs
+    de hits/misses pour la session.
+    """
+
+    def __init__(self, db_path="eda_history.db", max_entries: int = 200, max_bytes: int = 256 * 1024 ** 2):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._init_database()
+
+    def _init_database(self):
+        """Initialiser la table de cache"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                cache_key TEXT PRIMARY KEY,
+                filepath TEXT,
+                payload BLOB NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at TIMESTAMP,
+                last_access TIMESTAMP
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_cache_last_access ON analysis_cache(last_access)')
+
+        conn.commit()
+        conn.close()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Lire une entrée (et la marquer comme récemment utilisée)"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('SELECT payload FROM analysis_cache WHERE cache_key = ?', (key,))
+        row = cursor.fetchone()
+
+        if row is None:
+            conn.close()
+            self.misses += 1
+            return None
+
+        cursor.execute(
+            'UPDATE analysis_cache SET last_access = ? WHERE cache_key = ?',
+            (datetime.now().isoformat(), key)
+        )
+        conn.commit()
+        conn.close()
+
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            self.invalidate(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Dict, filepath: str = ""):
+        """Écrire une entrée puis appliquer l'éviction LRU"""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = datetime.now().isoformat()
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            INSERT OR REPLACE INTO analysis_cache
+            (cache_key, filepath, payload, size_bytes, created_at, last_access)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (key, filepath, payload, len(payload), now, now))
+
+        self._evict(cursor)
+
+        conn.commit()
+        conn.close()
+
+    def invalidate(self, key: str):
+        """Supprimer une entrée"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('DELETE FROM analysis_cache WHERE cache_key = ?', (key,))
+        conn.commit()
+        conn.close()
+
+    def clear(self):
+        """Vider le cache"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('DELETE FROM analysis_cache')
+        conn.commit()
+        conn.close()
+
+    def stats(self) -> Dict:
+        """Taille du cache et compteurs de session"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM analysis_cache')
+        entries, size_bytes = cursor.fetchone()
+        conn.close()
+
+        total = self.hits + self.misses
+        return {
+            'entries': entries,
+            'size_bytes': size_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total * 100) if total else 0.0
+        }
+
+    def _evict(self, cursor):
+        """Supprimer les entrées les moins récemment utilisées au-delà des limites"""
+        cursor.execute('SELECT cache_key, size_bytes FROM analysis_cache ORDER BY last_access DESC')
+        rows = cursor.fetchall()
+
+        kept_bytes = 0
+        to_delete = []
+        for i, (key, size_bytes) in enumerate(rows):
+            if i >= self.max_entries or kept_bytes + size_bytes > self.max_bytes:
+                to_delete.append((key,))
+            else:
+                kept_bytes += size_bytes
+
+        if to_delete:
+            cursor.executemany('DELETE FROM analysis_cache WHERE cache_key = ?', to_delete)
@@ -0,0 +1,103 @@
+"""
+ORDONNANCEUR D'ANALYSES - exécution parallèle hors du thread Tk
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+def default_workers() -> int:
+    """Nombre de workers par défaut (un cœur laissé à l'interface)"""
+    return max(1, min(8, (os.cpu_count() or 2) - 1))
+
+
+class AnalysisScheduler:
+    """Lance des analyses indépendantes dans un pool et publie les résultats.
+
+    Chaque tâche terminée produit ``('result', name, value, seconds)`` ou
+    ``('error', name, exception, seconds)`` dans ``self.events`` ; une fois
+    toutes les tâches terminées, ``('finished', None, None, total_seconds)``.
+    L'interface dépile la file avec ``root.after`` : aucun appel Tk n'est fait
+    depuis les workers.
+
+    Les threads conviennent aux calculs pandas/numpy (qui relâchent le GIL) ;
+    ``use_processes=True`` isole les calculs purement Python, au prix de la
+    sérialisation des données envoyées à chaque tâche.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, use_processes: bool = False):
+        self.max_workers = max_workers or default_workers()
+        self.use_processes = use_processes
+        self.events: "queue.Queue" = queue.Queue()
+        self._futures: Dict[Future, str] = {}
+        self._started: Dict[Future, float] = {}
+        self._pending = 0
+        self._closed = False
+        self._finished = False
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._start_time = time.perf_counter()
+
+        pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self._executor = pool_class(max_workers=self.max_workers)
+
+    def submit(self, name: str, fn: Callable, *args, **kwargs) -> Future:
+        """Soumettre une analyse nommée"""
+        with self._lock:
+            self._pending += 1
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._futures[future] = name
+        self._started[future] = time.perf_counter()
+        future.add_done_callback(self._on_done)
+        return future
+
+    def close(self):
+        """Plus aucune tâche ne sera soumise : libérer le pool à la fin"""
+        self._executor.shutdown(wait=False)
+        with self._lock:
+            self._closed = True
+        self._maybe_finish()
+
+    def cancel(self):
+        """Annuler les tâches en attente et ignorer les résultats restants"""
+        self._cancelled = True
+        for future in list(self._futures):
+            future.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.events.put(('cancelled', None, None, time.perf_counter() - self._start_time))
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def running(self) -> bool:
+        return not self._cancelled and self._pending > 0
+
+    def _on_done(self, future: Future):
+        """Callback du pool (thread worker) : publier le résultat"""
+        name = self._futures.get(future, '?')
+        elapsed = time.perf_counter() - self._started.get(future, self._start_time)
+
+        if not (self._cancelled or future.cancelled()):
+            error = future.exception()
+            if error is not None:
+                self.events.put(('error', name, error, elapsed))
+            else:
+                self.events.put(('result', name, future.result(), elapsed))
+
+        with self._lock:
+            self._pending -= 1
+        self._maybe_finish()
+
+    def _maybe_finish(self):
+        """Publier 'finished' une seule fois, quand tout est soumis et terminé"""
+        with self._lock:
+            if self._finished or self._cancelled or not self._closed or self._pending > 0:
+                return
+            self._finished = True
+        self.events.put(('finished', None, None, time.perf_counter() - self._start_time))
@@ -0,0 +1,3724 @@
+"""
+EDA-Desk PRO HYBRID — Version finale complète
+Architecture à 4 zones + Accumulation des résultats + Statistiques catégorielles
+Version améliorée : Support Excel + Zoom + Headers stylisés
+
+    eda-desk            (ou : python -m eda_desk)
+
+Démarrage : seules l'interface, pandas et les moteurs légers sont importés ;
+matplotlib / seaborn au premier graphique, python-docx / reportlab au premier
+export, openpyxl à la première ouverture d'un classeur Excel.
+"""
+
+import tkinter as tk
+from tkinter import filedialog, messagebox
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from ttkbootstrap.widgets import ToastNotification
+from ttkbootstrap.dialogs import Messagebox, Querybox
+import pandas as pd
+import numpy as np
+from typing import Optional, Dict, Hashable, List, Tuple
+import os
+import queue
+import threading
+import time
+
+from eda_desk.chunked_loader import ChunkedCSVLoader, format_bytes
+from eda_desk.column_profiler import profile_columns
+from eda_desk.analyses import (compute_missing_values, compute_quasi_constant, compute_outliers, split_columns,
+                               classify_columns, describe_numeric, quality_score,
+                               HIGH_MISSING_PCT, QUASI_CONSTANT_RATIO, IQR_FACTOR)
+from eda_desk.history import HISTORY_PAGE_SIZE, HistoryManager
+from eda_desk.export_jobs import ExportJob, DataExportJob, EXPORT_FORMATS
+from eda_desk.data_export import DATA_EXTENSIONS, available_formats
+from eda_desk.reports import (constant_result, global_stats_result, missing_result, outliers_result,
+                              quality_result, types_result, accumulated_header, section_text, ACCUMULATED_FOOTER)
+from eda_desk.results import AnalysisResult, ResultAccumulator
+from eda_desk.analysis_scheduler import AnalysisScheduler
+from eda_desk.analysis_cache import AnalysisCache, file_fingerprint, cache_key
+from eda_desk.snapshot_store import SnapshotStore
+from eda_desk.csv_dialect import CSVDialect, detect_dialect, validate_dialect
+from eda_desk.memory_compact import compact_dataframe
+from eda_desk.data_window import DataWindow
+from eda_desk.data_index import DataIndex, RowFilter, FILTER_OPERATORS
+from eda_desk.plot_cache import PlotCache
+from eda_desk.plots import PLOT_TYPES
+from eda_desk.sketches import ColumnSketch, sketch_frame, NUMERIC_STATS, QUANTILE_ALPHA, SAMPLE_SIZE
+from eda_desk.categorical import CategoricalStats, HEAVY_HITTER_CAPACITY, categorical_stats, format_count
+from eda_desk.streaming import StreamingAnalyzer, StreamingSummary
+from eda_desk.incremental import AppendCSVLoader, append_state_key, build_append_state, refresh_results
+from eda_desk.instrumentation import Span, Tracer, format_span, totals, write_chrome_trace
+from eda_desk.workspace import Workspace
+from eda_desk.plot_aggregation import AGGREGATION_THRESHOLD
+
+
+class EDADeskHybrid:
+    """Application EDA-Desk PRO Hybrid - Version finale complète"""
+    
+    # Résultats sauvegardés dans le cache d'analyses (restaurés à la réouverture)
+    CACHED_RESULTS = ('profile', 'missing_values', 'high_missing_vars', 'quasi_constant_vars',
+                      'outliers_info', 'current_stats', 'categorical_stats', 'accumulated_reports')
+    
+    # État propre à chaque jeu de données de la session (rétabli quand on revient à ce jeu)
+    DATASET_STATE = ('filename', 'filepath', 'load_params', 'variable_types', 'numeric_vars',
+                     'categorical_vars', 'boolean_vars', 'cache_key', 'file_fingerprint', 'stream_summary',
+                     'last_load_metrics') + CACHED_RESULTS
+    # Exécution (ouverture) du jeu : ses étapes chronométrées vont dans son entrée d'historique
+    RUN_STATE = ('run_id', 'run_started', 'history_entry_id')
+    
+    def __init__(self, root):
+        self.root = root
+        self.data: Optional[pd.DataFrame] = None
+        self.filename: str = ""
+        self.filepath: str = ""
+        self.variable_types: Dict[str, str] = {}
+        self.numeric_vars: List[str] = []
+        self.categorical_vars: List[str] = []
+        self.boolean_vars: List[str] = []
+
+        # Profil des colonnes (calculé une fois par chargement)
+        self.profile: Optional[pd.DataFrame] = None
+        
+        # Résultats
+        self.missing_values: Dict[str, Tuple[int, float]] = {}
+        self.high_missing_vars: List[str] = []
+        self.quasi_constant_vars: List[str] = []
+        self.outliers_info: Dict[str, Dict] = {}
+        self.current_stats: Dict = {}
+        # Modalités dominantes par variable catégorielle (statistiques, stats globales, exports)
+        self.categorical_stats: Dict[str, CategoricalStats] = {}
+        self.last_analysis_type: str = ""
+        
+        # Accumulation des résultats (onglet Résultats : une section de texte balisée par analyse)
+        self.accumulated_reports = ResultAccumulator()
+        self._result_tags: Dict[str, str] = {}
+        self._dirty_results: set = set()
+        
+        # Zoom factor
+        self.zoom_factor: float = 1.0
+        
+        # Managers
+        self.history_manager = HistoryManager()
+        self.history_cursor = None
+        self.history_has_more = False
+        self.history_filters: Dict = {}
+        self.analysis_cache = AnalysisCache(self.history_manager.db_path)
+        self.snapshot_store = SnapshotStore()
+        self.cache_key: Optional[str] = None
+        self.file_fingerprint: Optional[Dict] = None
+        self.load_params: Dict = {}
+        
+        # Zoom factor
+        self.zoom_factor: float = 1.0
+        self.viz_zoom_factor: float = 1.0  # AJOUT pour zoom visualisations
+        self.current_fig = None  # AJOUT pour stocker la figure actuelle
+        self.current_plot_key: Optional[Tuple] = None
+        self.data_version: int = 0
+        self.plot_cache = PlotCache(on_evict=self._release_plot)
+
+        # Chargement en arrière-plan
+        self.loader: Optional[ChunkedCSVLoader] = None
+        self.csv_dialect: Optional[CSVDialect] = None
+        self.last_load_metrics: Dict = {}
+        self._last_poll_time: float = 0.0
+        
+        # Exports (rapports Word / PDF, données) en arrière-plan
+        self.export_job = None
+        self._export_progress: Dict[str, float] = {}
+        self._export_errors: List[str] = []
+        self._export_cancelled: bool = False
+
+        # Mode mémoire compacte (catégories + types numériques réduits au chargement)
+        self.compact_mode = tk.BooleanVar(value=False)
+
+        # Analyse en flux : résumé du fichier entier, self.data ne contient que l'aperçu
+        self.stream_summary: Optional[StreamingSummary] = None
+
+        # Grille virtualisée de l'onglet Données
+        self.data_window = DataWindow()
+        self._grid_render_pending = False
+
+        # Tri / filtre de l'onglet Données (index construits à la demande)
+        self.data_index: Optional[DataIndex] = None
+        self.grid_filters: List[RowFilter] = []
+        self.grid_sort: Optional[Tuple[Hashable, bool]] = None
+        # Colonne affichée (texte du Treeview) -> étiquette d'origine (index, tri et filtres)
+        self.grid_columns: Dict[str, Hashable] = {}
+        self.filter_drives_analyses = tk.BooleanVar(value=False)
+        self._filter_preview_job = None
+        self._filtered_data_cache: Optional[Tuple[Tuple, pd.DataFrame]] = None
+
+        # Statistiques approchées (sketches par colonne, par version des données et filtre)
+        self.approximate_stats = tk.BooleanVar(value=False)
+        self._sketch_cache: Optional[Tuple[Tuple, Dict[str, ColumnSketch]]] = None
+
+        # Analyses parallèles du rapport complet
+        self.analysis_scheduler: Optional[AnalysisScheduler] = None
+        self._report_errors: List[str] = []
+
+        # Instrumentation : étapes chronométrées (barre de statut, historique, trace Chrome)
+        self.tracer = Tracer(on_span=self._on_span)
+        self.run_id = 0
+        self._run_count = 0
+        self.run_started: float = 0.0
+        self.history_entry_id: Optional[int] = None
+        self._timings_save_pending = False
+        self._load_started: float = 0.0
+
+        # matplotlib / seaborn configurés au premier graphique
+        self._plotting_ready = False
+        
+        # Session : fichiers ouverts gardés sous un budget mémoire, les moins récents sur disque
+        self.workspace = Workspace()
+        self.dataset_key: Optional[str] = None
+        self._dataset_choices: List[str] = []
+        
+        self._setup_window()
+        self._create_ui()
+        
+    def _setup_window(self):
+        """Configuration de la fenêtre avec adaptation automatique"""
+        self.root.title("EDA Exploratory Data Analysis Desk")
+        
+        # Obtenir les dimensions de l'écran
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        
+        # Utiliser 85% de la taille de l'écran comme BASE
+        self.base_width = int(screen_width * 0.85)
+        self.base_height = int(screen_height * 0.85)
+        
+        # Centrer
+        x = (screen_width - self.base_width) // 2
+        y = (screen_height - self.base_height) // 2
+        
+        self.root.geometry(f"{self.base_width}x{self.base_height}+{x}+{y}")
+        self.root.minsize(1000, 700)
+    
+    
+    
+    def _create_ui(self):
+        """Création de l'interface"""
+        # Menu bar
+        self._create_menubar()
+
+        # Barre de statut (packée avant le notebook pour rester visible)
+        self._create_statusbar()
+
+        # Notebook principal
+        self.notebook = ttk.Notebook(self.root, bootstyle="primary")
+        self.notebook.pack(fill=BOTH, expand=YES, padx=10, pady=10)
+        
+        # Onglet Vue d'ensemble (avec scroll)
+        tab_overview_container = ttk.Frame(self.notebook)
+        self.notebook.add(tab_overview_container, text="Vue d'ensemble")
+        self.tab_overview = self._create_scrollable_frame(tab_overview_container)
+        
+        # Onglet Résultats (avec scroll)
+        tab_results_container = ttk.Frame(self.notebook)
+        self.notebook.add(tab_results_container, text="Résultats & Exports")
+        self.tab_results = self._create_scrollable_frame(tab_results_container)
+        
+        # Onglet Statistiques (avec scroll)
+        tab_stats_container = ttk.Frame(self.notebook)
+        self.notebook.add(tab_stats_container, text="Statistiques avancées")
+        self.tab_stats = self._create_scrollable_frame(tab_stats_container)
+        
+        # Onglet Visualisations (avec scroll)
+        
+        self.tab_viz = ttk.Frame(self.notebook)
+        self.notebook.add(self.tab_viz, text="Visualisations")
+        
+        # Onglet Données (avec scroll)
+        
+        self.tab_data = ttk.Frame(self.notebook)
+        self.notebook.add(self.tab_data, text="Données complètes")
+        
+        # Onglet Historique (avec scroll)
+        tab_history_container = ttk.Frame(self.notebook)
+        self.notebook.add(tab_history_container, text="Historique")
+        self.tab_history = self._create_scrollable_frame(tab_history_container)
+        
+        # Créer contenu
+        self._create_overview_tab_4_zones()
+        self._create_results_tab()
+        self._create_stats_tab()
+        self._create_viz_tab()
+        self._create_data_tab()
+        self._create_history_tab()
+
+    def _create_scrollable_frame(self, parent):
+        """Créer un frame scrollable pour un onglet"""
+        # Container principal
+        container = ttk.Frame(parent)
+        container.pack(fill=BOTH, expand=YES)
+        
+        # Canvas
+        canvas = tk.Canvas(container, highlightthickness=0, bg='#f8f9fa')
+        
+        # Scrollbar verticale
+        v_scrollbar = ttk.Scrollbar(container, orient=VERTICAL, command=canvas.yview, bootstyle="primary-round")
+        v_scrollbar.pack(side=RIGHT, fill=Y)
+        
+        # Scrollbar horizontale
+        h_scrollbar = ttk.Scrollbar(container, orient=HORIZONTAL, command=canvas.xview, bootstyle="primary-round")
+        h_scrollbar.pack(side=BOTTOM, fill=X)
+        
+        # Pack canvas
+        canvas.pack(side=LEFT, fill=BOTH, expand=YES)
+        
+        # Configuration scrollbars
+        canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        
+        # Frame interne scrollable
+        scrollable_frame = ttk.Frame(canvas)
+        canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        
+        # Mise à jour de la région scrollable
+        def configure_scroll_region(event=None):
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        scrollable_frame.bind("<Configure>", configure_scroll_region)
+        
+        # Adapter la largeur du frame au canvas
+        def configure_canvas_window(event):
+            canvas.itemconfig(canvas_window, width=event.width)
+        
+        canvas.bind("<Configure>", configure_canvas_window)
+        
+        # Scroll avec la molette de souris
+        def on_mousewheel(event):
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        
+        def bind_mousewheel(event):
+            canvas.bind_all("<MouseWheel>", on_mousewheel)
+        
+        def unbind_mousewheel(event):
+            canvas.unbind_all("<MouseWheel>")
+        
+        # Activer le scroll uniquement quand la souris est sur cet onglet
+        canvas.bind("<Enter>", bind_mousewheel)
+        canvas.bind("<Leave>", unbind_mousewheel)
+        
+        return scrollable_frame
+
+    def _create_statusbar(self):
+        """Créer la barre de statut (progression du chargement)"""
+        statusbar = ttk.Frame(self.root, padding=(10, 2))
+        statusbar.pack(side=BOTTOM, fill=X)
+
+        # Jeux de données de la session
+        self.dataset_combo = ttk.Combobox(statusbar, state="readonly", width=28, bootstyle="primary")
+        self.dataset_combo.pack(side=LEFT, padx=(0, 5))
+        self.dataset_combo.bind('<<ComboboxSelected>>', self._on_dataset_selected)
+        self.session_label = ttk.Label(
+            statusbar,
+            text="",
+            font=("Segoe UI", 9),
+            bootstyle="info"
+        )
+        self.session_label.pack(side=LEFT, padx=(0, 15))
+
+        self.status_label = ttk.Label(
+            statusbar,
+            text="Prêt",
+            font=("Segoe UI", 9),
+            bootstyle="secondary"
+        )
+        self.status_label.pack(side=LEFT)
+
+        self.cancel_load_btn = ttk.Button(
+            statusbar,
+            text="Annuler",
+            command=self._cancel_background_task,
+            bootstyle="danger-outline",
+            state=DISABLED
+        )
+        self.cancel_load_btn.pack(side=RIGHT, padx=(10, 0))
+
+        self.load_progress = ttk.Progressbar(
+            statusbar,
+            mode='determinate',
+            maximum=100,
+            length=200,
+            bootstyle="success-striped"
+        )
+        self.load_progress.pack(side=RIGHT)
+
+        # Dernière étape chronométrée (durée, variation de la mémoire)
+        self.timing_label = ttk.Label(
+            statusbar,
+            text="",
+            font=("Segoe UI", 9),
+            bootstyle="info"
+        )
+        self.timing_label.pack(side=RIGHT, padx=(0, 15))
+
+    def _create_menubar(self):
+        """Créer la barre de menu"""
+        menubar = tk.Menu(self.root)
+        self.root.config(menu=menubar)
+        
+        # Menu Fichier
+        file_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Fichier", menu=file_menu)
+        file_menu.add_command(label="Ouvrir CSV...", command=self._open_file, accelerator="Ctrl+O")
+        file_menu.add_command(label="Ouvrir Excel...", command=self._open_excel_file, accelerator="Ctrl+E")
+        file_menu.add_command(label="Analyser en flux (CSV volumineux)...", command=self._open_file_streaming)
+        file_menu.add_command(label="Annuler la tâche en cours", command=self._cancel_background_task, accelerator="Échap")
+        file_menu.add_command(label="Vider le cache d'analyses", command=self._clear_analysis_cache)
+        file_menu.add_command(label="Instantanés colonnaires...", command=self._manage_snapshots)
+        file_menu.add_checkbutton(label="Mode mémoire compacte", variable=self.compact_mode)
+        file_menu.add_command(label="Budget mémoire de la session...", command=self._set_memory_budget)
+        file_menu.add_separator()
+        file_menu.add_command(label="Quitter", command=self.root.quit, accelerator="Ctrl+Q")
+        
+        # Menu Export
+        export_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Export", menu=export_menu)
+        export_menu.add_command(label="Export Word (.docx)", command=self._export_word)
+        export_menu.add_command(label="Export PDF", command=self._export_pdf)
+        export_menu.add_command(label="Export Word + PDF", command=self._export_word_pdf)
+        export_menu.add_command(label="Export données (Excel, Parquet, CSV.gz)", command=self._export_excel)
+        export_menu.add_separator()
+        export_menu.add_command(label="Trace des durées (Chrome / JSON)...", command=self._export_trace)
+        
+        # Menu Affichage
+        view_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Affichage", menu=view_menu)
+        view_menu.add_command(label="Zoom +", command=self._zoom_in, accelerator="Ctrl++")
+        view_menu.add_command(label="Zoom -", command=self._zoom_out, accelerator="Ctrl+-")
+        view_menu.add_command(label="Zoom 100%", command=self._zoom_reset, accelerator="Ctrl+0")
+        
+        # Menu Navigation
+        nav_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Navigation", menu=nav_menu)
+        nav_menu.add_command(label="Vue d'ensemble", command=lambda: self.notebook.select(0))
+        nav_menu.add_command(label="Résultats & Exports", command=lambda: self.notebook.select(1))
+        nav_menu.add_command(label="Statistiques", command=lambda: self.notebook.select(2))
+        nav_menu.add_command(label="Visualisations", command=lambda: self.notebook.select(3))
+        nav_menu.add_command(label="Données", command=lambda: self.notebook.select(4))
+        nav_menu.add_command(label="Historique", command=lambda: self.notebook.select(5))
+        
+        # Menu Aide
+        help_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Aide", menu=help_menu)
+        help_menu.add_command(label="À propos", command=self._show_about)
+        
+        # Raccourcis
+        self.root.bind('<Control-o>', lambda e: self._open_file())
+        self.root.bind('<Control-e>', lambda e: self._open_excel_file())
+        self.root.bind('<Control-q>', lambda e: self.root.quit())
+        self.root.bind('<Escape>', lambda e: self._cancel_background_task())
+        self.root.bind('<Control-plus>', lambda e: self._zoom_in())
+        self.root.bind('<Control-minus>', lambda e: self._zoom_out())
+        self.root.bind('<Control-0>', lambda e: self._zoom_reset())
+    
+    def _create_styled_header(self, parent, title, subtitle):
+        """Créer un header stylisé avec gradient bleu clair"""
+        header_container = ttk.Frame(parent)
+        header_container.pack(fill=X, padx=0, pady=0)
+        
+        title_canvas = tk.Canvas(header_container, height=120, highlightthickness=0)
+        title_canvas.pack(fill=X)
+        
+            # Gradient bleu clair élégant
+        for i in range(120):
+                r = int(74 + (100 - 74) * i / 120)      # 4A -> 64
+                g = int(144 + (180 - 144) * i / 120)    # 90 -> B4
+                b = int(226 + (240 - 226) * i / 120)    # E2 -> F0
+                color = f'#{r:02x}{g:02x}{b:02x}'
+                title_canvas.create_line(0, i, 2000, i, fill=color)
+                    
+        title_canvas.create_text(
+            750, 40,
+            text=title,
+            font=("Segoe UI", 28, "bold"),
+            fill='white'
+        )
+        
+        title_canvas.create_text(
+            750, 80,
+            text=subtitle,
+            font=("Segoe UI", 11),
+            fill='#e0e7ff'
+        )
+        
+        return header_container
+    
+    # ============================================================
+    # ZOOM FUNCTIONS
+    # ============================================================
+    
+    def _zoom_in(self):
+        """Augmenter le zoom"""
+        self.zoom_factor = min(2.0, self.zoom_factor + 0.1)
+        self._apply_zoom()
+        ToastNotification(
+            title="Zoom",
+            message=f"Zoom: {int(self.zoom_factor * 100)}%",
+            duration=1500,
+            bootstyle="info"
+        ).show_toast()
+    
+    def _zoom_out(self):
+        """Diminuer le zoom"""
+        self.zoom_factor = max(0.5, self.zoom_factor - 0.1)
+        self._apply_zoom()
+        ToastNotification(
+            title="Zoom",
+            message=f"Zoom: {int(self.zoom_factor * 100)}%",
+            duration=1500,
+            bootstyle="info"
+        ).show_toast()
+    
+    def _zoom_reset(self):
+        """Réinitialiser le zoom"""
+        self.zoom_factor = 1.0
+        self._apply_zoom()
+        ToastNotification(
+            title="Zoom",
+            message="Zoom: 100%",
+            duration=1500,
+            bootstyle="info"
+        ).show_toast()
+    
+    def _apply_zoom(self):
+        """Appliquer le facteur de zoom"""
+        # Calculer les nouvelles dimensions basées sur la taille de base adaptative
+        new_width = int(self.base_width * self.zoom_factor)
+        new_height = int(self.base_height * self.zoom_factor)
+        
+        # Centrer la fenêtre
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        x = (screen_width - new_width) // 2
+        y = (screen_height - new_height) // 2
+        
+        self.root.geometry(f"{new_width}x{new_height}+{x}+{y}")
+    # ============================================================
+    # ONGLET 1: VUE D'ENSEMBLE
+    # ============================================================
+    
+    def _create_overview_tab_4_zones(self):
+        """Onglet Vue d'ensemble - Architecture 4 zones"""
+        
+        # Header stylisé
+        self._create_styled_header(
+            self.tab_overview,
+            "VUE D'ENSEMBLE",
+            "Chargement et aperçu des données"
+        )
+        
+        # ZONE 1
+        self._create_zone1_top_bar()
+        
+        # Container central
+        central_container = ttk.Frame(self.tab_overview)
+        central_container.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        
+        # ZONE 2 et 3
+        self._create_zone2_left_data_preview(central_container)
+        self._create_zone3_right_controls(central_container)
+        
+        # ZONE 4
+        self._create_zone4_bottom_results()
+    
+    def _create_zone1_top_bar(self):
+        """ZONE 1: Barre supérieure"""
+        top_card = ttk.Labelframe(
+            self.tab_overview,
+            text="Sélection de fichier",
+            bootstyle="primary",
+            padding=15
+        )
+        top_card.pack(fill=X, padx=10, pady=(10, 5))
+        
+        content = ttk.Frame(top_card)
+        content.pack(fill=X)
+        
+        # Boutons
+        left_frame = ttk.Frame(content)
+        left_frame.pack(side=LEFT, fill=Y)
+        
+        ttk.Button(
+            left_frame,
+            text="Ouvrir CSV",
+            command=self._open_file,
+            bootstyle="success",
+            width=20
+        ).pack(pady=5, side=LEFT, padx=5)
+        
+        ttk.Button(
+            left_frame,
+            text="Ouvrir Excel",
+            command=self._open_excel_file,
+            bootstyle="success",
+            width=20
+        ).pack(pady=5, side=LEFT, padx=5)
+        
+        # Séparateur
+        ttk.Separator(content, orient=VERTICAL, bootstyle="secondary").pack(side=LEFT, fill=Y, padx=20)
+        
+        # Infos
+        right_frame = ttk.Frame(content)
+        right_frame.pack(side=LEFT, fill=BOTH, expand=YES)
+        
+        info_grid = ttk.Frame(right_frame)
+        info_grid.pack(fill=BOTH, expand=YES)
+        
+        # Nom fichier
+        file_frame = ttk.Frame(info_grid)
+        file_frame.pack(fill=X, pady=5)
+        
+        ttk.Label(
+            file_frame,
+            text="Fichier chargé:",
+            bootstyle="secondary",
+            font=("Segoe UI", 9)
+        ).pack(side=LEFT, padx=(0, 10))
+        
+        self.lbl_filename = ttk.Label(
+            file_frame,
+            text="Aucun fichier",
+            font=("Segoe UI", 11, "bold"),
+            bootstyle="primary"
+        )
+        self.lbl_filename.pack(side=LEFT)
+        
+        # Dimensions
+        dim_frame = ttk.Frame(info_grid)
+        dim_frame.pack(fill=X, pady=5)
+        
+        ttk.Label(
+            dim_frame,
+            text="Dimensions:",
+            bootstyle="secondary",
+            font=("Segoe UI", 9)
+        ).pack(side=LEFT, padx=(0, 10))
+        
+        self.lbl_dimensions = ttk.Label(
+            dim_frame,
+            text="0 lignes × 0 colonnes",
+            font=("Segoe UI", 11, "bold"),
+            bootstyle="info"
+        )
+        self.lbl_dimensions.pack(side=LEFT)
+    
+    def _create_zone2_left_data_preview(self, parent):
+        """ZONE 2: Aperçu des données"""
+        left_card = ttk.Labelframe(
+            parent,
+            text="Aperçu des données (50 premières lignes)",
+            bootstyle="info",
+            padding=10
+        )
+        left_card.pack(side=LEFT, fill=BOTH, expand=YES, padx=(0, 5))
+        
+        scroll_container = ttk.Frame(left_card)
+        scroll_container.pack(fill=BOTH, expand=YES)
+        
+        vsb = ttk.Scrollbar(scroll_container, orient=VERTICAL, bootstyle="info-round")
+        vsb.pack(side=RIGHT, fill=Y)
+        
+        hsb = ttk.Scrollbar(scroll_container, orient=HORIZONTAL, bootstyle="info-round")
+        hsb.pack(side=BOTTOM, fill=X)
+        
+        self.data_preview = tk.Text(
+            scroll_container,
+            wrap=NONE,
+            font=("Consolas", 9),
+            yscrollcommand=vsb.set,
+            xscrollcommand=hsb.set,
+            relief=FLAT,
+            bg='#f8f9fa',
+            fg='#212529',
+            padx=10,
+            pady=10
+        )
+        self.data_preview.pack(fill=BOTH, expand=YES)
+        
+        vsb.config(command=self.data_preview.yview)
+        hsb.config(command=self.data_preview.xview)
+        
+        welcome = """
+                  ZONE 2 - APERÇU DES DONNÉES
+                  
+Chargez un fichier CSV ou Excel pour visualiser les données.
+"""
+        self.data_preview.insert('1.0', welcome)
+        self.data_preview.config(state=DISABLED)
+    
+    def _create_zone3_right_controls(self, parent):
+        """ZONE 3: Analyses et contrôles"""
+        right_card = ttk.Labelframe(
+            parent,
+            text="Analyses et contrôles",
+            bootstyle="warning",
+            padding=10
+        )
+        right_card.pack(side=RIGHT, fill=BOTH, padx=(5, 0))
+        right_card.configure(width=400)
+        
+        canvas = tk.Canvas(right_card, bg='#f8f9fa', highlightthickness=0)
+        scrollbar = ttk.Scrollbar(right_card, orient=VERTICAL, command=canvas.yview, bootstyle="warning-round")
+        
+        controls_frame = ttk.Frame(canvas)
+        controls_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=controls_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        scrollbar.pack(side=RIGHT, fill=Y)
+        canvas.pack(side=LEFT, fill=BOTH, expand=YES)
+        
+        # Sélection variables
+        select_section = ttk.Labelframe(
+            controls_frame,
+            text="Sélection de variables",
+            bootstyle="info",
+            padding=15
+        )
+        select_section.pack(fill=X, padx=10, pady=10)
+        
+        var1_frame = ttk.Frame(select_section)
+        var1_frame.pack(fill=X, pady=5)
+        ttk.Label(var1_frame, text="Variable numérique 1:", font=("Segoe UI", 9)).pack(anchor=W)
+        self.var1_combo = ttk.Combobox(var1_frame, state='readonly', width=30)
+        self.var1_combo.pack(fill=X, pady=(5, 0))
+        
+        var2_frame = ttk.Frame(select_section)
+        var2_frame.pack(fill=X, pady=5)
+        ttk.Label(var2_frame, text="Variable numérique 2:", font=("Segoe UI", 9)).pack(anchor=W)
+        self.var2_combo = ttk.Combobox(var2_frame, state='readonly', width=30)
+        self.var2_combo.pack(fill=X, pady=(5, 0))
+        
+        cat_frame = ttk.Frame(select_section)
+        cat_frame.pack(fill=X, pady=5)
+        ttk.Label(cat_frame, text="Variable catégorielle:", font=("Segoe UI", 9)).pack(anchor=W)
+        self.cat_combo = ttk.Combobox(cat_frame, state='readonly', width=30)
+        self.cat_combo.pack(fill=X, pady=(5, 0))
+        
+        ttk.Button(
+            select_section,
+            text="Calculer statistiques détaillées",
+            command=self._go_to_stats,
+            bootstyle="success",
+            width=35
+        ).pack(pady=10)
+        
+        # Analyses statistiques
+        analysis_section = ttk.Labelframe(
+            controls_frame,
+            text="Analyses statistiques",
+            bootstyle="primary",
+            padding=15
+        )
+        analysis_section.pack(fill=X, padx=10, pady=10)
+        
+        ttk.Button(
+            analysis_section,
+            text="Types de variables",
+            command=self._show_detailed_types,
+            bootstyle="info",
+            width=35
+        ).pack(pady=5)
+        
+        ttk.Button(
+            analysis_section,
+            text="Valeurs manquantes",
+            command=self._analyze_missing_values,
+            bootstyle="warning",
+            width=35
+        ).pack(pady=5)
+        
+        ttk.Button(
+            analysis_section,
+            text="Variables constantes",
+            command=self._detect_quasi_constant,
+            bootstyle="secondary",
+            width=35
+        ).pack(pady=5)
+        
+        ttk.Button(
+            analysis_section,
+            text="Outliers (IQR)",
+            command=self._detect_outliers,
+            bootstyle="danger",
+            width=35
+        ).pack(pady=5)
+        
+        ttk.Separator(analysis_section, bootstyle="primary").pack(fill=X, pady=10)
+        
+        ttk.Button(
+            analysis_section,
+            text="RAPPORT COMPLET",
+            command=self._full_quality_report,
+            bootstyle="success",
+            width=35
+        ).pack(pady=5)
+        
+        # Visualisations
+        viz_section = ttk.Labelframe(
+            controls_frame,
+            text="Visualisations",
+            bootstyle="secondary",
+            padding=15
+        )
+        viz_section.pack(fill=X, padx=10, pady=10)
+        
+        ttk.Button(
+            viz_section,
+            text="Ouvrir l'onglet Visualisations",
+            command=lambda: self.notebook.select(3),
+            bootstyle="info-outline",
+            width=35
+        ).pack(pady=5)
+    
+    def _create_zone4_bottom_results(self):
+        """ZONE 4: Résultats rapides"""
+        bottom_card = ttk.Labelframe(
+            self.tab_overview,
+            text=" Aperçu rapide des résultats",
+            bootstyle="success",
+            padding=10
+        )
+        bottom_card.pack(fill=BOTH, padx=10, pady=(5, 10))
+        bottom_card.configure(height=250)
+        
+        header = ttk.Frame(bottom_card)
+        header.pack(fill=X, pady=(0, 10))
+        
+        ttk.Label(
+            header,
+            text="Aperçu rapide",
+            font=("Segoe UI", 12, "bold")
+        ).pack(side=LEFT)
+        
+        self.status_badge = ttk.Label(
+            header,
+            text="Prêt",
+            bootstyle="success",
+            font=("Segoe UI", 9)
+        )
+        self.status_badge.pack(side=RIGHT, padx=10)
+        
+        ttk.Button(
+            header,
+            text="Voir les résultats détaillés",
+            command=lambda: self.notebook.select(1),
+            bootstyle="primary-outline"
+        ).pack(side=RIGHT)
+        
+        results_container = ttk.Frame(bottom_card)
+        results_container.pack(fill=BOTH, expand=YES)
+        
+        scrollbar = ttk.Scrollbar(results_container, bootstyle="success-round")
+        scrollbar.pack(side=RIGHT, fill=Y)
+        
+        self.results_text = tk.Text(
+            results_container,
+            wrap=WORD,
+            font=("Consolas", 9),
+            yscrollcommand=scrollbar.set,
+            relief=FLAT,
+            bg='#f8f9fa',
+            fg='#212529',
+            padx=15,
+            pady=15
+        )
+        self.results_text.pack(fill=BOTH, expand=YES)
+        scrollbar.config(command=self.results_text.yview)
+        
+        welcome = """
+                      ZONE 4 - APERÇU RAPIDE DES RÉSULTATS
+
+Lancez des analyses pour voir les résultats ici.
+Les résultats complets s'accumulent dans l'onglet "Résultats & Exports".
+"""
+        self.results_text.insert('1.0', welcome)
+        self.results_text.config(state=DISABLED)
+    
+    # ============================================================
+    # ONGLET 2: RÉSULTATS & EXPORTS
+    # ============================================================
+    
+    def _create_results_tab(self):
+        """Onglet Résultats avec accumulation"""
+        
+        # Header stylisé
+        self._create_styled_header(
+            self.tab_results,
+            "RÉSULTATS D'ANALYSE",
+            "Accumulation progressive - Exports professionnels - Partage facile"
+        )
+        
+        # Container principal
+        main_container = ttk.Frame(self.tab_results)
+        main_container.pack(fill=BOTH, expand=YES, padx=20, pady=20)
+        
+        # Colonne gauche
+        left_column = ttk.Frame(main_container)
+        left_column.pack(side=LEFT, fill=BOTH, expand=YES, padx=(0, 10))
+        
+        info_card = ttk.Labelframe(
+            left_column,
+            text="Informations du fichier analysé",
+            bootstyle="info",
+            padding=20
+        )
+        info_card.pack(fill=X, pady=(0, 15))
+        
+        info_grid = ttk.Frame(info_card)
+        info_grid.pack(fill=X)
+        
+        self.result_filename_lbl = self._create_info_row(info_grid, "Fichier:", "Aucun fichier", 0)
+        self.result_dimensions_lbl = self._create_info_row(info_grid, "Dimensions:", "—", 1)
+        self.result_types_lbl = self._create_info_row(info_grid, "Types:", "—", 2)
+        self.result_quality_lbl = self._create_info_row(info_grid, "Qualité:", "—", 3)
+        
+        results_card = ttk.Labelframe(
+            left_column,
+            text="Résultats accumulés",
+            bootstyle="success",
+            padding=15
+        )
+        results_card.pack(fill=BOTH, expand=YES)
+        
+        results_scroll_frame = ttk.Frame(results_card)
+        results_scroll_frame.pack(fill=BOTH, expand=YES)
+        
+        results_scrollbar = ttk.Scrollbar(results_scroll_frame, bootstyle="success-round")
+        results_scrollbar.pack(side=RIGHT, fill=Y)
+        
+        self.results_detail_text = tk.Text(
+            results_scroll_frame,
+            wrap=WORD,
+            font=("Consolas", 10),
+            yscrollcommand=results_scrollbar.set,
+            relief=FLAT,
+            bg='#ffffff',
+            fg='#1e293b',
+            padx=20,
+            pady=20
+        )
+        self.results_detail_text.pack(fill=BOTH, expand=YES)
+        results_scrollbar.config(command=self.results_detail_text.yview)
+        
+        default_msg = """
+                    ESPACE RÉSULTATS ACCUMULÉS
+
+Lancez des analyses depuis l'onglet "Vue d'ensemble"
+   Chaque analyse s'ajoutera automatiquement ici
+
+Avantages:
+   - Toutes vos analyses dans un seul rapport
+   - Export facile en Word, PDF ou Excel
+   - Construction progressive de votre rapport
+"""
+        self.results_detail_text.insert('1.0', default_msg)
+        self.results_detail_text.config(state=DISABLED)
+        
+        # Colonne droite
+        right_column = ttk.Frame(main_container)
+        right_column.pack(side=RIGHT, fill=Y, padx=(10, 0))
+        right_column.configure(width=350)
+        
+        status_card = ttk.Labelframe(
+            right_column,
+            text="Statut",
+            bootstyle="warning",
+            padding=20
+        )
+        status_card.pack(fill=X, pady=(0, 15))
+        
+        self.result_status_label = ttk.Label(
+            status_card,
+            text="En attente...",
+            font=("Segoe UI", 11),
+            bootstyle="secondary",
+            wraplength=280
+        )
+        self.result_status_label.pack(pady=10)
+        
+        self.result_analysis_type_label = ttk.Label(
+            status_card,
+            text="Analyses: 0",
+            font=("Segoe UI", 9),
+            bootstyle="secondary"
+        )
+        self.result_analysis_type_label.pack()
+        
+        ttk.Separator(right_column, bootstyle="secondary").pack(fill=X, pady=15)
+        
+        export_card = ttk.Labelframe(
+            right_column,
+            text="Exporter",
+            bootstyle="primary",
+            padding=20
+        )
+        export_card.pack(fill=X, pady=(0, 15))
+        
+        ttk.Label(
+            export_card,
+            text="Choisissez votre format:",
+            font=("Segoe UI", 11, "bold"),
+            bootstyle="primary"
+        ).pack(pady=(0, 15))
+        
+        word_frame = ttk.Frame(export_card)
+        word_frame.pack(fill=X, pady=10)
+        ttk.Button(
+            word_frame,
+            text="Export Word (.docx)",
+            command=self._export_word,
+            bootstyle="info",
+            width=30
+        ).pack()
+        ttk.Label(word_frame, text="Format professionnel", font=("Segoe UI", 9), bootstyle="secondary").pack(pady=(3, 0))
+        
+        pdf_frame = ttk.Frame(export_card)
+        pdf_frame.pack(fill=X, pady=10)
+        ttk.Button(
+            pdf_frame,
+            text="Export PDF",
+            command=self._export_pdf,
+            bootstyle="danger",
+            width=30
+        ).pack()
+        ttk.Label(pdf_frame, text="Format universel", font=("Segoe UI", 9), bootstyle="secondary").pack(pady=(3, 0))
+        
+        both_frame = ttk.Frame(export_card)
+        both_frame.pack(fill=X, pady=10)
+        ttk.Button(
+            both_frame,
+            text="Export Word + PDF",
+            command=self._export_word_pdf,
+            bootstyle="primary",
+            width=30
+        ).pack()
+        ttk.Label(both_frame, text="Les deux rapports en parallèle", font=("Segoe UI", 9), bootstyle="secondary").pack(pady=(3, 0))
+        
+        excel_frame = ttk.Frame(export_card)
+        excel_frame.pack(fill=X, pady=10)
+        ttk.Button(
+            excel_frame,
+            text="Export Excel (.xlsx)",
+            command=self._export_excel,
+            bootstyle="success",
+            width=30
+        ).pack()
+        ttk.Label(excel_frame, text="Données + statistiques (ou Parquet / CSV.gz)", font=("Segoe UI", 9), bootstyle="secondary").pack(pady=(3, 0))
+        
+        ttk.Separator(right_column, bootstyle="secondary").pack(fill=X, pady=15)
+        
+        actions_card = ttk.Labelframe(
+            right_column,
+            text="Actions",
+            bootstyle="info",
+            padding=20
+        )
+        actions_card.pack(fill=X)
+        
+        ttk.Button(
+            actions_card,
+            text="Actualiser",
+            command=self._refresh_results_tab,
+            bootstyle="info",
+            width=30
+        ).pack(pady=5)
+        
+        ttk.Button(
+            actions_card,
+            text="Effacer tout",
+            command=self._clear_accumulated_results,
+            bootstyle="danger",
+            width=30
+        ).pack(pady=5)
+        
+        ttk.Button(
+            actions_card,
+            text="Vue d'ensemble",
+            command=lambda: self.notebook.select(0),
+            bootstyle="secondary",
+            width=30
+        ).pack(pady=5)
+    
+    def _create_info_row(self, parent, label_text, value_text, row):
+        """Créer ligne d'info"""
+        row_frame = ttk.Frame(parent)
+        row_frame.grid(row=row, column=0, sticky=W, pady=8)
+        
+        ttk.Label(
+            row_frame,
+            text=label_text,
+            font=("Segoe UI", 10, "bold"),
+            bootstyle="info",
+            width=15
+        ).pack(side=LEFT, anchor=W)
+        
+        value_label = ttk.Label(
+            row_frame,
+            text=value_text,
+            font=("Segoe UI", 10, "bold"),
+            bootstyle="primary"
+        )
+        value_label.pack(side=LEFT, anchor=W, padx=10)
+        
+        return value_label
+    
+    # ============================================================
+    # ACCUMULATION DES RÉSULTATS
+    # ============================================================
+    
+    def _add_analysis_to_accumulator(self, result: AnalysisResult, refresh: bool = True):
+        """Ajouter (ou remplacer) une analyse dans l'accumulateur"""
+        self.accumulated_reports.add(result)
+        self._dirty_results.add(result.type)
+        
+        if refresh:
+            self._update_accumulated_results()
+            self._save_analysis_cache()
+    
+    def _update_accumulated_results(self):
+        """Mettre à jour l'onglet Résultats : seules les sections ajoutées ou remplacées sont réécrites"""
+        if not self.accumulated_reports:
+            return
+        
+        text = self.results_detail_text
+        header = accumulated_header(self.filename, len(self.accumulated_reports))
+        text.config(state=NORMAL)
+        if not self._result_tags:
+            # Premier affichage (nouveau fichier, cache restauré, résultats effacés)
+            text.delete('1.0', END)
+            text.insert('1.0', header, 'resultats-entete')
+            text.insert(END, ACCUMULATED_FOOTER, 'resultats-pied')
+            self._dirty_results = set(self.accumulated_reports.types())
+        else:
+            text.delete('resultats-entete.first', 'resultats-entete.last')
+            text.insert('1.0', header, 'resultats-entete')
+        
+        for result in self.accumulated_reports:
+            if result.type not in self._dirty_results:
+                continue
+            number = self.accumulated_reports.position(result.type) + 1
+            section = section_text(number, result)
+            tag = self._result_tags.get(result.type)
+            if tag is None:
+                tag = self._result_tags[result.type] = f"analyse-{number}"
+                text.insert('resultats-pied.first', section, tag)
+            else:
+                start = text.index(f'{tag}.first')
+                text.delete(start, f'{tag}.last')
+                text.insert(start, section, tag)
+        text.config(state=DISABLED)
+        self._dirty_results.clear()
+        
+        self.result_status_label.config(
+            text=f"{len(self.accumulated_reports)} analyse(s)",
+            bootstyle="success"
+        )
+        self.result_analysis_type_label.config(
+            text=f"Analyses: {len(self.accumulated_reports)}"
+        )
+    
+    def _clear_accumulated_results(self):
+        """Effacer résultats accumulés"""
+        if not self.accumulated_reports:
+            messagebox.showinfo("Info", "Aucun résultat à effacer")
+            return
+        
+        if messagebox.askyesno(
+            "Confirmation",
+            f"Effacer les {len(self.accumulated_reports)} analyse(s) ?"
+        ):
+            self.accumulated_reports = ResultAccumulator()
+            self._result_tags = {}
+            self._dirty_results = set()
+            self._save_analysis_cache()
+            
+            self.results_detail_text.config(state=NORMAL)
+            self.results_detail_text.delete('1.0', END)
+            default_msg = """
+                    RÉSULTATS EFFACÉS
+
+Lancez de nouvelles analyses depuis "Vue d'ensemble".
+"""
+            self.results_detail_text.insert('1.0', default_msg)
+            self.results_detail_text.config(state=DISABLED)
+            
+            self.result_status_label.config(
+                text="En attente...",
+                bootstyle="secondary"
+            )
+            
+            ToastNotification(
+                title="Effacé",
+                message="Résultats supprimés",
+                duration=2000,
+                bootstyle="info"
+            ).show_toast()
+    
+    def _refresh_results_tab(self):
+        """Actualiser"""
+        if self.data is None:
+            messagebox.showinfo("Info", "Aucun fichier chargé")
+            return
+        
+        self._update_results_tab_info()
+        
+        ToastNotification(
+            title="Actualisé",
+            message="Résultats mis à jour",
+            duration=2000,
+            bootstyle="success"
+        ).show_toast()
+    
+    def _update_results_tab_info(self):
+        """MAJ infos onglet résultats"""
+        if self.data is None:
+            return
+        
+        self.result_filename_lbl.config(text=self.filename)
+        self.result_dimensions_lbl.config(
+            text=f"{self._row_count():,} × {self.data.shape[1]}"
+        )
+        self.result_types_lbl.config(
+            text=f"N:{len(self.numeric_vars)} C:{len(self.categorical_vars)} B:{len(self.boolean_vars)}"
+        )
+        
+        quality_score = self._calculate_quality_score()
+        if quality_score >= 90:
+            grade = "EXCELLENT"
+            style = "success"
+        elif quality_score >= 75:
+            grade = "BON"
+            style = "warning"
+        elif quality_score >= 60:
+            grade = "MOYEN"
+            style = "warning"
+        else:
+            grade = "FAIBLE"
+            style = "danger"
+        
+        self.result_quality_lbl.config(
+            text=f"{quality_score:.1f}/100 {grade}",
+            bootstyle=style
+        )
+    
+    # ============================================================
+    # ONGLET 3: STATISTIQUES
+    # ============================================================
+    
+    def _create_stats_tab(self):
+        """Onglet Statistiques"""
+        
+        # Header stylisé
+        self._create_styled_header(
+            self.tab_stats,
+            "STATISTIQUES DESCRIPTIVES",
+            "Analyses détaillées - Numériques et Catégorielles"
+        )
+        
+        config_frame = ttk.Labelframe(
+            self.tab_stats,
+            text="Configuration",
+            bootstyle="info",
+            padding=15
+        )
+        config_frame.pack(fill=X, padx=20, pady=(20, 20))
+        
+        row1 = ttk.Frame(config_frame)
+        row1.pack(fill=X, pady=5)
+        
+        ttk.Label(row1, text="Variable:", font=("Segoe UI", 10)).pack(side=LEFT, padx=5)
+        
+        self.stats_var_combo = ttk.Combobox(row1, width=30, state='readonly')
+        self.stats_var_combo.pack(side=LEFT, padx=10)
+        
+        ttk.Button(
+            row1,
+            text="Calculer",
+            command=self._calculate_stats,
+            bootstyle="primary"
+        ).pack(side=LEFT, padx=10)
+        
+        ttk.Button(
+            row1,
+            text="Toutes",
+            command=self._calculate_all_stats,
+            bootstyle="success-outline"
+        ).pack(side=LEFT)
+        
+        ttk.Checkbutton(
+            row1,
+            text="Mode approché (sketches)",
+            variable=self.approximate_stats,
+            bootstyle="info-round-toggle"
+        ).pack(side=LEFT, padx=20)
+        
+        results_frame = ttk.Labelframe(
+            self.tab_stats,
+            text="Résultats",
+            bootstyle="primary",
+            padding=15
+        )
+        results_frame.pack(fill=BOTH, expand=YES, padx=20, pady=(0, 20))
+        
+        scrollbar = ttk.Scrollbar(results_frame, bootstyle="primary-round")
+        scrollbar.pack(side=RIGHT, fill=Y)
+        
+        self.stats_text = tk.Text(
+            results_frame,
+            wrap=WORD,
+            font=("Consolas", 9),
+            yscrollcommand=scrollbar.set,
+            relief=FLAT,
+            bg='#f8f9fa',
+            fg='#212529',
+            padx=15,
+            pady=15
+        )
+        self.stats_text.pack(fill=BOTH, expand=YES)
+        scrollbar.config(command=self.stats_text.yview)
+        
+        welcome = """
+           STATISTIQUES DESCRIPTIVES
+
+Sélectionnez une variable et cliquez sur "Calculer".
+Supporte les variables numériques ET catégorielles.
+"""
+        self.stats_text.insert('1.0', welcome)
+        self.stats_text.config(state=DISABLED)
+    
+    # ============================================================
+    # ONGLET 4: VISUALISATIONS
+    # ============================================================
+    
+    
+    def _create_viz_tab(self):
+        """Onglet Visualisations avec scroll sur le graphique"""
+        
+        # Header stylisé
+        self._create_styled_header(
+            self.tab_viz,
+            "VISUALISATIONS",
+            "Graphiques interactifs - Exploration visuelle"
+        )
+        
+        controls = ttk.Labelframe(
+            self.tab_viz,
+            text="Configuration",
+            bootstyle="info",
+            padding=15
+        )
+        controls.pack(fill=X, padx=20, pady=(20, 10))
+        
+        row1 = ttk.Frame(controls)
+        row1.pack(fill=X, pady=5)
+        
+        ttk.Label(row1, text="Type:", width=15).pack(side=LEFT, padx=5)
+        
+        self.viz_type = ttk.Combobox(
+            row1,
+            values=list(PLOT_TYPES),
+            state='readonly',
+            width=25
+        )
+        self.viz_type.pack(side=LEFT, padx=10)
+        self.viz_type.current(0)
+        
+        row2 = ttk.Frame(controls)
+        row2.pack(fill=X, pady=5)
+        
+        ttk.Label(row2, text="Variable X:", width=15).pack(side=LEFT, padx=5)
+        self.viz_var1 = ttk.Combobox(row2, width=20, state='readonly')
+        self.viz_var1.pack(side=LEFT, padx=10)
+        
+        ttk.Label(row2, text="Variable Y:", width=15).pack(side=LEFT, padx=5)
+        self.viz_var2 = ttk.Combobox(row2, width=20, state='readonly')
+        self.viz_var2.pack(side=LEFT, padx=10)
+        
+        row3 = ttk.Frame(controls)
+        row3.pack(fill=X, pady=5)
+        
+        ttk.Label(row3, text="Agréger au-delà de:", width=15).pack(side=LEFT, padx=5)
+        self.plot_aggregation_combo = ttk.Combobox(
+            row3,
+            values=["50 000", "200 000", "1 000 000", "Jamais"],
+            width=20
+        )
+        self.plot_aggregation_combo.pack(side=LEFT, padx=10)
+        self.plot_aggregation_combo.set(f"{AGGREGATION_THRESHOLD:,}".replace(',', ' '))
+        ttk.Label(row3, text="points (densité 2D / histogramme pré-calculé)", bootstyle="secondary").pack(side=LEFT)
+        
+        row4 = ttk.Frame(controls)
+        row4.pack(fill=X, pady=5)
+        
+        ttk.Label(row4, text="Corrélation:", width=15).pack(side=LEFT, padx=5)
+        self.corr_method_combo = ttk.Combobox(row4, values=["Pearson", "Spearman"], width=20, state='readonly')
+        self.corr_method_combo.pack(side=LEFT, padx=10)
+        self.corr_method_combo.current(0)
+        ttk.Label(row4, text="toutes les variables numériques, ordre regroupé", bootstyle="secondary").pack(side=LEFT)
+        
+        ttk.Button(
+            controls,
+            text="Générer",
+            command=self._generate_plot,
+            bootstyle="success",
+            width=30
+        ).pack(pady=10)
+        
+        # Contrôles de zoom
+        zoom_controls = ttk.Frame(controls)
+        zoom_controls.pack(fill=X, pady=5)
+        
+        ttk.Label(zoom_controls, text="Zoom graphique:", font=("Segoe UI", 10, "bold")).pack(side=LEFT, padx=5)
+        
+        self.viz_zoom_label = ttk.Label(zoom_controls, text="100%", bootstyle="info")
+        self.viz_zoom_label.pack(side=RIGHT, padx=5)
+        
+        ttk.Button(
+            zoom_controls,
+            text="−",
+            command=self._viz_zoom_out,
+            bootstyle="secondary",
+            width=3
+        ).pack(side=RIGHT, padx=2)
+        
+        ttk.Button(
+            zoom_controls,
+            text="+",
+            command=self._viz_zoom_in,
+            bootstyle="secondary",
+            width=3
+        ).pack(side=RIGHT, padx=2)
+        
+        ttk.Button(
+            zoom_controls,
+            text="Reset",
+            command=self._viz_zoom_reset,
+            bootstyle="info-outline",
+            width=6
+        ).pack(side=RIGHT, padx=5)
+        
+        # SOLUTION : Container avec scrollbars pour le graphique uniquement
+        plot_container = ttk.Frame(self.tab_viz)
+        plot_container.pack(fill=BOTH, expand=YES, padx=20, pady=(0, 20))
+        
+        # Canvas scrollable
+        self.plot_canvas = tk.Canvas(plot_container, bg='white', highlightthickness=0)
+        
+        # Scrollbars
+        v_scrollbar = ttk.Scrollbar(plot_container, orient=VERTICAL, command=self.plot_canvas.yview, bootstyle="primary-round")
+        v_scrollbar.pack(side=RIGHT, fill=Y)
+        
+        h_scrollbar = ttk.Scrollbar(plot_container, orient=HORIZONTAL, command=self.plot_canvas.xview, bootstyle="primary-round")
+        h_scrollbar.pack(side=BOTTOM, fill=X)
+        
+        self.plot_canvas.pack(side=LEFT, fill=BOTH, expand=YES)
+        self.plot_canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        
+        # Frame pour le graphique DANS le canvas
+        self.plot_frame = ttk.Frame(self.plot_canvas, style='Card.TFrame')
+        self.plot_canvas_window = self.plot_canvas.create_window((0, 0), window=self.plot_frame, anchor="nw")
+        
+        # Fonction pour mettre à jour la zone scrollable
+        def configure_plot_scroll(event=None):
+            self.plot_canvas.configure(scrollregion=self.plot_canvas.bbox("all"))
+        
+        self.plot_frame.bind("<Configure>", configure_plot_scroll)
+        
+        # Adapter la largeur du frame au canvas
+        def on_canvas_configure(event):
+            canvas_width = event.width
+            self.plot_canvas.itemconfig(self.plot_canvas_window, width=canvas_width)
+        
+        self.plot_canvas.bind("<Configure>", on_canvas_configure)
+
+    def _viz_zoom_in(self):
+        """Zoom avant"""
+        self.viz_zoom_factor = min(3.0, self.viz_zoom_factor + 0.2)
+        self._update_viz_zoom()
+
+    def _viz_zoom_out(self):
+        """Zoom arrière"""
+        self.viz_zoom_factor = max(0.5, self.viz_zoom_factor - 0.2)
+        self._update_viz_zoom()
+
+    def _viz_zoom_reset(self):
+        """Reset zoom"""
+        self.viz_zoom_factor = 1.0
+        self._update_viz_zoom()
+
+    def _update_viz_zoom(self):
+        """Appliquer zoom (figure en cache redimensionnée, sans recalcul)"""
+        self.viz_zoom_label.config(text=f"{int(self.viz_zoom_factor * 100)}%")
+        entry = self.plot_cache.get(self.current_plot_key) if self.current_plot_key else None
+        if entry is not None and entry.get('canvas') is not None:
+            self._show_cached_plot(entry)
+        elif self.current_fig:
+            self._generate_plot()
+
+    def _init_plotting(self):
+        """Configuration matplotlib (une fois, au premier graphique : import coûteux évité au démarrage)"""
+        if self._plotting_ready:
+            return
+        with self.tracer.span("Chargement de matplotlib", 'graphiques'):
+            import matplotlib
+            matplotlib.use('TkAgg')
+            import seaborn as sns
+            sns.set_style("whitegrid")
+            matplotlib.rcParams['figure.facecolor'] = 'white'
+        self._plotting_ready = True
+    
+    def _generate_plot(self):
+        """Générer graphique (ou réafficher celui du cache)"""
+        if self.data is None:
+            messagebox.showwarning("Attention", "Veuillez d'abord charger des données")
+            return
+        
+        self._init_plotting()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from matplotlib.figure import Figure
+        from eda_desk.plots import draw_plot, prepare_plot
+        
+        viz_type = self.viz_type.get()
+        plot_data = self._analysis_data()
+        filtered = plot_data is not self.data
+        variables = self._plot_variables(viz_type)
+        aggregate = self._plot_is_large(plot_data)
+        
+        # Clé : type, variables, version des données (+ filtre actif, mode agrégé)
+        options = self.corr_method_combo.get().lower() if viz_type == "Matrice de corrélation" else None
+        key = (viz_type, variables, options, self.data_version,
+               tuple(self.grid_filters) if filtered else (), aggregate)
+        entry = self.plot_cache.get(key)
+        if entry is not None and entry.get('canvas') is not None:
+            self._show_cached_plot(entry)
+            print(f"✓ Graphique réaffiché depuis le cache : {viz_type}")
+            return
+        
+        try:
+            start = time.perf_counter()
+            with self.tracer.span(f"{viz_type} : préparation", 'graphiques', rows=len(plot_data), aggregate=aggregate):
+                spec = entry['spec'] if entry is not None else prepare_plot(
+                    viz_type, variables, plot_data, self.numeric_vars, aggregate, options)
+            prepare_seconds = time.perf_counter() - start
+            
+            with self.tracer.span(f"{viz_type} : tracé", 'graphiques'):
+                # Taille avec zoom - en pixels pour être sûr
+                dpi = 100
+                fig_width_inches = 10 * self.viz_zoom_factor
+                fig_height_inches = 6 * self.viz_zoom_factor
+            
+                # Créer la figure
+                fig = Figure(figsize=(fig_width_inches, fig_height_inches), facecolor='white', dpi=dpi)
+                self.current_fig = fig
+                ax = fig.add_subplot(111)
+                draw_plot(fig, ax, spec, f" (filtré : {len(plot_data):,} lignes)" if filtered else "")
+            
+                # Affichage avec tight_layout
+                fig.tight_layout()
+            
+                # Créer le canvas matplotlib (+ barre zoom/déplacement) dans son propre cadre
+                container = ttk.Frame(self.plot_frame)
+                canvas = FigureCanvasTkAgg(fig, master=container)
+                canvas.draw()
+                toolbar = NavigationToolbar2Tk(canvas, container, pack_toolbar=False)
+                toolbar.update()
+                toolbar.pack(side=BOTTOM, fill=X)
+            
+            self.current_plot_key = key
+            self._show_cached_plot(self.plot_cache.put(key, spec, fig, canvas), resize=False)
+            
+            print(f"✓ Graphique généré : {viz_type} ({fig_width_inches}x{fig_height_inches} inches, {dpi} dpi, "
+                  f"préparation {prepare_seconds:.2f} s)")
+            
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur:\n{str(e)}")
+            print(f"✗ Erreur : {e}")
+            import traceback
+            traceback.print_exc()      
+    
+    def _plot_variables(self, viz_type: str) -> Tuple:
+        """Variables utilisées par le graphique (partie de la clé de cache)"""
+        if viz_type == "Matrice de corrélation":
+            return tuple(self.numeric_vars)
+        if viz_type == "Nuage de points":
+            return (self.viz_var1.get(), self.viz_var2.get())
+        return (self.viz_var1.get(),)
+    
+    def _show_cached_plot(self, entry: Dict, resize: bool = True):
+        """Afficher une figure du cache à la taille du zoom courant (sans recalcul ni nouveau canvas)"""
+        canvas_widget = entry['canvas'].get_tk_widget()
+        container = canvas_widget.master
+        
+        # Masquer les autres graphiques (conservés dans le cache)
+        for widget in self.plot_frame.winfo_children():
+            if widget is not container:
+                widget.pack_forget()
+        
+        if resize:
+            fig = entry['figure']
+            width, height = 10 * self.viz_zoom_factor, 6 * self.viz_zoom_factor
+            fig.set_size_inches(width, height)
+            canvas_widget.config(width=int(width * fig.dpi), height=int(height * fig.dpi))
+            fig.tight_layout()
+            entry['canvas'].draw_idle()
+            self.current_fig = fig
+            self.current_plot_key = entry['key']
+        
+        # Obtenir le widget et le packager
+        canvas_widget.pack(fill=BOTH, expand=YES)
+        container.pack(fill=BOTH, expand=YES)
+        
+        # Mettre à jour la zone scrollable après ajout du graphique
+        self.plot_frame.update_idletasks()
+        self.plot_canvas.configure(scrollregion=self.plot_canvas.bbox("all"))
+        
+        # Scroller en haut
+        self.plot_canvas.yview_moveto(0)
+    
+    def _release_plot(self, entry: Dict):
+        """Éviction du cache : détruire le canvas Tk de la figure (et sa barre d'outils)"""
+        entry['canvas'].get_tk_widget().master.destroy()
+    
+    def _plot_is_large(self, plot_data: pd.DataFrame) -> bool:
+        """Agréger le graphique ? (seuil saisi dans l'onglet Visualisations)"""
+        text = self.plot_aggregation_combo.get().replace(' ', '').replace('\u202f', '')
+        if not text or not text.isdigit():
+            return False
+        return len(plot_data) > int(text)
+    
+        # ============================================================
+        # ONGLET 5: DONNÉES
+        # ============================================================
+        
+    def _create_data_tab(self):
+        """Onglet Données"""
+            
+        # Header stylisé
+        self._create_styled_header(
+            self.tab_data,
+            "DONNÉES COMPLÈTES",
+            "Vue tabulaire - Toutes les lignes"
+        )
+        
+        filter_frame = ttk.Labelframe(
+            self.tab_data,
+            text="Tri et filtres",
+            bootstyle="info",
+            padding=10
+        )
+        filter_frame.pack(fill=X, padx=20, pady=(20, 0))
+        
+        filter_row = ttk.Frame(filter_frame)
+        filter_row.pack(fill=X)
+        
+        ttk.Label(filter_row, text="Colonne:").pack(side=LEFT, padx=5)
+        self.filter_column_combo = ttk.Combobox(filter_row, width=20, state='readonly')
+        self.filter_column_combo.pack(side=LEFT, padx=5)
+        
+        self.filter_op_combo = ttk.Combobox(filter_row, values=FILTER_OPERATORS, width=6, state='readonly')
+        self.filter_op_combo.pack(side=LEFT, padx=5)
+        self.filter_op_combo.current(0)
+        
+        self.filter_value_entry = ttk.Entry(filter_row, width=14)
+        self.filter_value_entry.pack(side=LEFT, padx=5)
+        ttk.Label(filter_row, text="et").pack(side=LEFT)
+        self.filter_high_entry = ttk.Entry(filter_row, width=14)
+        self.filter_high_entry.pack(side=LEFT, padx=5)
+        
+        ttk.Button(
+            filter_row,
+            text="Ajouter le filtre",
+            command=self._add_grid_filter,
+            bootstyle="success"
+        ).pack(side=LEFT, padx=5)
+        
+        ttk.Button(
+            filter_row,
+            text="Réinitialiser",
+            command=self._clear_grid_filters,
+            bootstyle="danger-outline"
+        ).pack(side=LEFT, padx=5)
+        
+        self.filter_count_label = ttk.Label(filter_row, text="", bootstyle="info")
+        self.filter_count_label.pack(side=LEFT, padx=10)
+        
+        ttk.Checkbutton(
+            filter_frame,
+            text="Appliquer le filtre aux statistiques et visualisations",
+            variable=self.filter_drives_analyses,
+            bootstyle="round-toggle"
+        ).pack(anchor=W, pady=(8, 0))
+        
+        for widget in (self.filter_value_entry, self.filter_high_entry):
+            widget.bind('<KeyRelease>', self._on_filter_input)
+            widget.bind('<Return>', lambda e: self._add_grid_filter())
+        self.filter_column_combo.bind('<<ComboboxSelected>>', self._on_filter_input)
+        self.filter_op_combo.bind('<<ComboboxSelected>>', self._on_filter_input)
+        
+        info_frame = ttk.Frame(self.tab_data)
+        info_frame.pack(fill=X, padx=20, pady=(10, 0))
+        
+        self.grid_info_label = ttk.Label(
+            info_frame,
+            text="Aucune donnée chargée",
+            font=('Segoe UI', 9),
+            bootstyle="secondary"
+        )
+        self.grid_info_label.pack(side=LEFT)
+        
+        tree_frame = ttk.Frame(self.tab_data)
+        tree_frame.pack(fill=BOTH, expand=YES, padx=20, pady=(10, 20))
+        
+        # Défilement vertical géré par la fenêtre de données (grille virtualisée) :
+        # le Treeview ne contient que les lignes visibles
+        self.grid_vsb = ttk.Scrollbar(tree_frame, orient=VERTICAL, bootstyle="primary-round")
+        self.grid_vsb.pack(side=RIGHT, fill=Y)
+        
+        hsb = ttk.Scrollbar(tree_frame, orient=HORIZONTAL, bootstyle="primary-round")
+        hsb.pack(side=BOTTOM, fill=X)
+        
+        self.tree = ttk.Treeview(
+            tree_frame,
+            xscrollcommand=hsb.set,
+            show='tree headings',
+            selectmode='browse',
+            bootstyle="primary"
+        )
+        self.tree.pack(fill=BOTH, expand=YES)
+        
+        self.grid_vsb.config(command=self._grid_yview)
+        hsb.config(command=self.tree.xview)
+        
+        self.tree.bind('<Configure>', self._on_grid_configure)
+        self.tree.bind('<MouseWheel>', self._on_grid_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self._grid_scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self._grid_scroll(3))
+        self.tree.bind('<Prior>', lambda e: self._grid_scroll(pages=-1))
+        self.tree.bind('<Next>', lambda e: self._grid_scroll(pages=1))
+        self.tree.bind('<Control-Home>', lambda e: self._grid_moveto(0))
+        self.tree.bind('<Control-End>', lambda e: self._grid_moveto(1))
+    
+        # ============================================================
+        # ONGLET 6: HISTORIQUE
+        # ============================================================
+        
+    def _create_history_tab(self):
+        """Onglet Historique"""
+        
+        # Header stylisé
+        self._create_styled_header(
+            self.tab_history,
+            "HISTORIQUE",
+            "Fichiers précédemment analysés"
+        )
+        
+        btn_frame = ttk.Frame(self.tab_history)
+        btn_frame.pack(fill=X, padx=20, pady=(20, 10))
+        
+        ttk.Button(
+            btn_frame,
+            text="Actualiser",
+            command=self._load_history,
+            bootstyle="info-outline"
+        ).pack(side=LEFT, padx=5)
+        
+        ttk.Button(
+            btn_frame,
+            text="Effacer",
+            command=self._clear_history,
+            bootstyle="danger-outline"
+        ).pack(side=LEFT)
+        
+        ttk.Button(
+            btn_frame,
+            text="Exporter la trace",
+            command=self._export_history_trace,
+            bootstyle="secondary-outline"
+        ).pack(side=LEFT, padx=5)
+        
+        self.history_count_label = ttk.Label(btn_frame, text="", bootstyle="info")
+        self.history_count_label.pack(side=LEFT, padx=10)
+        
+        search_frame = ttk.Labelframe(
+            self.tab_history,
+            text="Recherche",
+            bootstyle="info",
+            padding=10
+        )
+        search_frame.pack(fill=X, padx=20, pady=(0, 10))
+        
+        ttk.Label(search_frame, text="Fichier (début, * joker):").pack(side=LEFT, padx=5)
+        self.history_name_entry = ttk.Entry(search_frame, width=20)
+        self.history_name_entry.pack(side=LEFT, padx=5)
+        ttk.Label(search_frame, text="Du (AAAA-MM-JJ):").pack(side=LEFT, padx=5)
+        self.history_from_entry = ttk.Entry(search_frame, width=12)
+        self.history_from_entry.pack(side=LEFT, padx=5)
+        ttk.Label(search_frame, text="au:").pack(side=LEFT, padx=5)
+        self.history_to_entry = ttk.Entry(search_frame, width=12)
+        self.history_to_entry.pack(side=LEFT, padx=5)
+        
+        ttk.Button(
+            search_frame,
+            text="Rechercher",
+            command=self._search_history,
+            bootstyle="success"
+        ).pack(side=LEFT, padx=5)
+        
+        ttk.Button(
+            search_frame,
+            text="Réinitialiser",
+            command=self._reset_history_search,
+            bootstyle="danger-outline"
+        ).pack(side=LEFT, padx=5)
+        
+        for widget in (self.history_name_entry, self.history_from_entry, self.history_to_entry):
+            widget.bind('<Return>', lambda e: self._search_history())
+        
+        tree_frame = ttk.Frame(self.tab_history)
+        tree_frame.pack(fill=BOTH, expand=YES, padx=20, pady=(0, 20))
+        
+        vsb = ttk.Scrollbar(tree_frame, orient=VERTICAL, bootstyle="primary-round")
+        vsb.pack(side=RIGHT, fill=Y)
+        
+        def on_history_scroll(first, last):
+            vsb.set(first, last)
+            # Page suivante chargée quand la fin de la liste devient visible
+            if float(last) >= 1.0 and self.history_has_more:
+                self.root.after_idle(self._load_history_page)
+        
+        columns = ('ID', 'Fichier', 'Date', 'Lignes', 'Colonnes', 'Score')
+        self.history_tree = ttk.Treeview(
+            tree_frame,
+            columns=columns,
+            show='headings',
+            yscrollcommand=on_history_scroll,
+            bootstyle="primary"
+        )
+        
+        for col in columns:
+            self.history_tree.heading(col, text=col)
+            self.history_tree.column(col, width=100)
+        
+        self.history_tree.pack(fill=BOTH, expand=YES)
+        vsb.config(command=self.history_tree.yview)
+        
+        self._load_history()
+        
+    # ============================================================
+    # FONCTIONS UTILITAIRES
+    # ============================================================
+    
+    def _detect_csv_dialect(self, filepath: str) -> CSVDialect:
+        """Dialecte CSV : celui de la dernière ouverture s'il est encore valide, sinon détection"""
+        with self.tracer.span("Détection du séparateur", 'chargement') as span:
+            previous = self.history_manager.get_last_dialect(filepath)
+            if previous:
+                dialect = CSVDialect.from_dict(previous)
+                if validate_dialect(filepath, dialect):
+                    span['source'] = 'historique'
+                    print(f"✓ Dialecte réutilisé pour {os.path.basename(filepath)}")
+                    return dialect
+            
+            dialect = detect_dialect(filepath)
+            span['source'] = 'détection'
+        print(f"✓ Dialecte détecté : {dialect.delimiter!r}, {dialect.encoding}, "
+              f"en-tête={dialect.has_header}, confiance={dialect.confidence:.2f}")
+        return dialect
+    
+    def _open_file(self):
+        """Ouvrir fichier CSV"""
+        filename = filedialog.askopenfilename(
+            title="Sélectionner un fichier CSV",
+            filetypes=[("Fichiers CSV", "*.csv"), ("Tous", "*.*")]
+        )
+        
+        if filename:
+            if self.loader is not None and self.loader.is_alive():
+                messagebox.showwarning("Attention", "Un chargement est déjà en cours")
+                return
+
+            try:
+                self._start_run()
+                self.csv_dialect = self._detect_csv_dialect(filename)
+
+                # Fichier déjà lu qui n'a fait que grossir : seule la fin est relue
+                self.loader = AppendCSVLoader(
+                    filename,
+                    read_kwargs=self.csv_dialect.read_kwargs(),
+                    snapshot_store=self.snapshot_store,
+                    compact=self.compact_mode.get(),
+                    history=self.history_manager,
+                    state_cache=self.analysis_cache
+                )
+                self.loader.start()
+                self._load_started = self.tracer.now()
+
+                self.load_progress['value'] = 0
+                self.cancel_load_btn.config(state=NORMAL)
+                self.status_label.config(text=f"Chargement de {os.path.basename(filename)}...")
+                self.last_load_metrics = {'ui_max_latency_ms': 0.0}
+                self._last_poll_time = time.perf_counter()
+                self.root.after(50, self._poll_loader)
+
+            except Exception as e:
+                messagebox.showerror("Erreur", f"Erreur:\n{str(e)}")
+
+    def _poll_loader(self):
+        """Dépiler les événements du chargeur (thread Tk uniquement)"""
+        loader = self.loader
+        if loader is None:
+            return
+
+        # Latence de la boucle Tk pendant le chargement
+        now = time.perf_counter()
+        latency_ms = (now - self._last_poll_time) * 1000
+        self._last_poll_time = now
+        self.last_load_metrics['ui_max_latency_ms'] = max(self.last_load_metrics.get('ui_max_latency_ms', 0.0), latency_ms)
+
+        while True:
+            try:
+                kind, payload = loader.events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'progress':
+                pct = payload['bytes_read'] / payload['total_bytes'] * 100 if payload['total_bytes'] else 100
+                self.load_progress['value'] = pct
+                self.status_label.config(
+                    text=f"Chargement : {payload['rows']:,} lignes - "
+                         f"{format_bytes(payload['bytes_read'])} / {format_bytes(payload['total_bytes'])} "
+                         f"({payload['elapsed']:.1f} s)"
+                )
+            elif kind == 'done':
+                self._finish_loading()
+                if isinstance(payload, StreamingSummary):
+                    self._on_stream_analyzed(payload, loader)
+                else:
+                    self._on_csv_loaded(payload, loader)
+                return
+            elif kind == 'cancelled':
+                self._finish_loading()
+                self.status_label.config(text="Chargement annulé")
+                return
+            elif kind == 'error':
+                self._finish_loading()
+                self.status_label.config(text="Erreur de chargement")
+                messagebox.showerror("Erreur", f"Erreur:\n{str(payload)}")
+                return
+
+        self.root.after(50, self._poll_loader)
+
+    def _finish_loading(self):
+        """Remettre la barre de statut au repos"""
+        self.loader = None
+        self.cancel_load_btn.config(state=DISABLED)
+        self.load_progress['value'] = 0
+
+    def _cancel_loading(self):
+        """Annuler le chargement en cours"""
+        if self.loader is not None and self.loader.is_alive():
+            self.loader.cancel()
+            self.status_label.config(text="Annulation en cours...")
+
+    def _cancel_background_task(self):
+        """Annuler le chargement, le rapport ou l'export de données en cours"""
+        self._cancel_loading()
+        if isinstance(self.export_job, DataExportJob) and self.export_job.is_alive():
+            self.export_job.cancel()
+            self.status_label.config(text="Annulation de l'export...")
+        if self.analysis_scheduler is not None and self.analysis_scheduler.running:
+            self.analysis_scheduler.cancel()
+            self.status_label.config(text="Annulation en cours...")
+
+    def _on_csv_loaded(self, data: pd.DataFrame, loader: ChunkedCSVLoader):
+        """Installer le DataFrame assemblé par le chargeur"""
+        try:
+            self._save_dataset_state(run=False)
+            self.data = data
+            self.filename = os.path.basename(loader.filepath)
+            self.filepath = loader.filepath
+            separator = loader.sep
+            self.load_params = dict(loader.snapshot_params)
+            self.last_load_metrics.update(loader.metrics)
+            append_result = getattr(loader, 'append_result', None)
+            self._record_load_spans(loader.metrics, append_result)
+
+            self._reset_analysis_state()
+            restored = self._restore_cached_analyses()
+            merged = not restored and append_result is not None and self._merge_appended_analyses(append_result)
+            if self.profile is None:
+                # Calculé par le chargeur, hors du thread Tk
+                self.profile = loader.profile
+
+            sep_name = {
+                ',': 'virgule',
+                ';': 'point-virgule',
+                '\t': 'tabulation',
+                '|': 'barre',
+                ' ': 'espace'
+            }.get(separator, separator)
+
+            self._detect_variable_types()
+            self._update_ui_after_load()
+            self._add_to_history()
+            self._update_results_tab_info()
+            if restored:
+                self._update_accumulated_results()
+            self._save_append_state(append_result)
+            self._register_dataset()
+
+            metrics = self.last_load_metrics
+            if metrics.get('source') == 'snapshot':
+                source = "instantané"
+            elif metrics.get('source') == 'append':
+                source = (f"+{metrics['appended_rows']:,} lignes ajoutées, "
+                          f"{format_bytes(metrics['bytes_parsed'])} lus")
+            else:
+                source = f"{metrics['chunks']} blocs"
+            self.status_label.config(
+                text=f"{metrics['rows']:,} lignes chargées en {metrics['load_seconds']:.2f} s "
+                     f"({source}, latence UI max {metrics['ui_max_latency_ms']:.0f} ms)"
+            )
+            print(f"✓ Chargement : {self.filename} - {metrics['rows']:,} lignes, "
+                  f"{metrics['load_seconds']:.2f} s, latence UI max {metrics['ui_max_latency_ms']:.0f} ms")
+            if metrics.get('memory_after') is not None:
+                self._report_memory_compaction(metrics.get('memory_before'), metrics['memory_after'])
+            if restored:
+                self._notify_cache_restored()
+            elif merged:
+                self.status_label.config(
+                    text=f"{self.status_label.cget('text')} - analyses précédentes mises à jour"
+                )
+
+            ToastNotification(
+                title="Succès",
+                message=f"{self.data.shape[0]:,} lignes - Sep: {sep_name}",
+                duration=3000,
+                bootstyle="success"
+            ).show_toast()
+
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur:\n{str(e)}")
+
+    def _open_file_streaming(self):
+        """Analyser un CSV plus gros que la mémoire (résumés bloc par bloc, aperçu seul en mémoire)"""
+        filename = filedialog.askopenfilename(
+            title="Sélectionner un fichier CSV volumineux",
+            filetypes=[("Fichiers CSV", "*.csv"), ("Tous", "*.*")]
+        )
+        
+        if filename:
+            if self.loader is not None and self.loader.is_alive():
+                messagebox.showwarning("Attention", "Un chargement est déjà en cours")
+                return
+            
+            try:
+                self._start_run()
+                self.csv_dialect = self._detect_csv_dialect(filename)
+                self.loader = StreamingAnalyzer(filename, read_kwargs=self.csv_dialect.read_kwargs())
+                self.loader.start()
+                self._load_started = self.tracer.now()
+                
+                self.load_progress['value'] = 0
+                self.cancel_load_btn.config(state=NORMAL)
+                self.status_label.config(text=f"Analyse en flux de {os.path.basename(filename)}...")
+                self.last_load_metrics = {'ui_max_latency_ms': 0.0}
+                self._last_poll_time = time.perf_counter()
+                self.root.after(50, self._poll_loader)
+            
+            except Exception as e:
+                messagebox.showerror("Erreur", f"Erreur:\n{str(e)}")
+    
+    def _on_stream_analyzed(self, summary: StreamingSummary, loader: StreamingAnalyzer):
+        """Installer le résumé d'une analyse en flux (l'aperçu tient lieu de self.data)"""
+        try:
+            self._save_dataset_state(run=False)
+            self.data = summary.preview
+            self.filename = os.path.basename(loader.filepath)
+            self.filepath = loader.filepath
+            self.load_params = dict(loader.snapshot_params)
+            self._record_load_spans(loader.metrics)
+            
+            self._reset_analysis_state()
+            self.stream_summary = summary
+            self.profile = summary.profile()
+            restored = self._restore_cached_analyses()
+            
+            self._detect_variable_types()
+            self._update_ui_after_load()
+            self._add_to_history()
+            self._update_results_tab_info()
+            if restored:
+                self._update_accumulated_results()
+            
+            self.last_load_metrics.update(loader.metrics)
+            self._register_dataset()
+            metrics = self.last_load_metrics
+            self.status_label.config(
+                text=f"{metrics['rows']:,} lignes analysées en flux en {metrics['load_seconds']:.2f} s "
+                     f"({metrics['chunks']} blocs, aperçu de {len(self.data):,} lignes en mémoire)"
+            )
+            print(f"✓ Analyse en flux : {self.filename} - {metrics['rows']:,} lignes, "
+                  f"{metrics['chunks']} blocs, {metrics['load_seconds']:.2f} s")
+            for col, count in summary.coerced.items():
+                print(f"✗ {col} : {count:,} valeur(s) non numérique(s) ignorée(s)")
+            if restored:
+                self._notify_cache_restored()
+            
+            ToastNotification(
+                title="Analyse en flux",
+                message=f"{summary.n_rows:,} lignes résumées",
+                duration=3000,
+                bootstyle="success"
+            ).show_toast()
+        
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur:\n{str(e)}")
+    
+    def _record_load_spans(self, metrics: Dict, append_result: Optional[Dict] = None):
+        """Étapes mesurées dans le thread du chargeur, ajoutées à la trace à leur place"""
+        name = {
+            'snapshot': "Lecture de l'instantané",
+            'append': "Lecture des lignes ajoutées",
+            'stream': "Analyse en flux"
+        }.get(metrics.get('source'), "Lecture CSV")
+        start = self._load_started
+        self.tracer.record(name, metrics['load_seconds'], 'chargement', start=start, thread='chargement',
+                           rows=metrics['rows'], bytes=metrics.get('bytes_parsed', metrics.get('bytes')))
+        start += metrics['load_seconds']
+        if append_result is not None:
+            self.tracer.record("Fusion du profil", append_result['merge_seconds'], 'chargement',
+                               start=start, thread='chargement')
+            start += append_result['merge_seconds']
+        if metrics.get('snapshot_seconds') is not None:
+            self.tracer.record("Écriture de l'instantané", metrics['snapshot_seconds'], 'chargement',
+                               start=start, thread='chargement')
+            start += metrics['snapshot_seconds']
+        if metrics.get('profile_seconds') is not None and append_result is None:
+            self.tracer.record("Profil des colonnes", metrics['profile_seconds'], 'types',
+                               start=start, thread='chargement')
+    
+    def _row_count(self) -> int:
+        """Lignes du fichier analysé (fichier entier en mode flux, pas seulement l'aperçu)"""
+        if self.stream_summary is not None:
+            return self.stream_summary.n_rows
+        return len(self.data)
+    
+    def _memory_note(self) -> str:
+        """Mémoire occupée par les données (aperçu seul en mode flux)"""
+        memory = self.data.memory_usage(deep=True).sum() / 1024**2
+        if self.stream_summary is not None:
+            return f"{memory:.2f} MB (aperçu de {len(self.data):,} lignes, analyse en flux)"
+        return f"{memory:.2f} MB"
+    
+    def _report_memory_compaction(self, before: Optional[int], after: int):
+        """Afficher la mémoire avant/après le mode compact (barre d'état + console)"""
+        if before:
+            message = (f"Mémoire : {format_bytes(before)} → {format_bytes(after)} "
+                       f"(÷{before / max(after, 1):.1f})")
+        else:
+            message = f"Mémoire : {format_bytes(after)} (mode compact)"
+        
+        self.status_label.config(text=f"{self.status_label.cget('text')} - {message}")
+        print(f"✓ {message}")
+    
+    def _open_excel_file(self):
+        """Ouvrir fichier Excel"""
+        filename = filedialog.askopenfilename(
+            title="Sélectionner un fichier Excel",
+            filetypes=[("Fichiers Excel", "*.xlsx *.xls"), ("Tous", "*.*")]
+        )
+        
+        if filename:
+            try:
+                self._start_run()
+                load_params = {'format': 'excel', 'sheet': 0}
+                compact = self.compact_mode.get()
+                if compact:
+                    load_params['compact'] = True
+                start = time.perf_counter()
+                memory = None
+                self._save_dataset_state(run=False)
+                
+                with self.tracer.span("Lecture Excel", 'chargement') as span:
+                    # Instantané colonnaire d'un fichier inchangé, sinon lecture Excel
+                    snapshot = self.snapshot_store.load(filename, load_params)
+                    if snapshot is not None:
+                        self.data = snapshot[0]
+                        source = "instantané"
+                        if compact:
+                            memory = (snapshot[1].get('extra', {}).get('memory_before'),
+                                      int(self.data.memory_usage(deep=True).sum()))
+                    else:
+                        self.data = pd.read_excel(filename, engine='openpyxl')
+                        extra = None
+                        if compact:
+                            self.data, memory_report = compact_dataframe(self.data)
+                            memory = (memory_report['before_bytes'], memory_report['after_bytes'])
+                            extra = {'memory_before': memory_report['before_bytes']}
+                        self.snapshot_store.save_in_background(filename, load_params, self.data, extra)
+                        source = "openpyxl"
+                    span.update(source=source, rows=len(self.data))
+                
+                self.status_label.config(
+                    text=f"{len(self.data):,} lignes chargées en {time.perf_counter() - start:.2f} s ({source})"
+                )
+                
+                self.filename = os.path.basename(filename)
+                self.filepath = filename
+                self.load_params = load_params
+                self.csv_dialect = None
+                
+                self._reset_analysis_state()
+                restored = self._restore_cached_analyses()
+                
+                self._detect_variable_types()
+                self._update_ui_after_load()
+                self._add_to_history()
+                self._update_results_tab_info()
+                if restored:
+                    self._update_accumulated_results()
+                    self._notify_cache_restored()
+                if memory is not None:
+                    self._report_memory_compaction(*memory)
+                self._register_dataset()
+                
+                ToastNotification(
+                    title="Succès",
+                    message=f"{self.data.shape[0]:,} lignes chargées depuis Excel",
+                    duration=3000,
+                    bootstyle="success"
+                ).show_toast()
+                
+            except Exception as e:
+                messagebox.showerror("Erreur", f"Erreur lors de l'ouverture du fichier Excel:\n{str(e)}")
+    
+    # ============================================================
+    # SESSION MULTI-FICHIERS
+    # ============================================================
+    
+    def _dataset_state(self, run: bool = True) -> Dict:
+        return {attr: getattr(self, attr) for attr in self.DATASET_STATE + (self.RUN_STATE if run else ())}
+    
+    def _save_dataset_state(self, run: bool = True):
+        """Mémoriser les résultats du jeu affiché avant d'en afficher un autre.
+
+        ``run=False`` : une nouvelle exécution a déjà commencé (``_start_run``), celle du jeu
+        affiché a été mémorisée à ce moment-là.
+        """
+        if self.data is not None and self.dataset_key in self.workspace:
+            self.workspace.update_state(self.dataset_key, self._dataset_state(run))
+    
+    def _register_dataset(self):
+        """Ajouter le jeu qui vient d'être chargé à la session (remplace une lecture précédente du même fichier)"""
+        key = os.path.abspath(self.filepath) + ("#flux" if self.stream_summary is not None else "")
+        with self.tracer.span("Session : ajout du jeu", 'session') as span:
+            spilled = self.workspace.put(key, self.filename, self.data, self._dataset_state())
+            span['mis_sur_disque'] = len(spilled)
+        self.dataset_key = key
+        self._update_dataset_choices()
+        if spilled:
+            print(f"✓ Session : {', '.join(d.name for d in spilled)} mis sur disque (budget mémoire)")
+    
+    def _update_dataset_choices(self):
+        """Liste des jeux de la session (barre de statut), du plus récent au plus ancien"""
+        datasets = self.workspace.datasets()
+        self._dataset_choices = [dataset.key for dataset in datasets]
+        self.dataset_combo['values'] = [
+            dataset.name + ("" if dataset.in_memory else " (disque)") for dataset in datasets
+        ]
+        if self.dataset_key in self._dataset_choices:
+            self.dataset_combo.current(self._dataset_choices.index(self.dataset_key))
+        self.session_label.config(
+            text=f"{len(datasets)} jeu(x) - {format_bytes(self.workspace.memory_used())} / "
+                 f"{format_bytes(self.workspace.budget_bytes)}"
+        )
+    
+    def _on_dataset_selected(self, event=None):
+        index = self.dataset_combo.current()
+        if 0 <= index < len(self._dataset_choices):
+            self._switch_dataset(self._dataset_choices[index])
+    
+    def _switch_dataset(self, key: str):
+        """Afficher un autre jeu de la session avec ses analyses (relu depuis le disque s'il y a été mis)"""
+        if key == self.dataset_key:
+            return
+        if (self.loader is not None and self.loader.is_alive()) or \
+                (self.analysis_scheduler is not None and self.analysis_scheduler.running):
+            messagebox.showwarning("Attention", "Attendez la fin du chargement ou du rapport en cours")
+            self._update_dataset_choices()
+            return
+        
+        try:
+            # Étapes du jeu quitté enregistrées dans son entrée d'historique avant de changer d'exécution
+            self._save_run_timings()
+            self._save_dataset_state()
+            start = time.perf_counter()
+            with self.tracer.span("Changement de jeu de données", 'session') as span:
+                reloads = self.workspace.metrics['reloads']
+                dataset = self.workspace.get(key)
+                reloaded = self.workspace.metrics['reloads'] > reloads
+                span.update(jeu=dataset.name, relu=reloaded)
+                
+                self._reset_analysis_state()
+                self.data = dataset.data
+                for attr, value in dataset.state.items():
+                    setattr(self, attr, value)
+                self.dataset_key = key
+                # Changement compté dans l'exécution du jeu affiché, comme les étapes suivantes
+                self.tracer.context['execution'] = span['execution'] = self.run_id
+                
+                self._update_ui_after_load()
+                self._update_results_tab_info()
+                if self.accumulated_reports:
+                    self._update_accumulated_results()
+                else:
+                    self.results_detail_text.config(state=NORMAL)
+                    self.results_detail_text.delete('1.0', END)
+                    self.results_detail_text.insert('1.0', f"""
+                    AUCUNE ANALYSE POUR {dataset.name}
+
+Lancez des analyses depuis "Vue d'ensemble".
+""")
+                    self.results_detail_text.config(state=DISABLED)
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur:\n{str(e)}")
+            return
+        
+        self._update_dataset_choices()
+        source = "relu depuis le disque" if reloaded else "en mémoire"
+        self.status_label.config(
+            text=f"{dataset.name} : {dataset.rows:,} lignes ({source}) en {(time.perf_counter() - start) * 1000:.0f} ms"
+        )
+    
+    def _set_memory_budget(self):
+        """Budget mémoire des jeux de la session (le jeu affiché reste toujours en mémoire)"""
+        budget = Querybox.get_integer(
+            prompt="Mémoire maximale des jeux de données ouverts (Mo) :",
+            title="Budget mémoire de la session",
+            initialvalue=self.workspace.budget_bytes // 1024**2,
+            minvalue=64,
+            parent=self.root
+        )
+        if budget is None:
+            return
+        
+        spilled = self.workspace.set_budget(budget * 1024**2)
+        self._update_dataset_choices()
+        self.status_label.config(
+            text=f"Budget mémoire : {format_bytes(self.workspace.budget_bytes)}"
+                 + (f" - {len(spilled)} jeu(x) mis sur disque" if spilled else "")
+        )
+    
+    # ============================================================
+    # CACHE DES ANALYSES
+    # ============================================================
+    
+    def _reset_analysis_state(self):
+        """Oublier les résultats du fichier précédent"""
+        self.profile = None
+        self.missing_values = {}
+        self.high_missing_vars = []
+        self.quasi_constant_vars = []
+        self.outliers_info = {}
+        self.current_stats = {}
+        self.categorical_stats = {}
+        self.accumulated_reports = ResultAccumulator()
+        self._result_tags = {}
+        self._dirty_results = set()
+        self.cache_key = None
+        
+        # Nouvelle version des données : graphiques en cache périmés
+        self.data_version += 1
+        self.plot_cache.clear()
+        self.current_plot_key = None
+        self.current_fig = None
+        self._sketch_cache = None
+        self.stream_summary = None
+        self.file_fingerprint = None
+    
+    def _analysis_params(self) -> Dict:
+        """Paramètres qui influencent les résultats (font partie de la clé de cache)"""
+        return {
+            'load': self.load_params,
+            'high_missing_pct': HIGH_MISSING_PCT,
+            'quasi_constant_ratio': QUASI_CONSTANT_RATIO,
+            'iqr_factor': IQR_FACTOR
+        }
+    
+    def _restore_cached_analyses(self) -> bool:
+        """Restaurer les résultats d'un fichier déjà analysé"""
+        try:
+            self.file_fingerprint = file_fingerprint(self.filepath)
+            self.cache_key = cache_key(self.file_fingerprint, self._analysis_params())
+            cached = self.analysis_cache.get(self.cache_key)
+        except Exception as e:
+            print(f"✗ Cache : {e}")
+            return False
+        
+        if not cached:
+            return False
+        
+        for attr in self.CACHED_RESULTS:
+            if attr in cached:
+                setattr(self, attr, cached[attr])
+        if not isinstance(self.accumulated_reports, ResultAccumulator):
+            # Cache d'une version précédente : liste de rapports texte
+            self.accumulated_reports = ResultAccumulator.from_entries(self.accumulated_reports)
+        return True
+    
+    def _save_analysis_cache(self):
+        """Sauvegarder les résultats courants dans le cache"""
+        if self.data is None or self.cache_key is None:
+            return
+        
+        try:
+            self.analysis_cache.put(
+                self.cache_key,
+                {attr: getattr(self, attr) for attr in self.CACHED_RESULTS},
+                filepath=self.filepath
+            )
+        except Exception as e:
+            print(f"✗ Cache : {e}")
+    
+    def _merge_appended_analyses(self, append_result: Dict) -> bool:
+        """Fichier complété depuis la dernière lecture : profil fusionné, analyses précédentes mises à jour"""
+        start = time.perf_counter()
+        self.profile = append_result['profile']
+        
+        with self.tracer.span("Mise à jour des analyses", 'analyses'):
+            previous_key = cache_key(append_result['fingerprint'], self._analysis_params())
+            previous = self.analysis_cache.get(previous_key) or {}
+            refreshed = refresh_results(self.data, self.profile, append_result['moments'], previous)
+        for attr, value in refreshed.items():
+            setattr(self, attr, value)
+        
+        recomputed = append_result['recomputed']
+        print(f"✓ Lecture incrémentale : +{append_result['appended_rows']:,} lignes, profil fusionné en "
+              f"{append_result['merge_seconds']:.2f} s, analyses mises à jour en {time.perf_counter() - start:.2f} s"
+              + (f" (reprofilées : {', '.join(map(str, recomputed))})" if recomputed else ""))
+        
+        merged = len(refreshed) > 1
+        if merged:
+            self._save_analysis_cache()
+        return merged
+    
+    def _save_append_state(self, append_result: Optional[Dict] = None):
+        """Conserver profil, moments et effectifs de cette lecture (complétion à la prochaine ouverture)"""
+        fingerprint = self.file_fingerprint
+        if fingerprint is None or fingerprint['size'] != self.last_load_metrics.get('bytes'):
+            return
+        
+        key = append_state_key(fingerprint, self.load_params)
+        data, profile, filepath = self.data, self._ensure_profile(), self.filepath
+        
+        def save():
+            try:
+                merged = append_result or {}
+                state = build_append_state(data, profile, merged.get('moments'), merged.get('counts'))
+                self.analysis_cache.put(key, state, filepath=filepath)
+            except Exception as e:
+                print(f"✗ État incrémental : {e}")
+        
+        threading.Thread(target=save, name="append-state", daemon=True).start()
+    
+    def _notify_cache_restored(self):
+        """Signaler une restauration depuis le cache"""
+        cache_stats = self.analysis_cache.stats()
+        self.status_label.config(
+            text=f"{len(self.accumulated_reports)} analyse(s) restaurée(s) depuis le cache "
+                 f"(hits {cache_stats['hits']} / misses {cache_stats['misses']})"
+        )
+        ToastNotification(
+            title="Cache",
+            message=f"{len(self.accumulated_reports)} analyse(s) restaurée(s)",
+            duration=2000,
+            bootstyle="info"
+        ).show_toast()
+    
+    def _clear_analysis_cache(self):
+        """Vider le cache d'analyses"""
+        cache_stats = self.analysis_cache.stats()
+        if messagebox.askyesno(
+            "Confirmation",
+            f"Vider le cache d'analyses ?\n\n"
+            f"{cache_stats['entries']} entrée(s) - {format_bytes(cache_stats['size_bytes'])}\n"
+            f"Session : {cache_stats['hits']} hit(s) / {cache_stats['misses']} miss(es)"
+        ):
+            self.analysis_cache.clear()
+            ToastNotification(
+                title="OK",
+                message="Cache d'analyses vidé",
+                duration=2000,
+                bootstyle="success"
+            ).show_toast()
+    
+    def _manage_snapshots(self):
+        """Consulter et purger les instantanés colonnaires"""
+        if not self.snapshot_store.available:
+            messagebox.showinfo("Instantanés", "pyarrow n'est pas installé : instantanés désactivés")
+            return
+        
+        entries = self.snapshot_store.entries()
+        if not entries:
+            messagebox.showinfo("Instantanés", "Aucun instantané")
+            return
+        
+        lines = [
+            f"- {os.path.basename(e['source'])} : {e['rows']:,} × {e['columns']} - {format_bytes(e['size_bytes'])}"
+            for e in entries[:15]
+        ]
+        if len(entries) > 15:
+            lines.append(f"... et {len(entries) - 15} autres")
+        
+        if messagebox.askyesno(
+            "Instantanés colonnaires",
+            f"{len(entries)} instantané(s) - {format_bytes(self.snapshot_store.total_size())}\n\n"
+            + "\n".join(lines)
+            + "\n\nPurger tous les instantanés ?"
+        ):
+            removed = self.snapshot_store.purge()
+            ToastNotification(
+                title="OK",
+                message=f"{removed} instantané(s) supprimé(s)",
+                duration=2000,
+                bootstyle="success"
+            ).show_toast()
+    
+    def _build_profile(self):
+        """Calculer le profil des colonnes (un seul passage sur les données)"""
+        start = time.perf_counter()
+        with self.tracer.span("Profil des colonnes", 'types', columns=len(self.data.columns)):
+            self.profile = profile_columns(self.data)
+        print(f"✓ Profil : {len(self.profile)} colonnes en {time.perf_counter() - start:.2f} s")
+
+    def _profile_is_current(self) -> bool:
+        return self.profile is not None and len(self.profile) == len(self.data.columns)
+    
+    def _ensure_profile(self) -> pd.DataFrame:
+        """Profil courant, recalculé si les données ont changé"""
+        if not self._profile_is_current():
+            self._build_profile()
+        return self.profile
+
+    def _detect_variable_types(self):
+        """Détecter types"""
+        if self.profile is None:
+            self._build_profile()
+        
+        with self.tracer.span("Détection des types", 'types'):
+            (self.variable_types, self.numeric_vars,
+             self.categorical_vars, self.boolean_vars) = classify_columns(self.profile, self._row_count())
+    
+    def _update_ui_after_load(self):
+        """MAJ UI"""
+        self.lbl_filename.config(text=self.filename)
+        self.lbl_dimensions.config(text=f"{self._row_count():,} × {self.data.shape[1]}")
+        
+        self._display_data_preview()
+        
+        self.var1_combo['values'] = self.numeric_vars
+        self.var2_combo['values'] = self.numeric_vars
+        self.cat_combo['values'] = self.categorical_vars + self.boolean_vars
+        
+        if self.numeric_vars:
+            self.var1_combo.current(0)
+            if len(self.numeric_vars) > 1:
+                self.var2_combo.current(1)
+        
+        if self.categorical_vars:
+            self.cat_combo.current(0)
+        
+        # Stats - TOUTES les variables
+        all_vars = self.numeric_vars + self.categorical_vars + self.boolean_vars
+        self.stats_var_combo['values'] = all_vars
+        if all_vars:
+            self.stats_var_combo.current(0)
+        
+        self.viz_var1['values'] = self.numeric_vars
+        self.viz_var2['values'] = self.numeric_vars
+        if self.numeric_vars:
+            self.viz_var1.current(0)
+            if len(self.numeric_vars) > 1:
+                self.viz_var2.current(1)
+        
+        self._display_data_in_tree()
+    
+    def _display_data_preview(self):
+        """Aperçu données"""
+        self.data_preview.config(state=NORMAL)
+        self.data_preview.delete('1.0', END)
+        
+        n_rows = min(50, len(self.data))
+        preview_data = self.data.head(n_rows).to_string()
+        
+        if self.stream_summary is not None:
+            scope = (f"analyse en flux : onglets Données et Visualisations limités aux "
+                     f"{len(self.data):,} premières lignes")
+        else:
+            scope = "toutes les lignes : onglet Données"
+        header = f"""
+  APERÇU - {n_rows} lignes sur {self._row_count():,} ({scope})
+
+"""
+        self.data_preview.insert('1.0', header + preview_data)
+        self.data_preview.config(state=DISABLED)
+    
+    def _display_data_in_tree(self):
+        """Afficher dans treeview (grille virtualisée : seules les lignes visibles sont créées)"""
+        self.tree.delete(*self.tree.get_children())
+        
+        self.grid_columns = {str(col): col for col in self.data.columns}
+        columns = list(self.grid_columns)
+        self.tree['columns'] = columns
+        
+        self.tree.heading('#0', text='Ligne')
+        self.tree.column('#0', width=80, stretch=False)
+        for col, label in self.grid_columns.items():
+            self.tree.heading(col, text=col, command=lambda c=label: self._toggle_grid_sort(c))
+            self.tree.column(col, width=100)
+        
+        # Nouveau jeu de données : index, tri et filtres repartent de zéro
+        self.data_index = DataIndex(self.data)
+        self.grid_filters = []
+        self.grid_sort = None
+        self._filtered_data_cache = None
+        self.filter_column_combo['values'] = columns
+        if columns:
+            self.filter_column_combo.current(0)
+        self.filter_count_label.config(text="")
+        
+        self.data_window.set_data(self.data)
+        self.data_window.resize(self._grid_visible_rows())
+        self._render_grid()
+    
+    def _grid_visible_rows(self) -> int:
+        """Nombre de lignes que le Treeview peut afficher à sa hauteur actuelle"""
+        try:
+            row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        except (tk.TclError, ValueError):
+            row_height = 20
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return self.data_window.visible_rows
+        # En-tête de colonnes : environ une ligne
+        return max(1, height // row_height - 1)
+    
+    def _render_grid(self):
+        """Réécrire les lignes visibles (les items existants sont réutilisés)"""
+        self._grid_render_pending = False
+        rows = self.data_window.rows()
+        items = self.tree.get_children()
+        
+        for i, (label, values) in enumerate(rows):
+            if i < len(items):
+                self.tree.item(items[i], text=label, values=values)
+            else:
+                self.tree.insert('', END, text=label, values=values)
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+        
+        self.grid_vsb.set(*self.data_window.fractions())
+        
+        total = self.data_window.total_rows
+        if total:
+            text = f"Lignes {self.data_window.first_row + 1:,}–{self.data_window.last_row:,} sur {total:,}"
+        elif self.grid_filters:
+            text = "Aucune ligne ne correspond aux filtres"
+        else:
+            text = "Aucune donnée chargée"
+        if self.grid_filters:
+            text += (f" (filtrées parmi {len(self.data):,}) - Filtres : "
+                     + " ; ".join(f.describe() for f in self.grid_filters))
+        if self.grid_sort:
+            text += f" - Tri : {self.grid_sort[0]} {'▲' if self.grid_sort[1] else '▼'}"
+        self.grid_info_label.config(text=text)
+    
+    def _schedule_grid_render(self):
+        """Regrouper les événements de défilement rapprochés en un seul rendu"""
+        if not self._grid_render_pending:
+            self._grid_render_pending = True
+            self.root.after_idle(self._render_grid)
+    
+    def _grid_scroll(self, rows: int = 0, pages: int = 0):
+        moved = self.data_window.scroll_pages(pages) if pages else self.data_window.scroll_by(rows)
+        if moved:
+            self._schedule_grid_render()
+        return "break"
+    
+    def _grid_moveto(self, fraction: float):
+        if self.data_window.moveto(fraction):
+            self._schedule_grid_render()
+        return "break"
+    
+    def _grid_yview(self, *args):
+        """Commande de la barre de défilement verticale (moveto / scroll)"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._grid_moveto(float(args[1]))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                self._grid_scroll(pages=amount)
+            else:
+                self._grid_scroll(amount)
+    
+    def _on_grid_mousewheel(self, event):
+        # Windows : multiples de 120 ; macOS : petits deltas
+        step = -event.delta // 120 if abs(event.delta) >= 120 else -event.delta
+        return self._grid_scroll(step * 3)
+    
+    def _toggle_grid_sort(self, column: Hashable):
+        """Clic sur un en-tête : croissant, puis décroissant, puis ordre d'origine"""
+        if self.data_index is None:
+            return
+        
+        if self.grid_sort is None or self.grid_sort[0] != column:
+            self.grid_sort = (column, True)
+        elif self.grid_sort[1]:
+            self.grid_sort = (column, False)
+        else:
+            self.grid_sort = None
+        
+        for col, label in self.grid_columns.items():
+            arrow = ''
+            if self.grid_sort and self.grid_sort[0] == label:
+                arrow = ' ▲' if self.grid_sort[1] else ' ▼'
+            self.tree.heading(col, text=f"{col}{arrow}")
+        
+        self._apply_grid_view()
+    
+    def _apply_grid_view(self) -> bool:
+        """Recalculer la vue (filtres + tri) via l'index et revenir en haut de la grille"""
+        try:
+            positions = self.data_index.view(self.grid_filters, self.grid_sort)
+        except (KeyError, ValueError) as e:
+            messagebox.showwarning("Filtre", str(e))
+            return False
+        
+        self.data_window.set_positions(positions)
+        self._render_grid()
+        self._filtered_data_cache = None
+        print(f"✓ Vue Données : {self.data_window.total_rows:,} lignes en "
+              f"{self.data_index.last_seconds * 1000:.1f} ms")
+        return True
+    
+    def _pending_grid_filter(self) -> Optional[RowFilter]:
+        """Filtre en cours de saisie (None si incomplet)"""
+        column = self.filter_column_combo.get()
+        if column not in self.grid_columns:
+            return None
+        return RowFilter(
+            column=self.grid_columns[column],
+            op=self.filter_op_combo.get() or '=',
+            value=self.filter_value_entry.get().strip(),
+            high=self.filter_high_entry.get().strip()
+        )
+    
+    def _on_filter_input(self, event=None):
+        """Saisie d'un filtre : compter les lignes correspondantes après une courte pause"""
+        if self._filter_preview_job is not None:
+            self.root.after_cancel(self._filter_preview_job)
+        self._filter_preview_job = self.root.after(250, self._preview_grid_filter)
+    
+    def _preview_grid_filter(self):
+        """Nombre de lignes qu'afficherait le filtre saisi, combiné aux filtres actifs"""
+        self._filter_preview_job = None
+        pending = self._pending_grid_filter()
+        if self.data_index is None or pending is None:
+            return
+        
+        try:
+            count = self.data_index.count(self.grid_filters + [pending])
+        except (KeyError, ValueError) as e:
+            self.filter_count_label.config(text=f"⚠ {e}")
+            return
+        self.filter_count_label.config(text=f"→ {count:,} lignes")
+    
+    def _add_grid_filter(self):
+        """Ajouter le filtre saisi aux filtres actifs"""
+        if self.data_index is None:
+            messagebox.showwarning("Attention", "Veuillez d'abord charger des données")
+            return
+        
+        pending = self._pending_grid_filter()
+        if pending is None:
+            return
+        
+        self.grid_filters.append(pending)
+        if not self._apply_grid_view():
+            self.grid_filters.pop()
+            return
+        
+        self.filter_value_entry.delete(0, END)
+        self.filter_high_entry.delete(0, END)
+        self.filter_count_label.config(text="")
+    
+    def _clear_grid_filters(self):
+        """Retirer tous les filtres (le tri est conservé)"""
+        if self.data_index is None or not self.grid_filters:
+            return
+        self.grid_filters = []
+        self._apply_grid_view()
+        self.filter_count_label.config(text="")
+    
+    def _analysis_data(self) -> pd.DataFrame:
+        """Données des onglets Statistiques et Visualisations (filtrées si demandé)"""
+        if not (self.filter_drives_analyses.get() and self.grid_filters and self.data_index is not None):
+            return self.data
+        if self.stream_summary is not None:
+            # Les filtres ne portent que sur l'aperçu : statistiques du fichier entier
+            return self.data
+        
+        key = tuple(self.grid_filters)
+        if self._filtered_data_cache is None or self._filtered_data_cache[0] != key:
+            positions = self.data_index.filtered_positions(self.grid_filters)
+            self._filtered_data_cache = (key, self.data.iloc[positions])
+        return self._filtered_data_cache[1]
+    
+    def _on_grid_configure(self, event=None):
+        """Redimensionnement (ou zoom) : ajuster le nombre de lignes matérialisées"""
+        visible_rows = self._grid_visible_rows()
+        if visible_rows != self.data_window.visible_rows:
+            self.data_window.resize(visible_rows)
+            self._schedule_grid_render()
+    
+    def _add_to_history(self):
+        """Ajouter historique"""
+        data_info = {
+            'filename': self.filename,
+            'filepath': self.filepath,
+            'rows': self._row_count(),
+            'columns': len(self.data.columns),
+            'numeric_vars': len(self.numeric_vars),
+            'categorical_vars': len(self.categorical_vars),
+            'boolean_vars': len(self.boolean_vars),
+            'quality_score': 0,
+            'missing_pct': 0,
+            'outliers_count': 0
+        }
+        if self.csv_dialect is not None and self.load_params.get('format') == 'csv':
+            data_info['dialect'] = self.csv_dialect.to_dict()
+        
+        # Contenu lu en entier (pas en flux) : point de reprise d'une prochaine lecture incrémentale
+        fingerprint = self.file_fingerprint
+        if (fingerprint is not None and self.stream_summary is None and self.load_params.get('format') == 'csv'
+                and fingerprint['size'] == self.last_load_metrics.get('bytes')):
+            data_info['fingerprint'] = fingerprint
+            data_info['byte_offset'] = fingerprint['size']
+        
+        # Étapes de l'exécution jusqu'ici ; les suivantes sont ajoutées au fil de la session
+        data_info['timings'] = self._run_timings()
+        self.history_entry_id = self.history_manager.add_entry(data_info)
+        self._load_history()
+    
+    def _start_run(self):
+        """Nouvelle exécution (ouverture d'un fichier) : ses étapes iront dans sa propre entrée d'historique"""
+        if self.history_entry_id is not None:
+            self._save_run_timings()
+        # Le jeu affiché garde son exécution pour le jour où on y revient
+        self._save_dataset_state()
+        self._run_count += 1
+        self.run_id = self._run_count
+        self.tracer.context['execution'] = self.run_id
+        self.run_started = self.tracer.now()
+        self.history_entry_id = None
+    
+    def _run_timings(self) -> List[Dict]:
+        """Étapes de l'exécution courante (jeu affiché), sérialisables"""
+        return [span.to_dict() for span in self.tracer.spans(since=self.run_started)
+                if span.args.get('execution') == self.run_id]
+    
+    def _on_span(self, span: Span):
+        """Dernière étape dans la barre de statut ; durées de l'exécution enregistrées peu après"""
+        if threading.current_thread() is not threading.main_thread():
+            return  # Tk : thread principal uniquement
+        self.timing_label.config(text=f"⏱ {format_span(span)}")
+        if self.history_entry_id is not None and not self._timings_save_pending:
+            self._timings_save_pending = True
+            self.root.after(1000, self._save_run_timings)
+    
+    def _save_run_timings(self):
+        """Mettre à jour les étapes de l'exécution dans son entrée d'historique"""
+        self._timings_save_pending = False
+        if self.history_entry_id is None:
+            return
+        try:
+            self.history_manager.set_timings(self.history_entry_id, self._run_timings())
+        except Exception as e:
+            print(f"✗ Historique : {e}")
+    
+    def _write_trace(self, spans: List[Span], stem: str, metadata: Dict):
+        """Choisir le fichier puis écrire la trace (chrome://tracing, ui.perfetto.dev)"""
+        output_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("Trace Chrome (JSON)", "*.json")],
+            initialfile=f"trace_{stem}.json"
+        )
+        if not output_path:
+            return
+        
+        metadata['durees_cumulees'] = {name: round(seconds, 4) for name, seconds in totals(spans).items()}
+        try:
+            write_chrome_trace(output_path, spans, metadata)
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur:\n{str(e)}")
+            return
+        
+        for name, seconds in list(totals(spans).items())[:5]:
+            print(f"   {name} : {seconds:.2f} s")
+        self.status_label.config(text=f"Trace de {len(spans)} étape(s) exportée : {os.path.basename(output_path)}")
+        ToastNotification(
+            title="Trace exportée",
+            message="Ouvrir dans chrome://tracing ou ui.perfetto.dev",
+            duration=3000,
+            bootstyle="success"
+        ).show_toast()
+    
+    def _export_trace(self):
+        """Exporter les étapes chronométrées de la session"""
+        spans = self.tracer.spans()
+        if not spans:
+            messagebox.showwarning("Attention", "Aucune étape chronométrée dans cette session")
+            return
+        
+        stem = self.filename.replace('.csv', '').replace('.xlsx', '') if self.filename else "session"
+        self._write_trace(spans, stem, {
+            'session': self.tracer.started_at.isoformat(timespec='seconds'),
+            'fichier': self.filename
+        })
+    
+    def _export_history_trace(self):
+        """Exporter les étapes chronométrées de l'entrée d'historique sélectionnée"""
+        selection = self.history_tree.selection()
+        if not selection:
+            messagebox.showwarning("Attention", "Sélectionnez une entrée de l'historique")
+            return
+        
+        entry_id, filename, loaded_at = self.history_tree.item(selection[0], 'values')[:3]
+        if self.history_entry_id == int(entry_id):
+            self._save_run_timings()
+        timings = self.history_manager.get_timings(int(entry_id))
+        if not timings:
+            messagebox.showwarning("Attention", "Aucune durée enregistrée pour cette entrée")
+            return
+        
+        self._write_trace([Span.from_dict(values) for values in timings], os.path.splitext(filename)[0],
+                          {'fichier': filename, 'date': loaded_at, 'entree': int(entry_id)})
+    
+    def _load_history(self):
+        """Charger historique (première page, filtres de recherche en cours)"""
+        for item in self.history_tree.get_children():
+            self.history_tree.delete(item)
+        
+        self.history_cursor = None
+        self.history_has_more = True
+        self._load_history_page()
+        
+        total = self.history_manager.count(**self.history_filters)
+        self.history_count_label.config(text=f"{total:,} entrée(s)")
+    
+    def _load_history_page(self):
+        """Ajouter la page suivante (pagination par curseur, sans OFFSET)"""
+        if not self.history_has_more:
+            return
+        
+        page = self.history_manager.get_history(
+            HISTORY_PAGE_SIZE, after=self.history_cursor, **self.history_filters
+        )
+        self.history_has_more = len(page) == HISTORY_PAGE_SIZE
+        self.history_cursor = HistoryManager.page_cursor(page) or self.history_cursor
+        
+        for entry in page:
+            self.history_tree.insert('', END, values=(
+                entry['id'],
+                entry['filename'],
+                entry['loaded_at'][:19],
+                f"{entry['rows'] or 0:,}",
+                entry['columns'],
+                f"{entry.get('quality_score') or 0:.1f}/100"
+            ))
+    
+    def _search_history(self):
+        """Filtrer l'historique par nom de fichier et période"""
+        filters = {
+            'filename': self.history_name_entry.get().strip() or None,
+            'date_from': self.history_from_entry.get().strip() or None,
+            'date_to': self.history_to_entry.get().strip() or None
+        }
+        try:
+            self.history_manager.count(**filters)
+        except ValueError:
+            messagebox.showwarning("Attention", "Dates au format AAAA-MM-JJ (ou AAAA-MM-JJ HH:MM:SS)")
+            return
+        
+        self.history_filters = {key: value for key, value in filters.items() if value}
+        self._load_history()
+    
+    def _reset_history_search(self):
+        for widget in (self.history_name_entry, self.history_from_entry, self.history_to_entry):
+            widget.delete(0, END)
+        self.history_filters = {}
+        self._load_history()
+    
+    def _clear_history(self):
+        """Effacer historique"""
+        if messagebox.askyesno("Confirmation", "Effacer l'historique et le cache d'analyses ?"):
+            self.history_manager.clear()
+            self.analysis_cache.clear()
+            self._load_history()
+            
+            ToastNotification(
+                title="OK",
+                message="Historique effacé",
+                duration=2000,
+                bootstyle="success"
+            ).show_toast()
+    
+    def _go_to_stats(self):
+        """Aller stats"""
+        if self.data is None:
+            messagebox.showwarning("Attention", "Aucun fichier")
+            return
+        
+        var = self.var1_combo.get()
+        if var:
+            self.stats_var_combo.set(var)
+        
+        self.notebook.select(2)
+        
+        ToastNotification(
+            title="Navigation",
+            message="Statistiques",
+            duration=2000,
+            bootstyle="info"
+        ).show_toast()
+    
+    # ============================================================
+    # ANALYSES - AVEC ACCUMULATION
+    # ============================================================
+    
+    def _show_detailed_types(self):
+        """Types détaillés"""
+        if self.data is None:
+            messagebox.showwarning("Attention", "Aucun fichier")
+            return
+        
+        result = types_result(self._ensure_profile(), self.numeric_vars, self.categorical_vars,
+                              self.boolean_vars, len(self.data.columns))
+        
+        # Zone 4 (aperçu)
+        self.results_text.config(state=NORMAL)
+        self.results_text.delete('1.0', END)
+        self.results_text.insert('1.0', result.text)
+        self.results_text.config(state=DISABLED)
+        self.status_badge.config(text="Terminé")
+        
+        # ACCUMULER
+        self._add_analysis_to_accumulator(result)
+        
+        ToastNotification(
+            title="Ajouté",
+            message="Voir l'onglet Résultats",
+            duration=2000,
+            bootstyle="success"
+        ).show_toast()
+    
+    def _analyze_missing_values(self):
+        """Valeurs manquantes"""
+        if self.data is None:
+            messagebox.showwarning("Attention", "Aucun fichier")
+            return
+        
+        with self.tracer.span("Valeurs manquantes", 'analyses'):
+            self.missing_values, self.high_missing_vars = compute_missing_values(self._ensure_profile())
+        
+        self._display_missing_report()
+    
+    def _build_missing_result(self) -> AnalysisResult:
+        """Résultat missing"""
+        return missing_result(self.missing_values, self._row_count() * len(self.data.columns))
+    
+    def _display_missing_report(self):
+        """Rapport missing"""
+        self._show_single_report(self._build_missing_result())
+    
+    def _detect_quasi_constant(self):
+        """Variables constantes"""
+        if self.data is None:
+            return
+        
+        with self.tracer.span("Variables constantes", 'analyses'):
+            self.quasi_constant_vars = compute_quasi_constant(self._ensure_profile(), self._row_count())
+        
+        self._display_constant_report()
+    
+    def _build_constant_result(self) -> AnalysisResult:
+        """Résultat constantes"""
+        return constant_result(self.quasi_constant_vars)
+    
+    def _display_constant_report(self):
+        """Rapport constantes"""
+        self._show_single_report(self._build_constant_result())
+    
+    def _detect_outliers(self):
+        """Outliers"""
+        if self.data is None or not self.numeric_vars:
+            return
+        
+        with self.tracer.span("Outliers (IQR)", 'analyses', variables=len(self.numeric_vars)):
+            if self.stream_summary is not None:
+                self.outliers_info = self.stream_summary.outliers(self.numeric_vars)
+            else:
+                self.outliers_info = compute_outliers(self.data[self.numeric_vars])
+        
+        self._display_outliers_report()
+    
+    def _build_outliers_result(self) -> AnalysisResult:
+        """Résultat outliers"""
+        return outliers_result(self.outliers_info)
+    
+    def _display_outliers_report(self):
+        """Rapport outliers"""
+        self._show_single_report(self._build_outliers_result())
+    
+    def _show_single_report(self, result: AnalysisResult):
+        """Afficher une analyse en zone 4 et l'accumuler"""
+        self.results_text.config(state=NORMAL)
+        self.results_text.delete('1.0', END)
+        self.results_text.insert('1.0', result.text)
+        self.results_text.config(state=DISABLED)
+        self.status_badge.config(text="Terminé")
+        
+        # ACCUMULER
+        self._add_analysis_to_accumulator(result)
+        
+        ToastNotification(
+            title="Ajouté",
+            message="Voir l'onglet Résultats",
+            duration=2000,
+            bootstyle="success"
+        ).show_toast()
+    
+    def _full_quality_report(self):
+        """Rapport complet (analyses lancées en parallèle hors du thread Tk)"""
+        if self.data is None:
+            return
+        
+        if self.analysis_scheduler is not None and self.analysis_scheduler.running:
+            messagebox.showwarning("Attention", "Un rapport est déjà en cours")
+            return
+        
+        n_rows = self._row_count()
+        
+        scheduler = AnalysisScheduler()
+        profile_ready = self._profile_is_current()
+        if profile_ready:
+            self._submit_profile_analyses(scheduler, self.profile)
+        else:
+            # Profil à refaire : manquants et constantes soumis à son arrivée (_poll_analysis_scheduler)
+            scheduler.submit("Profil des colonnes", profile_columns, self.data)
+        if self.stream_summary is not None:
+            # Analyse en flux : outliers déduits des sketches, sans relire le fichier
+            scheduler.submit("Outliers (IQR)", self.stream_summary.outliers, self.numeric_vars)
+        else:
+            # Outliers découpés par blocs de colonnes : c'est l'analyse la plus coûteuse
+            for block in split_columns(self.numeric_vars, scheduler.max_workers):
+                scheduler.submit("Outliers (IQR)", compute_outliers, self.data[block], n_rows)
+        if profile_ready:
+            scheduler.close()
+        
+        self.analysis_scheduler = scheduler
+        self.outliers_info = {}
+        self._report_errors = []
+        
+        self.results_text.config(state=NORMAL)
+        self.results_text.delete('1.0', END)
+        self.results_text.insert('1.0', f"""
+                         RAPPORT COMPLET EN COURS...
+
+{scheduler.max_workers} worker(s) - Échap pour annuler
+
+""")
+        self.results_text.config(state=DISABLED)
+        self.status_badge.config(text="En cours...")
+        self.cancel_load_btn.config(state=NORMAL)
+        self.status_label.config(text="Rapport complet en cours...")
+        
+        self.root.after(50, self._poll_analysis_scheduler)
+    
+    def _submit_profile_analyses(self, scheduler: AnalysisScheduler, profile: pd.DataFrame):
+        """Analyses déduites du profil (il doit être calculé avant leur soumission)"""
+        scheduler.submit("Valeurs manquantes", compute_missing_values, profile)
+        scheduler.submit("Variables constantes", compute_quasi_constant, profile, self._row_count())
+    
+    def _poll_analysis_scheduler(self):
+        """Dépiler les résultats partiels du rapport complet (thread Tk uniquement)"""
+        scheduler = self.analysis_scheduler
+        if scheduler is None:
+            return
+        
+        while True:
+            try:
+                kind, name, value, seconds = scheduler.events.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'result':
+                if name == "Profil des colonnes":
+                    self.profile = value
+                    self._submit_profile_analyses(scheduler, value)
+                    scheduler.close()
+                elif name == "Valeurs manquantes":
+                    self.missing_values, self.high_missing_vars = value
+                elif name == "Variables constantes":
+                    self.quasi_constant_vars = value
+                elif name == "Outliers (IQR)":
+                    self.outliers_info.update(value)
+                self.tracer.record_parallel(name, seconds, 'analyses', group='rapport')
+                self._append_results_text(f"  ✓ {name} ({seconds:.2f} s)\n")
+            elif kind == 'error':
+                self._report_errors.append(f"{name} : {value}")
+                self._append_results_text(f"  ✗ {name} : {value}\n")
+                if name == "Profil des colonnes":
+                    # Pas d'analyses dépendantes : le rapport se termine avec les outliers
+                    scheduler.close()
+            elif kind == 'cancelled':
+                self.analysis_scheduler = None
+                self.cancel_load_btn.config(state=DISABLED)
+                self._append_results_text("\n  Rapport annulé\n")
+                self.status_badge.config(text="Annulé")
+                self.status_label.config(text="Rapport complet annulé")
+                return
+            elif kind == 'finished':
+                self.analysis_scheduler = None
+                self.cancel_load_btn.config(state=DISABLED)
+                self.tracer.record("Rapport complet", seconds, 'analyses')
+                self._finish_quality_report(seconds)
+                return
+        
+        self.root.after(50, self._poll_analysis_scheduler)
+    
+    def _append_results_text(self, text: str):
+        """Ajouter une ligne en zone 4 sans tout réafficher"""
+        self.results_text.config(state=NORMAL)
+        self.results_text.insert(END, text)
+        self.results_text.see(END)
+        self.results_text.config(state=DISABLED)
+    
+    def _finish_quality_report(self, total_seconds: float):
+        """Assembler le rapport complet une fois toutes les analyses terminées"""
+        # Ordre stable des variables, quel que soit l'ordre de fin des blocs
+        self.outliers_info = {col: self.outliers_info[col] for col in self.numeric_vars if col in self.outliers_info}
+        
+        self._add_analysis_to_accumulator(self._build_missing_result(), refresh=False)
+        self._add_analysis_to_accumulator(self._build_constant_result(), refresh=False)
+        if self.numeric_vars:
+            self._add_analysis_to_accumulator(self._build_outliers_result(), refresh=False)
+        
+        total_missing = sum(count for count, _ in self.missing_values.values())
+        result = quality_result(self.filename, self._row_count(), self.data.shape[1], self._memory_note(),
+                                self._calculate_quality_score(), total_missing,
+                                self._row_count() * len(self.data.columns),
+                                len(self.quasi_constant_vars), len(self.outliers_info))
+        
+        self.results_text.config(state=NORMAL)
+        self.results_text.delete('1.0', END)
+        self.results_text.insert('1.0', result.text)
+        self.results_text.config(state=DISABLED)
+        self.status_badge.config(text="Rapport généré")
+        self.status_label.config(text=f"Rapport complet généré en {total_seconds:.2f} s")
+        
+        # ACCUMULER (un seul rafraîchissement de l'onglet Résultats)
+        self._add_analysis_to_accumulator(result)
+        
+        # Basculer vers Résultats
+        self.notebook.select(1)
+        
+        if self._report_errors:
+            messagebox.showerror("Erreur", "Analyses en échec:\n" + "\n".join(self._report_errors))
+        
+        ToastNotification(
+            title="Rapport complet",
+            message=f"{len(self.accumulated_reports)} analyse(s) disponible(s)",
+            duration=3000,
+            bootstyle="success"
+        ).show_toast()
+    
+    def _calculate_quality_score(self):
+        """Score qualité"""
+        total_missing = int(self._ensure_profile()['null_count'].sum()) if self.missing_values else None
+        return quality_score(total_missing, self._row_count() * len(self.data.columns), len(self.data.columns),
+                             len(self.quasi_constant_vars), self.outliers_info, len(self.numeric_vars))
+    
+    # ============================================================
+    # STATISTIQUES - AVEC SUPPORT CATÉGORIELLES
+    # ============================================================
+    
+    def _calculate_stats(self):
+        """Calculer stats (numérique OU catégorielle)"""
+        if self.data is None:
+            return
+        
+        var = self.stats_var_combo.get()
+        if not var:
+            return
+        
+        data = self._analysis_data()
+        filtered = data is not self.data
+        if filtered and data.empty:
+            messagebox.showwarning("Filtre", "Aucune ligne ne correspond au filtre actif")
+            return
+        
+        self.stats_text.config(state=NORMAL)
+        self.stats_text.delete('1.0', END)
+        
+        finish = self.tracer.start("Statistiques", 'statistiques', variable=var, rows=len(data))
+        approximate = self.approximate_stats.get() or self.stream_summary is not None
+        if approximate:
+            report = self._approximate_stats_report(var, data)
+        
+        elif var in self.numeric_vars:
+            # NUMÉRIQUE
+            self.current_stats[var] = describe_numeric(data[var])
+            
+            report = f"""
+      STATISTIQUES NUMÉRIQUES - {var[:40]:<40}
+
+"""
+            if filtered:
+                report += self._filter_note(data)
+            for stat, value in self.current_stats[var].items():
+                report += f"{stat:<20} : {value:>12.4f}\n"
+        
+        else:
+            # CATÉGORIELLE (un passage ; compteurs bornés pour les colonnes de type identifiant)
+            stats = self._categorical_stats(data, [var])[var]
+            n_total = stats.n_total
+            n_missing = stats.n_missing
+            
+            report = f"""
+    STATISTIQUES CATÉGORIELLES - {var[:40]:<40}
+
+INFORMATIONS
+{'-' * 70}
+Total           : {n_total:,}
+Manquantes      : {n_missing:,} ({stats.missing_pct:.2f}%)
+Valeurs uniques : {format_count(stats.n_unique)}
+
+MODALITÉS DOMINANTES (Top 10)
+{'-' * 70}
+{'Modalité':<30} {'Effectif':>12} {'%':>12}
+{'-' * 70}
+"""
+            if filtered:
+                report = self._filter_note(data) + report
+            
+            for modalite, count in stats.top[:10]:
+                modalite_str = str(modalite)[:28]
+                report += f"{modalite_str:<30} {format_count(count):>12} {stats.percent(count.value):>11.2f}%\n"
+            
+            if stats.n_unique.value > len(stats.top[:10]):
+                report += f"\n... et {stats.n_unique.value - len(stats.top[:10]):,.0f} autres modalités\n"
+            if stats.heavy_hitters:
+                report += (f"\nEffectifs approchés ({HEAVY_HITTER_CAPACITY:,} compteurs, colonne à forte cardinalité) : "
+                           f"± {stats.count_error:,.0f} au plus par modalité\n")
+        
+        finish()
+        self.stats_text.insert('1.0', report)
+        self.stats_text.config(state=DISABLED)
+        
+        # Statistiques d'un sous-ensemble filtré ou approchées : pas dans le cache du fichier
+        if not filtered and not approximate:
+            self._save_analysis_cache()
+    
+    def _filter_note(self, data: pd.DataFrame) -> str:
+        """Mention du filtre actif en tête des rapports de statistiques"""
+        filters = " ; ".join(f.describe() for f in self.grid_filters)
+        return f"Filtre actif : {filters} ({len(data):,} lignes sur {len(self.data):,})\n\n"
+    
+    def _calculate_all_stats(self):
+        """Stats globales"""
+        if self.data is None:
+            return
+        
+        self.stats_text.config(state=NORMAL)
+        self.stats_text.delete('1.0', END)
+        
+        with self.tracer.span("Statistiques globales", 'statistiques'):
+            data = self._analysis_data()
+        
+            if self.approximate_stats.get() or self.stream_summary is not None:
+                self.stats_text.insert('1.0', self._approximate_all_stats_report(data))
+                self.stats_text.config(state=DISABLED)
+                return
+        
+            filtered = data is not self.data
+            header_note = self._filter_note(data) if filtered else ""
+            result = global_stats_result(data, self.numeric_vars, self.categorical_vars, header_note,
+                                         categorical=self._categorical_stats(data, self.categorical_vars[:10]))
+            self.stats_text.insert('1.0', result.text)
+            self.stats_text.config(state=DISABLED)
+        
+        # Tableaux des modalités repris par les exports (données complètes uniquement)
+        if not filtered:
+            self._add_analysis_to_accumulator(result)
+    
+    def _categorical_stats(self, data: pd.DataFrame, columns: List[str]) -> Dict[str, CategoricalStats]:
+        """Résumés des variables catégorielles, gardés par variable pour le fichier complet"""
+        if data is not self.data:
+            return {col: categorical_stats(data[col]) for col in columns}
+        
+        for col in columns:
+            if col not in self.categorical_stats:
+                # Cardinalité exacte déjà connue par le profil : pas d'HyperLogLog
+                known = self.profile is not None and col in self.profile.index
+                n_unique = int(self.profile.at[col, 'n_unique']) if known else None
+                self.categorical_stats[col] = categorical_stats(data[col], n_unique=n_unique)
+        return {col: self.categorical_stats[col] for col in columns}
+    
+    def _column_sketches(self, data: pd.DataFrame, columns: List[str]) -> Dict[str, ColumnSketch]:
+        """Sketches des colonnes demandées, calculés une fois par version des données et filtre"""
+        if self.stream_summary is not None and data is self.data:
+            return self.stream_summary.sketches
+        
+        key = (self.data_version, tuple(self.grid_filters) if data is not self.data else ())
+        if self._sketch_cache is None or self._sketch_cache[0] != key:
+            self._sketch_cache = (key, {})
+        sketches = self._sketch_cache[1]
+        
+        todo = [col for col in columns if col not in sketches]
+        if todo:
+            start = time.perf_counter()
+            sketches.update(sketch_frame(data, todo, numeric=[col for col in todo if col in self.numeric_vars]))
+            seconds = time.perf_counter() - start
+            self.status_label.config(text=f"Statistiques approchées : {len(todo)} colonne(s) résumée(s) en {seconds:.2f} s")
+        return sketches
+    
+    def _sketch_precision_note(self, sketch: ColumnSketch) -> str:
+        """Rappel des garanties des sketches (bornes à ~95 %)"""
+        distinct_pct = sketch.distinct_count().error / max(sketch.distinct_count().value, 1) * 100
+        if sketch.sample is not None:
+            categories = f"modalités sur {SAMPLE_SIZE:,} lignes tirées (effectifs sans borne)"
+        else:
+            categories = "modalités par compteurs de fréquence (effectifs bornés)"
+        note = (f"Approximations : quantiles à ±{QUANTILE_ALPHA / (1 - QUANTILE_ALPHA) * 100:.2g} % relatif, "
+                f"distincts à ±{distinct_pct:.1f} %, {categories} ; "
+                f"moyenne, écart-type, skewness, kurtosis, min, max et manquants exacts\n\n")
+        if self.stream_summary is not None:
+            note = f"Analyse en flux : {self.stream_summary.n_rows:,} lignes résumées bloc par bloc\n" + note
+        return note
+    
+    def _approximate_stats_report(self, var: str, data: pd.DataFrame) -> str:
+        """Statistiques d'une variable à partir de son sketch, avec bornes d'erreur"""
+        sketch = self._column_sketches(data, [var])[var]
+        distinct = sketch.distinct_count()
+        filter_note = self._filter_note(data) if data is not self.data else ""
+        
+        if sketch.numeric:
+            summary = sketch.summary()
+            self.current_stats[var] = {stat: summary[stat].value for stat in NUMERIC_STATS}
+            
+            report = f"""
+      STATISTIQUES NUMÉRIQUES (APPROCHÉES) - {var[:40]:<40}
+
+"""
+            report += filter_note + self._sketch_precision_note(sketch)
+            report += f"{'Statistique':<20}   {'Valeur':>12}   Borne\n{'-' * 70}\n"
+            for stat in NUMERIC_STATS:
+                report += f"{stat:<20} : {summary[stat].value:>12.4f}   {summary[stat].describe('.4g')}\n"
+            report += f"{'Valeurs distinctes':<20} : {distinct.value:>12,.0f}   {distinct.describe(',.0f')}\n"
+            report += f"{'Manquantes':<20} : {sketch.n_missing:>12,}   exact\n"
+            return report
+        
+        n_total = sketch.n_total
+        n_valid = n_total - sketch.n_missing
+        report = f"""
+    STATISTIQUES CATÉGORIELLES (APPROCHÉES) - {var[:40]:<40}
+
+"""
+        report += filter_note + self._sketch_precision_note(sketch)
+        report += f"""INFORMATIONS
+{'-' * 70}
+Total           : {n_total:,}
+Manquantes      : {sketch.n_missing:,} ({sketch.n_missing / max(n_total, 1) * 100:.2f}%)
+Valeurs uniques : ≈ {distinct.value:,.0f} ({distinct.describe(',.0f')})
+
+MODALITÉS DOMINANTES (Top 10, hors manquantes)
+{'-' * 70}
+{'Modalité':<30} {'Effectif':>12} {'%':>10}   Borne
+{'-' * 70}
+"""
+        for modalite, count in sketch.top_values(10):
+            pct = count.value / max(n_valid, 1) * 100
+            report += f"{str(modalite)[:28]:<30} {count.value:>12,.0f} {pct:>9.2f}%   {count.describe(',.0f')}\n"
+        return report
+    
+    def _approximate_all_stats_report(self, data: pd.DataFrame) -> str:
+        """Statistiques globales approchées de toutes les variables"""
+        numeric = [var for var in self.numeric_vars if var in data.columns]
+        categorical = [var for var in self.categorical_vars if var in data.columns]
+        sketches = self._column_sketches(data, numeric + categorical)
+        
+        report = """
+         STATISTIQUES GLOBALES (APPROCHÉES)
+
+"""
+        if data is not self.data:
+            report += self._filter_note(data)
+        if sketches:
+            report += self._sketch_precision_note(next(iter(sketches.values())))
+        
+        if numeric:
+            report += f"\nVARIABLES NUMÉRIQUES ({len(numeric)})\n{'=' * 70}\n"
+            for var in numeric:
+                summary = sketches[var].summary()
+                median = summary['Médiane']
+                report += f"\n{var}\n{'-' * 70}\n"
+                report += (f"Moy: {summary['Moyenne'].value:.2f} | Med: {median.value:.2f} ({median.describe('.2g')}) | "
+                           f"Std: {summary['Écart-type'].value:.2f}\n")
+                report += (f"Min: {summary['Min'].value:.2f} | Max: {summary['Max'].value:.2f} | "
+                           f"Distinctes: ≈ {sketches[var].distinct_count().value:,.0f}\n")
+        
+        if categorical:
+            report += f"\n\nVARIABLES CATÉGORIELLES ({len(categorical)})\n{'=' * 70}\n"
+            for var in categorical:
+                sketch = sketches[var]
+                n_valid = max(sketch.n_total - sketch.n_missing, 1)
+                report += f"\n{var} (≈ {sketch.distinct_count().value:,.0f} modalités)\n{'-' * 70}\n"
+                for i, (modalite, count) in enumerate(sketch.top_values(3)):
+                    pct = count.value / n_valid * 100
+                    report += f"  {i+1}. {str(modalite)[:30]:<30} : ≈ {count.value:>8,.0f} ({pct:>5.1f}%)\n"
+        
+        return report
+    
+    # ============================================================
+    # EXPORTS
+    # ============================================================
+    
+    def _export_word(self):
+        """Export Word avec contenu accumulé complet"""
+        self._start_report_export(['word'])
+    
+    def _export_pdf(self):
+        """Export PDF avec contenu accumulé complet"""
+        self._start_report_export(['pdf'])
+    
+    def _export_word_pdf(self):
+        """Exports Word et PDF produits en parallèle"""
+        self._start_report_export(['word', 'pdf'])
+    
+    def _export_data_info(self) -> Dict:
+        """Synthèse passée aux gabarits d'export"""
+        quality_score = self._calculate_quality_score()
+        
+        total_missing = sum(count for count, _ in self.missing_values.values()) if self.missing_values else 0
+        total_cells = self._row_count() * len(self.data.columns)
+        
+        return {
+            'filename': self.filename,
+            'rows': self._row_count(),
+            'columns': len(self.data.columns),
+            'numeric_vars': len(self.numeric_vars),
+            'categorical_vars': len(self.categorical_vars),
+            'boolean_vars': len(self.boolean_vars),
+            'quality_score': quality_score,
+            'missing_pct': (total_missing / total_cells * 100) if total_cells > 0 else 0,
+            'outliers_count': len(self.outliers_info),
+            'constant_vars': len(self.quasi_constant_vars),
+            'analyses_count': len(self.accumulated_reports)
+        }
+    
+    def _start_report_export(self, formats: List[str]):
+        """Choisir les fichiers puis générer les rapports hors du thread Tk"""
+        if self.data is None:
+            messagebox.showwarning("Attention", "Aucun fichier")
+            return
+        
+        if self.export_job is not None and self.export_job.is_alive():
+            messagebox.showwarning("Attention", "Un export est déjà en cours")
+            return
+        
+        stem = self.filename.replace('.csv', '').replace('.xlsx', '')
+        targets = {}
+        for export_format in formats:
+            extension = ".docx" if export_format == 'word' else ".pdf"
+            output_path = filedialog.asksaveasfilename(
+                defaultextension=extension,
+                filetypes=[(EXPORT_FORMATS[export_format], f"*{extension}")],
+                initialfile=f"rapport_{stem}{extension}"
+            )
+            if not output_path:
+                return
+            targets[export_format] = output_path
+        
+        try:
+            # PASSER LES RÉSULTATS STRUCTURÉS (copie figée : l'interface reste utilisable pendant l'export)
+            self.export_job = ExportJob(targets, self._export_data_info(), dict(self.current_stats),
+                                        results=self.accumulated_reports.to_list())
+            self.export_job.start()
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur:\n{str(e)}")
+            return
+        
+        self._export_progress = {export_format: 0.0 for export_format in targets}
+        self._export_errors = []
+        self._export_cancelled = False
+        self.load_progress['value'] = 0
+        names = " + ".join(EXPORT_FORMATS[f] for f in targets)
+        mode = "en parallèle" if self.export_job.use_processes else "en arrière-plan"
+        self.status_label.config(text=f"Export {names} {mode}...")
+        self.root.after(50, self._poll_export_job)
+    
+    def _poll_export_job(self):
+        """Dépiler la progression des exports (thread Tk uniquement)"""
+        job = self.export_job
+        if job is None:
+            return
+        
+        while True:
+            try:
+                kind, name, value, seconds = job.events.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'progress':
+                done, total = value
+                self._export_progress[name] = done / total if total else 1.0
+                pct = sum(self._export_progress.values()) / len(self._export_progress) * 100
+                self.load_progress['value'] = pct
+                self.status_label.config(text=f"Export en cours : {pct:.0f} % ({seconds:.1f} s)")
+            elif kind == 'result':
+                self._export_progress[name] = 1.0
+                self.tracer.record_parallel(f"Export {job.formats[name]}", seconds, 'exports', group='export')
+                print(f"✓ Export {job.formats[name]} : {value} ({seconds:.2f} s)")
+            elif kind == 'error':
+                self._export_errors.append(f"{job.formats[name]} : {value}")
+            elif kind == 'cancelled':
+                self._export_cancelled = True
+            elif kind == 'finished':
+                self.export_job = None
+                self.load_progress['value'] = 0
+                self.cancel_load_btn.config(state=DISABLED)
+                self._finish_export(job, seconds)
+                return
+        
+        self.root.after(50, self._poll_export_job)
+    
+    def _finish_export(self, job, seconds: float):
+        """Bilan des exports une fois le travail terminé"""
+        if self._export_cancelled:
+            self.status_label.config(text="Export annulé")
+            return
+        if self._export_errors:
+            self.status_label.config(text="Erreur d'export")
+            messagebox.showerror("Erreur", "Erreur:\n" + "\n".join(self._export_errors))
+            return
+        
+        names = " et ".join(job.formats[f] for f in job.targets)
+        if isinstance(job, DataExportJob):
+            sheets = job.metrics.get('sheets', 1)
+            detail = f" ({sheets} feuilles de données)" if sheets > 1 else ""
+            message = f"Export {names} terminé{detail}"
+        else:
+            message = f"Rapport {names} complet généré"
+        self.status_label.config(text=f"{message} en {seconds:.2f} s")
+        ToastNotification(
+            title="Succès",
+            message=message,
+            duration=3000,
+            bootstyle="success"
+        ).show_toast()
+    
+    def _export_excel(self):
+        """Export des données + statistiques : Excel en flux, ou Parquet / CSV.gz pour les données"""
+        if self.data is None:
+            messagebox.showwarning("Attention", "Aucun fichier")
+            return
+        
+        if self.export_job is not None and self.export_job.is_alive():
+            messagebox.showwarning("Attention", "Un export est déjà en cours")
+            return
+        
+        # Analyse en flux : seul l'aperçu est en mémoire, pas le fichier complet
+        if self.stream_summary is not None and not messagebox.askyesno(
+            "Analyse en flux",
+            f"Seules les {len(self.data):,} premières lignes sur {self.stream_summary.n_rows:,} "
+            f"sont en mémoire : l'export ne contiendra que cet aperçu (et les statistiques calculées).\n\n"
+            f"Exporter l'aperçu ?"
+        ):
+            return
+        
+        stem = self.filename.replace('.csv', '').replace('.xlsx', '')
+        output_path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[(label, f"*{DATA_EXTENSIONS[fmt]}") for fmt, label in available_formats().items()],
+            initialfile=f"export_{stem}.xlsx"
+        )
+        
+        if output_path:
+            try:
+                # Écriture bloc par bloc dans un thread : mémoire constante, interface réactive
+                self.export_job = DataExportJob(self.data, output_path, dict(self.current_stats))
+                self.export_job.start()
+            except Exception as e:
+                messagebox.showerror("Erreur", f"Erreur:\n{str(e)}")
+                return
+            
+            self._export_progress = {self.export_job.export_format: 0.0}
+            self._export_errors = []
+            self._export_cancelled = False
+            self.load_progress['value'] = 0
+            self.cancel_load_btn.config(state=NORMAL)
+            scope = "lignes (aperçu)" if self.stream_summary is not None else "lignes"
+            self.status_label.config(text=f"Export {DataExportJob.formats[self.export_job.export_format]} "
+                                          f"de {len(self.data):,} {scope}...")
+            self.root.after(50, self._poll_export_job)
+    
+    def _show_about(self):
+        """À propos"""
+        about_text = """EDA-Desk PRO HYBRID v4.0 ENHANCED
+
+Fonctionnalités complètes:
+- Architecture 4 zones respectée
+- Support CSV et Excel (.xlsx)
+- Zoom adaptatif (50% à 200%)
+- Headers stylisés uniformes
+- Accumulation progressive des résultats
+- Statistiques numériques ET catégorielles
+- Exports professionnels (Word, PDF, Excel)
+- Visualisations interactives
+- Historique complet
+- Interface moderne avec couleurs
+
+Raccourcis clavier:
+- Ctrl+O : Ouvrir CSV
+- Ctrl+E : Ouvrir Excel
+- Ctrl++ : Zoom avant
+- Ctrl+- : Zoom arrière
+- Ctrl+0 : Réinitialiser zoom
+
+Développé avec Python, tkinter & ttkbootstrap
+"""
+        Messagebox.show_info(about_text, "À propos")
+
+
+def main():
+    """Point d'entrée (commande ``eda-desk``)"""
+    root = ttk.Window(themename="flatly")
+    app = EDADeskHybrid(root)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
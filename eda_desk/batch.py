@@ -0,0 +1,252 @@
+"""
+MODE BATCH - profilage et exports sans interface, un fichier par processus
+
+    python -m eda_desk.batch donnees/ "archives/*.csv" -o rapports --formats word pdf excel
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from eda_desk.analyses import (classify_columns, compute_missing_values, compute_outliers,
+                               compute_quasi_constant, describe_numeric, quality_score)
+from eda_desk.chunked_loader import ChunkedCSVLoader
+from eda_desk.column_profiler import profile_columns
+from eda_desk.csv_dialect import detect_dialect
+from eda_desk.data_export import write_excel
+from eda_desk.export_jobs import run_export
+from eda_desk.history import HistoryManager
+from eda_desk.instrumentation import sequential_spans
+from eda_desk.memory_compact import compact_dataframe, memory_bytes
+from eda_desk.reports import (constant_result, global_stats_result, missing_result, outliers_result,
+                              quality_result)
+
+
+DATA_EXTENSIONS = ('.csv', '.xlsx', '.xls')
+EXPORT_FORMATS = ('word', 'pdf', 'excel')
+
+# Entrées d'historique écrites par transaction
+HISTORY_BATCH_SIZE = 100
+
+
+def expand_inputs(inputs: Sequence[str]) -> List[str]:
+    """Fichiers à traiter : fichiers, dossiers (CSV / Excel qu'ils contiennent) ou motifs glob"""
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = [os.path.join(item, name) for name in sorted(os.listdir(item))]
+        elif glob.has_magic(item):
+            candidates = sorted(glob.glob(item, recursive=True))
+        else:
+            candidates = [item]
+
+        for path in candidates:
+            if os.path.isfile(path) and path.lower().endswith(DATA_EXTENSIONS):
+                files.append(os.path.abspath(path))
+
+    # Un fichier cité deux fois n'est traité qu'une fois
+    return list(dict.fromkeys(files))
+
+
+def output_stems(files: Sequence[str]) -> Dict[str, str]:
+    """Nom de base des exports de chaque fichier : son nom sans extension, ou son chemin
+    relatif (``sub_data_csv``) quand plusieurs fichiers portent le même nom"""
+    stems = {path: os.path.splitext(os.path.basename(path))[0] for path in files}
+    counts = Counter(stems.values())
+    duplicates = [path for path in files if counts[stems[path]] > 1]
+    if duplicates:
+        root = os.path.commonpath([os.path.dirname(path) for path in duplicates])
+        for path in duplicates:
+            stems[path] = os.path.relpath(path, root).replace(os.sep, '_').replace('.', '_')
+
+    # Dernier recours (chemin relatif égal au nom d'un autre fichier) : suffixe numérique
+    used = set()
+    for path in files:
+        stem, number = stems[path], 1
+        while stem in used:
+            number += 1
+            stem = f"{stems[path]}_{number}"
+        used.add(stem)
+        stems[path] = stem
+    return stems
+
+
+def load_file(path: str, compact: bool = False) -> Tuple[pd.DataFrame, Optional[Dict]]:
+    """Charger un CSV (dialecte détecté) ou un Excel, comme l'interface : (données, dialecte)"""
+    if path.lower().endswith('.csv'):
+        dialect = detect_dialect(path)
+        loader = ChunkedCSVLoader(path, read_kwargs=dialect.read_kwargs(), compact=compact)
+        return loader.load(), dialect.to_dict()
+
+    data = pd.read_excel(path, engine='openpyxl')
+    if compact:
+        data, _ = compact_dataframe(data)
+    return data, None
+
+
+def analyze_file(path: str, output_dir: str, formats: Sequence[str] = EXPORT_FORMATS,
+                 compact: bool = False, stem: Optional[str] = None) -> Dict:
+    """Rapport complet + statistiques globales + exports d'un fichier (exécuté dans un worker).
+
+    Retourne uniquement des objets sérialisables : informations pour
+    l'historique, fichiers écrits et durée de chaque étape. ``stem`` : nom
+    de base des exports (voir ``output_stems``).
+    """
+    timings = {}
+    start = time.perf_counter()
+    filename = os.path.basename(path)
+
+    data, dialect = load_file(path, compact)
+    timings['chargement'] = time.perf_counter() - start
+
+    step = time.perf_counter()
+    n_rows, n_columns = data.shape
+    profile = profile_columns(data)
+    _, numeric_vars, categorical_vars, boolean_vars = classify_columns(profile, n_rows)
+    missing_values, _ = compute_missing_values(profile)
+    quasi_constant_vars = compute_quasi_constant(profile, n_rows)
+    outliers_info = compute_outliers(data[numeric_vars], n_rows) if numeric_vars else {}
+
+    total_cells = n_rows * n_columns
+    total_missing = int(profile['null_count'].sum())
+    score = quality_score(total_missing, total_cells, n_columns, len(quasi_constant_vars),
+                          outliers_info, len(numeric_vars))
+    stats = {var: describe_numeric(data[var]) for var in numeric_vars}
+    timings['analyses'] = time.perf_counter() - step
+
+    # Mêmes analyses, dans le même ordre, que le rapport complet puis « Toutes » de l'interface
+    results = [missing_result(missing_values, total_cells), constant_result(quasi_constant_vars)]
+    if numeric_vars:
+        results.append(outliers_result(outliers_info))
+    results.append(quality_result(
+        filename, n_rows, n_columns, f"{memory_bytes(data) / 1024**2:.2f} MB", score,
+        total_missing, total_cells, len(quasi_constant_vars), len(outliers_info)))
+    results.append(global_stats_result(data, numeric_vars, categorical_vars))
+
+    data_info = {
+        'filename': filename,
+        'filepath': path,
+        'rows': n_rows,
+        'columns': n_columns,
+        'numeric_vars': len(numeric_vars),
+        'categorical_vars': len(categorical_vars),
+        'boolean_vars': len(boolean_vars),
+        'quality_score': score,
+        'missing_pct': (total_missing / total_cells * 100) if total_cells > 0 else 0,
+        'outliers_count': len(outliers_info),
+        'constant_vars': len(quasi_constant_vars),
+        'analyses_count': len(results),
+        'notes': 'batch',
+        'dialect': dialect
+    }
+
+    step = time.perf_counter()
+    outputs = export_reports(data, data_info, stats, [result.to_dict() for result in results], output_dir, formats,
+                             stem)
+    timings['exports'] = time.perf_counter() - step
+
+    return {
+        'path': path,
+        'data_info': data_info,
+        'outputs': outputs,
+        'timings': timings,
+        'seconds': time.perf_counter() - start
+    }
+
+
+def export_reports(data: pd.DataFrame, data_info: Dict, stats: Dict, results: List[Dict], output_dir: str,
+                   formats: Sequence[str], stem: Optional[str] = None) -> List[str]:
+    """Écrire les exports demandés (mêmes gabarits que l'interface)"""
+    os.makedirs(output_dir, exist_ok=True)
+    stem = stem or os.path.splitext(data_info['filename'])[0]
+    outputs = []
+
+    if 'word' in formats:
+        outputs.append(run_export('word', data_info, stats, os.path.join(output_dir, f"rapport_{stem}.docx"), results))
+    if 'pdf' in formats:
+        outputs.append(run_export('pdf', data_info, stats, os.path.join(output_dir, f"rapport_{stem}.pdf"), results))
+    if 'excel' in formats:
+        path = os.path.join(output_dir, f"export_{stem}.xlsx")
+        write_excel(data, path, stats)
+        outputs.append(path)
+    return outputs
+
+
+def run_batch(files: Sequence[str], output_dir: str, formats: Sequence[str] = EXPORT_FORMATS,
+              max_workers: Optional[int] = None, history_db: Optional[str] = "eda_history.db",
+              compact: bool = False, log=print) -> List[Dict]:
+    """Traiter les fichiers dans un pool de processus ; l'historique est écrit par le processus principal"""
+    history = HistoryManager(history_db) if history_db else None
+    pending_history = []
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(files) or 1))
+    results = []
+    start = time.perf_counter()
+    stems = output_stems(files)
+
+    log(f"{len(files)} fichier(s), {workers} processus, exports : {', '.join(formats) or 'aucun'}")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(analyze_file, path, output_dir, formats, compact, stems[path]): path for path in files}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                results.append({'path': path, 'error': str(e)})
+                log(f"✗ {os.path.basename(path)} : {e}")
+                continue
+
+            if history is not None:
+                timings = [span.to_dict() for span in sequential_spans(result['timings'])]
+                pending_history.append(dict(result['data_info'], timings=timings))
+                if len(pending_history) >= HISTORY_BATCH_SIZE:
+                    history.add_entries(pending_history)
+                    pending_history.clear()
+            results.append(result)
+            info = result['data_info']
+            steps = " | ".join(f"{name} {seconds:.2f} s" for name, seconds in result['timings'].items())
+            log(f"✓ {info['filename']} - {info['rows']:,} × {info['columns']}, "
+                f"score {info['quality_score']:.1f} - {steps} - total {result['seconds']:.2f} s")
+
+    if history is not None:
+        history.add_entries(pending_history)
+        history.close()
+
+    failed = sum(1 for r in results if 'error' in r)
+    log(f"Terminé en {time.perf_counter() - start:.2f} s : {len(results) - failed} réussi(s), {failed} échec(s)")
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m eda_desk.batch",
+        description="Profilage EDA sans interface : rapport de qualité, statistiques et exports pour chaque fichier."
+    )
+    parser.add_argument('inputs', nargs='+', help="fichiers, dossiers ou motifs glob (CSV, Excel)")
+    parser.add_argument('-o', '--output-dir', default='rapports', help="dossier des exports (défaut : rapports)")
+    parser.add_argument('--formats', nargs='*', choices=EXPORT_FORMATS, default=list(EXPORT_FORMATS),
+                        help="exports à produire (défaut : word pdf excel)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="processus en parallèle (défaut : un par cœur)")
+    parser.add_argument('--history', default='eda_history.db', help="base d'historique SQLite")
+    parser.add_argument('--no-history', action='store_true', help="ne pas enregistrer les exécutions")
+    parser.add_argument('--compact', action='store_true', help="mode mémoire compacte au chargement")
+    args = parser.parse_args(argv)
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        print("Aucun fichier CSV ou Excel trouvé", file=sys.stderr)
+        return 2
+
+    results = run_batch(files, args.output_dir, args.formats, args.workers,
+                        None if args.no_history else args.history, args.compact)
+    return 1 if any('error' in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
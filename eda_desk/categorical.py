@@ -0,0 +1,130 @@
+"""
+STATISTIQUES CATÉGORIELLES - effectifs, manquants, cardinalité et modalités dominantes en un passage
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from eda_desk.results import Table
+from eda_desk.sketches import Z_95, DistinctSketch, Estimate, TopValueSketch
+
+
+# Modalités dominantes gardées par colonne (tableau des statistiques et des exports)
+TOP_K = 10
+# Effectifs exacts tant que la colonne a au plus ce nombre de modalités...
+EXACT_MAX_UNIQUE = 100_000
+# ... au-delà, compteurs de Misra-Gries : erreur par effectif <= lignes / (capacité + 1)
+HEAVY_HITTER_CAPACITY = 2_000
+# Lignes par bloc : la table de hachage d'un bloc fixe le pic mémoire (~40 Mo pour des identifiants texte)
+CHUNK_ROWS = 250_000
+
+
+@dataclass
+class CategoricalStats:
+    """Résumé d'une colonne catégorielle : manquants, cardinalité et ``TOP_K`` modalités dominantes.
+
+    ``heavy_hitters`` : effectifs issus des compteurs bornés (valeur au milieu
+    de l'intervalle garanti, voir ``Estimate``) ; sinon tout est exact.
+    """
+    n_total: int
+    n_missing: int
+    n_unique: Estimate
+    top: List[Tuple[object, Estimate]] = field(default_factory=list)
+    heavy_hitters: bool = False
+
+    @property
+    def missing_pct(self) -> float:
+        return self.n_missing / self.n_total * 100 if self.n_total else 0.0
+
+    @property
+    def count_error(self) -> float:
+        """Erreur maximale sur l'effectif d'une modalité (0 : effectifs exacts)"""
+        return max((count.error for _, count in self.top), default=0.0)
+
+    def percent(self, count: float) -> float:
+        """Part des lignes (manquants compris, comme ``value_counts(normalize=True, dropna=False)``)"""
+        return count / self.n_total * 100 if self.n_total else 0.0
+
+    def top_table(self, n: int = TOP_K, title: str = "") -> Table:
+        rows = [[str(value), count.value, self.percent(count.value)] for value, count in self.top[:n]]
+        return Table(['Modalité', 'Effectif', '%'], rows, title)
+
+
+def format_count(count: Estimate) -> str:
+    """Effectif ou cardinalité pour l'affichage : « 1,234 » ou « 1,234 ± 56 »"""
+    if count.exact:
+        return f"{int(count.value):,}"
+    return f"{count.value:,.0f} ± {count.error:,.0f}"
+
+
+def categorical_stats(series: pd.Series, top_k: int = TOP_K, n_unique: Optional[int] = None,
+                      max_exact: int = EXACT_MAX_UNIQUE, capacity: int = HEAVY_HITTER_CAPACITY,
+                      chunk_rows: int = CHUNK_ROWS) -> CategoricalStats:
+    """Un passage par blocs de ``chunk_rows`` lignes (un ``factorize`` + ``bincount`` par bloc).
+
+    Les effectifs des blocs sont cumulés exactement tant que la colonne a au
+    plus ``max_exact`` modalités (ou qu'elle tient en un bloc). Au-delà, ils
+    passent dans un résumé de Misra-Gries de ``capacity`` compteurs et la
+    cardinalité dans un HyperLogLog : la mémoire ne dépend plus du nombre de
+    modalités. ``n_unique`` : cardinalité exacte déjà connue (profil du
+    fichier), qui évite l'HyperLogLog et fait basculer dès le premier bloc.
+    """
+    n_total = len(series)
+    n_missing = 0
+    counts: Optional[pd.Series] = None
+    top: Optional[TopValueSketch] = None
+    distinct: Optional[DistinctSketch] = None
+    if n_unique is not None and n_unique > max_exact and n_total > chunk_rows:
+        top = TopValueSketch(capacity)
+
+    for start in range(0, n_total, chunk_rows):
+        labels, chunk_counts, missing = _block_counts(series.iloc[start:start + chunk_rows])
+        n_missing += missing
+
+        if top is None:
+            counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0).astype('int64')
+            if len(counts) > max_exact and start + chunk_rows < n_total:
+                # Bascule : les modalités déjà vues amorcent les compteurs et l'HyperLogLog
+                top = TopValueSketch(capacity)
+                top.update_counts(counts)
+                if n_unique is None:
+                    distinct = DistinctSketch()
+                    distinct.update_hashes(pd.util.hash_array(np.asarray(counts.index, dtype=object),
+                                                              categorize=False))
+                counts = None
+            continue
+
+        if n_unique is None:
+            if distinct is None:
+                distinct = DistinctSketch()
+            distinct.update_hashes(pd.util.hash_array(labels, categorize=False))
+        top.update_counts(chunk_counts)
+
+    if top is None:
+        counts = counts if counts is not None else pd.Series(dtype='int64')
+        largest = counts.nlargest(top_k, keep='first')
+        return CategoricalStats(n_total, n_missing, Estimate(len(counts)),
+                                [(value, Estimate(int(count))) for value, count in largest.items()])
+
+    if n_unique is not None:
+        cardinality = Estimate(n_unique)
+    else:
+        estimate = distinct.estimate()
+        cardinality = Estimate(round(estimate), Z_95 * distinct.standard_error * estimate)
+    return CategoricalStats(n_total, n_missing, cardinality, top.top_values(top_k), heavy_hitters=True)
+
+
+def _block_counts(series: pd.Series) -> Tuple[np.ndarray, pd.Series, int]:
+    """(modalités du bloc, effectifs non nuls, manquants) ; codes des catégories repris tels quels"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series)
+    present = codes[codes >= 0]
+    labels = np.asarray(uniques, dtype=object)
+    counts = np.bincount(present, minlength=labels.size)
+    nonzero = counts > 0
+    return labels[nonzero], pd.Series(counts[nonzero], index=labels[nonzero]), len(codes) - present.size
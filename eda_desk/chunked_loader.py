@@ -0,0 +1,176 @@
+"""
+CHARGEMENT CSV EN ARRIÈRE-PLAN - lecture par blocs, progression et annulation
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Dict, Optional
+
+import pandas as pd
+
+from eda_desk.column_profiler import profile_columns
+from eda_desk.memory_compact import compact_frame, concat_compact, memory_bytes
+
+
+class LoadCancelled(Exception):
+    """Chargement interrompu par l'utilisateur"""
+
+
+class ChunkedCSVLoader:
+    """Lecture d'un CSV par blocs dans un thread de travail.
+
+    Le thread ne touche jamais à Tk : il publie ses événements dans
+    ``self.events`` (``'progress'``, ``'done'``, ``'error'``, ``'cancelled'``)
+    que l'interface dépile avec ``root.after``. Le profil des colonnes est
+    calculé dans le même thread : ``self.profile`` est prêt avec ``'done'``.
+    """
+
+    def __init__(self, filepath: str, read_kwargs: Optional[Dict] = None, chunksize: int = 100_000,
+                 snapshot_store=None, snapshot_params: Optional[Dict] = None, compact: bool = False):
+        self.filepath = filepath
+        self.read_kwargs = dict(read_kwargs or {})
+        self.read_kwargs.setdefault('sep', ',')
+        self.compact = compact
+        self.snapshot_store = snapshot_store
+        self.snapshot_params = snapshot_params or {'format': 'csv', **self.read_kwargs}
+        if compact:
+            self.snapshot_params['compact'] = True
+        self.chunksize = chunksize
+        self.total_bytes = os.path.getsize(filepath)
+        self.events: "queue.Queue" = queue.Queue()
+        self.metrics: Dict = {}
+        self.profile: Optional[pd.DataFrame] = None
+        self._cancel_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ============================================================
+    # API
+    # ============================================================
+
+    def start(self):
+        """Lancer le chargement dans un thread de travail"""
+        self._thread = threading.Thread(target=self._run, name="csv-loader", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Demander l'arrêt au prochain bloc"""
+        self._cancel_event.set()
+
+    @property
+    def sep(self) -> str:
+        return self.read_kwargs['sep']
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def build_profile(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Profil des colonnes (tri des colonnes numériques : hors du thread Tk)"""
+        return profile_columns(data)
+
+    def load(self) -> pd.DataFrame:
+        """Chargement synchrone (utilisé par le thread, ou directement sans interface)"""
+        start = time.perf_counter()
+
+        if self.snapshot_store is not None:
+            snapshot = self.snapshot_store.load(self.filepath, self.snapshot_params)
+            if snapshot is not None:
+                data, meta = snapshot
+                self.metrics = {
+                    'rows': len(data),
+                    'chunks': 0,
+                    'bytes': self.total_bytes,
+                    'load_seconds': time.perf_counter() - start,
+                    'separator': self.sep,
+                    'source': 'snapshot'
+                }
+                if self.compact:
+                    self.metrics['memory_before'] = meta.get('extra', {}).get('memory_before')
+                    self.metrics['memory_after'] = memory_bytes(data)
+                return data
+
+        chunks = []
+        rows = 0
+        memory_before = 0
+        with open(self.filepath, 'rb') as handle:
+            reader = pd.read_csv(handle, chunksize=self.chunksize, **self.read_kwargs)
+            for chunk in reader:
+                if self._cancel_event.is_set():
+                    raise LoadCancelled()
+                if self.compact:
+                    # Compacté bloc par bloc : le pic mémoire reste celui d'un bloc brut
+                    memory_before += memory_bytes(chunk)
+                    chunk = compact_frame(chunk)
+                chunks.append(chunk)
+                rows += len(chunk)
+                self.events.put(('progress', {
+                    'rows': rows,
+                    'bytes_read': min(handle.tell(), self.total_bytes),
+                    'total_bytes': self.total_bytes,
+                    'elapsed': time.perf_counter() - start
+                }))
+
+        if self._cancel_event.is_set():
+            raise LoadCancelled()
+
+        if not chunks:
+            data = pd.read_csv(self.filepath, **self.read_kwargs)
+        elif self.compact:
+            data = concat_compact(chunks)
+        elif len(chunks) == 1:
+            data = chunks[0]
+        else:
+            data = pd.concat(chunks, ignore_index=True)
+
+        self.metrics = {
+            'rows': len(data),
+            'chunks': len(chunks),
+            'bytes': self.total_bytes,
+            'load_seconds': time.perf_counter() - start,
+            'separator': self.sep,
+            'source': 'csv'
+        }
+        extra = None
+        if self.compact:
+            self.metrics['memory_before'] = memory_before
+            self.metrics['memory_after'] = memory_bytes(data)
+            extra = {'memory_before': memory_before}
+
+        if self.snapshot_store is not None and not self._cancel_event.is_set():
+            self.snapshot_store.save(self.filepath, self.snapshot_params, data, extra)
+            self.metrics['snapshot_seconds'] = time.perf_counter() - start - self.metrics['load_seconds']
+        return data
+
+    # ============================================================
+    # INTERNE
+    # ============================================================
+
+    def _run(self):
+        """Corps du thread : publier le résultat dans la file d'événements"""
+        try:
+            data = self.load()
+            start = time.perf_counter()
+            self.profile = self.build_profile(data)
+            self.metrics['profile_seconds'] = time.perf_counter() - start
+            if self._cancel_event.is_set():
+                raise LoadCancelled()
+        except LoadCancelled:
+            self.events.put(('cancelled', None))
+        except Exception as e:
+            self.events.put(('error', e))
+        else:
+            self.events.put(('done', data))
+
+
+def format_bytes(n: float) -> str:
+    """Taille lisible (Ko, Mo, Go)"""
+    for unit in ('o', 'Ko', 'Mo', 'Go'):
+        if n < 1024 or unit == 'Go':
+            return f"{n:.0f} {unit}" if unit == 'o' else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} Go"
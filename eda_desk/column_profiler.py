@@ -0,0 +1,147 @@
+"""
+PROFIL DES COLONNES - un seul passage vectorisé pour toutes les analyses
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Colonnes du profil (une ligne par variable du dataset)
+PROFILE_COLUMNS = ['dtype', 'count', 'null_count', 'null_pct', 'n_unique',
+                   'top_count', 'min', 'max', 'is_numeric', 'bool_like']
+
+BOOL_LIKE_VALUES = [0, 1, True, False, 'True', 'False', 'yes', 'no']
+
+# Taille cible d'un bloc numérique trié en mémoire (nombre de cellules float64)
+BLOCK_CELLS = 8_000_000
+
+
+def profile_columns(df: pd.DataFrame, block_cells: int = BLOCK_CELLS) -> pd.DataFrame:
+    """Profil complet de chaque colonne : type, manquants, distincts, modalité dominante, min, max.
+
+    Les colonnes numériques sont traitées par blocs 2D (un tri par bloc), les
+    autres par ``pd.factorize`` (un passage par colonne). ``top_count`` suit
+    la sémantique de ``value_counts(dropna=False)`` : les manquants forment
+    une modalité.
+    """
+    n_rows = len(df)
+    profile = pd.DataFrame(index=pd.Index(df.columns, name='variable'), columns=PROFILE_COLUMNS)
+    profile['dtype'] = [str(t) for t in df.dtypes]
+    profile['count'] = n_rows
+
+    numeric_cols = [col for col, dtype in df.dtypes.items() if _is_sortable_numeric(df[col], dtype)]
+    other_cols = [col for col in df.columns if col not in set(numeric_cols)]
+
+    if numeric_cols:
+        block_width = max(1, block_cells // max(n_rows, 1))
+        for start in range(0, len(numeric_cols), block_width):
+            cols = numeric_cols[start:start + block_width]
+            _profile_numeric_block(df, cols, profile)
+
+    for col in other_cols:
+        _profile_generic_column(df[col], col, profile)
+
+    profile['null_pct'] = (profile['null_count'] / n_rows * 100) if n_rows else 0.0
+    for col in ('count', 'null_count', 'n_unique', 'top_count'):
+        profile[col] = profile[col].astype('int64')
+    profile['null_pct'] = profile['null_pct'].astype('float64')
+    profile['min'] = profile['min'].astype('float64')
+    profile['max'] = profile['max'].astype('float64')
+    profile['is_numeric'] = profile['is_numeric'].astype(bool)
+    profile['bool_like'] = profile['bool_like'].astype(bool)
+    return profile
+
+
+def _is_sortable_numeric(series: pd.Series, dtype) -> bool:
+    """Colonne traitable en float64 sans perte (int trop grands exclus)"""
+    if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+        return False
+    if pd.api.types.is_extension_array_dtype(dtype):
+        return False
+    if pd.api.types.is_integer_dtype(dtype) and len(series):
+        return bool(np.abs(series.to_numpy()).max() < 2 ** 53)
+    return True
+
+
+def _profile_numeric_block(df: pd.DataFrame, cols, profile: pd.DataFrame):
+    """Trier un bloc de colonnes d'un coup et en déduire toutes les mesures"""
+    values = df[cols].to_numpy(dtype='float64', na_value=np.nan)
+    n_rows = values.shape[0]
+
+    null_count = np.isnan(values).sum(axis=0)
+    n_valid = n_rows - null_count
+
+    if n_rows == 0:
+        profile.loc[cols, 'null_count'] = 0
+        profile.loc[cols, 'n_unique'] = 0
+        profile.loc[cols, 'top_count'] = 0
+        profile.loc[cols, 'min'] = np.nan
+        profile.loc[cols, 'max'] = np.nan
+        profile.loc[cols, 'is_numeric'] = True
+        profile.loc[cols, 'bool_like'] = False
+        return
+
+    # Tri par colonne : les NaN se retrouvent en bas
+    values.sort(axis=0)
+    row_idx = np.arange(n_rows)[:, None]
+    valid = row_idx < n_valid[None, :]
+
+    # Début de chaque groupe de valeurs égales (parmi les valeurs non manquantes)
+    new_group = np.empty_like(valid)
+    new_group[0] = True
+    np.not_equal(values[1:], values[:-1], out=new_group[1:])
+    new_group &= valid
+    n_unique = new_group.sum(axis=0)
+
+    # Longueur de la plus longue série de valeurs identiques
+    run_start = np.where(new_group, row_idx, 0)
+    np.maximum.accumulate(run_start, axis=0, out=run_start)
+    run_length = np.where(valid, row_idx - run_start + 1, 0)
+    top_valid = run_length.max(axis=0)
+    top_count = np.maximum(top_valid, null_count)
+
+    col_idx = np.arange(values.shape[1])
+    has_valid = n_valid > 0
+    min_vals = np.where(has_valid, values[0], np.nan)
+    max_vals = np.where(has_valid, values[np.maximum(n_valid - 1, 0), col_idx], np.nan)
+
+    profile.loc[cols, 'null_count'] = null_count
+    profile.loc[cols, 'n_unique'] = n_unique
+    profile.loc[cols, 'top_count'] = top_count
+    profile.loc[cols, 'min'] = min_vals
+    profile.loc[cols, 'max'] = max_vals
+    profile.loc[cols, 'is_numeric'] = True
+    profile.loc[cols, 'bool_like'] = (n_unique == 2) & (min_vals == 0) & (max_vals == 1)
+
+
+def _profile_generic_column(series: pd.Series, col, profile: pd.DataFrame):
+    """Colonnes texte, booléennes, dates : un factorize par colonne"""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    null_mask = codes < 0
+    null_count = int(null_mask.sum())
+    n_unique = len(uniques)
+
+    if n_unique:
+        counts = np.bincount(codes[~null_mask], minlength=n_unique)
+        top_count = max(int(counts.max()), null_count)
+    else:
+        top_count = null_count
+
+    is_numeric = pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+    min_val: Optional[float] = np.nan
+    max_val: Optional[float] = np.nan
+    if is_numeric and n_unique:
+        min_val = series.min()
+        max_val = series.max()
+
+    bool_like = n_unique == 2 and bool(pd.Index(uniques).isin(BOOL_LIKE_VALUES).all())
+
+    profile.at[col, 'null_count'] = null_count
+    profile.at[col, 'n_unique'] = n_unique
+    profile.at[col, 'top_count'] = top_count
+    profile.at[col, 'min'] = min_val
+    profile.at[col, 'max'] = max_val
+    profile.at[col, 'is_numeric'] = is_numeric
+    profile.at[col, 'bool_like'] = bool_like
@@ -0,0 +1,187 @@
+"""
+CORRÉLATIONS À GRANDE ÉCHELLE - Pearson / Spearman par blocs de lignes en float32, en parallèle
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from eda_desk.analysis_scheduler import default_workers
+
+try:
+    from scipy.cluster.hierarchy import leaves_list, linkage
+    from scipy.spatial.distance import squareform
+except ImportError:  # scipy optionnel : ordre spectral à la place du regroupement hiérarchique
+    linkage = None
+
+
+# Taille cible d'un bloc de lignes (cellules) traité par un worker
+CHUNK_CELLS = 4_000_000
+# Au-delà, Spearman est calculé sur un échantillon de lignes (matrice des rangs en mémoire)
+RANK_BUDGET_CELLS = 100_000_000
+METHODS = ('pearson', 'spearman')
+
+
+@dataclass
+class CorrelationResult:
+    """Matrice de corrélation et conditions du calcul"""
+    matrix: pd.DataFrame
+    method: str = 'pearson'
+    n_rows: int = 0
+    sampled: bool = False
+    seconds: float = 0.0
+    order: List[str] = field(default_factory=list)
+
+    def top_pairs(self, k: int = 20) -> List[Tuple[str, str, float]]:
+        return top_pairs(self.matrix, k)
+
+
+def correlation_matrix(data: pd.DataFrame, columns: Optional[Sequence[str]] = None, method: str = 'pearson',
+                       max_workers: Optional[int] = None, chunk_cells: int = CHUNK_CELLS,
+                       rank_budget_cells: int = RANK_BUDGET_CELLS, seed: int = 0) -> CorrelationResult:
+    """Matrice complète, paires complètes (comme ``DataFrame.corr``), en une passe sur les lignes.
+
+    Les lignes sont découpées en blocs ; chaque worker calcule pour son bloc les
+    produits matriciels (float32, BLAS) des effectifs, sommes, sommes de carrés et
+    produits croisés, accumulés en float64. Spearman = Pearson sur les rangs de
+    chaque colonne (rangs calculés sur les valeurs non manquantes de la colonne).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Méthode inconnue : {method}")
+    start = time.perf_counter()
+
+    columns = list(columns) if columns is not None else data.select_dtypes(include=[np.number]).columns.tolist()
+    workers = max_workers or default_workers()
+    source = data[columns]
+    sampled = False
+
+    if method == 'spearman':
+        if len(source) * max(len(columns), 1) > rank_budget_cells:
+            n_sample = max(1, rank_budget_cells // max(len(columns), 1))
+            source = source.sample(n=n_sample, random_state=seed)
+            sampled = True
+        source = pd.DataFrame(_rank_columns(source, workers), columns=columns)
+
+    n_rows, n_cols = source.shape
+    if n_cols == 0:
+        return CorrelationResult(pd.DataFrame(), method, n_rows, sampled, time.perf_counter() - start)
+
+    # Centrage par la moyenne de chaque colonne : sommes float32 bien conditionnées
+    means = source.mean().to_numpy(dtype='float64')
+    has_missing = bool(source.isna().to_numpy().any())
+
+    chunk_rows = max(1_000, chunk_cells // n_cols)
+    bounds = [(i, min(i + chunk_rows, n_rows)) for i in range(0, n_rows, chunk_rows)]
+
+    def accumulate(bound):
+        block = source.iloc[bound[0]:bound[1]].to_numpy(dtype='float64', na_value=np.nan)
+        block = (block - means).astype(np.float32)
+        if not has_missing:
+            return {'xy': block.T @ block, 'x': block.sum(axis=0, dtype=np.float64)}
+        valid = ~np.isnan(block)
+        block[~valid] = 0.0
+        mask = valid.astype(np.float32)
+        return {
+            'n': mask.T @ mask,
+            'x': block.T @ mask,
+            'xx': (block * block).T @ mask,
+            'xy': block.T @ block
+        }
+
+    totals = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(accumulate, bounds):
+            for name, value in part.items():
+                value = value.astype(np.float64)
+                totals[name] = value if name not in totals else totals[name] + value
+
+    if has_missing:
+        n = totals['n']
+        sx = totals['x']
+        sy = sx.T
+        cov = totals['xy'] - sx * sy / np.where(n > 0, n, np.nan)
+        var_x = totals['xx'] - sx * sx / np.where(n > 0, n, np.nan)
+        var_y = var_x.T
+    else:
+        s = totals['x']
+        cov = totals['xy'] - np.outer(s, s) / n_rows
+        diag = np.diag(cov)
+        var_x = np.broadcast_to(diag[:, None], cov.shape)
+        var_y = np.broadcast_to(diag[None, :], cov.shape)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        corr = cov / np.sqrt(var_x * var_y)
+    corr = np.clip(corr, -1.0, 1.0).astype(np.float32)
+    defined = np.isfinite(np.diag(corr))
+    corr[np.diag_indices(n_cols)] = np.where(defined, 1.0, np.nan)
+
+    matrix = pd.DataFrame(corr, index=columns, columns=columns)
+    return CorrelationResult(matrix, method, n_rows, sampled, time.perf_counter() - start)
+
+
+def _rank_columns(source: pd.DataFrame, max_workers: int) -> np.ndarray:
+    """Rangs moyens (ex-aequo) de chaque colonne en float32, manquants conservés"""
+    # Ordre Fortran : chaque colonne de rangs est contiguë
+    ranks = np.full(source.shape, np.nan, dtype=np.float32, order='F')
+
+    def rank_one(j):
+        values = source.iloc[:, j].to_numpy(dtype='float64', na_value=np.nan)
+        valid = np.flatnonzero(~np.isnan(values))
+        if valid.size == 0:
+            return
+        # Tri non stable suffisant : les ex-aequo reçoivent tous le même rang moyen
+        order = valid[np.argsort(values[valid])]
+        sorted_values = values[order]
+
+        # Groupes d'ex-aequo : rang moyen = milieu des positions du groupe (base 1)
+        starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+        ends = np.r_[starts[1:], sorted_values.size]
+        group_rank = (starts + ends + 1) / 2.0
+        ranks[order, j] = np.repeat(group_rank, ends - starts)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(rank_one, range(source.shape[1])))
+    return ranks
+
+
+def top_pairs(matrix: pd.DataFrame, k: int = 20) -> List[Tuple[str, str, float]]:
+    """Les k paires (distinctes) de plus forte corrélation absolue"""
+    values = matrix.to_numpy(dtype='float64')
+    n = values.shape[0]
+    if n < 2:
+        return []
+
+    rows, cols = np.triu_indices(n, k=1)
+    strength = np.abs(values[rows, cols])
+    strength = np.where(np.isfinite(strength), strength, -1.0)
+
+    k = min(k, strength.size)
+    best = np.argpartition(-strength, k - 1)[:k]
+    best = best[np.argsort(-strength[best], kind='stable')]
+    names = matrix.columns
+    return [(names[rows[i]], names[cols[i]], float(values[rows[i], cols[i]]))
+            for i in best if strength[i] >= 0]
+
+
+def cluster_order(matrix: pd.DataFrame) -> List[str]:
+    """Ordre des variables regroupant les variables corrélées (pour la heatmap)"""
+    names = list(matrix.columns)
+    if len(names) < 3:
+        return names
+
+    similarity = np.nan_to_num(np.abs(matrix.to_numpy(dtype='float64')), nan=0.0)
+    if linkage is not None:
+        distance = 1.0 - similarity
+        np.fill_diagonal(distance, 0.0)
+        distance = (distance + distance.T) / 2
+        tree = linkage(squareform(np.clip(distance, 0.0, None), checks=False), method='average')
+        return [names[i] for i in leaves_list(tree)]
+
+    # Sans scipy : tri selon l'angle des deux premiers vecteurs propres
+    _, vectors = np.linalg.eigh(similarity)
+    angle = np.arctan2(vectors[:, -2], vectors[:, -1])
+    return [names[i] for i in np.argsort(angle)]
@@ -0,0 +1,189 @@
+"""
+DÉTECTION DU DIALECTE CSV - séparateur, guillemets, encodage et en-tête sur un échantillon borné
+"""
+
+import codecs
+import csv
+import io
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+SAMPLE_BYTES = 64 * 1024
+CANDIDATE_DELIMITERS = [',', ';', '\t', '|', ' ']
+FALLBACK_ENCODINGS = ['utf-8', 'cp1252', 'latin-1']
+
+
+@dataclass
+class CSVDialect:
+    """Dialecte détecté, réutilisable d'une ouverture à l'autre"""
+    delimiter: str = ','
+    quotechar: str = '"'
+    encoding: str = 'utf-8'
+    has_header: bool = True
+    n_fields: int = 0
+    confidence: float = 0.0
+    fallback: bool = False
+    reason: str = ""
+
+    def read_kwargs(self) -> Dict:
+        """Options pd.read_csv correspondantes"""
+        kwargs = {
+            'sep': self.delimiter,
+            'quotechar': self.quotechar,
+            'encoding': self.encoding,
+            'header': 0 if self.has_header else None
+        }
+        if not self.has_header and self.n_fields:
+            # Noms de colonnes texte : les rapports les tronquent comme des chaînes
+            kwargs['names'] = [f"colonne_{i}" for i in range(1, self.n_fields + 1)]
+        return kwargs
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, values: Dict) -> "CSVDialect":
+        known = {k: v for k, v in values.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+def detect_dialect(filepath: str, sample_bytes: int = SAMPLE_BYTES) -> CSVDialect:
+    """Décider du dialecte à partir des premiers ``sample_bytes`` octets uniquement"""
+    with open(filepath, 'rb') as f:
+        raw = f.read(sample_bytes)
+        truncated = bool(f.read(1))
+
+    encoding, text = _decode_sample(raw)
+    lines = _complete_lines(text, truncated)
+
+    if not lines:
+        return _fallback(encoding, "fichier vide")
+
+    scores = [_score_delimiter(lines, delim) for delim in CANDIDATE_DELIMITERS]
+    scores = [s for s in scores if s[2] > 1]
+    # L'espace n'est retenu qu'en dernier recours (présent dans beaucoup de valeurs texte)
+    if any(s[0] != ' ' for s in scores):
+        scores = [s for s in scores if s[0] != ' ']
+    if not scores:
+        return _fallback(encoding, "aucun séparateur ne donne plus d'une colonne")
+
+    # Meilleure régularité, puis plus grand nombre de colonnes
+    delimiter, consistency, n_fields = max(scores, key=lambda s: (s[1], s[2]))
+
+    sniffed = _sniff(lines)
+    confidence = consistency
+    if sniffed is not None and sniffed.delimiter == delimiter:
+        confidence = min(1.0, consistency + 0.1)
+    quotechar = sniffed.quotechar if sniffed is not None and sniffed.quotechar else '"'
+
+    dialect = CSVDialect(
+        delimiter=delimiter,
+        quotechar=quotechar,
+        encoding=encoding,
+        has_header=_has_header(lines, delimiter, quotechar),
+        n_fields=n_fields,
+        confidence=round(confidence, 3),
+        reason=f"{n_fields} colonnes sur {consistency * 100:.0f}% des lignes échantillonnées"
+    )
+
+    if dialect.confidence < 0.6:
+        print(f"⚠ Dialecte CSV incertain ({dialect.confidence:.2f}) : {dialect.reason}")
+    return dialect
+
+
+def validate_dialect(filepath: str, dialect: CSVDialect) -> bool:
+    """Vérifier qu'un dialecte mémorisé correspond encore au fichier (première ligne seulement)"""
+    if dialect.fallback or not dialect.n_fields:
+        return False
+    try:
+        with open(filepath, 'r', encoding=dialect.encoding, newline='') as f:
+            first_line = f.readline()
+    except (OSError, UnicodeError, LookupError):
+        return False
+
+    _, _, n_fields = _score_delimiter([first_line.rstrip('\r\n')], dialect.delimiter)
+    return n_fields == dialect.n_fields
+
+
+def _fallback(encoding: str, reason: str) -> CSVDialect:
+    """Dialecte par défaut quand l'échantillon ne permet pas de décider"""
+    print(f"⚠ Détection CSV en repli (virgule) : {reason}")
+    return CSVDialect(encoding=encoding, confidence=0.0, fallback=True, reason=reason)
+
+
+def _decode_sample(raw: bytes) -> Tuple[str, str]:
+    """Encodage : BOM, sinon UTF-8 strict, sinon encodages occidentaux"""
+    if raw.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig', raw.decode('utf-8-sig', errors='replace')
+    if raw.startswith(codecs.BOM_UTF16_LE) or raw.startswith(codecs.BOM_UTF16_BE):
+        return 'utf-16', raw.decode('utf-16', errors='replace')
+
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            return encoding, raw.decode(encoding)
+        except UnicodeDecodeError as e:
+            # Un caractère multi-octets coupé en fin d'échantillon n'invalide pas l'UTF-8
+            if encoding == 'utf-8' and e.start >= len(raw) - 3:
+                return encoding, raw[:e.start].decode(encoding)
+            continue
+
+    return 'latin-1', raw.decode('latin-1', errors='replace')
+
+
+def _complete_lines(text: str, truncated: bool) -> List[str]:
+    """Lignes non vides de l'échantillon (la dernière est ignorée si elle est coupée)"""
+    lines = text.splitlines()
+    if truncated and lines:
+        lines = lines[:-1]
+    return [line for line in lines if line.strip()][:200]
+
+
+def _score_delimiter(lines: List[str], delimiter: str) -> Tuple[str, float, int]:
+    """(séparateur, part des lignes ayant le nombre de champs modal, nombre de champs modal)"""
+    reader = csv.reader(io.StringIO('\n'.join(lines)), delimiter=delimiter, quotechar='"')
+    try:
+        counts = [len(row) for row in reader if row]
+    except csv.Error:
+        return delimiter, 0.0, 0
+
+    if not counts:
+        return delimiter, 0.0, 0
+
+    n_fields, occurrences = Counter(counts).most_common(1)[0]
+    return delimiter, occurrences / len(counts), n_fields
+
+
+def _sniff(lines: List[str]) -> Optional[csv.Dialect]:
+    try:
+        return csv.Sniffer().sniff('\n'.join(lines[:50]), delimiters=',;\t|')
+    except csv.Error:
+        return None
+
+
+def _has_header(lines: List[str], delimiter: str, quotechar: str) -> bool:
+    """En-tête présent si la première ligne n'est pas numérique alors que les suivantes le sont"""
+    rows = list(csv.reader(io.StringIO('\n'.join(lines[:20])), delimiter=delimiter, quotechar=quotechar))
+    if len(rows) < 2:
+        return True
+
+    def is_number(value: str) -> bool:
+        try:
+            float(value.replace(',', '.'))
+            return True
+        except ValueError:
+            return False
+
+    first = rows[0]
+    numeric_in_first = sum(is_number(v) for v in first if v.strip())
+    if numeric_in_first == 0:
+        return True
+
+    body = rows[1:]
+    numeric_cols_body = sum(
+        all(is_number(row[i]) for row in body if i < len(row) and row[i].strip())
+        for i in range(len(first))
+    )
+    # Première ligne aussi numérique que le corps : pas d'en-tête
+    return numeric_in_first < numeric_cols_body
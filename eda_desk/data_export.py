@@ -0,0 +1,284 @@
+"""
+EXPORT DES DONNÉES - Excel en flux (mémoire constante), Parquet et CSV.gz
+
+xlsxwriter, openpyxl et pyarrow.parquet sont importés au premier export qui
+en a besoin (démarrage de l'interface plus rapide).
+"""
+
+import gzip
+import importlib.util
+import os
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+DATA_FORMATS = {'excel': "Excel", 'parquet': "Parquet", 'csv.gz': "CSV.gz"}
+DATA_EXTENSIONS = {'excel': ".xlsx", 'parquet': ".parquet", 'csv.gz': ".csv.gz"}
+
+# Limite d'Excel par feuille, ligne d'en-tête comprise
+EXCEL_MAX_ROWS = 1_048_576
+
+# Lignes converties / écrites à la fois (mémoire bornée par bloc)
+EXPORT_CHUNK_ROWS = 50_000
+
+DATA_SHEET = 'Données'
+STATS_SHEET = 'Statistiques'
+
+
+class ExportCancelled(Exception):
+    """Export interrompu par l'utilisateur"""
+
+
+def format_for_path(path: str) -> str:
+    """Format d'export déduit de l'extension du fichier"""
+    lower = path.lower()
+    for export_format, extension in DATA_EXTENSIONS.items():
+        if lower.endswith(extension):
+            return export_format
+    return 'excel'
+
+
+def _xlsxwriter():
+    try:
+        import xlsxwriter
+    except ImportError:  # xlsxwriter optionnel : openpyxl en mode écriture seule
+        return None
+    return xlsxwriter
+
+
+def _parquet_available() -> bool:
+    """pyarrow installé ? (vérifié sans l'importer)"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def available_formats() -> Dict[str, str]:
+    return {fmt: label for fmt, label in DATA_FORMATS.items() if fmt != 'parquet' or _parquet_available()}
+
+
+def sheet_names(n_rows: int, rows_per_sheet: int = EXCEL_MAX_ROWS - 1) -> List[str]:
+    """Feuilles nécessaires aux données : « Données », « Données (2) »..."""
+    n_sheets = max(1, -(-n_rows // rows_per_sheet))
+    return [DATA_SHEET if i == 0 else f"{DATA_SHEET} ({i + 1})" for i in range(n_sheets)]
+
+
+def _python_rows(chunk: pd.DataFrame) -> Iterator[Tuple]:
+    """Lignes d'un bloc en objets Python (manquants à None, dates sans fuseau, infinis en texte comme pandas)"""
+    for i, dtype in enumerate(chunk.dtypes):
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            chunk = chunk.copy()
+            chunk.isetitem(i, chunk.iloc[:, i].dt.tz_localize(None))
+        elif pd.api.types.is_float_dtype(dtype):
+            column = chunk.iloc[:, i]
+            infinite = np.isinf(column.to_numpy())
+            if infinite.any():
+                chunk = chunk.copy()
+                chunk.isetitem(i, column.astype(object).mask(infinite, np.where(column > 0, 'inf', '-inf')))
+    values = chunk.astype(object)
+    values = values.where(chunk.notna(), None)
+    return values.itertuples(index=False, name=None)
+
+
+class _XlsxWriterBook:
+    """Classeur xlsxwriter en mémoire constante : chaque ligne est écrite puis oubliée"""
+
+    def __init__(self, path: str, xlsxwriter):
+        self.workbook = xlsxwriter.Workbook(path, {
+            'constant_memory': True,
+            'remove_timezone': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            'strings_to_numbers': False,
+            'strings_to_formulas': False,
+            'strings_to_urls': False
+        })
+
+    def add_sheet(self, name: str) -> Callable[[Tuple], None]:
+        sheet = self.workbook.add_worksheet(name)
+        row_index = [0]
+
+        def append(row):
+            sheet.write_row(row_index[0], 0, row)
+            row_index[0] += 1
+        return append
+
+    def close(self):
+        self.workbook.close()
+
+
+class _OpenpyxlBook:
+    """Classeur openpyxl en écriture seule (lignes sérialisées au fil de l'eau)"""
+
+    def __init__(self, path: str):
+        import openpyxl
+        self.path = path
+        self.workbook = openpyxl.Workbook(write_only=True)
+
+    def add_sheet(self, name: str) -> Callable[[Tuple], None]:
+        return self.workbook.create_sheet(name).append
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+def _open_workbook(path: str):
+    xlsxwriter = _xlsxwriter()
+    return _XlsxWriterBook(path, xlsxwriter) if xlsxwriter is not None else _OpenpyxlBook(path)
+
+
+def _stats_rows(stats: Dict[str, Dict]) -> Iterator[Tuple]:
+    """Feuille statistiques au format de ``pd.DataFrame(stats).to_excel``"""
+    frame = pd.DataFrame(stats)
+    yield (None, *[str(col) for col in frame.columns])
+    for stat, row in zip(frame.index, _python_rows(frame)):
+        yield (str(stat), *row)
+
+
+def write_excel(data: Optional[pd.DataFrame], path: str, stats: Optional[Dict] = None,
+                progress: Optional[Callable[[int, int], None]] = None,
+                cancel_event: Optional[threading.Event] = None,
+                rows_per_sheet: int = EXCEL_MAX_ROWS - 1,
+                chunk_rows: int = EXPORT_CHUNK_ROWS) -> Dict:
+    """Écrire les données (une feuille par tranche de ``rows_per_sheet`` lignes) et les statistiques.
+
+    ``data`` à None : classeur des seules statistiques.
+    """
+    n_rows = len(data) if data is not None else 0
+    header = tuple(str(col) for col in data.columns) if data is not None else ()
+    sheets = sheet_names(n_rows, rows_per_sheet) if data is not None else []
+    book = _open_workbook(path)
+    written = 0
+    try:
+        for sheet_index, name in enumerate(sheets):
+            append = book.add_sheet(name)
+            append(header)
+            sheet_end = min(n_rows, (sheet_index + 1) * rows_per_sheet)
+            while written < sheet_end:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ExportCancelled()
+                stop = min(written + chunk_rows, sheet_end)
+                for row in _python_rows(data.iloc[written:stop]):
+                    append(row)
+                written = stop
+                if progress is not None:
+                    progress(written, n_rows)
+
+        if stats:
+            append = book.add_sheet(STATS_SHEET)
+            for row in _stats_rows(stats):
+                append(row)
+    finally:
+        book.close()
+    return {'rows': written, 'sheets': len(sheets)}
+
+
+def write_parquet(data: pd.DataFrame, path: str,
+                  progress: Optional[Callable[[int, int], None]] = None,
+                  cancel_event: Optional[threading.Event] = None,
+                  chunk_rows: int = EXPORT_CHUNK_ROWS) -> Dict:
+    """Parquet par groupes de lignes (schéma fixé sur le premier bloc, voir ``_parquet_schema``)"""
+    if not _parquet_available():
+        raise RuntimeError("pyarrow n'est pas installé : export Parquet indisponible")
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    n_rows = len(data)
+    schema = _parquet_schema(data, chunk_rows)
+    with pq.ParquetWriter(path, schema) as writer:
+        for start in range(0, max(n_rows, 1), chunk_rows):
+            if cancel_event is not None and cancel_event.is_set():
+                raise ExportCancelled()
+            chunk = data.iloc[start:start + chunk_rows]
+            try:
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            except (pa.ArrowTypeError, pa.ArrowInvalid):
+                # Colonne object à types mélangés (texte puis nombres...) : valeurs écrites en texte
+                table = pa.Table.from_pandas(_as_schema_text(chunk, schema), schema=schema, preserve_index=False)
+            writer.write_table(table)
+            if progress is not None:
+                progress(min(start + chunk_rows, n_rows), n_rows)
+    return {'rows': n_rows}
+
+
+def _parquet_schema(data: pd.DataFrame, chunk_rows: int):
+    """Schéma du premier bloc ; une colonne vide dans ce bloc prend le type de son premier bloc non vide
+    (texte si elle est entièrement vide)"""
+    import pyarrow as pa
+
+    schema = pa.Schema.from_pandas(data.iloc[:chunk_rows], preserve_index=False)
+    fields = []
+    for position, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            column = data.iloc[:, position]
+            present = column.notna().to_numpy()
+            if present.any():
+                first = int(present.argmax())
+                block = column.iloc[first:first + chunk_rows].to_frame()
+                field = field.with_type(pa.Schema.from_pandas(block, preserve_index=False).field(0).type)
+            else:
+                field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _as_schema_text(chunk: pd.DataFrame, schema) -> pd.DataFrame:
+    """Colonnes texte du schéma converties en texte (manquants conservés)"""
+    import pyarrow as pa
+
+    chunk = chunk.copy()
+    for position, field in enumerate(schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            column = chunk.iloc[:, position]
+            chunk.isetitem(position, column.where(column.isna(), column.astype(str)))
+    return chunk
+
+
+def write_csv_gz(data: pd.DataFrame, path: str,
+                 progress: Optional[Callable[[int, int], None]] = None,
+                 cancel_event: Optional[threading.Event] = None,
+                 chunk_rows: int = EXPORT_CHUNK_ROWS, compresslevel: int = 6) -> Dict:
+    """CSV compressé gzip, écrit bloc par bloc"""
+    n_rows = len(data)
+    with gzip.open(path, 'wt', encoding='utf-8', newline='', compresslevel=compresslevel) as handle:
+        for start in range(0, max(n_rows, 1), chunk_rows):
+            if cancel_event is not None and cancel_event.is_set():
+                raise ExportCancelled()
+            data.iloc[start:start + chunk_rows].to_csv(handle, header=start == 0, index=False)
+            if progress is not None:
+                progress(min(start + chunk_rows, n_rows), n_rows)
+    return {'rows': n_rows}
+
+
+def stats_companion_path(path: str) -> str:
+    """Classeur des statistiques à côté d'un export Parquet / CSV.gz"""
+    return f"{path[:-len(DATA_EXTENSIONS[format_for_path(path)])]}_statistiques.xlsx"
+
+
+def export_data(data: pd.DataFrame, path: str, stats: Optional[Dict] = None,
+                progress: Optional[Callable[[int, int], None]] = None,
+                cancel_event: Optional[threading.Event] = None) -> Dict:
+    """Exporter selon l'extension : .xlsx (données + statistiques), .parquet ou .csv.gz.
+
+    Pour Parquet et CSV.gz, les statistiques vont dans un petit classeur voisin.
+    En cas d'annulation ou d'erreur, les fichiers commencés sont supprimés.
+    """
+    export_format = format_for_path(path)
+    written = [path]
+    try:
+        if export_format == 'excel':
+            return write_excel(data, path, stats, progress, cancel_event)
+
+        writer = write_parquet if export_format == 'parquet' else write_csv_gz
+        result = writer(data, path, progress, cancel_event)
+        if stats:
+            result['stats_path'] = stats_companion_path(path)
+            written.append(result['stats_path'])
+            write_excel(None, result['stats_path'], stats)
+        return result
+    except BaseException:
+        # Annulation ou erreur : pas de fichier partiel
+        for partial in written:
+            if os.path.exists(partial):
+                os.remove(partial)
+        raise
@@ -0,0 +1,258 @@
+"""
+INDEX DE TRI ET DE FILTRE - ordres de tri et index de valeurs par colonne, construits à la demande
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+FILTER_OPERATORS = ['=', '≠', 'entre']
+MISSING_TOKENS = ('', 'NaN', 'nan')
+
+# Masques de filtres conservés (un octet par ligne chacun)
+MASK_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class RowFilter:
+    """Filtre sur une colonne (étiquette d'origine), valeurs saisies telles quelles dans l'interface"""
+    column: Hashable
+    op: str = '='
+    value: str = ''
+    high: str = ''
+
+    def describe(self) -> str:
+        if self.op == 'entre':
+            low = self.value or '-∞'
+            high = self.high or '+∞'
+            return f"{self.column} entre {low} et {high}"
+        return f"{self.column} {self.op} {self.value or 'NaN'}"
+
+
+class DataIndex:
+    """Tri et filtrage répétés sur un DataFrame fixe.
+
+    Pour chaque colonne sollicitée, on construit une seule fois :
+    - colonnes numériques / dates : l'ordre de tri des lignes non manquantes et
+      les valeurs triées (égalité et intervalle par recherche dichotomique) ;
+    - autres colonnes : les codes de ``pd.factorize`` et les lignes groupées
+      par code (égalité par simple découpage).
+
+    Les masques des filtres récents et la dernière vue (filtres + tri) sont
+    mis en cache : refiltrer ou retrier revient à quelques opérations numpy.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self.n_rows = len(data)
+        self._sorted: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._codes: Dict[str, Tuple[np.ndarray, Dict[str, int], np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._orders: Dict[Tuple[str, bool], np.ndarray] = {}
+        self._masks: "OrderedDict[RowFilter, np.ndarray]" = OrderedDict()
+        self._last_view: Optional[Tuple] = None
+        self._last_positions: Optional[np.ndarray] = None
+        self.last_seconds = 0.0
+
+    # ============================================================
+    # VUES
+    # ============================================================
+
+    def view(self, filters: Sequence[RowFilter] = (), sort: Optional[Tuple[str, bool]] = None) -> Optional[np.ndarray]:
+        """Positions des lignes à afficher (None : toutes, dans l'ordre d'origine)"""
+        start = time.perf_counter()
+        filters = tuple(filters)
+        key = (filters, sort)
+        if key == self._last_view:
+            self.last_seconds = time.perf_counter() - start
+            return self._last_positions
+
+        mask = self.combined_mask(filters)
+        if sort is None:
+            positions = None if mask is None else np.flatnonzero(mask)
+        else:
+            order = self.sort_order(*sort)
+            positions = order if mask is None else order[mask[order]]
+
+        self._last_view = key
+        self._last_positions = positions
+        self.last_seconds = time.perf_counter() - start
+        return positions
+
+    def count(self, filters: Sequence[RowFilter]) -> int:
+        mask = self.combined_mask(tuple(filters))
+        return self.n_rows if mask is None else int(np.count_nonzero(mask))
+
+    def filtered_positions(self, filters: Sequence[RowFilter]) -> Optional[np.ndarray]:
+        """Lignes retenues dans l'ordre d'origine (pour les statistiques et graphiques)"""
+        mask = self.combined_mask(tuple(filters))
+        return None if mask is None else np.flatnonzero(mask)
+
+    def combined_mask(self, filters: Sequence[RowFilter]) -> Optional[np.ndarray]:
+        mask = None
+        for row_filter in filters:
+            filter_mask = self.filter_mask(row_filter)
+            mask = filter_mask.copy() if mask is None else np.logical_and(mask, filter_mask, out=mask)
+        return mask
+
+    # ============================================================
+    # TRI
+    # ============================================================
+
+    def sort_order(self, column: str, ascending: bool = True) -> np.ndarray:
+        """Ordre des lignes trié sur une colonne (manquants en fin, tri stable)"""
+        key = (column, ascending)
+        if key in self._orders:
+            return self._orders[key]
+
+        if self._is_ordered(column):
+            order, sorted_values, missing = self._sorted_index(column)
+            if not ascending:
+                # Tri stable décroissant : les ex-aequo gardent l'ordre d'origine
+                order = order[np.argsort(-sorted_values, kind='stable')]
+        else:
+            codes, _, _, _, missing = self._value_index(column)
+            valid = np.flatnonzero(codes >= 0)
+            keys = codes[valid] if ascending else -codes[valid]
+            order = valid[np.argsort(keys, kind='stable')]
+
+        result = np.concatenate([order, missing])
+        self._orders[key] = result
+        return result
+
+    # ============================================================
+    # FILTRES
+    # ============================================================
+
+    def filter_mask(self, row_filter: RowFilter) -> np.ndarray:
+        """Masque booléen d'un filtre (mis en cache)"""
+        if row_filter in self._masks:
+            self._masks.move_to_end(row_filter)
+            return self._masks[row_filter]
+
+        if row_filter.column not in self.data.columns:
+            raise KeyError(f"Colonne inconnue : {row_filter.column}")
+        if row_filter.op not in FILTER_OPERATORS:
+            raise ValueError(f"Opérateur inconnu : {row_filter.op}")
+
+        if row_filter.op == 'entre':
+            mask = self._range_mask(row_filter)
+        else:
+            mask = self._equal_mask(row_filter.column, row_filter.value)
+            if row_filter.op == '≠':
+                mask = ~mask
+
+        self._masks[row_filter] = mask
+        while len(self._masks) > MASK_CACHE_SIZE:
+            self._masks.popitem(last=False)
+        return mask
+
+    def _equal_mask(self, column: str, value: str) -> np.ndarray:
+        mask = np.zeros(self.n_rows, dtype=bool)
+
+        if value.strip() in MISSING_TOKENS:
+            mask[self._missing_positions(column)] = True
+            return mask
+
+        if self._is_ordered(column):
+            target = self._parse(column, value)
+            order, sorted_values, _ = self._sorted_index(column)
+            lo = np.searchsorted(sorted_values, target, side='left')
+            hi = np.searchsorted(sorted_values, target, side='right')
+            mask[order[lo:hi]] = True
+            return mask
+
+        _, lookup, grouped, offsets, _ = self._value_index(column)
+        code = lookup.get(value.strip())
+        if code is not None:
+            mask[grouped[offsets[code]:offsets[code + 1]]] = True
+        return mask
+
+    def _range_mask(self, row_filter: RowFilter) -> np.ndarray:
+        column = row_filter.column
+        if not self._is_ordered(column):
+            raise ValueError(f"Filtre par intervalle réservé aux colonnes numériques ou dates : {column}")
+
+        order, sorted_values, _ = self._sorted_index(column)
+        lo = 0
+        hi = len(sorted_values)
+        if row_filter.value.strip():
+            lo = np.searchsorted(sorted_values, self._parse(column, row_filter.value), side='left')
+        if row_filter.high.strip():
+            hi = np.searchsorted(sorted_values, self._parse(column, row_filter.high), side='right')
+
+        mask = np.zeros(self.n_rows, dtype=bool)
+        if hi > lo:
+            mask[order[lo:hi]] = True
+        return mask
+
+    # ============================================================
+    # INDEX PAR COLONNE
+    # ============================================================
+
+    def _is_ordered(self, column: str) -> bool:
+        dtype = self.data[column].dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            return False
+        return pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype)
+
+    def _sorted_index(self, column: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(lignes non manquantes triées, valeurs triées, lignes manquantes)"""
+        if column not in self._sorted:
+            series = self.data[column]
+            missing_mask = series.isna().to_numpy()
+            values = _ordered_values(series)
+            valid = np.flatnonzero(~missing_mask)
+            order = valid[np.argsort(values[valid], kind='stable')]
+            self._sorted[column] = (order, values[order], np.flatnonzero(missing_mask))
+        return self._sorted[column]
+
+    def _value_index(self, column: str):
+        """(codes, texte -> code, lignes groupées par code, bornes des groupes, lignes manquantes)"""
+        if column not in self._codes:
+            series = self.data[column]
+            try:
+                codes, uniques = pd.factorize(series, sort=True)
+            except TypeError:
+                # Types mélangés non comparables : ordre du texte
+                codes, uniques = pd.factorize(series.where(series.isna(), series.astype(str)), sort=True)
+            lookup = {str(u): i for i, u in enumerate(uniques)}
+
+            valid = np.flatnonzero(codes >= 0)
+            grouped = valid[np.argsort(codes[valid], kind='stable')]
+            offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(codes[valid], minlength=len(uniques)), out=offsets[1:])
+            self._codes[column] = (codes, lookup, grouped, offsets, np.flatnonzero(codes < 0))
+        return self._codes[column]
+
+    def _missing_positions(self, column: str) -> np.ndarray:
+        if self._is_ordered(column):
+            return self._sorted_index(column)[2]
+        return self._value_index(column)[4]
+
+    def _parse(self, column: str, text: str):
+        """Convertir la saisie dans l'espace des valeurs triées"""
+        text = text.strip()
+        if pd.api.types.is_datetime64_any_dtype(self.data[column].dtype):
+            return pd.Timestamp(text).value
+        try:
+            return float(text.replace(',', '.'))
+        except ValueError:
+            raise ValueError(f"Valeur numérique attendue pour {column} : {text!r}")
+
+    def built_columns(self) -> List[str]:
+        """Colonnes déjà indexées"""
+        return sorted(set(self._sorted) | set(self._codes))
+
+
+def _ordered_values(series: pd.Series) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        if getattr(series.dt, 'tz', None) is not None:
+            series = series.dt.tz_convert(None)
+        return series.to_numpy(dtype='datetime64[ns]').view('int64')
+    return series.to_numpy(dtype='float64', na_value=np.nan)
+
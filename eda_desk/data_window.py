@@ -0,0 +1,106 @@
+"""
+FENÊTRE DE DONNÉES - lignes visibles d'une grille virtualisée, matérialisées à la demande
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class DataWindow:
+    """Fenêtre glissante sur un DataFrame pour une grille virtualisée.
+
+    Seules les ``visible_rows`` lignes à partir de ``first_row`` sont converties
+    en texte à chaque défilement : le coût d'affichage et la mémoire ne
+    dépendent pas de la taille du DataFrame.
+
+    ``positions`` (optionnel) restreint et ordonne les lignes affichées
+    (résultat d'un tri ou d'un filtre de ``DataIndex``).
+    """
+
+    def __init__(self, data: Optional[pd.DataFrame] = None, visible_rows: int = 30):
+        self.data = data
+        self.positions: Optional[np.ndarray] = None
+        self.visible_rows = max(1, visible_rows)
+        self.first_row = 0
+
+    @property
+    def total_rows(self) -> int:
+        if self.data is None:
+            return 0
+        return len(self.data) if self.positions is None else len(self.positions)
+
+    @property
+    def last_row(self) -> int:
+        """Indice (exclu) de la dernière ligne visible"""
+        return min(self.first_row + self.visible_rows, self.total_rows)
+
+    def set_data(self, data: Optional[pd.DataFrame]):
+        self.data = data
+        self.positions = None
+        self.first_row = 0
+
+    def set_positions(self, positions: Optional[np.ndarray]):
+        """Nouvelle vue triée/filtrée (None : toutes les lignes), retour en haut"""
+        self.positions = positions
+        self.first_row = 0
+
+    def resize(self, visible_rows: int):
+        """Nouvelle hauteur de la fenêtre (en lignes)"""
+        self.visible_rows = max(1, visible_rows)
+        self.scroll_to(self.first_row)
+
+    # ============================================================
+    # DÉFILEMENT
+    # ============================================================
+
+    def scroll_to(self, row: int) -> bool:
+        """Placer la première ligne visible ; retourne True si la fenêtre a bougé"""
+        max_first = max(0, self.total_rows - self.visible_rows)
+        row = int(min(max(row, 0), max_first))
+        moved = row != self.first_row
+        self.first_row = row
+        return moved
+
+    def scroll_by(self, rows: int) -> bool:
+        return self.scroll_to(self.first_row + rows)
+
+    def scroll_pages(self, pages: int) -> bool:
+        return self.scroll_to(self.first_row + pages * max(1, self.visible_rows - 1))
+
+    def moveto(self, fraction: float) -> bool:
+        """Position de la barre de défilement (0..1) vers première ligne"""
+        return self.scroll_to(round(float(fraction) * self.total_rows))
+
+    def fractions(self) -> Tuple[float, float]:
+        """(début, fin) au format attendu par ``Scrollbar.set``"""
+        total = self.total_rows
+        if total == 0:
+            return 0.0, 1.0
+        return self.first_row / total, self.last_row / total
+
+    # ============================================================
+    # MATÉRIALISATION
+    # ============================================================
+
+    def rows(self) -> List[Tuple[str, List[str]]]:
+        """Lignes visibles : (libellé d'index, valeurs en texte)"""
+        if self.total_rows == 0:
+            return []
+
+        if self.positions is None:
+            block = self.data.iloc[self.first_row:self.last_row]
+        else:
+            block = self.data.iloc[self.positions[self.first_row:self.last_row]]
+        labels = [str(label) for label in block.index]
+        values = block.to_numpy(dtype=object)
+        return [(label, [_format_cell(v) for v in row]) for label, row in zip(labels, values)]
+
+
+def _format_cell(value) -> str:
+    if isinstance(value, (float, np.floating)):
+        return 'NaN' if np.isnan(value) else str(value)
+    if value is None or value is pd.NA or value is pd.NaT:
+        return 'NaN'
+    return str(value)
@@ -0,0 +1,231 @@
+"""
+EXPORTS EN ARRIÈRE-PLAN - rapports Word / PDF (en parallèle si les deux sont demandés) et données, hors du thread Tk
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from eda_desk.data_export import DATA_FORMATS, ExportCancelled, export_data, format_for_path
+
+
+EXPORT_FORMATS = {'word': "Word", 'pdf': "PDF"}
+
+# En dessous (lignes de texte des analyses accumulées), démarrer deux processus coûte plus
+# que ce que le parallélisme fait gagner : exports enchaînés dans le thread
+PARALLEL_MIN_LINES = 30_000
+
+# Intervalle minimal entre deux événements de progression d'un même export
+PROGRESS_INTERVAL = 0.1
+
+
+def run_export(export_format: str, data_info: Dict, stats: Dict, output_path: str,
+               results: Optional[List[Dict]] = None,
+               progress: Optional[Callable[[int, int], None]] = None) -> str:
+    """Produire un rapport avec les gabarits ``export_templates_masterclass``.
+
+    ``results`` : analyses accumulées (``AnalysisResult.to_dict()``), rendues
+    en tableaux sans repasser par le texte de l'onglet Résultats.
+    """
+    from export_templates_masterclass import export_to_pdf_masterclass, export_to_word_masterclass
+
+    exporter = export_to_word_masterclass if export_format == 'word' else export_to_pdf_masterclass
+    if exporter(data_info, stats, output_path, results=results, progress=progress) is False:
+        raise RuntimeError(f"échec de l'export {EXPORT_FORMATS[export_format]} ({output_path})")
+    return output_path
+
+
+def _throttled(callback: Callable[[int, int], None]) -> Callable[[int, int], None]:
+    """Ne transmettre la progression qu'à intervalle régulier (et à la fin)"""
+    last = [0.0]
+
+    def progress(done: int, total: int):
+        now = time.perf_counter()
+        if done >= total or now - last[0] >= PROGRESS_INTERVAL:
+            last[0] = now
+            callback(done, total)
+    return progress
+
+
+# File de progression du processus de travail (fixée par l'initialiseur du pool)
+_worker_progress: Optional["multiprocessing.Queue"] = None
+
+
+def _init_worker(progress_queue):
+    global _worker_progress
+    _worker_progress = progress_queue
+
+
+def _export_in_worker(export_format: str, data_info: Dict, stats: Dict, output_path: str,
+                      results: Optional[List[Dict]]) -> str:
+    def progress(done, total):
+        _worker_progress.put((export_format, done, total))
+    return run_export(export_format, data_info, stats, output_path, results, _throttled(progress))
+
+
+class ExportJob:
+    """Exports Word / PDF dans un thread de travail.
+
+    Même protocole que ``AnalysisScheduler`` : ``self.events`` reçoit
+    ``('progress', format, (fait, total), secondes)``, ``('result', format,
+    chemin, secondes)`` ou ``('error', format, exception, secondes)``, puis
+    ``('finished', None, None, secondes)``. Quand les deux formats sont
+    demandés pour un gros rapport et que la machine a plusieurs cœurs, chacun
+    est produit dans son propre processus : la génération est du Python pur,
+    limitée par le GIL dans des threads.
+    """
+
+    formats = EXPORT_FORMATS
+
+    def __init__(self, targets: Dict[str, str], data_info: Dict, stats: Dict,
+                 results: Optional[List[Dict]] = None, use_processes: Optional[bool] = None):
+        self.targets = dict(targets)
+        self.data_info = data_info
+        self.stats = stats
+        self.results = results
+        if use_processes is None:
+            n_lines = sum(result['text'].count('\n') for result in results or [])
+            use_processes = (len(self.targets) > 1 and (os.cpu_count() or 1) > 1
+                             and n_lines >= PARALLEL_MIN_LINES)
+        self.use_processes = use_processes
+        self.events: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_time = time.perf_counter()
+
+    def start(self):
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="report-export", daemon=True)
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def run(self) -> Dict[str, str]:
+        """Exécution synchrone : {format: chemin} des exports réussis"""
+        self._start_time = time.perf_counter()
+        self._run()
+        outputs = {}
+        while True:
+            try:
+                kind, name, value, _ = self.events.get_nowait()
+            except queue.Empty:
+                return outputs
+            if kind == 'result':
+                outputs[name] = value
+
+    # ============================================================
+    # INTERNE
+    # ============================================================
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self._start_time
+
+    def _progress(self, export_format: str, done: int, total: int):
+        self.events.put(('progress', export_format, (done, total), self._elapsed()))
+
+    def _run(self):
+        if self.use_processes:
+            self._run_processes()
+        else:
+            for export_format, output_path in self.targets.items():
+                started = time.perf_counter()
+                progress = _throttled(lambda done, total, f=export_format: self._progress(f, done, total))
+                try:
+                    run_export(export_format, self.data_info, self.stats, output_path,
+                               self.results, progress)
+                except Exception as e:
+                    self.events.put(('error', export_format, e, time.perf_counter() - started))
+                else:
+                    self.events.put(('result', export_format, output_path, time.perf_counter() - started))
+        self.events.put(('finished', None, None, self._elapsed()))
+
+    def _run_processes(self):
+        # spawn : pas de fork d'un processus Tk depuis un thread de travail
+        context = multiprocessing.get_context('spawn')
+        progress_queue = context.Queue()
+        stop = threading.Event()
+
+        def relay():
+            while not stop.is_set() or not progress_queue.empty():
+                try:
+                    export_format, done, total = progress_queue.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                self._progress(export_format, done, total)
+
+        relay_thread = threading.Thread(target=relay, name="report-export-progress", daemon=True)
+        relay_thread.start()
+        try:
+            with ProcessPoolExecutor(max_workers=len(self.targets), mp_context=context,
+                                     initializer=_init_worker, initargs=(progress_queue,)) as pool:
+                futures = {
+                    pool.submit(_export_in_worker, export_format, self.data_info, self.stats, output_path,
+                                self.results): export_format
+                    for export_format, output_path in self.targets.items()
+                }
+                for future in as_completed(futures):
+                    export_format = futures[future]
+                    try:
+                        output_path = future.result()
+                    except Exception as e:
+                        self.events.put(('error', export_format, e, self._elapsed()))
+                    else:
+                        self.events.put(('result', export_format, output_path, self._elapsed()))
+        finally:
+            stop.set()
+            relay_thread.join()
+
+
+class DataExportJob:
+    """Export des données (Excel en flux, Parquet, CSV.gz) dans un thread de travail, annulable.
+
+    Même protocole que ``ExportJob`` ; la progression compte les lignes
+    écrites et une annulation publie ``('cancelled', format, None, secondes)``
+    avant ``'finished'`` (le fichier partiel est supprimé).
+    """
+
+    formats = DATA_FORMATS
+
+    def __init__(self, data: pd.DataFrame, output_path: str, stats: Optional[Dict] = None):
+        self.data = data
+        self.output_path = output_path
+        self.stats = stats
+        self.export_format = format_for_path(output_path)
+        self.targets = {self.export_format: output_path}
+        self.events: "queue.Queue" = queue.Queue()
+        self.metrics: Dict = {}
+        self._cancel_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="data-export", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Demander l'arrêt au prochain bloc de lignes"""
+        self._cancel_event.set()
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        start = time.perf_counter()
+        progress = _throttled(lambda done, total: self.events.put(
+            ('progress', self.export_format, (done, total), time.perf_counter() - start)))
+        try:
+            self.metrics = export_data(self.data, self.output_path, self.stats, progress, self._cancel_event)
+        except ExportCancelled:
+            # Fichier partiel déjà supprimé par export_data
+            self.events.put(('cancelled', self.export_format, None, time.perf_counter() - start))
+        except Exception as e:
+            self.events.put(('error', self.export_format, e, time.perf_counter() - start))
+        else:
+            self.metrics['seconds'] = time.perf_counter() - start
+            self.events.put(('result', self.export_format, self.output_path, self.metrics['seconds']))
+        self.events.put(('finished', None, None, time.perf_counter() - start))
@@ -0,0 +1,247 @@
+"""
+HISTORIQUE DES ANALYSES - fichiers ouverts et résultats, stockés dans SQLite
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+# Entrées par page de l'onglet Historique
+HISTORY_PAGE_SIZE = 200
+
+# Curseur de pagination : (loaded_at, id) de la dernière ligne affichée
+HistoryCursor = Tuple[str, int]
+
+DateLike = Union[str, date, datetime, None]
+
+_INSERT_SQL = '''
+    INSERT INTO analysis_history
+    (filename, filepath, rows, columns, numeric_vars, categorical_vars,
+     boolean_vars, quality_score, missing_pct, outliers_count, notes, dialect,
+     fingerprint, byte_offset, timings)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Colonnes des listes de l'onglet (sans les durées détaillées, lues à la demande)
+_LIST_COLUMNS = '''
+    id, filename, filepath, loaded_at, rows, columns, numeric_vars, categorical_vars,
+    boolean_vars, quality_score, missing_pct, outliers_count, notes, dialect, fingerprint, byte_offset
+'''
+
+
+def _entry_values(data_info: Dict) -> Tuple:
+    return (
+        data_info.get('filename'),
+        data_info.get('filepath'),
+        data_info.get('rows'),
+        data_info.get('columns'),
+        data_info.get('numeric_vars'),
+        data_info.get('categorical_vars'),
+        data_info.get('boolean_vars'),
+        data_info.get('quality_score'),
+        data_info.get('missing_pct'),
+        data_info.get('outliers_count'),
+        data_info.get('notes', ''),
+        json.dumps(data_info['dialect']) if data_info.get('dialect') else None,
+        json.dumps(data_info['fingerprint']) if data_info.get('fingerprint') else None,
+        data_info.get('byte_offset'),
+        json.dumps(data_info['timings'], ensure_ascii=False) if data_info.get('timings') else None
+    )
+
+
+def _date_bound(value: DateLike, end: bool = False) -> Optional[str]:
+    """Borne de date au format de ``loaded_at`` ; une borne de fin sans heure inclut toute la journée"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, str):
+        value = value.strip()
+        if len(value) > 10:
+            return datetime.fromisoformat(value).strftime('%Y-%m-%d %H:%M:%S')
+        value = date.fromisoformat(value)
+    if end:
+        value += timedelta(days=1)
+    return value.strftime('%Y-%m-%d')
+
+
+class HistoryManager:
+    """Gestionnaire d'historique avec SQLite.
+
+    Une connexion ouverte pour toute la durée de vie de l'objet (journal WAL,
+    partagée entre threads sous verrou). Les listes sont paginées par curseur
+    ``(loaded_at, id)`` et filtrées côté SQL, servies par les index.
+    """
+
+    def __init__(self, db_path="eda_history.db"):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._init_database()
+
+    def _init_database(self):
+        """Initialiser la base de données"""
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            # WAL : lecteurs (onglet, cache) et écrivain ne se bloquent plus
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS analysis_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    filename TEXT NOT NULL,
+                    filepath TEXT,
+                    loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    rows INTEGER,
+                    columns INTEGER,
+                    numeric_vars INTEGER,
+                    categorical_vars INTEGER,
+                    boolean_vars INTEGER,
+                    quality_score REAL,
+                    missing_pct REAL,
+                    outliers_count INTEGER,
+                    notes TEXT
+                )
+            ''')
+
+            # Migration : dialecte CSV détecté (JSON), réutilisé à la réouverture
+            cursor.execute('PRAGMA table_info(analysis_history)')
+            existing_columns = {row[1] for row in cursor.fetchall()}
+            if 'dialect' not in existing_columns:
+                cursor.execute('ALTER TABLE analysis_history ADD COLUMN dialect TEXT')
+            # Migration : empreinte du contenu lu et position de fin (réanalyse incrémentale)
+            if 'fingerprint' not in existing_columns:
+                cursor.execute('ALTER TABLE analysis_history ADD COLUMN fingerprint TEXT')
+            if 'byte_offset' not in existing_columns:
+                cursor.execute('ALTER TABLE analysis_history ADD COLUMN byte_offset INTEGER')
+            # Migration : étapes chronométrées de l'exécution (JSON, voir eda_desk.instrumentation)
+            if 'timings' not in existing_columns:
+                cursor.execute('ALTER TABLE analysis_history ADD COLUMN timings TEXT')
+
+            # Tri de l'onglet (et pagination), recherche par nom, dernier dialecte d'un fichier
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_loaded_at ON analysis_history(loaded_at, id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_filename '
+                           'ON analysis_history(filename COLLATE NOCASE, loaded_at, id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_filepath ON analysis_history(filepath, loaded_at, id)')
+
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add_entry(self, data_info: Dict) -> int:
+        """Ajouter une entrée à l'historique ; retourne son identifiant"""
+        with self._lock, self._conn:
+            return self._conn.execute(_INSERT_SQL, _entry_values(data_info)).lastrowid
+
+    def add_entries(self, entries: Iterable[Dict]) -> int:
+        """Ajouter plusieurs entrées en une seule transaction (mode batch)"""
+        rows = [_entry_values(data_info) for data_info in entries]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(_INSERT_SQL, rows)
+        return len(rows)
+
+    def get_history(self, limit=50, after: Optional[HistoryCursor] = None, filename: Optional[str] = None,
+                    date_from: DateLike = None, date_to: DateLike = None) -> List[Dict]:
+        """Récupérer l'historique, du plus récent au plus ancien.
+
+        ``after`` : curseur de la dernière ligne de la page précédente
+        (voir ``page_cursor``). ``filename`` : début du nom de fichier, sans
+        casse (« * » remplace n'importe quelle suite de caractères) ;
+        ``date_from`` / ``date_to`` : dates incluses.
+        """
+        where, params = self._filters(filename, date_from, date_to)
+        if after is not None:
+            where.append('(loaded_at, id) < (?, ?)')
+            params.extend(after)
+
+        sql = f'SELECT {_LIST_COLUMNS} FROM analysis_history'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY loaded_at DESC, id DESC LIMIT ?'
+        params.append(limit)
+
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def page_cursor(page: List[Dict]) -> Optional[HistoryCursor]:
+        """Curseur de la page suivante (None si la page est vide)"""
+        return (page[-1]['loaded_at'], page[-1]['id']) if page else None
+
+    def count(self, filename: Optional[str] = None, date_from: DateLike = None, date_to: DateLike = None) -> int:
+        """Nombre d'entrées correspondant aux filtres"""
+        where, params = self._filters(filename, date_from, date_to)
+        sql = 'SELECT COUNT(*) FROM analysis_history'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def clear(self):
+        """Supprimer toutes les entrées (la base et ses autres tables sont conservées)"""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM analysis_history')
+
+    def set_timings(self, entry_id: int, timings: List[Dict]):
+        """Remplacer les étapes chronométrées d'une entrée (l'exécution se poursuit après l'ajout)"""
+        with self._lock, self._conn:
+            self._conn.execute('UPDATE analysis_history SET timings = ? WHERE id = ?',
+                               (json.dumps(timings, ensure_ascii=False), entry_id))
+
+    def get_timings(self, entry_id: int) -> List[Dict]:
+        """Étapes chronométrées d'une entrée (liste vide si rien n'a été enregistré)"""
+        with self._lock:
+            row = self._conn.execute('SELECT timings FROM analysis_history WHERE id = ?', (entry_id,)).fetchone()
+        return json.loads(row[0]) if row and row[0] else []
+
+    def get_last_dialect(self, filepath: str) -> Optional[Dict]:
+        """Dernier dialecte CSV enregistré pour ce fichier"""
+        with self._lock:
+            row = self._conn.execute('''
+                SELECT dialect FROM analysis_history
+                WHERE filepath = ? AND dialect IS NOT NULL
+                ORDER BY loaded_at DESC, id DESC
+                LIMIT 1
+            ''', (filepath,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_last_load(self, filepath: str) -> Optional[Dict]:
+        """Dernière lecture complète enregistrée pour ce fichier : {'fingerprint', 'byte_offset'}"""
+        with self._lock:
+            row = self._conn.execute('''
+                SELECT fingerprint, byte_offset FROM analysis_history
+                WHERE filepath = ? AND fingerprint IS NOT NULL
+                ORDER BY loaded_at DESC, id DESC
+                LIMIT 1
+            ''', (filepath,)).fetchone()
+        return {'fingerprint': json.loads(row[0]), 'byte_offset': row[1]} if row else None
+
+    @staticmethod
+    def _filters(filename: Optional[str], date_from: DateLike, date_to: DateLike) -> Tuple[List[str], List]:
+        where, params = [], []
+        if filename:
+            # Préfixe du nom, sans casse (servi par idx_history_filename) ; « * » : joker
+            pattern = filename.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_').replace('*', '%')
+            where.append("filename LIKE ? ESCAPE '\\'")
+            params.append(f"{pattern}%")
+        lower = _date_bound(date_from)
+        if lower is not None:
+            where.append('loaded_at >= ?')
+            params.append(lower)
+        upper = _date_bound(date_to, end=True)
+        if upper is not None:
+            # Borne avec heure : incluse ; date seule : jusqu'au lendemain exclu
+            where.append('loaded_at < ?' if len(upper) == 10 else 'loaded_at <= ?')
+            params.append(upper)
+        return where, params
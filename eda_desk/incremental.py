@@ -0,0 +1,381 @@
+"""
+RÉANALYSE INCRÉMENTALE - fichiers en ajout seul : lecture de la seule fin du fichier, fusion des résultats
+"""
+
+import copy
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from eda_desk.analyses import (classify_columns, compute_missing_values, compute_outliers,
+                               compute_quasi_constant, describe_numeric)
+from eda_desk.analysis_cache import cache_key, file_fingerprint
+from eda_desk.chunked_loader import ChunkedCSVLoader, LoadCancelled
+from eda_desk.column_profiler import BOOL_LIKE_VALUES, profile_columns
+from eda_desk.memory_compact import compact_frame, concat_compact, memory_bytes
+from eda_desk.sketches import MomentSketch
+
+
+# Colonnes dont les effectifs par modalité sont conservés (au-delà : valeurs de la fin
+# recherchées dans les lignes déjà lues)
+STATE_MAX_DISTINCT = 10_000
+
+
+class NotAppendable(Exception):
+    """Le fichier ne peut pas être complété : relecture complète"""
+
+
+def append_state_key(fingerprint: Dict, params: Dict) -> str:
+    """Clé (dans le cache d'analyses) de l'état fusionnable d'une lecture"""
+    return cache_key(fingerprint, {'append_state': params})
+
+
+def appended_offset(filepath: str, last_load: Optional[Dict]) -> Optional[int]:
+    """Position de la suite si le fichier n'a fait que grossir depuis ``last_load``, sinon None.
+
+    Le contenu déjà lu doit avoir la même empreinte et se terminer par une
+    fin de ligne (pas de dernière ligne complétée après coup).
+    """
+    if not last_load or not last_load.get('byte_offset'):
+        return None
+    offset = int(last_load['byte_offset'])
+    if os.path.getsize(filepath) <= offset:
+        return None
+    if file_fingerprint(filepath, length=offset)['content_hash'] != last_load['fingerprint'].get('content_hash'):
+        return None
+    with open(filepath, 'rb') as f:
+        f.seek(offset - 1)
+        if f.read(1) != b'\n':
+            return None
+    return offset
+
+
+# ============================================================
+# ÉTAT FUSIONNABLE
+# ============================================================
+
+def column_moments(series: pd.Series) -> Optional[MomentSketch]:
+    """Moments exacts d'une colonne numérique (None si elle contient des infinis)"""
+    values = series.to_numpy(dtype='float64', na_value=np.nan)
+    values = values[~np.isnan(values)]
+    if np.isinf(values).any():
+        return None
+    moments = MomentSketch()
+    moments.update(values)
+    return moments
+
+
+def value_counts(series: pd.Series) -> pd.Series:
+    """Effectifs des valeurs non manquantes, index ``object`` (fusionnable quel que soit le type)"""
+    counts = series.value_counts(dropna=True)
+    counts = counts[counts > 0]
+    counts.index = pd.Index(counts.index.to_numpy(dtype=object), dtype=object)
+    return counts
+
+
+def build_append_state(data: pd.DataFrame, profile: pd.DataFrame,
+                       moments: Optional[Dict[str, Optional[MomentSketch]]] = None,
+                       counts: Optional[Dict[str, pd.Series]] = None) -> Dict:
+    """État conservé après une lecture : profil, moments des colonnes numériques,
+    effectifs des colonnes peu variées"""
+    if moments is None:
+        moments = {col: column_moments(data[col]) for col in profile.index[profile['is_numeric']]}
+    if counts is None:
+        counts = {col: value_counts(data[col]) for col in profile.index[profile['n_unique'] <= STATE_MAX_DISTINCT]}
+    return {
+        'columns': list(data.columns),
+        'dtypes': {col: str(dtype) for col, dtype in data.dtypes.items()},
+        'n_rows': len(data),
+        'profile': profile,
+        'moments': moments,
+        'counts': counts
+    }
+
+
+def _kind(dtype) -> str:
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'bool'
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'numeric'
+    return 'other'
+
+
+def merge_profile(old_profile: pd.DataFrame, data: pd.DataFrame, n_old: int,
+                  counts: Dict[str, pd.Series]) -> Tuple[pd.DataFrame, Dict[str, pd.Series], List[str]]:
+    """Profil de ``data`` à partir de celui de ses ``n_old`` premières lignes.
+
+    Manquants, min et max s'additionnent ; distincts et modalité dominante
+    viennent des effectifs conservés (``counts``) ou, pour les colonnes très
+    variées, de la recherche des seules valeurs de la fin dans les lignes
+    déjà profilées. Les colonnes dont le type a changé sont reprofilées.
+    Retourne (profil, effectifs fusionnés, colonnes reprofilées).
+    """
+    head, tail = data.iloc[:n_old], data.iloc[n_old:]
+    n_rows = len(data)
+    profile = old_profile.copy()
+    profile['dtype'] = [str(t) for t in data.dtypes]
+    profile['count'] = n_rows
+
+    recomputed = [col for col in data.columns
+                  if bool(old_profile.at[col, 'is_numeric']) != (_kind(data[col].dtype) == 'numeric')]
+    merged_counts = {}
+
+    for col in data.columns:
+        if col in recomputed:
+            continue
+        series = tail[col]
+        null_count = int(old_profile.at[col, 'null_count']) + int(series.isna().sum())
+        n_unique = int(old_profile.at[col, 'n_unique'])
+        top_count = max(int(old_profile.at[col, 'top_count']), null_count)
+
+        if col in counts:
+            column_counts = counts[col].add(value_counts(series), fill_value=0).astype('int64')
+            n_unique = len(column_counts)
+            if len(column_counts):
+                top_count = max(int(column_counts.max()), null_count)
+            if n_unique <= STATE_MAX_DISTINCT:
+                merged_counts[col] = column_counts
+        else:
+            # Recherche dans le type natif de la colonne (pas de conversion en object)
+            tail_counts = series.value_counts(dropna=True)
+            tail_counts = tail_counts[tail_counts > 0]
+            previous = head[col][head[col].isin(tail_counts.index)].value_counts()
+            previous = previous[previous > 0]
+            n_unique += int((~tail_counts.index.isin(previous.index)).sum())
+            top_count = max(top_count, int(tail_counts.add(previous, fill_value=0).max()))
+
+        low, high = old_profile.at[col, 'min'], old_profile.at[col, 'max']
+        if old_profile.at[col, 'is_numeric'] and series.notna().any():
+            low = np.fmin(low, float(series.min()))
+            high = np.fmax(high, float(series.max()))
+
+        if old_profile.at[col, 'is_numeric']:
+            bool_like = n_unique == 2 and low == 0 and high == 1
+        else:
+            # Deux modalités : effectifs forcément conservés
+            bool_like = n_unique == 2 and bool(merged_counts[col].index.isin(BOOL_LIKE_VALUES).all())
+
+        profile.loc[col, ['null_count', 'n_unique', 'top_count', 'min', 'max', 'bool_like']] = [
+            null_count, n_unique, top_count, low, high, bool_like
+        ]
+
+    if recomputed:
+        profile.loc[recomputed] = profile_columns(data[recomputed]).loc[recomputed, profile.columns]
+        for col in recomputed:
+            if profile.at[col, 'n_unique'] <= STATE_MAX_DISTINCT:
+                merged_counts[col] = value_counts(data[col])
+
+    profile['null_pct'] = (profile['null_count'] / n_rows * 100) if n_rows else 0.0
+    for col in ('count', 'null_count', 'n_unique', 'top_count'):
+        profile[col] = profile[col].astype('int64')
+    for col in ('null_pct', 'min', 'max'):
+        profile[col] = profile[col].astype('float64')
+    profile['is_numeric'] = profile['is_numeric'].astype(bool)
+    profile['bool_like'] = profile['bool_like'].astype(bool)
+    return profile, merged_counts, recomputed
+
+
+def merge_moments(old: Dict[str, Optional[MomentSketch]], data: pd.DataFrame, n_old: int,
+                  profile: pd.DataFrame) -> Dict[str, Optional[MomentSketch]]:
+    """Moments des colonnes numériques : fusion (Pébay) des anciens et de ceux de la fin"""
+    tail = data.iloc[n_old:]
+    moments = {}
+    for col in profile.index[profile['is_numeric']]:
+        previous = old.get(col)
+        delta = column_moments(tail[col]) if previous is not None else None
+        if previous is not None and delta is not None:
+            moments[col] = copy.deepcopy(previous).merge(delta)
+        else:
+            moments[col] = column_moments(data[col])
+    return moments
+
+
+# ============================================================
+# RÉSULTATS
+# ============================================================
+
+def describe_from_moments(moments: MomentSketch, quartiles: pd.Series) -> Dict[str, float]:
+    """Statistiques de ``describe_numeric`` : moments fusionnés, quartiles recalculés"""
+    variance = moments.variance()
+    return {
+        'Moyenne': moments.mean if moments.n else np.nan,
+        'Médiane': quartiles.loc[0.5],
+        'Écart-type': np.sqrt(variance),
+        'Variance': variance,
+        'Min': moments.min,
+        'Max': moments.max,
+        'Q1': quartiles.loc[0.25],
+        'Q3': quartiles.loc[0.75],
+        'Skewness': moments.skew(),
+        'Kurtosis': moments.kurtosis()
+    }
+
+
+def refresh_results(data: pd.DataFrame, profile: pd.DataFrame, moments: Dict[str, Optional[MomentSketch]],
+                    previous: Dict) -> Dict:
+    """Mettre à jour les analyses déjà faites sur la version précédente du fichier.
+
+    Valeurs manquantes et variables constantes se déduisent du profil fusionné ;
+    les statistiques reprennent les moments fusionnés. Médiane, quartiles et
+    outliers IQR (bornes issues des quartiles) ne sont pas fusionnables : un
+    seul appel ``quantile`` pour toutes les colonnes concernées.
+    """
+    n_rows = len(data)
+    results = {'profile': profile}
+    if not any(previous.get(attr) for attr in ('missing_values', 'quasi_constant_vars',
+                                                 'outliers_info', 'current_stats')):
+        return results
+
+    results['missing_values'], results['high_missing_vars'] = compute_missing_values(profile)
+    results['quasi_constant_vars'] = compute_quasi_constant(profile, n_rows)
+
+    _, numeric_vars, _, _ = classify_columns(profile, n_rows)
+    stats_vars = [var for var in previous.get('current_stats') or {} if var in data.columns]
+    quantile_vars = list(dict.fromkeys(
+        (numeric_vars if previous.get('outliers_info') else []) +
+        [var for var in stats_vars if moments.get(var) is not None]
+    ))
+    quartiles = data[quantile_vars].quantile([0.25, 0.5, 0.75]) if quantile_vars else pd.DataFrame()
+
+    if previous.get('outliers_info'):
+        results['outliers_info'] = compute_outliers(data[numeric_vars], n_rows, quartiles[numeric_vars])
+    if stats_vars:
+        results['current_stats'] = {
+            var: (describe_from_moments(moments[var], quartiles[var]) if moments.get(var) is not None
+                  else describe_numeric(data[var]))
+            for var in stats_vars
+        }
+    return results
+
+
+# ============================================================
+# CHARGEUR
+# ============================================================
+
+class AppendCSVLoader(ChunkedCSVLoader):
+    """Chargeur CSV qui ne lit que la fin d'un fichier en ajout seul.
+
+    Si l'historique connaît une lecture précédente dont le contenu est
+    toujours en tête du fichier, l'instantané de cette lecture est relu et
+    seules les lignes ajoutées sont analysées ; ``append_result`` contient
+    alors le profil et les moments fusionnés. Sinon (ou si la fin du fichier
+    change le type d'une colonne), chargement complet habituel.
+    """
+
+    def __init__(self, filepath: str, read_kwargs: Optional[Dict] = None, chunksize: int = 100_000,
+                 snapshot_store=None, compact: bool = False, history=None, state_cache=None):
+        super().__init__(filepath, read_kwargs, chunksize, snapshot_store=snapshot_store, compact=compact)
+        self.history = history
+        self.state_cache = state_cache
+        self.append_result: Optional[Dict] = None
+
+    def load(self) -> pd.DataFrame:
+        if self.history is not None and self.state_cache is not None and self.snapshot_store is not None:
+            try:
+                return self._load_appended()
+            except NotAppendable as e:
+                print(f"✗ Lecture incrémentale impossible ({e}) : lecture complète")
+        return super().load()
+
+    def build_profile(self, data: pd.DataFrame) -> pd.DataFrame:
+        if self.append_result is not None:
+            return self.append_result['profile']
+        return super().build_profile(data)
+
+    def _load_appended(self) -> pd.DataFrame:
+        last_load = self.history.get_last_load(self.filepath)
+        if last_load is None:
+            return super().load()
+        offset = appended_offset(self.filepath, last_load)
+        if offset is None:
+            if os.path.getsize(self.filepath) > last_load['byte_offset']:
+                raise NotAppendable("début du fichier modifié")
+            return super().load()
+
+        start = time.perf_counter()
+        fingerprint = last_load['fingerprint']
+        state = self.state_cache.get(append_state_key(fingerprint, self.snapshot_params))
+        snapshot = self.snapshot_store.load_key(cache_key(fingerprint, self.snapshot_params))
+        if state is None or snapshot is None:
+            raise NotAppendable("état ou instantané de la lecture précédente absent")
+        previous, meta = snapshot
+        if list(previous.columns) != state['columns'] or len(previous) != state['n_rows']:
+            raise NotAppendable("instantané incohérent")
+
+        columns = state['columns']
+        read_kwargs = {k: v for k, v in self.read_kwargs.items() if k not in ('header', 'names')}
+        text_columns = {col: str for col in columns if _kind(previous[col].dtype) == 'other'}
+
+        chunks = [previous]
+        rows = 0
+        memory_before = meta.get('extra', {}).get('memory_before') or 0
+        with open(self.filepath, 'rb') as handle:
+            handle.seek(offset)
+            try:
+                reader = pd.read_csv(handle, chunksize=self.chunksize, header=None, names=columns,
+                                     dtype=text_columns, **read_kwargs)
+            except pd.errors.EmptyDataError:
+                # Seulement des lignes vides ajoutées
+                reader = []
+            for chunk in reader:
+                if self._cancel_event.is_set():
+                    raise LoadCancelled()
+                if chunk.empty:
+                    continue
+                for col in columns:
+                    if _kind(chunk[col].dtype) != _kind(previous[col].dtype) and chunk[col].notna().any():
+                        raise NotAppendable(f"la colonne {col} change de type")
+                if self.compact:
+                    memory_before += memory_bytes(chunk)
+                    chunk = compact_frame(chunk)
+                chunks.append(chunk)
+                rows += len(chunk)
+                self.events.put(('progress', {
+                    'rows': len(previous) + rows,
+                    'bytes_read': min(handle.tell(), self.total_bytes),
+                    'total_bytes': self.total_bytes,
+                    'elapsed': time.perf_counter() - start
+                }))
+
+        if self._cancel_event.is_set():
+            raise LoadCancelled()
+
+        data = concat_compact(chunks) if self.compact else pd.concat(chunks, ignore_index=True)
+        load_seconds = time.perf_counter() - start
+
+        n_old = len(previous)
+        profile, counts, recomputed = merge_profile(state['profile'], data, n_old, state['counts'])
+        moments = merge_moments(state['moments'], data, n_old, profile)
+        self.append_result = {
+            'fingerprint': fingerprint,
+            'profile': profile,
+            'moments': moments,
+            'counts': counts,
+            'appended_rows': rows,
+            'recomputed': recomputed,
+            'merge_seconds': time.perf_counter() - start - load_seconds
+        }
+
+        self.metrics = {
+            'rows': len(data),
+            'chunks': len(chunks) - 1,
+            'bytes': self.total_bytes,
+            'bytes_parsed': self.total_bytes - offset,
+            'appended_rows': rows,
+            'load_seconds': load_seconds,
+            'separator': self.sep,
+            'source': 'append'
+        }
+        extra = None
+        if self.compact:
+            self.metrics['memory_before'] = memory_before
+            self.metrics['memory_after'] = memory_bytes(data)
+            extra = {'memory_before': memory_before}
+
+        if not self._cancel_event.is_set():
+            self.snapshot_store.save(self.filepath, self.snapshot_params, data, extra)
+            self.metrics['snapshot_seconds'] = time.perf_counter() - start - load_seconds - self.append_result['merge_seconds']
+        return data
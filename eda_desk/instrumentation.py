@@ -0,0 +1,219 @@
+"""
+INSTRUMENTATION - durée et mémoire des étapes d'une session, export au format Chrome trace
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    import psutil
+except ImportError:  # psutil optionnel : /proc/self/statm (Linux), sinon mémoire non mesurée
+    psutil = None
+
+
+# Étapes conservées par session (les plus anciennes sont oubliées au-delà)
+MAX_SPANS = 5_000
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def rss_bytes() -> Optional[int]:
+    """Mémoire résidente du processus (None si aucune source n'est disponible)"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _thread_name() -> str:
+    thread = threading.current_thread()
+    return 'interface' if thread is threading.main_thread() else thread.name
+
+
+@dataclass
+class Span:
+    """Une étape chronométrée (début relatif à l'ouverture de la session, en secondes)"""
+    name: str
+    category: str
+    start: float
+    seconds: float
+    thread: str = 'interface'
+    rss_before: Optional[int] = None
+    rss_after: Optional[int] = None
+    args: Dict = field(default_factory=dict)
+
+    @property
+    def memory_delta(self) -> Optional[int]:
+        if self.rss_before is None or self.rss_after is None:
+            return None
+        return self.rss_after - self.rss_before
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name, 'cat': self.category, 'start': round(self.start, 6),
+            'seconds': round(self.seconds, 6), 'thread': self.thread,
+            'rss_before': self.rss_before, 'rss_after': self.rss_after, 'args': self.args
+        }
+
+    @classmethod
+    def from_dict(cls, values: Dict) -> "Span":
+        return cls(values['name'], values.get('cat', 'app'), values['start'], values['seconds'],
+                   values.get('thread', 'interface'), values.get('rss_before'), values.get('rss_after'),
+                   values.get('args') or {})
+
+
+def format_span(span: Span) -> str:
+    """Résumé d'une étape pour la barre de statut : « Outliers (IQR) 0.42 s, +12 Mo »"""
+    duration = f"{span.seconds:.2f} s" if span.seconds >= 0.01 else f"{span.seconds * 1000:.1f} ms"
+    text = f"{span.name} {duration}"
+    delta = span.memory_delta
+    if delta is not None and abs(delta) >= 1024**2:
+        text += f", {delta / 1024**2:+,.0f} Mo"
+    return text
+
+
+class Tracer:
+    """Journal des étapes d'une session.
+
+    ``span()`` chronomètre un bloc du thread courant (mémoire résidente avant
+    et après) ; ``record()`` enregistre une durée mesurée ailleurs, par exemple
+    dans un worker qui la publie avec son résultat. ``on_span`` est appelé
+    après chaque enregistrement, dans le thread qui enregistre. ``context`` :
+    arguments ajoutés à chaque étape dès son début (exécution en cours...).
+    """
+
+    def __init__(self, max_spans: int = MAX_SPANS, on_span: Optional[Callable[[Span], None]] = None):
+        self.origin = time.perf_counter()
+        self.started_at = datetime.now()
+        self.on_span = on_span
+        self.context: Dict = {}
+        self._spans: deque = deque(maxlen=max_spans)
+        self._lanes: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        """Secondes écoulées depuis le début de la session"""
+        return time.perf_counter() - self.origin
+
+    def start(self, name: str, category: str = 'app', **args) -> Callable[..., Span]:
+        """Ouvrir une étape ; la fonction renvoyée la termine et l'enregistre (arguments complémentaires)"""
+        rss_before = rss_bytes()
+        start = self.now()
+        args = {**self.context, **args}
+
+        def finish(**extra) -> Span:
+            args.update(extra)
+            span = Span(name, category, start, self.now() - start, _thread_name(), rss_before, rss_bytes(), args)
+            self._add(span)
+            return span
+        return finish
+
+    @contextmanager
+    def span(self, name: str, category: str = 'app', **args) -> Iterator[Dict]:
+        """Chronométrer un bloc ; le dictionnaire renvoyé complète les arguments de l'étape"""
+        finish = self.start(name, category)
+        try:
+            yield args
+        except Exception as e:
+            args['erreur'] = str(e)
+            raise
+        finally:
+            finish(**args)
+
+    def record(self, name: str, seconds: float, category: str = 'app', start: Optional[float] = None,
+               thread: str = 'interface', **args) -> Span:
+        """Enregistrer une durée déjà mesurée (par défaut : terminée à l'instant)"""
+        if start is None:
+            start = self.now() - seconds
+        span = Span(name, category, start, seconds, thread, None, rss_bytes(), {**self.context, **args})
+        self._add(span)
+        return span
+
+    def record_parallel(self, name: str, seconds: float, category: str = 'app', group: str = 'workers',
+                        **args) -> Span:
+        """Durée mesurée dans un pool : placée sur la première ligne « group n » libre à son début,
+        pour que les étapes simultanées ne se chevauchent pas dans la trace"""
+        start = self.now() - seconds
+        with self._lock:
+            lanes = self._lanes.setdefault(group, [])
+            lane = next((i for i, end in enumerate(lanes) if end <= start), len(lanes))
+            if lane == len(lanes):
+                lanes.append(0.0)
+            lanes[lane] = start + seconds
+        return self.record(name, seconds, category, start=start, thread=f"{group} {lane + 1}", **args)
+
+    def _add(self, span: Span):
+        with self._lock:
+            self._spans.append(span)
+        if self.on_span is not None:
+            self.on_span(span)
+
+    def spans(self, since: float = 0.0) -> List[Span]:
+        """Étapes commencées depuis ``since`` (secondes de session)"""
+        with self._lock:
+            return [span for span in self._spans if span.start >= since]
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self._lanes.clear()
+
+
+def totals(spans: List[Span]) -> Dict[str, float]:
+    """Durée cumulée par nom d'étape, de la plus coûteuse à la moins coûteuse"""
+    result: Dict[str, float] = {}
+    for span in spans:
+        result[span.name] = result.get(span.name, 0.0) + span.seconds
+    return dict(sorted(result.items(), key=lambda item: item[1], reverse=True))
+
+
+def sequential_spans(timings: Dict[str, float], category: str = 'batch', thread: str = 'batch') -> List[Span]:
+    """Étapes consécutives à partir de durées nommées (mode batch : {'chargement': 1.2, ...})"""
+    spans, start = [], 0.0
+    for name, seconds in timings.items():
+        spans.append(Span(name, category, start, seconds, thread))
+        start += seconds
+    return spans
+
+
+def chrome_trace(spans: List[Span], metadata: Optional[Dict] = None) -> Dict:
+    """Trace au format « Trace Event » (chrome://tracing, Perfetto) : une ligne par thread,
+    mémoire résidente en compteur"""
+    pid = os.getpid()
+    threads: Dict[str, int] = {}
+    events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': 'EDA-Desk'}}]
+
+    for span in sorted(spans, key=lambda s: s.start):
+        if span.thread not in threads:
+            threads[span.thread] = len(threads) + 1
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': threads[span.thread],
+                           'args': {'name': span.thread}})
+        args = dict(span.args)
+        if span.memory_delta is not None:
+            args['memoire_delta_mo'] = round(span.memory_delta / 1024**2, 2)
+        events.append({
+            'name': span.name, 'cat': span.category, 'ph': 'X', 'pid': pid, 'tid': threads[span.thread],
+            'ts': round(span.start * 1e6, 1), 'dur': round(span.seconds * 1e6, 1), 'args': args
+        })
+        if span.rss_after is not None:
+            events.append({'name': 'Mémoire résidente', 'ph': 'C', 'pid': pid, 'tid': 0,
+                           'ts': round((span.start + span.seconds) * 1e6, 1),
+                           'args': {'Mo': round(span.rss_after / 1024**2, 1)}})
+
+    return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': metadata or {}}
+
+
+def write_chrome_trace(path: str, spans: List[Span], metadata: Optional[Dict] = None) -> str:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(chrome_trace(spans, metadata), f, ensure_ascii=False)
+    return path
@@ -0,0 +1,113 @@
+"""
+MODE MÉMOIRE COMPACTE - catégories pour le texte peu varié, types numériques réduits sans perte
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+
+# Au-delà de cette part de valeurs distinctes, une catégorie coûte plus qu'elle ne rapporte
+CATEGORY_MAX_RATIO = 0.5
+
+
+def memory_bytes(df: pd.DataFrame) -> int:
+    """Empreinte mémoire réelle (chaînes comprises)"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def compact_frame(df: pd.DataFrame, category_max_ratio: float = CATEGORY_MAX_RATIO) -> pd.DataFrame:
+    """Réduire chaque colonne au type le plus petit qui conserve toutes les valeurs.
+
+    - texte (object) peu varié -> ``category``
+    - entiers -> plus petit entier signé contenant min et max
+    - flottants -> ``float32`` seulement si chaque valeur y est représentable exactement
+    """
+    columns = {}
+    for col in df.columns:
+        columns[col] = _compact_series(df[col], category_max_ratio)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def concat_compact(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concaténer des blocs compactés en conservant les catégories.
+
+    ``pd.concat`` retombe sur ``object`` quand les catégories diffèrent d'un
+    bloc à l'autre : on les aligne d'abord sur leur union.
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+
+    first = chunks[0]
+    for col in first.columns:
+        is_category = [isinstance(chunk[col].dtype, CategoricalDtype) for chunk in chunks]
+        if not any(is_category):
+            continue
+        if not all(is_category):
+            # Bloc plus varié que les autres (ou très court) : catégorisé lui aussi
+            if any(chunk[col].dtype != object for chunk, cat in zip(chunks, is_category) if not cat):
+                continue
+            for chunk, cat in zip(chunks, is_category):
+                if not cat:
+                    chunk[col] = chunk[col].astype('category')
+        categories = pd.Index(np.concatenate([chunk[col].cat.categories.to_numpy(dtype=object)
+                                              for chunk in chunks])).unique()
+        for chunk in chunks:
+            chunk[col] = chunk[col].cat.set_categories(categories)
+
+    return pd.concat(chunks, ignore_index=True)
+
+
+def compact_dataframe(df: pd.DataFrame,
+                      category_max_ratio: float = CATEGORY_MAX_RATIO) -> Tuple[pd.DataFrame, Dict]:
+    """Compacter un DataFrame déjà chargé : (DataFrame compacté, rapport mémoire)"""
+    before = memory_bytes(df)
+    compacted = compact_frame(df, category_max_ratio)
+    return compacted, memory_report(df, compacted, before)
+
+
+def memory_report(original: pd.DataFrame, compacted: pd.DataFrame, before_bytes: int) -> Dict:
+    """Mémoire avant/après et colonnes dont le type a changé"""
+    after = memory_bytes(compacted)
+    converted = {
+        col: (str(original[col].dtype), str(compacted[col].dtype))
+        for col in compacted.columns
+        if col in original.columns and original[col].dtype != compacted[col].dtype
+    }
+    return {
+        'before_bytes': before_bytes,
+        'after_bytes': after,
+        'ratio': (before_bytes / after) if after else 1.0,
+        'converted': converted
+    }
+
+
+def _compact_series(series: pd.Series, category_max_ratio: float) -> pd.Series:
+    dtype = series.dtype
+
+    if dtype == object or (pd.api.types.is_string_dtype(dtype) and not isinstance(dtype, CategoricalDtype)):
+        n_valid = int(series.notna().sum())
+        if n_valid == 0:
+            return series
+        n_unique = series.nunique(dropna=True)
+        if n_unique <= max(1, n_valid * category_max_ratio):
+            return series.astype('category')
+        return series
+
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_extension_array_dtype(dtype):
+        return series
+
+    if pd.api.types.is_integer_dtype(dtype):
+        return pd.to_numeric(series, downcast='integer')
+
+    if pd.api.types.is_float_dtype(dtype) and dtype != np.float32:
+        values = series.to_numpy()
+        with np.errstate(over='ignore', invalid='ignore'):
+            narrowed = values.astype(np.float32)
+            exact = np.array_equal(narrowed.astype(dtype), values, equal_nan=True)
+        if exact:
+            return pd.Series(narrowed, index=series.index, name=series.name)
+
+    return series
@@ -0,0 +1,101 @@
+"""
+AGRÉGATION POUR GRAPHIQUES - histogrammes, densités 2D et boîtes à moustaches calculés en numpy
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Au-delà de ce nombre de points, les graphiques sont agrégés avant le tracé
+AGGREGATION_THRESHOLD = 200_000
+DENSITY_BINS = 200
+MAX_FLIERS = 2_000
+
+
+def finite_values(series: pd.Series) -> np.ndarray:
+    """Valeurs numériques finies (float64), manquants exclus"""
+    values = series.to_numpy(dtype='float64', na_value=np.nan)
+    return values[np.isfinite(values)]
+
+
+def histogram_counts(values: np.ndarray, bins: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+    """(effectifs, bornes) d'un histogramme à pas constant, par ``np.bincount``"""
+    if values.size == 0:
+        return np.zeros(bins, dtype=np.int64), np.linspace(0.0, 1.0, bins + 1)
+
+    low, high = float(values.min()), float(values.max())
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    edges = np.linspace(low, high, bins + 1)
+
+    idx = _bin_index(values, low, high, bins)
+    counts = np.bincount(idx, minlength=bins)
+    return counts, edges
+
+
+def density_2d(x: pd.Series, y: pd.Series, bins: int = DENSITY_BINS) -> Dict:
+    """Nombre de points par case d'une grille ``bins`` x ``bins`` (paires complètes uniquement)"""
+    xv = x.to_numpy(dtype='float64', na_value=np.nan)
+    yv = y.to_numpy(dtype='float64', na_value=np.nan)
+    valid = np.isfinite(xv) & np.isfinite(yv)
+    xv = xv[valid]
+    yv = yv[valid]
+
+    if xv.size == 0:
+        return {'counts': np.zeros((bins, bins), dtype=np.int64), 'x_edges': np.linspace(0, 1, bins + 1),
+                'y_edges': np.linspace(0, 1, bins + 1), 'n_points': 0}
+
+    x_low, x_high = _bounds(xv)
+    y_low, y_high = _bounds(yv)
+    ix = _bin_index(xv, x_low, x_high, bins)
+    iy = _bin_index(yv, y_low, y_high, bins)
+
+    # Une seule passe : indice de case linéaire puis comptage
+    counts = np.bincount(iy * bins + ix, minlength=bins * bins).reshape(bins, bins)
+    return {
+        'counts': counts,
+        'x_edges': np.linspace(x_low, x_high, bins + 1),
+        'y_edges': np.linspace(y_low, y_high, bins + 1),
+        'n_points': int(xv.size)
+    }
+
+
+def box_stats(values: np.ndarray, label: str = "", max_fliers: int = MAX_FLIERS,
+              seed: Optional[int] = 0) -> Dict:
+    """Statistiques pour ``Axes.bxp`` : quartiles, moustaches (1.5 IQR) et outliers échantillonnés"""
+    q1, med, q3 = np.percentile(values, [25, 50, 75]) if values.size else (np.nan,) * 3
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    fliers = values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)]
+
+    n_fliers = int(fliers.size)
+    if n_fliers > max_fliers:
+        rng = np.random.default_rng(seed)
+        fliers = rng.choice(fliers, max_fliers, replace=False)
+
+    return {
+        'label': label,
+        'med': med,
+        'q1': q1,
+        'q3': q3,
+        'whislo': float(inside.min()) if inside.size else q1,
+        'whishi': float(inside.max()) if inside.size else q3,
+        'fliers': fliers,
+        'n_fliers': n_fliers
+    }
+
+
+def _bounds(values: np.ndarray) -> Tuple[float, float]:
+    low, high = float(values.min()), float(values.max())
+    if low == high:
+        return low - 0.5, high + 0.5
+    return low, high
+
+
+def _bin_index(values: np.ndarray, low: float, high: float, bins: int) -> np.ndarray:
+    """Indice de case de chaque valeur (la borne haute tombe dans la dernière case)"""
+    idx = ((values - low) * (bins / (high - low))).astype(np.int64)
+    np.clip(idx, 0, bins - 1, out=idx)
+    return idx
@@ -0,0 +1,75 @@
+"""
+CACHE DES GRAPHIQUES - données préparées et figures vivantes, par (type, variables, version des données)
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+
+class PlotCache:
+    """Cache LRU à deux niveaux pour l'onglet Visualisations.
+
+    - ``spec`` : données déjà calculées du graphique (effectifs, densité,
+      matrice de corrélation...), peu volumineuses, gardées pour ``max_specs``
+      graphiques ;
+    - ``figure`` / ``canvas`` : la figure matplotlib et son canvas Tk, gardés
+      pour les ``max_canvases`` derniers graphiques seulement. À l'éviction,
+      ``on_evict(entry)`` libère les widgets ; la ``spec`` reste disponible
+      pour redessiner sans recalcul.
+    """
+
+    def __init__(self, max_specs: int = 32, max_canvases: int = 4,
+                 on_evict: Optional[Callable[[Dict], None]] = None):
+        self.max_specs = max_specs
+        self.max_canvases = max_canvases
+        self.on_evict = on_evict
+        self._entries: "OrderedDict[Hashable, Dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, spec: Dict, figure=None, canvas=None) -> Dict:
+        """Enregistrer un graphique (et sa figure si elle est affichée)"""
+        entry = self._entries.get(key) or {'key': key}
+        entry.update(spec=spec, figure=figure, canvas=canvas)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._evict()
+        return entry
+
+    def clear(self):
+        """Nouvelles données : tout oublier (et libérer les widgets)"""
+        for entry in self._entries.values():
+            self._release(entry)
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        return {
+            'entries': len(self._entries),
+            'canvases': sum(1 for e in self._entries.values() if e.get('canvas') is not None),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def _evict(self):
+        while len(self._entries) > self.max_specs:
+            _, entry = self._entries.popitem(last=False)
+            self._release(entry)
+
+        live = [e for e in self._entries.values() if e.get('canvas') is not None]
+        for entry in live[:max(0, len(live) - self.max_canvases)]:
+            self._release(entry)
+
+    def _release(self, entry: Dict):
+        if entry.get('canvas') is not None and self.on_evict is not None:
+            self.on_evict(entry)
+        entry['figure'] = None
+        entry['canvas'] = None
@@ -0,0 +1,160 @@
+"""
+GRAPHIQUES - préparation (calculs) et tracé matplotlib, sans dépendance à l'interface
+
+matplotlib et scipy (regroupement de la matrice de corrélation) ne sont importés
+qu'au premier graphique qui en a besoin : ``PLOT_TYPES`` reste léger à importer.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from eda_desk.plot_aggregation import box_stats, density_2d, finite_values, histogram_counts
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+
+PLOT_TYPES = ("Histogramme", "Boxplot", "Nuage de points", "Matrice de corrélation")
+
+
+def prepare_plot(viz_type: str, variables: Tuple, plot_data: pd.DataFrame, numeric_vars: Sequence[str],
+                 aggregate: bool, options: Optional[str] = None, log: Callable = print) -> Dict:
+    """Calculs du graphique (effectifs, densité, corrélations), séparés du tracé"""
+    spec = {'viz_type': viz_type, 'variables': variables, 'aggregate': aggregate, 'title_suffix': ''}
+
+    if viz_type in ("Histogramme", "Boxplot"):
+        var = variables[0]
+        if not (var and var in numeric_vars):
+            spec['message'] = '⚠ Sélectionnez une variable numérique'
+        elif viz_type == "Histogramme":
+            if aggregate:
+                # Effectifs calculés en numpy, 30 barres tracées (même rendu)
+                spec['counts'], spec['edges'] = histogram_counts(finite_values(plot_data[var]), bins=30)
+            else:
+                spec['values'] = plot_data[var].dropna()
+        elif aggregate:
+            # Quartiles calculés une fois, outliers échantillonnés pour le tracé
+            spec['box'] = box_stats(finite_values(plot_data[var]), label=var)
+        else:
+            spec['values'] = plot_data[var].dropna()
+
+    elif viz_type == "Nuage de points":
+        var1, var2 = variables
+        if not (var1 and var2 and var1 in numeric_vars and var2 in numeric_vars):
+            spec['message'] = '⚠ Sélectionnez deux variables numériques'
+        elif aggregate:
+            # Densité 2D : coût de tracé indépendant du nombre de lignes
+            spec['density'] = density_2d(plot_data[var1], plot_data[var2])
+            spec['title_suffix'] = f" (densité, {spec['density']['n_points']:,} points)"
+        else:
+            spec['x'] = plot_data[var1]
+            spec['y'] = plot_data[var2]
+
+    elif viz_type == "Matrice de corrélation":
+        if len(variables) >= 2:
+            from eda_desk.correlation import cluster_order, correlation_matrix
+
+            # Matrice complète (blocs float32 en parallèle), variables corrélées regroupées
+            result = correlation_matrix(plot_data, list(variables), method=options or 'pearson')
+            order = cluster_order(result.matrix) if len(variables) > 10 else list(variables)
+            spec['corr'] = result.matrix.loc[order, order]
+            spec['top_pairs'] = result.top_pairs(15)
+            spec['title_suffix'] = f" ({result.method}, {len(variables)} variables" + (
+                f", échantillon de {result.n_rows:,} lignes)" if result.sampled else ")")
+            log(f"✓ Corrélations {result.method} : {len(variables)} variables en {result.seconds:.2f} s")
+            for var1, var2, r in spec['top_pairs'][:5]:
+                log(f"   {var1} × {var2} : {r:+.3f}")
+        else:
+            spec['message'] = '⚠ Au moins 2 variables numériques requises'
+
+    return spec
+
+
+def draw_plot(fig: "Figure", ax, spec: Dict, filter_suffix: str = ""):
+    """Tracer un graphique à partir de ses données préparées"""
+    viz_type = spec['viz_type']
+    title_suffix = filter_suffix + spec.get('title_suffix', '')
+
+    if 'message' in spec:
+        ax.text(0.5, 0.5, spec['message'],
+                ha='center', va='center', fontsize=14, transform=ax.transAxes)
+        ax.axis('off')
+
+    elif viz_type == "Histogramme":
+        var = spec['variables'][0]
+        if 'counts' in spec:
+            ax.hist(spec['edges'][:-1], bins=spec['edges'], weights=spec['counts'],
+                    color='#6366f1', alpha=0.7, edgecolor='black')
+        else:
+            ax.hist(spec['values'], bins=30, color='#6366f1', alpha=0.7, edgecolor='black')
+        ax.set_title(f'Histogramme - {var}{title_suffix}', fontsize=14, fontweight='bold')
+        ax.set_xlabel(var, fontsize=11)
+        ax.set_ylabel('Fréquence', fontsize=11)
+        ax.grid(True, alpha=0.3)
+
+    elif viz_type == "Boxplot":
+        var = spec['variables'][0]
+        if 'box' in spec:
+            box = {k: v for k, v in spec['box'].items() if k != 'n_fliers'}
+            bp = ax.bxp([box], vert=True, patch_artist=True)
+        else:
+            bp = ax.boxplot(spec['values'], vert=True, patch_artist=True)
+        for patch in bp['boxes']:
+            patch.set_facecolor("#4A90E2")
+        ax.set_title(f'Boxplot - {var}{title_suffix}', fontsize=14, fontweight='bold')
+        ax.set_ylabel(var, fontsize=11)
+        ax.grid(True, alpha=0.3, axis='y')
+
+    elif viz_type == "Nuage de points":
+        var1, var2 = spec['variables']
+        if 'density' in spec:
+            from matplotlib.colors import LogNorm
+
+            density = spec['density']
+            counts = np.ma.masked_equal(density['counts'], 0)
+            mesh = ax.pcolormesh(density['x_edges'], density['y_edges'], counts,
+                                 cmap='viridis', norm=LogNorm(), shading='flat')
+            fig.colorbar(mesh, ax=ax, label='Points par case')
+        else:
+            ax.scatter(spec['x'], spec['y'], c='#06b6d4', alpha=0.6, s=50)
+        ax.set_xlabel(var1, fontsize=11)
+        ax.set_ylabel(var2, fontsize=11)
+        ax.set_title(f'{var1} vs {var2}{title_suffix}', fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+
+    elif viz_type == "Matrice de corrélation":
+        corr = spec['corr']
+        names = list(corr.columns)
+
+        # Heatmap à gauche, paires les plus corrélées à droite
+        grid = fig.add_gridspec(1, 2, width_ratios=[3, 1.3])
+        ax.set_subplotspec(grid[0])
+        cax = ax.matshow(corr.to_numpy(), cmap='coolwarm', vmin=-1, vmax=1)
+        fig.colorbar(cax, ax=ax)
+
+        if len(names) <= 30:
+            ax.set_xticks(range(len(names)))
+            ax.set_yticks(range(len(names)))
+            ax.set_xticklabels(names, rotation=90, ha='left', fontsize=9)
+            ax.set_yticklabels(names, fontsize=9)
+        else:
+            # Tableau large : noms au survol, zoom avec la barre d'outils
+            ax.set_xticks([])
+            ax.set_yticks([])
+            values = corr.to_numpy()
+
+            def format_coord(x, y):
+                i, j = int(round(y)), int(round(x))
+                if 0 <= i < len(names) and 0 <= j < len(names):
+                    return f"{names[i]} × {names[j]} : r = {values[i, j]:+.3f}"
+                return ""
+            ax.format_coord = format_coord
+        ax.set_title(f'Matrice de corrélation{title_suffix}', fontsize=14, fontweight='bold', pad=20)
+
+        text_ax = fig.add_subplot(grid[1])
+        text_ax.axis('off')
+        lines = [f"{str(a)[:14]} × {str(b)[:14]}  {r:+.2f}" for a, b, r in spec.get('top_pairs', [])]
+        text_ax.text(0, 1, "Paires les plus corrélées\n\n" + "\n".join(lines),
+                     va='top', ha='left', fontsize=9, family='monospace', transform=text_ax.transAxes)
@@ -0,0 +1,295 @@
+"""
+RAPPORTS TEXTE - mise en forme des résultats d'analyse (interface et mode batch)
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from eda_desk.categorical import CategoricalStats, categorical_stats, format_count
+from eda_desk.results import AnalysisResult, Finding, Table
+
+
+def _missing_level(pct: float) -> str:
+    return "CRITIQUE" if pct > 50 else "ELEVE" if pct > 30 else "MOYEN" if pct > 10 else "FAIBLE"
+
+
+def _outlier_level(pct: float) -> str:
+    return "ELEVE" if pct > 10 else "MOYEN" if pct > 5 else "FAIBLE"
+
+
+def missing_report(missing_values: Dict[str, Tuple[int, float]], total_cells: int) -> str:
+    """Texte du rapport missing"""
+    total_missing = sum(count for count, _ in missing_values.values())
+
+    report = f"""
+                         VALEURS MANQUANTES
+
+Total : {total_missing:,} / {total_cells:,} ({total_missing / total_cells * 100 if total_cells else 0:.2f}%)
+
+"""
+
+    vars_with_missing = [(col, count, pct) for col, (count, pct) in missing_values.items() if count > 0]
+    vars_with_missing.sort(key=lambda x: x[2], reverse=True)
+
+    if vars_with_missing:
+        report += "Variables concernées:\n" + "-" * 80 + "\n"
+        for col, count, pct in vars_with_missing[:15]:
+            report += f"[{_missing_level(pct)}] {col[:35]:<35} {count:>8,} ({pct:>5.1f}%)\n"
+    else:
+        report += " Aucune valeur manquante\n"
+
+    return report
+
+
+def constant_report(quasi_constant_vars: List[str]) -> str:
+    """Texte du rapport constantes"""
+    report = f"""
+                      VARIABLES QUASI-CONSTANTES
+
+Détectées : {len(quasi_constant_vars)}
+
+"""
+
+    for var in quasi_constant_vars:
+        report += f"- {var}\n"
+
+    if not quasi_constant_vars:
+        report += " Aucune variable quasi-constante\n"
+
+    return report
+
+
+def outliers_report(outliers_info: Dict[str, Dict]) -> str:
+    """Texte du rapport outliers"""
+    report = f"""
+                       OUTLIERS (MÉTHODE IQR)
+
+Variables avec outliers : {len(outliers_info)}
+
+"""
+
+    for col, info in sorted(outliers_info.items(), key=lambda x: x[1]['percentage'], reverse=True):
+        report += f"[{_outlier_level(info['percentage'])}] {col[:35]:<35} {info['count']:>6,} ({info['percentage']:>5.1f}%)"
+        # Analyse en flux : comptage estimé depuis le sketch des quantiles
+        report += f"  ± {info['error']:,.0f}\n" if info.get('error') else "\n"
+
+    if not outliers_info:
+        report += " Aucun outlier significatif\n"
+
+    return report
+
+
+def quality_grade(score: float) -> str:
+    if score >= 90:
+        return "EXCELLENT"
+    if score >= 75:
+        return "BON"
+    if score >= 60:
+        return "MOYEN"
+    return "FAIBLE"
+
+
+def quality_report(filename: str, n_rows: int, n_columns: int, memory: str, score: float,
+                   total_missing: int, total_cells: int, n_constant: int, n_outliers: int) -> str:
+    """Synthèse du rapport complet de qualité"""
+    return f"""
+                         RAPPORT COMPLET DE QUALITÉ
+
+INFORMATIONS
+{'-' * 85}
+Fichier      : {filename}
+Dimensions   : {n_rows:,} × {n_columns}
+Mémoire      : {memory}
+
+SCORE : {score:.1f}/100  {quality_grade(score)}
+
+DIAGNOSTIC
+{'-' * 85}
+Valeurs manquantes    : {total_missing:,} ({total_missing / total_cells * 100 if total_cells else 0:.2f}%)
+Variables constantes  : {n_constant}
+Variables avec outliers: {n_outliers}
+"""
+
+
+def global_stats_report(data: pd.DataFrame, numeric_vars: List[str], categorical_vars: List[str],
+                        header_note: str = "") -> str:
+    """Stats globales (10 premières variables numériques et catégorielles)"""
+    return global_stats_result(data, numeric_vars, categorical_vars, header_note).text
+
+
+def global_stats_result(data: pd.DataFrame, numeric_vars: List[str], categorical_vars: List[str],
+                        header_note: str = "", analysis_type: str = "Statistiques globales",
+                        categorical: Optional[Dict[str, CategoricalStats]] = None) -> AnalysisResult:
+    """Stats globales : texte et tableaux calculés en une passe (``categorical`` : résumés déjà calculés)"""
+    report = """
+         STATISTIQUES GLOBALES
+
+"""
+    report += header_note
+    tables = []
+
+    # Numériques
+    if numeric_vars:
+        report += f"\nVARIABLES NUMÉRIQUES\n{'=' * 70}\n"
+        rows = []
+        for var in numeric_vars[:10]:
+            data_var = data[var].dropna()
+            mean, median, std = data_var.mean(), data_var.median(), data_var.std()
+            low, high = data_var.min(), data_var.max()
+            rows.append([var, mean, median, std, low, high])
+            report += f"\n{var}\n{'-' * 70}\n"
+            report += f"Moy: {mean:.2f} | Med: {median:.2f} | Std: {std:.2f}\n"
+            report += f"Min: {low:.2f} | Max: {high:.2f}\n"
+        tables.append(Table(['Variable', 'Moyenne', 'Médiane', 'Écart-type', 'Min', 'Max'], rows,
+                            "Variables numériques"))
+
+    # Catégorielles
+    if categorical_vars:
+        report += f"\n\nVARIABLES CATÉGORIELLES\n{'=' * 70}\n"
+        rows = []
+
+        for var in categorical_vars[:10]:
+            stats = (categorical or {}).get(var) or categorical_stats(data[var])
+            n_unique = stats.n_unique
+
+            report += f"\n{var} ({format_count(n_unique)} modalités)\n{'-' * 70}\n"
+
+            for i, (modalite, count) in enumerate(stats.top[:3]):
+                pct = stats.percent(count.value)
+                rows.append([var if i == 0 else "", round(n_unique.value) if i == 0 else None, str(modalite),
+                             count.value, pct])
+                report += f"  {i+1}. {str(modalite)[:30]:<30} : {format_count(count):>6} ({pct:>5.1f}%)\n"
+        tables.append(Table(['Variable', 'Modalités', 'Modalité', 'Effectif', '%'], rows,
+                            "Variables catégorielles (3 modalités les plus fréquentes)"))
+
+    metrics = {'Variables numériques': len(numeric_vars), 'Variables catégorielles': len(categorical_vars)}
+    return AnalysisResult(analysis_type, report, metrics, tables)
+
+
+def accumulated_header(filename: str, count: int) -> str:
+    return f"""
+                         RAPPORT D'ANALYSE COMPLET
+                         {count} analyse(s) effectuée(s)
+
+Fichier : {filename}
+Date : {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
+
+"""
+
+
+def section_text(number: int, result: AnalysisResult) -> str:
+    """Section d'une analyse dans le rapport accumulé"""
+    return (f"\n\n{'=' * 85}\n"
+            f"ANALYSE #{number} - {result.type.upper()} (à {result.timestamp})\n"
+            f"{'=' * 85}\n\n"
+            + result.text)
+
+
+ACCUMULATED_FOOTER = (f"\n\n{'=' * 85}\n"
+                      "Toutes les analyses sont disponibles pour l'export.\n"
+                      "Utilisez les boutons d'export (Word, PDF, Excel).\n"
+                      f"{'=' * 85}\n")
+
+
+# ============================================================
+# RÉSULTATS STRUCTURÉS
+# ============================================================
+
+def missing_result(missing_values: Dict[str, Tuple[int, float]], total_cells: int) -> AnalysisResult:
+    total_missing = sum(count for count, _ in missing_values.values())
+    rows = sorted(([col, count, pct, _missing_level(pct)] for col, (count, pct) in missing_values.items()
+                   if count > 0), key=lambda row: row[2], reverse=True)
+    return AnalysisResult(
+        "Valeurs manquantes", missing_report(missing_values, total_cells),
+        metrics={'Valeurs manquantes': total_missing, 'Cellules': total_cells,
+                 '% manquant': total_missing / total_cells * 100 if total_cells else 0.0,
+                 'Variables concernées': len(rows)},
+        tables=[Table(['Variable', 'Manquantes', '%', 'Niveau'], rows[:15])] if rows else [],
+        findings=[Finding(level, col, f"{pct:.1f} % de valeurs manquantes")
+                  for col, _, pct, level in rows if level in ("CRITIQUE", "ELEVE")]
+    )
+
+
+def constant_result(quasi_constant_vars: List[str]) -> AnalysisResult:
+    return AnalysisResult(
+        "Variables constantes", constant_report(quasi_constant_vars),
+        metrics={'Variables quasi-constantes': len(quasi_constant_vars)},
+        findings=[Finding("MOYEN", var, "variable quasi-constante") for var in quasi_constant_vars]
+    )
+
+
+def outliers_result(outliers_info: Dict[str, Dict]) -> AnalysisResult:
+    rows = [[col, info['count'], info['percentage'], _outlier_level(info['percentage']), info.get('error')]
+            for col, info in sorted(outliers_info.items(), key=lambda x: x[1]['percentage'], reverse=True)]
+    columns = ['Variable', 'Outliers', '%', 'Niveau', '± erreur']
+    if not any(row[4] for row in rows):
+        # Analyse exacte : pas de colonne d'erreur
+        columns, rows = columns[:4], [row[:4] for row in rows]
+    return AnalysisResult(
+        "Outliers (IQR)", outliers_report(outliers_info),
+        metrics={'Variables avec outliers': len(outliers_info)},
+        tables=[Table(columns, rows)] if rows else [],
+        findings=[Finding(row[3], row[0], f"{row[2]:.1f} % d'outliers") for row in rows if row[3] == "ELEVE"]
+    )
+
+
+def quality_result(filename: str, n_rows: int, n_columns: int, memory: str, score: float,
+                   total_missing: int, total_cells: int, n_constant: int, n_outliers: int) -> AnalysisResult:
+    return AnalysisResult(
+        "Rapport complet de qualité",
+        quality_report(filename, n_rows, n_columns, memory, score, total_missing, total_cells,
+                       n_constant, n_outliers),
+        metrics={'Fichier': filename, 'Dimensions': f"{n_rows:,} × {n_columns}", 'Mémoire': memory,
+                 'Score': f"{score:.1f} / 100", 'Évaluation': quality_grade(score),
+                 'Valeurs manquantes': f"{total_missing:,} ({total_missing / total_cells * 100 if total_cells else 0:.2f}%)",
+                 'Variables constantes': n_constant, 'Variables avec outliers': n_outliers}
+    )
+
+
+def types_result(profile: pd.DataFrame, numeric_vars: List[str], categorical_vars: List[str],
+                 boolean_vars: List[str], n_columns: int) -> AnalysisResult:
+    """Types détectés : texte (aperçu) et tableau des variables"""
+    report = """
+                    DÉTECTION AUTOMATIQUE DES TYPES
+
+"""
+    rows = []
+
+    if numeric_vars:
+        report += "\n VARIABLES NUMÉRIQUES\n" + "-" * 80 + "\n"
+        for i, var in enumerate(numeric_vars, 1):
+            info = profile.loc[var]
+            report += f"{i:2d}. {var:30s} | {info['dtype']:10s} | {info['n_unique']:6d} valeurs | [{info['min']:.2f}, {info['max']:.2f}]\n"
+            rows.append([var, "Numérique", info['dtype'], int(info['n_unique']), info['min'], info['max']])
+
+    if categorical_vars:
+        report += "\n\n VARIABLES CATÉGORIELLES\n" + "-" * 80 + "\n"
+        for i, var in enumerate(categorical_vars, 1):
+            report += f"{i:2d}. {var:30s} | {profile.at[var, 'n_unique']:6d} modalités\n"
+            rows.append([var, "Catégorielle", profile.at[var, 'dtype'], int(profile.at[var, 'n_unique']), None, None])
+
+    if boolean_vars:
+        report += "\n\n VARIABLES BOOLÉENNES\n" + "-" * 80 + "\n"
+        for i, var in enumerate(boolean_vars, 1):
+            report += f"{i:2d}. {var:30s}\n"
+            rows.append([var, "Booléenne", profile.at[var, 'dtype'], int(profile.at[var, 'n_unique']), None, None])
+
+    report += f"""
+
+                                  RÉCAPITULATIF
+
+    Total : {n_columns}
+    
+    Numériques    : {len(numeric_vars):3d}
+    Catégorielles : {len(categorical_vars):3d}
+    Booléennes    : {len(boolean_vars):3d}
+"""
+
+    return AnalysisResult(
+        "Types de variables", report,
+        metrics={'Variables': n_columns, 'Numériques': len(numeric_vars),
+                 'Catégorielles': len(categorical_vars), 'Booléennes': len(boolean_vars)},
+        tables=[Table(['Variable', 'Type', 'dtype', 'Valeurs distinctes', 'Min', 'Max'], rows)] if rows else []
+    )
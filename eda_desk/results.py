@@ -0,0 +1,106 @@
+"""
+RÉSULTATS STRUCTURÉS - analyses accumulées (métriques, tableaux, constats) et leur texte
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+@dataclass
+class Table:
+    """Tableau d'un résultat : valeurs brutes, mises en forme par l'affichage ou l'export"""
+    columns: List[str]
+    rows: List[List]
+    title: str = ""
+
+
+@dataclass
+class Finding:
+    """Constat sur une variable (niveau CRITIQUE, ELEVE, MOYEN, FAIBLE ou INFO)"""
+    level: str
+    subject: str
+    message: str
+
+
+@dataclass
+class AnalysisResult:
+    """Une analyse de l'accumulateur : texte de l'onglet Résultats et données structurées des exports"""
+    type: str
+    text: str
+    metrics: Dict[str, object] = field(default_factory=dict)
+    tables: List[Table] = field(default_factory=list)
+    findings: List[Finding] = field(default_factory=list)
+    timestamp: str = field(default_factory=lambda: datetime.now().strftime('%H:%M:%S'))
+
+    @property
+    def structured(self) -> bool:
+        return bool(self.metrics or self.tables or self.findings)
+
+    def to_dict(self) -> Dict:
+        """Types simples uniquement (transmis aux processus d'export, sauvegardés dans le cache)"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, values: Dict) -> "AnalysisResult":
+        # Entrées des versions précédentes : {'type', 'report', 'timestamp'}
+        text = values['text'] if 'text' in values else values.get('report', '')
+        result = cls(values['type'], text, dict(values.get('metrics') or {}),
+                     [Table(**table) for table in values.get('tables') or []],
+                     [Finding(**finding) for finding in values.get('findings') or []])
+        if values.get('timestamp'):
+            result.timestamp = values['timestamp']
+        return result
+
+
+class ResultAccumulator:
+    """Analyses accumulées, une par type.
+
+    Une analyse relancée remplace la précédente à la même place : l'ordre
+    (et donc la numérotation des sections) ne change jamais, ce qui permet à
+    l'onglet Résultats de ne réécrire que la section concernée.
+    """
+
+    def __init__(self, results: Iterable[AnalysisResult] = ()):
+        self._results: Dict[str, AnalysisResult] = {}
+        self._positions: Dict[str, int] = {}
+        for result in results:
+            self.add(result)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Union[AnalysisResult, Dict]]) -> "ResultAccumulator":
+        return cls(entry if isinstance(entry, AnalysisResult) else AnalysisResult.from_dict(entry)
+                   for entry in entries)
+
+    def add(self, result: AnalysisResult) -> Tuple[int, bool]:
+        """Ajouter ou remplacer ; renvoie (position, remplacement ?)"""
+        replaced = result.type in self._results
+        if not replaced:
+            self._positions[result.type] = len(self._results)
+        self._results[result.type] = result
+        return self._positions[result.type], replaced
+
+    def get(self, analysis_type: str) -> Optional[AnalysisResult]:
+        return self._results.get(analysis_type)
+
+    def position(self, analysis_type: str) -> int:
+        return self._positions[analysis_type]
+
+    def types(self) -> List[str]:
+        return list(self._results)
+
+    def clear(self):
+        self._results.clear()
+        self._positions.clear()
+
+    def to_list(self) -> List[Dict]:
+        return [result.to_dict() for result in self._results.values()]
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[AnalysisResult]:
+        return iter(list(self._results.values()))
+
+    def __contains__(self, analysis_type: str) -> bool:
+        return analysis_type in self._results
@@ -0,0 +1,651 @@
+"""
+STATISTIQUES APPROCHÉES - sketches fusionnables (quantiles, distincts, moments) avec bornes d'erreur
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from eda_desk.analysis_scheduler import default_workers
+
+
+# Erreur relative garantie des quantiles (DDSketch)
+QUANTILE_ALPHA = 0.01
+QUANTILE_MAX_BINS = 2048
+# 2^14 registres HyperLogLog : erreur type 1.04 / 128 ≈ 0.8 %
+HLL_PRECISION = 14
+# Échantillon uniforme de lignes pour les modalités dominantes
+SAMPLE_SIZE = 100_000
+# Compteurs des valeurs les plus fréquentes (Misra-Gries)
+TOP_CAPACITY = 1_000
+# Lignes traitées par bloc (mémoire de travail bornée quelle que soit la taille du fichier)
+CHUNK_ROWS = 1_000_000
+# Bornes affichées à ~95 %
+Z_95 = 1.96
+
+NUMERIC_STATS = ['Moyenne', 'Médiane', 'Écart-type', 'Variance', 'Min', 'Max',
+                 'Q1', 'Q3', 'Skewness', 'Kurtosis']
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """Valeur estimée et borne d'erreur absolue (0 : valeur exacte)"""
+    value: float
+    error: float = 0.0
+
+    @property
+    def exact(self) -> bool:
+        return self.error == 0.0
+
+    def describe(self, fmt: str = '.4f') -> str:
+        if self.exact:
+            return "exact"
+        if math.isnan(self.error):
+            return "≈ (sans borne)"
+        return f"± {self.error:{fmt}}"
+
+
+# ============================================================
+# MOMENTS
+# ============================================================
+
+class MomentSketch:
+    """Effectif, moyenne et moments centrés d'ordre 2 à 4, fusion de Pébay (exacts)"""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+    def update(self, values: np.ndarray):
+        """Ajouter des valeurs finies (float64)"""
+        if values.size == 0:
+            return
+        part = MomentSketch()
+        part.n = int(values.size)
+        part.mean = float(values.mean())
+        deviation = values - part.mean
+        square = deviation * deviation
+        part.m2 = float(square.sum())
+        part.m3 = float((square * deviation).sum())
+        part.m4 = float((square * square).sum())
+        part.min = float(values.min())
+        part.max = float(values.max())
+        self.merge(part)
+
+    def merge(self, other: 'MomentSketch') -> 'MomentSketch':
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+
+        m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        m3 = (self.m3 + other.m3 + delta * delta_n ** 2 * na * nb * (na - nb)
+              + 3 * delta_n * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4 + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * delta_n ** 2 * (na * na * other.m2 + nb * nb * self.m2)
+              + 4 * delta_n * (na * other.m3 - nb * self.m3))
+
+        self.n = n
+        self.mean += delta_n * nb
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        return self
+
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan
+
+    def skew(self) -> float:
+        """Coefficient d'asymétrie corrigé (même définition que ``Series.skew``)"""
+        n = self.n
+        if n < 3:
+            return np.nan
+        if self.m2 <= 1e-14 * n * max(self.mean * self.mean, 1.0):
+            return 0.0
+        return n * (n - 1) ** 0.5 / (n - 2) * self.m3 / self.m2 ** 1.5
+
+    def kurtosis(self) -> float:
+        """Kurtosis en excès corrigé (même définition que ``Series.kurtosis``)"""
+        n = self.n
+        if n < 4:
+            return np.nan
+        if self.m2 <= 1e-14 * n * max(self.mean * self.mean, 1.0):
+            return 0.0
+        numerator = n * (n + 1) * (n - 1) * self.m4
+        denominator = (n - 2) * (n - 3) * self.m2 ** 2
+        return numerator / denominator - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+
+
+# ============================================================
+# QUANTILES
+# ============================================================
+
+class _Buckets:
+    """Compteurs denses d'indices de cases contigus à partir de ``offset``"""
+
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.collapsed = False
+
+    def add(self, offset: int, counts: np.ndarray):
+        if counts.size == 0:
+            return
+        if self.counts.size == 0:
+            self.offset, self.counts = offset, counts.astype(np.int64)
+            return
+        low = min(self.offset, offset)
+        high = max(self.offset + self.counts.size, offset + counts.size)
+        merged = np.zeros(high - low, dtype=np.int64)
+        merged[self.offset - low:self.offset - low + self.counts.size] += self.counts
+        merged[offset - low:offset - low + counts.size] += counts
+        self.offset, self.counts = low, merged
+
+    def collapse(self, max_bins: int):
+        """Regrouper les cases les plus basses au-delà de ``max_bins``"""
+        excess = self.counts.size - max_bins
+        if excess > 0:
+            head = self.counts[:excess + 1].sum()
+            self.counts = self.counts[excess:].copy()
+            self.counts[0] = head
+            self.offset += excess
+            self.collapsed = True
+
+
+class QuantileSketch:
+    """DDSketch : cases logarithmiques, erreur relative ``alpha`` sur chaque quantile.
+
+    Toute valeur x tombe dans la case ``ceil(log_gamma |x|)`` ; le représentant
+    de la case est à moins de ``alpha * |x|`` de x. Deux sketches se fusionnent
+    en additionnant leurs compteurs. Au-delà de ``max_bins`` cases par signe,
+    les plus petites valeurs absolues sont regroupées (la garantie ne tient
+    plus pour elles, plage dynamique ~1e17 avec les valeurs par défaut).
+    """
+
+    def __init__(self, alpha: float = QUANTILE_ALPHA, max_bins: int = QUANTILE_MAX_BINS):
+        self.alpha = alpha
+        self.max_bins = max_bins
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = _Buckets()
+        self.negative = _Buckets()
+        self.zero_count = 0
+
+    @property
+    def count(self) -> int:
+        return int(self.positive.counts.sum() + self.negative.counts.sum() + self.zero_count)
+
+    def update(self, values: np.ndarray):
+        """Ajouter des valeurs finies (float64)"""
+        zero = values == 0
+        self.zero_count += int(np.count_nonzero(zero))
+        self._add(self.positive, values[values > 0])
+        self._add(self.negative, -values[values < 0])
+
+    def _add(self, buckets: _Buckets, magnitudes: np.ndarray):
+        if magnitudes.size == 0:
+            return
+        index = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        low = int(index.min())
+        buckets.add(low, np.bincount(index - low))
+        buckets.collapse(self.max_bins)
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        self.positive.add(other.positive.offset, other.positive.counts)
+        self.negative.add(other.negative.offset, other.negative.counts)
+        self.positive.collapse(self.max_bins)
+        self.negative.collapse(self.max_bins)
+        self.zero_count += other.zero_count
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Quantile interpolé entre statistiques d'ordre (comme ``Series.quantile``)"""
+        return self.quantile_estimate(q).value
+
+    def quantile_estimate(self, q: float) -> Estimate:
+        """Quantile et sa borne.
+
+        Seul le représentant r est connu : |x| <= |r| / (1 - alpha), donc
+        |r - x| <= alpha / (1 - alpha) * |r| pour chaque statistique d'ordre,
+        et l'interpolation pondère les deux bornes.
+        """
+        values, counts = self._ordered()
+        total = int(counts.sum())
+        if total == 0:
+            return Estimate(np.nan)
+
+        cumulative = np.cumsum(counts)
+        rank = q * (total - 1)
+        low = int(math.floor(rank))
+        high = min(low + 1, total - 1)
+        weight = rank - low
+        v_low = values[np.searchsorted(cumulative, low, side='right')]
+        v_high = values[np.searchsorted(cumulative, high, side='right')]
+        error = self.alpha / (1 - self.alpha) * ((1 - weight) * abs(v_low) + weight * abs(v_high))
+        return Estimate(float(v_low + weight * (v_high - v_low)), float(error))
+
+    def count_outside(self, low: float, high: float) -> Estimate:
+        """Nombre de valeurs hors de [low, high] (les cases à cheval sur une borne font l'incertitude)"""
+        lower, upper, counts = self._intervals()
+        outside = int(counts[(upper < low) | (lower > high)].sum())
+        straddling = int(counts[((lower < low) & (upper >= low)) | ((lower <= high) & (upper > high))].sum())
+        return Estimate(outside + straddling / 2, straddling / 2)
+
+    def _intervals(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Bornes (basse, haute) de chaque case, par ordre croissant, et effectifs"""
+        def bounds(buckets: _Buckets) -> Tuple[np.ndarray, np.ndarray]:
+            index = np.arange(buckets.offset, buckets.offset + buckets.counts.size)
+            low, high = np.power(self.gamma, index - 1), np.power(self.gamma, index)
+            if buckets.collapsed and low.size:
+                low[0] = 0.0
+            return low, high
+
+        pos_low, pos_high = bounds(self.positive)
+        neg_low, neg_high = bounds(self.negative)
+        lower = np.concatenate([-neg_high[::-1], [0.0], pos_low])
+        upper = np.concatenate([-neg_low[::-1], [0.0], pos_high])
+        counts = np.concatenate([self.negative.counts[::-1], [self.zero_count], self.positive.counts])
+        return lower, upper, counts
+
+    def _ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Représentants des cases non vides, par ordre croissant, et leurs effectifs"""
+        def representatives(buckets: _Buckets) -> np.ndarray:
+            index = np.arange(buckets.offset, buckets.offset + buckets.counts.size)
+            return 2 * np.power(self.gamma, index) / (self.gamma + 1)
+
+        values = np.concatenate([-representatives(self.negative)[::-1], [0.0], representatives(self.positive)])
+        counts = np.concatenate([self.negative.counts[::-1], [self.zero_count], self.positive.counts])
+        keep = counts > 0
+        return values[keep], counts[keep]
+
+
+# ============================================================
+# VALEURS DISTINCTES
+# ============================================================
+
+class DistinctSketch:
+    """HyperLogLog sur hachages 64 bits (``pd.util.hash_array``), fusion par maximum des registres"""
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    @property
+    def standard_error(self) -> float:
+        return 1.04 / math.sqrt(self.m)
+
+    def update_hashes(self, hashes: np.ndarray):
+        if hashes.size == 0:
+            return
+        tail_bits = 64 - self.precision
+        index = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+        tail = (hashes & np.uint64((1 << tail_bits) - 1)).astype(np.float64)
+        # Rang du premier bit à 1 : 1 + nombre de zéros en tête de la queue (exact, queue < 2^53)
+        _, bit_length = np.frexp(tail)
+        rank = (tail_bits + 1 - bit_length).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: 'DistinctSketch') -> 'DistinctSketch':
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        """Estimateur d'Ertl (2017) sur l'histogramme des registres.
+
+        Pas de bascule comptage linéaire / HyperLogLog brut : celle-ci laissait
+        un biais de ~3 % vers 2.5·m valeurs distinctes, au-delà de la borne.
+        """
+        m = self.m
+        q = 64 - self.precision
+        histogram = np.bincount(self.registers, minlength=q + 2)
+        if histogram[0] == m:
+            return 0.0
+        z = m * _hll_tau(1 - histogram[q + 1] / m)
+        for k in range(q, 0, -1):
+            z = 0.5 * (z + histogram[k])
+        z += m * _hll_sigma(histogram[0] / m)
+        return float(m * m / (2 * math.log(2)) / z)
+
+
+def _hll_sigma(x: float) -> float:
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous = z
+        z += x * y
+        y += y
+        if z == previous:
+            return z
+
+
+def _hll_tau(x: float) -> float:
+    if x == 0.0 or x == 1.0:
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = math.sqrt(x)
+        previous = z
+        y *= 0.5
+        z -= (1 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+# ============================================================
+# VALEURS FRÉQUENTES
+# ============================================================
+
+class TopValueSketch:
+    """Résumé de Misra-Gries : au plus ``capacity`` compteurs, fusionnable.
+
+    Chaque effectif conservé est un minorant ; l'effectif réel est au plus
+    ``count + error``, avec ``error <= total / (capacity + 1)``. Toute valeur
+    plus fréquente que ``error`` est forcément conservée.
+    """
+
+    def __init__(self, capacity: int = TOP_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='int64')
+        self.total = 0
+        self.error = 0
+
+    def update(self, values: pd.Series):
+        self.update_counts(values.value_counts(dropna=True))
+
+    def update_counts(self, counts: pd.Series):
+        """Ajouter les effectifs exacts d'un bloc (valeur -> effectif)"""
+        counts = counts[counts > 0]
+        self.total += int(counts.sum())
+        self._combine(self._trim(counts.astype('int64')))
+
+    def merge(self, other: 'TopValueSketch') -> 'TopValueSketch':
+        self.total += other.total
+        self.error += other.error
+        self._combine(other.counts)
+        return self
+
+    def _combine(self, counts: pd.Series):
+        if len(self.counts):
+            counts = self.counts.add(counts, fill_value=0).astype('int64')
+        self.counts = self._trim(counts)
+
+    def _trim(self, counts: pd.Series) -> pd.Series:
+        """Garder ``capacity`` compteurs : tous diminués du (capacity+1)-ième effectif"""
+        if len(counts) > self.capacity + 1:
+            # Sélection partielle : seuls les capacity+1 plus grands effectifs sont triés
+            counts = counts.nlargest(self.capacity + 1, keep='first')
+        else:
+            counts = counts.sort_values(ascending=False, kind='stable')
+        if len(counts) > self.capacity:
+            threshold = int(counts.iloc[self.capacity])
+            counts = counts.iloc[:self.capacity] - threshold
+            counts = counts[counts > 0]
+            self.error += threshold
+        return counts
+
+    def top_values(self, n: int = 10) -> List[Tuple[object, Estimate]]:
+        """Valeurs les plus fréquentes : effectif au milieu de [minorant, minorant + erreur]"""
+        half = self.error / 2
+        return [(value, Estimate(count + half, half)) for value, count in self.counts.head(n).items()]
+
+    def values(self) -> List:
+        return list(self.counts.index)
+
+
+# ============================================================
+# ÉCHANTILLON
+# ============================================================
+
+class SampleSketch:
+    """Échantillon uniforme de taille fixe : les ``size`` lignes de plus petite clé aléatoire.
+
+    La fusion garde les plus petites clés de l'union, ce qui reste un
+    échantillon uniforme de l'ensemble des lignes vues.
+    """
+
+    def __init__(self, size: int = SAMPLE_SIZE, seed: Optional[int] = 0):
+        self.size = size
+        self.seen = 0
+        self.keys = np.zeros(0, dtype=np.float64)
+        self.values = np.zeros(0, dtype=object)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray, labels: Optional[np.ndarray] = None):
+        """Ajouter des valeurs (ou des codes, traduits par ``labels``)"""
+        if values.size == 0:
+            return
+        self.seen += int(values.size)
+        keys = self._rng.random(values.size)
+        if self.keys.size == self.size:
+            # Échantillon plein : seules les clés sous le seuil actuel peuvent entrer
+            candidates = np.flatnonzero(keys < self.keys.max())
+            keys, values = keys[candidates], values[candidates]
+        values = labels[values] if labels is not None else values.astype(object)
+        self._keep(np.concatenate([self.keys, keys]), np.concatenate([self.values, values]))
+
+    def merge(self, other: 'SampleSketch') -> 'SampleSketch':
+        self.seen += other.seen
+        self._keep(np.concatenate([self.keys, other.keys]), np.concatenate([self.values, other.values]))
+        return self
+
+    def _keep(self, keys: np.ndarray, values: np.ndarray):
+        if keys.size > self.size:
+            best = np.argpartition(keys, self.size - 1)[:self.size]
+            keys, values = keys[best], values[best]
+        self.keys, self.values = keys, values
+
+    def top_values(self, n: int = 10) -> List[Tuple[object, Estimate]]:
+        """Modalités les plus fréquentes de l'échantillon, effectif extrapolé à toutes les lignes vues.
+
+        Sans borne d'erreur (``nan``) : les modalités sont choisies parce que
+        leur effectif d'échantillon est grand, ce qui le biaise vers le haut ;
+        un intervalle binomial par valeur ne tiendrait pas compte de ce choix.
+        """
+        if self.values.size == 0:
+            return []
+        counts = pd.Series(self.values).value_counts()
+        exact = self.values.size == self.seen
+        return [(value, Estimate(count / self.values.size * self.seen, 0.0 if exact else math.nan))
+                for value, count in counts.head(n).items()]
+
+
+# ============================================================
+# SKETCH D'UNE COLONNE
+# ============================================================
+
+class ColumnSketch:
+    """Résumé fusionnable d'une colonne : manquants, distincts et, selon le type,
+    moments + quantiles (numérique) ou échantillon de modalités (autres).
+
+    ``track_top`` : compteurs de Misra-Gries des valeurs fréquentes (toutes
+    colonnes), qui remplacent l'échantillon pour les modalités dominantes.
+    """
+
+    def __init__(self, numeric: bool, alpha: float = QUANTILE_ALPHA, precision: int = HLL_PRECISION,
+                 sample_size: int = SAMPLE_SIZE, seed: Optional[int] = 0, track_top: bool = False):
+        self.numeric = numeric
+        self.n_total = 0
+        self.n_missing = 0
+        self.distinct = DistinctSketch(precision)
+        self.moments = MomentSketch() if numeric else None
+        self.quantiles = QuantileSketch(alpha) if numeric else None
+        self.top = TopValueSketch() if track_top else None
+        self.sample = None if numeric or track_top else SampleSketch(sample_size, seed)
+
+    def update(self, series: pd.Series):
+        self.n_total += len(series)
+        if self.numeric:
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+            finite = values[np.isfinite(values)]
+            self.n_missing += int(np.isnan(values).sum())
+            self.moments.update(finite)
+            self.quantiles.update(finite)
+            self.distinct.update_hashes(pd.util.hash_array(values[~np.isnan(values)]))
+            if self.top is not None:
+                self.top.update(pd.Series(values[~np.isnan(values)]))
+            return
+
+        # Codes par ligne (-1 : manquant) : seules les modalités du bloc sont hachées
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+        else:
+            codes, uniques = pd.factorize(series)
+        present = codes[codes >= 0]
+        self.n_missing += len(codes) - present.size
+        labels = np.asarray(uniques, dtype=object)
+        self.distinct.update_hashes(pd.util.hash_array(labels, categorize=False)[present])
+        if self.top is not None:
+            self.top.update_counts(pd.Series(np.bincount(present, minlength=labels.size), index=labels))
+        else:
+            self.sample.update(present, labels)
+
+    def merge(self, other: 'ColumnSketch') -> 'ColumnSketch':
+        self.n_total += other.n_total
+        self.n_missing += other.n_missing
+        self.distinct.merge(other.distinct)
+        if self.numeric:
+            self.moments.merge(other.moments)
+            self.quantiles.merge(other.quantiles)
+        if self.top is not None:
+            self.top.merge(other.top)
+        elif self.sample is not None:
+            self.sample.merge(other.sample)
+        return self
+
+    def distinct_count(self) -> Estimate:
+        if self.top is not None and self.top.error == 0:
+            # Compteurs complets : toutes les valeurs distinctes y figurent
+            return Estimate(len(self.top.counts))
+        estimate = self.distinct.estimate()
+        return Estimate(round(estimate), Z_95 * self.distinct.standard_error * estimate)
+
+    def summary(self) -> Dict[str, Estimate]:
+        """Statistiques numériques (clés de ``NUMERIC_STATS``) et leurs bornes"""
+        moments = self.moments
+        variance = moments.variance()
+        quantile = self.quantile
+        return {
+            'Moyenne': Estimate(moments.mean if moments.n else np.nan),
+            'Médiane': quantile(0.5),
+            'Écart-type': Estimate(math.sqrt(variance) if variance == variance else np.nan),
+            'Variance': Estimate(variance),
+            'Min': Estimate(moments.min),
+            'Max': Estimate(moments.max),
+            'Q1': quantile(0.25),
+            'Q3': quantile(0.75),
+            'Skewness': Estimate(moments.skew()),
+            'Kurtosis': Estimate(moments.kurtosis())
+        }
+
+    def top_values(self, n: int = 10) -> List[Tuple[object, Estimate]]:
+        if self.top is not None:
+            return self.top.top_values(n)
+        return self.sample.top_values(n) if self.sample is not None else []
+
+    def top_count(self) -> Estimate:
+        """Effectif de la valeur la plus fréquente (compteurs ``track_top``)"""
+        top = self.top_values(1)
+        return top[0][1] if top else Estimate(0)
+
+    def quantile(self, q: float) -> Estimate:
+        """Quantile exact si les compteurs couvrent toutes les valeurs, sinon DDSketch"""
+        exact = self._exact_counts()
+        if exact is not None:
+            values, counts = exact
+            if values.size == 0:
+                return Estimate(np.nan)
+            cumulative = np.cumsum(counts)
+            rank = q * (cumulative[-1] - 1)
+            low = int(np.floor(rank))
+            v_low = values[np.searchsorted(cumulative, low, side='right')]
+            v_high = values[np.searchsorted(cumulative, min(low + 1, cumulative[-1] - 1), side='right')]
+            return Estimate(float(v_low + (rank - low) * (v_high - v_low)))
+
+        estimate = self.quantiles.quantile_estimate(q)
+        # Ramené dans l'étendue observée : l'écart au vrai quantile ne peut que diminuer
+        if self.moments.n:
+            return Estimate(float(np.clip(estimate.value, self.moments.min, self.moments.max)), estimate.error)
+        return estimate
+
+    def outlier_count(self, factor: float) -> Estimate:
+        """Valeurs hors de [Q1 - factor·IQR, Q3 + factor·IQR].
+
+        Exact pour les colonnes à peu de valeurs distinctes ; sinon la borne
+        couvre à la fois l'incertitude des quartiles et la résolution des cases.
+        """
+        q1, q3 = self.quantile(0.25), self.quantile(0.75)
+        exact = self._exact_counts()
+        if exact is not None:
+            values, counts = exact
+            low = q1.value - factor * (q3.value - q1.value)
+            high = q3.value + factor * (q3.value - q1.value)
+            return Estimate(int(counts[(values < low) | (values > high)].sum()))
+
+        q1_low, q1_high = q1.value - q1.error, q1.value + q1.error
+        q3_low, q3_high = q3.value - q3.error, q3.value + q3.error
+        # Intervalle le plus large (moins d'outliers) et le plus étroit (plus d'outliers)
+        widest = self.quantiles.count_outside(q1_low - factor * (q3_high - q1_low), q3_high + factor * (q3_high - q1_low))
+        narrowest = self.quantiles.count_outside(q1_high - factor * max(q3_low - q1_high, 0.0),
+                                                 q3_low + factor * max(q3_low - q1_high, 0.0))
+        least = max(widest.value - widest.error, 0.0)
+        most = narrowest.value + narrowest.error
+        return Estimate((least + most) / 2, (most - least) / 2)
+
+    def _exact_counts(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """(valeurs triées, effectifs) si les compteurs Misra-Gries sont complets et exacts"""
+        top = self.top
+        if not self.numeric or top is None or top.error or int(top.counts.sum()) != self.moments.n:
+            return None
+        values = top.counts.index.to_numpy(dtype='float64')
+        order = np.argsort(values)
+        return values[order], top.counts.to_numpy()[order]
+
+
+def sketch_frame(data: pd.DataFrame, columns: Optional[Sequence[str]] = None, chunk_rows: int = CHUNK_ROWS,
+                 max_workers: Optional[int] = None, numeric: Optional[Sequence[str]] = None) -> Dict[str, ColumnSketch]:
+    """Sketches de plusieurs colonnes, une colonne par worker, par blocs de ``chunk_rows`` lignes.
+
+    ``numeric`` : colonnes à traiter comme numériques (par défaut, d'après le dtype). Les autres
+    gardent des compteurs de Misra-Gries : modalités dominantes avec borne d'erreur garantie.
+    Les numériques à au plus ``TOP_CAPACITY`` valeurs distinctes les gardent aussi, tant
+    qu'ils restent exacts : quantiles, outliers et distincts sont alors exacts.
+    """
+    columns = list(columns) if columns is not None else list(data.columns)
+    if numeric is None:
+        numeric = [col for col in columns if _is_numeric(data[col].dtype)]
+    numeric = set(numeric)
+
+    def build(col):
+        series = data[col]
+        # Test bon marché sur le début de la colonne, avant de compter chaque bloc
+        few_values = col in numeric and series.iloc[:10 * TOP_CAPACITY].nunique() <= TOP_CAPACITY
+        sketch = ColumnSketch(col in numeric, track_top=col not in numeric or few_values)
+        for start in range(0, max(len(series), 1), chunk_rows):
+            sketch.update(series.iloc[start:start + chunk_rows])
+            if sketch.numeric and sketch.top is not None and sketch.top.error:
+                # Trop de valeurs distinctes : plus de chemin exact, on revient au DDSketch
+                sketch.top = None
+        return col, sketch
+
+    with ThreadPoolExecutor(max_workers=max_workers or default_workers()) as pool:
+        return dict(pool.map(build, columns))
+
+
+def _is_numeric(dtype) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
@@ -0,0 +1,222 @@
+"""
+INSTANTANÉS COLONNAIRES - réouverture d'un fichier inchangé sans re-parsing
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from eda_desk.analysis_cache import cache_key, file_fingerprint
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow optionnel : instantanés désactivés
+    pa = None
+    feather = None
+
+
+class SnapshotStore:
+    """Instantanés Feather (Arrow IPC) des DataFrames chargés.
+
+    Le premier chargement réussi écrit le DataFrame avec ses types déjà
+    inférés ; les ouvertures suivantes d'un fichier inchangé (même empreinte,
+    mêmes options de lecture) relisent l'instantané en mémoire mappée.
+    Chaque instantané est accompagné d'un fichier ``.json`` de métadonnées.
+    """
+
+    def __init__(self, root_dir: str = "eda_snapshots", max_bytes: int = 5 * 1024 ** 3):
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return feather is not None
+
+    # ============================================================
+    # LECTURE / ÉCRITURE
+    # ============================================================
+
+    def key_for(self, filepath: str, params: Dict) -> str:
+        """Clé de l'instantané : empreinte du fichier source + options de lecture"""
+        return cache_key(file_fingerprint(filepath), params)
+
+    def load(self, filepath: str, params: Dict) -> Optional[Tuple[pd.DataFrame, Dict]]:
+        """Relire l'instantané d'un fichier inchangé : (DataFrame, métadonnées) ou None"""
+        if not self.available:
+            return None
+
+        return self.load_key(self.key_for(filepath, params))
+
+    def load_key(self, key: str) -> Optional[Tuple[pd.DataFrame, Dict]]:
+        """Relire un instantané par sa clé (ex. version précédente d'un fichier qui a grossi)"""
+        if not self.available:
+            return None
+
+        data_path = self._data_path(key)
+        if not os.path.exists(data_path):
+            return None
+
+        try:
+            table = feather.read_table(data_path, memory_map=True)
+            data = table.to_pandas()
+        except Exception as e:
+            print(f"✗ Instantané illisible ({e}), suppression")
+            self._remove(key)
+            return None
+
+        meta = self._touch(key)
+        labels = meta.get('column_labels')
+        if labels is not None and len(labels) == len(data.columns):
+            # Arrow ne garde que des noms texte : on rend les étiquettes d'origine (ex. 2020, pas '2020')
+            data.columns = labels
+        return data, meta
+
+    def save(self, filepath: str, params: Dict, data: pd.DataFrame, extra: Optional[Dict] = None) -> bool:
+        """Écrire l'instantané (ignoré si les colonnes ne sont pas convertibles en Arrow).
+
+        ``extra`` est conservé dans les métadonnées (ex. séparateur finalement retenu).
+        """
+        if not self.available:
+            return False
+
+        start = time.perf_counter()
+        key = self.key_for(filepath, params)
+        os.makedirs(self.root_dir, exist_ok=True)
+
+        data_path = self._data_path(key)
+        tmp_path = data_path + '.tmp'
+        try:
+            labels = _column_labels(data)
+            table = pa.Table.from_pandas(data, preserve_index=False)
+            feather.write_feather(table, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, data_path)
+        except Exception as e:
+            # Colonnes object à types mélangés, par exemple : on garde le parsing classique
+            print(f"✗ Instantané non créé pour {os.path.basename(filepath)} : {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        meta = {
+            'key': key,
+            'source': os.path.abspath(filepath),
+            'params': params,
+            'extra': extra or {},
+            'rows': len(data),
+            'columns': len(data.columns),
+            'column_labels': labels,
+            'size_bytes': os.path.getsize(data_path),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'last_access': datetime.now().isoformat(timespec='seconds')
+        }
+        with open(self._meta_path(key), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, default=str)
+
+        self._evict()
+        print(f"✓ Instantané écrit : {os.path.basename(filepath)} en {time.perf_counter() - start:.2f} s")
+        return True
+
+    def save_in_background(self, filepath: str, params: Dict, data: pd.DataFrame,
+                           extra: Optional[Dict] = None) -> threading.Thread:
+        """Écrire l'instantané dans un thread (le DataFrame ne doit plus être modifié en place)"""
+        thread = threading.Thread(
+            target=self.save, args=(filepath, params, data, extra), name="snapshot-writer", daemon=True
+        )
+        thread.start()
+        return thread
+
+    # ============================================================
+    # CONSULTATION / PURGE
+    # ============================================================
+
+    def entries(self) -> List[Dict]:
+        """Métadonnées des instantanés, du plus récent au plus ancien"""
+        if not os.path.isdir(self.root_dir):
+            return []
+
+        entries = []
+        for name in os.listdir(self.root_dir):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.root_dir, name), encoding='utf-8') as f:
+                    entries.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+
+        entries.sort(key=lambda e: e.get('last_access', ''), reverse=True)
+        return entries
+
+    def total_size(self) -> int:
+        """Taille totale des instantanés (octets)"""
+        return sum(e.get('size_bytes', 0) for e in self.entries())
+
+    def purge(self, source: Optional[str] = None) -> int:
+        """Supprimer tous les instantanés (ou ceux d'un fichier source). Retourne le nombre supprimé"""
+        removed = 0
+        for entry in self.entries():
+            if source is None or entry.get('source') == os.path.abspath(source):
+                self._remove(entry['key'])
+                removed += 1
+        return removed
+
+    # ============================================================
+    # INTERNE
+    # ============================================================
+
+    def _data_path(self, key: str) -> str:
+        return os.path.join(self.root_dir, f"{key}.feather")
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.root_dir, f"{key}.json")
+
+    def _touch(self, key: str) -> Dict:
+        """Mettre à jour la date de dernier accès (pour l'éviction) et retourner les métadonnées"""
+        meta_path = self._meta_path(key)
+        meta: Dict = {}
+        try:
+            with self._lock:
+                with open(meta_path, encoding='utf-8') as f:
+                    meta = json.load(f)
+                meta['last_access'] = datetime.now().isoformat(timespec='seconds')
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f, ensure_ascii=False, default=str)
+        except (OSError, ValueError):
+            pass
+        return meta
+
+    def _remove(self, key: str):
+        with self._lock:
+            for path in (self._data_path(key), self._meta_path(key)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _evict(self):
+        """Supprimer les instantanés les moins récemment utilisés au-delà de max_bytes"""
+        kept = 0
+        for entry in self.entries():
+            kept += entry.get('size_bytes', 0)
+            if kept > self.max_bytes:
+                self._remove(entry['key'])
+
+
+def _column_labels(data: pd.DataFrame) -> Optional[List]:
+    """Étiquettes de colonnes à restaurer au chargement (None : toutes texte).
+
+    ValueError si une étiquette ne tient pas en JSON (tuple, date...) : pas d'instantané.
+    """
+    labels = [label.item() if isinstance(label, np.generic) else label for label in data.columns]
+    if all(isinstance(label, str) for label in labels):
+        return None
+    for label in labels:
+        if not isinstance(label, (str, int, float, bool)):
+            raise ValueError(f"étiquette de colonne non restaurable : {label!r}")
+    return labels
@@ -0,0 +1,174 @@
+"""
+ANALYSE EN FLUX - fichiers plus gros que la mémoire, résumés fusionnables bloc par bloc
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from eda_desk.analyses import IQR_FACTOR
+from eda_desk.analysis_scheduler import default_workers
+from eda_desk.chunked_loader import ChunkedCSVLoader, LoadCancelled
+from eda_desk.column_profiler import BOOL_LIKE_VALUES, PROFILE_COLUMNS
+from eda_desk.sketches import ColumnSketch
+
+
+# Lignes gardées en mémoire pour l'aperçu, la grille et les graphiques
+PREVIEW_ROWS = 20_000
+
+
+class StreamingSummary:
+    """Résumé d'un fichier lu bloc par bloc : un ``ColumnSketch`` par colonne.
+
+    La mémoire dépend de la taille d'un bloc et du nombre de colonnes, pas du
+    nombre de lignes. Deux résumés des mêmes colonnes se fusionnent
+    (``merge``), par exemple pour des fichiers découpés.
+    """
+
+    def __init__(self, dtypes: Dict[str, str], numeric: List[str], preview: Optional[pd.DataFrame] = None):
+        self.columns = list(dtypes)
+        self.dtypes = dict(dtypes)
+        numeric = set(numeric)
+        self.numeric = [col for col in self.columns if col in numeric]
+        self.sketches: Dict[str, ColumnSketch] = {
+            col: ColumnSketch(col in numeric, track_top=True) for col in self.columns
+        }
+        self.preview = preview
+        self.n_rows = 0
+        self.chunks = 0
+        # Valeurs non numériques rencontrées dans une colonne numérique (comptées manquantes)
+        self.coerced: Dict[str, int] = {}
+
+    @classmethod
+    def from_preview(cls, preview: pd.DataFrame) -> 'StreamingSummary':
+        """Types des colonnes fixés d'après les premières lignes du fichier"""
+        numeric = [col for col, dtype in preview.dtypes.items()
+                   if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)]
+        return cls({col: str(dtype) for col, dtype in preview.dtypes.items()}, numeric, preview)
+
+    def fold(self, chunk: pd.DataFrame, max_workers: Optional[int] = None):
+        """Intégrer un bloc de lignes (une colonne par worker)"""
+        def update(col):
+            series = chunk[col]
+            if self.sketches[col].numeric and not pd.api.types.is_numeric_dtype(series.dtype):
+                converted = pd.to_numeric(series, errors='coerce')
+                coerced = int(converted.isna().sum() - series.isna().sum())
+                if coerced:
+                    self.coerced[col] = self.coerced.get(col, 0) + coerced
+                series = converted
+            self.sketches[col].update(series)
+
+        with ThreadPoolExecutor(max_workers=max_workers or default_workers()) as pool:
+            list(pool.map(update, self.columns))
+        self.n_rows += len(chunk)
+        self.chunks += 1
+
+    def merge(self, other: 'StreamingSummary') -> 'StreamingSummary':
+        for col in self.columns:
+            self.sketches[col].merge(other.sketches[col])
+        for col, count in other.coerced.items():
+            self.coerced[col] = self.coerced.get(col, 0) + count
+        self.n_rows += other.n_rows
+        self.chunks += other.chunks
+        return self
+
+    # ============================================================
+    # RÉSULTATS (mêmes formes que les analyses en mémoire)
+    # ============================================================
+
+    def profile(self) -> pd.DataFrame:
+        """Profil au format de ``profile_columns`` (distincts et dominante estimés)"""
+        profile = pd.DataFrame(index=pd.Index(self.columns, name='variable'), columns=PROFILE_COLUMNS)
+        for col in self.columns:
+            sketch = self.sketches[col]
+            n_unique = int(sketch.distinct_count().value) if sketch.n_total > sketch.n_missing else 0
+            top_count = max(int(round(sketch.top_count().value)), sketch.n_missing)
+            low = high = np.nan
+            if sketch.numeric and sketch.moments.n:
+                low, high = sketch.moments.min, sketch.moments.max
+            if sketch.numeric:
+                bool_like = n_unique == 2 and low == 0 and high == 1
+            else:
+                values = sketch.top.values()
+                bool_like = (n_unique == 2 and len(values) == 2 and sketch.top.error == 0
+                             and bool(pd.Index(values).isin(BOOL_LIKE_VALUES).all()))
+
+            profile.loc[col] = [self.dtypes[col], self.n_rows, sketch.n_missing, 0.0, n_unique,
+                                top_count, low, high, sketch.numeric, bool_like]
+
+        profile['null_pct'] = (profile['null_count'] / self.n_rows * 100) if self.n_rows else 0.0
+        for col in ('count', 'null_count', 'n_unique', 'top_count'):
+            profile[col] = profile[col].astype('int64')
+        for col in ('null_pct', 'min', 'max'):
+            profile[col] = profile[col].astype('float64')
+        profile['is_numeric'] = profile['is_numeric'].astype(bool)
+        profile['bool_like'] = profile['bool_like'].astype(bool)
+        return profile
+
+    def outliers(self, columns: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Outliers IQR au format de ``compute_outliers``, plus la borne d'erreur du comptage"""
+        outliers_info = {}
+        for col in columns if columns is not None else self.numeric:
+            sketch = self.sketches[col]
+            if not sketch.numeric or sketch.moments.n == 0:
+                continue
+            estimate = sketch.outlier_count(IQR_FACTOR)
+            count = int(round(estimate.value))
+            if count > 0:
+                outliers_info[col] = {
+                    'count': count,
+                    'percentage': count / self.n_rows * 100,
+                    'error': estimate.error
+                }
+        return outliers_info
+
+
+class StreamingAnalyzer(ChunkedCSVLoader):
+    """Analyse d'un CSV en flux dans un thread de travail.
+
+    Mêmes événements que ``ChunkedCSVLoader`` ; ``'done'`` publie un
+    ``StreamingSummary`` au lieu d'un DataFrame. Les premières lignes sont lues
+    à part (aperçu, types des colonnes) ; les colonnes non numériques sont
+    ensuite lues en texte pour que tous les blocs aient le même type.
+    """
+
+    def __init__(self, filepath: str, read_kwargs: Optional[Dict] = None, chunksize: int = 100_000,
+                 preview_rows: int = PREVIEW_ROWS):
+        super().__init__(filepath, read_kwargs, chunksize)
+        self.snapshot_params = {'format': 'csv', 'mode': 'stream', **self.read_kwargs}
+        self.preview_rows = preview_rows
+
+    def load(self) -> StreamingSummary:
+        start = time.perf_counter()
+        preview = pd.read_csv(self.filepath, nrows=self.preview_rows, **self.read_kwargs)
+        summary = StreamingSummary.from_preview(preview)
+        text_columns = {col: str for col in summary.columns if col not in set(summary.numeric)}
+
+        with open(self.filepath, 'rb') as handle:
+            reader = pd.read_csv(handle, chunksize=self.chunksize, dtype=text_columns, **self.read_kwargs)
+            for chunk in reader:
+                if self._cancel_event.is_set():
+                    raise LoadCancelled()
+                summary.fold(chunk)
+                self.events.put(('progress', {
+                    'rows': summary.n_rows,
+                    'bytes_read': min(handle.tell(), self.total_bytes),
+                    'total_bytes': self.total_bytes,
+                    'elapsed': time.perf_counter() - start
+                }))
+
+        if self._cancel_event.is_set():
+            raise LoadCancelled()
+
+        self.metrics = {
+            'rows': summary.n_rows,
+            'chunks': summary.chunks,
+            'bytes': self.total_bytes,
+            'load_seconds': time.perf_counter() - start,
+            'separator': self.sep,
+            'source': 'stream'
+        }
+        return summary
@@ -0,0 +1,180 @@
+"""
+SESSION MULTI-FICHIERS - jeux de données ouverts, budget mémoire, mise sur disque des moins récents
+"""
+
+import itertools
+import os
+import shutil
+import tempfile
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from eda_desk.memory_compact import memory_bytes
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow optionnel : fichiers pickle à la place de Feather
+    pa = None
+    feather = None
+
+
+# Mémoire occupée par les jeux de données de la session (le jeu affiché n'est jamais mis sur disque)
+DEFAULT_MEMORY_BUDGET = 2 * 1024 ** 3
+
+
+@dataclass
+class Dataset:
+    """Un jeu de données de la session : DataFrame (None s'il est sur disque) et résultats associés"""
+    key: str
+    name: str
+    data: Optional[pd.DataFrame]
+    state: Dict = field(default_factory=dict)
+    nbytes: int = 0
+    rows: int = 0
+    columns: int = 0
+    spill_path: Optional[str] = None
+    last_used: float = 0.0
+
+    @property
+    def in_memory(self) -> bool:
+        return self.data is not None
+
+
+class Workspace:
+    """Jeux de données de la session, du moins au plus récemment utilisé.
+
+    Au-delà de ``budget_bytes``, les jeux les moins récents sont écrits dans
+    un fichier Feather (Arrow IPC, non compressé) puis libérés ; ``get()`` les
+    relit en mémoire mappée. Les données ne changent pas après chargement :
+    un jeu déjà écrit une fois est libéré sans réécriture.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_MEMORY_BUDGET, spill_dir: Optional[str] = None):
+        self.budget_bytes = budget_bytes
+        self._spill_dir = spill_dir
+        self._owns_spill_dir = spill_dir is None
+        self._datasets: "OrderedDict[str, Dataset]" = OrderedDict()
+        self._spill_ids = itertools.count()
+        self.metrics = {'spills': 0, 'spill_seconds': 0.0, 'reloads': 0, 'reload_seconds': 0.0}
+
+    # ============================================================
+    # JEUX DE DONNÉES
+    # ============================================================
+
+    def put(self, key: str, name: str, data: pd.DataFrame, state: Optional[Dict] = None) -> List[Dataset]:
+        """Ajouter (ou remplacer) un jeu, devenu le plus récent ; renvoie les jeux mis sur disque"""
+        previous = self._datasets.pop(key, None)
+        if previous is not None:
+            self._remove_spill(previous)
+        self._datasets[key] = Dataset(key, name, data, dict(state or {}), memory_bytes(data), len(data),
+                                      len(data.columns), last_used=time.time())
+        return self._enforce_budget(keep=key)
+
+    def update_state(self, key: str, state: Dict):
+        """Résultats d'analyse du jeu (mis à jour, les données ne changent pas)"""
+        if key in self._datasets:
+            self._datasets[key].state.update(state)
+
+    def get(self, key: str) -> Dataset:
+        """Jeu le plus récent désormais, relu depuis le disque si besoin"""
+        dataset = self._datasets[key]
+        self._datasets.move_to_end(key)
+        dataset.last_used = time.time()
+        if dataset.data is None:
+            self._reload(dataset)
+            self._enforce_budget(keep=key)
+        return dataset
+
+    def remove(self, key: str):
+        dataset = self._datasets.pop(key, None)
+        if dataset is not None:
+            self._remove_spill(dataset)
+
+    def set_budget(self, budget_bytes: int) -> List[Dataset]:
+        self.budget_bytes = budget_bytes
+        current = next(reversed(self._datasets), None)
+        return self._enforce_budget(keep=current)
+
+    def datasets(self) -> List[Dataset]:
+        """Du plus récent au moins récent"""
+        return list(reversed(self._datasets.values()))
+
+    def memory_used(self) -> int:
+        return sum(dataset.nbytes for dataset in self._datasets.values() if dataset.in_memory)
+
+    def close(self):
+        """Supprimer les fichiers de la session"""
+        self._datasets.clear()
+        if self._owns_spill_dir and self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._datasets
+
+    def __len__(self) -> int:
+        return len(self._datasets)
+
+    # ============================================================
+    # INTERNE
+    # ============================================================
+
+    def _enforce_budget(self, keep: Optional[str]) -> List[Dataset]:
+        spilled = []
+        for dataset in list(self._datasets.values()):
+            if self.memory_used() <= self.budget_bytes:
+                break
+            if dataset.key != keep and dataset.in_memory:
+                self._spill(dataset)
+                spilled.append(dataset)
+        return spilled
+
+    def _directory(self) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="eda_session_")
+            # Fichiers supprimés avec la session, même sans appel à close()
+            weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+        os.makedirs(self._spill_dir, exist_ok=True)
+        return self._spill_dir
+
+    def _spill(self, dataset: Dataset):
+        start = time.perf_counter()
+        if dataset.spill_path is None or not os.path.exists(dataset.spill_path):
+            stem = os.path.join(self._directory(), f"{next(self._spill_ids):04d}")
+            dataset.spill_path = None
+            if feather is not None:
+                try:
+                    table = pa.Table.from_pandas(dataset.data)
+                    feather.write_feather(table, stem + '.feather', compression='uncompressed')
+                    dataset.spill_path = stem + '.feather'
+                except Exception as e:
+                    # Colonnes object à types mélangés, par exemple : pickle
+                    print(f"✗ Feather impossible pour {dataset.name} ({e}), pickle")
+                    if os.path.exists(stem + '.feather'):
+                        os.remove(stem + '.feather')
+            if dataset.spill_path is None:
+                dataset.data.to_pickle(stem + '.pkl')
+                dataset.spill_path = stem + '.pkl'
+        dataset.data = None
+        self.metrics['spills'] += 1
+        self.metrics['spill_seconds'] += time.perf_counter() - start
+
+    def _reload(self, dataset: Dataset):
+        start = time.perf_counter()
+        if dataset.spill_path.endswith('.feather'):
+            dataset.data = feather.read_table(dataset.spill_path, memory_map=True).to_pandas()
+        else:
+            dataset.data = pd.read_pickle(dataset.spill_path)
+        self.metrics['reloads'] += 1
+        self.metrics['reload_seconds'] += time.perf_counter() - start
+
+    def _remove_spill(self, dataset: Dataset):
+        if dataset.spill_path is not None and os.path.exists(dataset.spill_path):
+            os.remove(dataset.spill_path)
+        dataset.spill_path = None
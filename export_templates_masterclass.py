@@ -2,24 +2,212 @@
 TEMPLATES D'EXPORT PROFESSIONNELS - 
 """
 
+import numbers
+import re
+from functools import lru_cache
+from io import BytesIO
+from xml.sax.saxutils import escape
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Preformatted, Spacer, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas
 from datetime import datetime
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 
-def export_to_word_masterclass(data_info: Dict, stats: Dict, output_path: str, accumulated_content: str = None):
-    """Export Word -"""
+# Progression : progress(étape faite, nombre d'étapes)
+ProgressCallback = Callable[[int, int], None]
+
+# Largeur utile d'une ligne de rapport en Courier 9 pt (au-delà : retour à la ligne)
+PDF_MAX_LINE = 86
+
+_ANALYSIS_TITLE = re.compile(r'ANALYSE #\d+\s*-\s*(.*?)(?:\s*\(à [^)]*\))?\s*$')
+
+# Bloc d'une analyse : lignes de texte (police fixe) ou tableau {'columns', 'rows', 'title'}
+Block = Union[List[str], Dict]
+
+_LEVELS = {'CRITIQUE': 0, 'ELEVE': 1, 'MOYEN': 2, 'FAIBLE': 3, 'INFO': 4}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONTENU ACCUMULÉ - découpé une fois, partagé par les deux exports
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _text_blocks(lines, sections=None) -> List[List[str]]:
+    """Regrouper des lignes de rapport en blocs.
+
+    Les lignes vides et les cadres sont ignorés ; les lignes de séparation
+    (─, ═) ferment un bloc. Chaque bloc devient un seul paragraphe dans les
+    exports, au lieu d'un paragraphe stylé par ligne. Si ``sections`` est
+    fourni, les titres « ANALYSE #n » y ouvrent une nouvelle analyse.
+    """
+    title, blocks, block = None, [], []
+
+    def close_block():
+        nonlocal block
+        if block:
+            blocks.append(block)
+            block = []
+
+    for line in lines:
+        line_stripped = line.strip()
+        if not line_stripped or line_stripped.startswith('╔') or line_stripped.startswith('╚'):
+            continue
+
+        if sections is not None and 'ANALYSE #' in line:
+            close_block()
+            if title is not None or blocks:
+                sections.append((title, blocks))
+            match = _ANALYSIS_TITLE.search(line.replace('═', ''))
+            title = match.group(1).strip() if match else line.replace('═', '').replace('ANALYSE #', '').strip()
+            blocks = []
+            continue
+
+        if line_stripped.startswith('─') or line_stripped.startswith('═'):
+            close_block()
+            continue
+
+        if line_stripped.startswith('║'):
+            line_stripped = line.replace('║', '').strip()
+            if not line_stripped:
+                continue
+        block.append(line_stripped)
+
+    close_block()
+    if sections is not None and (title is not None or blocks):
+        sections.append((title, blocks))
+    return blocks
+
+
+def parse_report_sections(accumulated_content: str) -> List[Tuple[str, List[Block]]]:
+    """Découper un rapport accumulé (texte) en analyses : [(titre, blocs de lignes)]"""
+    sections = []
+    _text_blocks(accumulated_content.split('\n'), sections)
+    return sections
+
+
+def format_cell(value) -> str:
+    """Valeur d'un tableau de résultats : entiers avec séparateurs, décimaux à 2 chiffres"""
+    if value is None:
+        return ""
+    if isinstance(value, numbers.Integral) and not isinstance(value, bool):
+        return f"{value:,}"
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        return f"{value:,.2f}"
+    return str(value)
+
+
+def result_sections(results: List[Dict]) -> List[Tuple[str, List[Block]]]:
+    """Analyses structurées (``AnalysisResult.to_dict()``) : métriques et tableaux rendus en
+    tableaux, constats en texte ; une analyse sans données structurées garde son texte"""
+    sections = []
+    for result in results:
+        if not (result.get('metrics') or result.get('tables') or result.get('findings')):
+            sections.append((result['type'], _text_blocks(result['text'].split('\n'))))
+            continue
+
+        blocks: List[Block] = []
+        if result.get('metrics'):
+            blocks.append({'columns': ['Métrique', 'Valeur'], 'rows': list(result['metrics'].items()), 'title': ''})
+        blocks.extend(table for table in result.get('tables') or [] if table['rows'])
+        if result.get('findings'):
+            findings = sorted(result['findings'], key=lambda f: _LEVELS.get(f['level'], len(_LEVELS)))
+            blocks.append([f"[{f['level']}] {f['subject']} : {f['message']}" for f in findings])
+        sections.append((result['type'], blocks))
+    return sections
+
+
+def _report_sections(accumulated_content: Optional[str], results: Optional[List[Dict]]):
+    return result_sections(results) if results is not None else parse_report_sections(accumulated_content)
+
+
+def _word_table(doc, table: Dict, style_id: str):
+    """Tableau Word d'un résultat : en-tête puis une ligne par valeur.
+
+    ``style_id`` est résolu une fois par document : la recherche d'un style
+    par son nom parcourt tous les styles du document à chaque appel.
+    """
+    if table.get('title'):
+        doc.add_paragraph().add_run(table['title']).bold = True
+    word_table = doc.add_table(rows=1, cols=len(table['columns']))
+    word_table._tbl.tblStyle_val = style_id
+    for cell, name in zip(word_table.rows[0].cells, table['columns']):
+        cell.text = str(name)
+
+    # Lignes de valeurs construites en un seul fragment XML (cell.text coûte ~0,3 ms par cellule)
+    widths = [tc.tcPr.tcW.get(qn('w:w')) for tc in word_table.rows[0]._tr.tc_lst]
+    rows_xml = ''.join(
+        '<w:tr>' + ''.join(
+            f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+            f'<w:p><w:r><w:t xml:space="preserve">{escape(format_cell(value))}</w:t></w:r></w:p></w:tc>'
+            for width, value in zip(widths, row)
+        ) + '</w:tr>'
+        for row in table['rows']
+    )
+    if rows_xml:
+        word_table._tbl.extend(list(parse_xml(f'<w:tbl {nsdecls("w")}>{rows_xml}</w:tbl>')))
+    doc.add_paragraph()
+
+
+def _pdf_table(table: Dict, styles: Dict) -> List:
+    """Tableau PDF d'un résultat (en-tête répété à chaque page)"""
+    flowables = []
+    if table.get('title'):
+        flowables.append(Paragraph(escape(table['title']), styles['analysis_num']))
+    data = [[str(name) for name in table['columns']]]
+    data += [[format_cell(value)[:40] for value in row] for row in table['rows']]
+    pdf_table = Table(data, repeatRows=1, hAlign='LEFT')
+    pdf_table.setStyle(_result_table_style())
+    flowables.append(pdf_table)
+    return flowables
+
+
+@lru_cache(maxsize=1)
+def _word_template() -> bytes:
+    """Document vide portant les styles du contenu détaillé (construit une fois)"""
+    doc = Document()
+    styles = doc.styles
+
+    content = styles.add_style('EDA Contenu', WD_STYLE_TYPE.PARAGRAPH)
+    content.base_style = styles['Normal']
+    content.font.name = 'Consolas'
+    content.font.size = Pt(9)
+    content.font.color.rgb = RGBColor(52, 73, 94)
+    content.paragraph_format.left_indent = Inches(0.3)
+
+    number = styles.add_style('EDA Numéro', WD_STYLE_TYPE.CHARACTER)
+    number.font.size = Pt(11)
+    number.font.color.rgb = RGBColor(41, 128, 185)
+    number.font.bold = True
+
+    heading = styles.add_style('EDA Titre analyse', WD_STYLE_TYPE.CHARACTER)
+    heading.font.size = Pt(16)
+    heading.font.color.rgb = RGBColor(41, 128, 185)
+    heading.font.bold = True
+
+    rule = styles.add_style('EDA Filet', WD_STYLE_TYPE.CHARACTER)
+    rule.font.size = Pt(10)
+    rule.font.color.rgb = RGBColor(174, 214, 241)
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def export_to_word_masterclass(data_info: Dict, stats: Dict, output_path: str, accumulated_content: str = None,
+                               progress: Optional[ProgressCallback] = None, results: Optional[List[Dict]] = None):
+    """Export Word - analyses structurées (``results``) ou rapport texte (``accumulated_content``)"""
     
     try:
-        doc = Document()
+        doc = Document(BytesIO(_word_template()))
         
         # PAGE DE GARDE
         doc.add_paragraph('\n' * 3)
@@ -157,7 +345,7 @@ def export_to_word_masterclass(data_info: Dict, stats: Dict, output_path: str, a
         score_run.font.color.rgb = RGBColor(52, 73, 94)
         
         # ANALYSES DÉTAILLÉES
-        if accumulated_content and data_info.get('analyses_count', 0) > 0:
+        if (results or accumulated_content) and data_info.get('analyses_count', 0) > 0:
             doc.add_page_break()
             
             analyses_title = doc.add_heading('ANALYSES DÉTAILLÉES', 1)
@@ -168,52 +356,29 @@ def export_to_word_masterclass(data_info: Dict, stats: Dict, output_path: str, a
             
             doc.add_paragraph()
             
-            lines = accumulated_content.split('\n')
+            sections = _report_sections(accumulated_content, results)
+            table_style = doc.styles['Light Grid Accent 1'].style_id
+            total_steps = sum(len(blocks) for _, blocks in sections) + 1
+            done = 0
             analysis_count = 0
             
-            for line in lines:
-                line_stripped = line.strip()
-                
-                if not line_stripped:
-                    continue
-                
-                if 'ANALYSE #' in line:
+            for clean_title, blocks in sections:
+                if clean_title is not None:
                     analysis_count += 1
                     doc.add_paragraph()
-                    
-                    num_para = doc.add_paragraph()
-                    num_run = num_para.add_run(f"● Analyse {analysis_count}")
-                    num_run.font.size = Pt(11)
-                    num_run.font.color.rgb = RGBColor(41, 128, 185)
-                    num_run.font.bold = True
-                    
-                    clean_title = line.replace('═', '').replace('ANALYSE #', '').strip()
-                    if ' (à ' in clean_title:
-                        clean_title = clean_title.split(' (à ')[0].strip()
-                    
-                    title_heading = doc.add_heading('', 2)
-                    title_run = title_heading.add_run(f"▸ {clean_title}")
-                    title_run.font.size = Pt(16)
-                    title_run.font.color.rgb = RGBColor(41, 128, 185)
-                    title_run.font.bold = True
-                    
-                    line_para = doc.add_paragraph('━' * 60)
-                    for run in line_para.runs:
-                        run.font.color.rgb = RGBColor(174, 214, 241)
-                        run.font.size = Pt(10)
-                    
-                    continue
-                
-                if line_stripped.startswith('─') or line_stripped.startswith('═'):
-                    continue
+                    doc.add_paragraph().add_run(f"● Analyse {analysis_count}", style='EDA Numéro')
+                    doc.add_heading('', 2).add_run(f"▸ {clean_title}", style='EDA Titre analyse')
+                    doc.add_paragraph().add_run('━' * 60, style='EDA Filet')
                 
-                if line_stripped:
-                    content_para = doc.add_paragraph(line_stripped)
-                    content_para.paragraph_format.left_indent = Inches(0.3)
-                    for run in content_para.runs:
-                        run.font.name = 'Consolas'
-                        run.font.size = Pt(9)
-                        run.font.color.rgb = RGBColor(52, 73, 94)
+                # Un paragraphe par bloc de texte, lignes séparées par des sauts de ligne
+                for block in blocks:
+                    if isinstance(block, dict):
+                        _word_table(doc, block, table_style)
+                    else:
+                        doc.add_paragraph('\n'.join(block), style='EDA Contenu')
+                    done += 1
+                    if progress is not None:
+                        progress(done, total_steps)
         
         else:
             doc.add_page_break()
@@ -287,6 +452,8 @@ def export_to_word_masterclass(data_info: Dict, stats: Dict, output_path: str, a
         v2.font.italic = True
         
         doc.save(output_path)
+        if progress is not None:
+            progress(1, 1)
         return True
         
     except Exception as e:
@@ -298,65 +465,69 @@ def export_to_word_masterclass(data_info: Dict, stats: Dict, output_path: str, a
 # EXPORT PDF - DESIGN PROFESSIONNEL BLEU MASTERCLASS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, accumulated_content: str = None):
-    """Export PDF avec design professionnel bleu élégant"""
-    
-    # Créer le document avec une classe personnalisée pour le header/footer
-    class NumberedCanvas(canvas.Canvas):
-        def __init__(self, *args, **kwargs):
-            canvas.Canvas.__init__(self, *args, **kwargs)
-            self._saved_page_states = []
-
-        def showPage(self):
-            self._saved_page_states.append(dict(self.__dict__))
-            self._startPage()
-
-        def save(self):
-            num_pages = len(self._saved_page_states)
-            for state in self._saved_page_states:
-                self.__dict__.update(state)
-                self.draw_page_number(num_pages)
-                canvas.Canvas.showPage(self)
-            canvas.Canvas.save(self)
-
-        def draw_page_number(self, page_count):
-            page = self._pageNumber
-            if page > 1:  # Pas de numéro sur la page de garde
-                # Ligne bleue en haut
-                self.setStrokeColorRGB(0.16, 0.50, 0.73)  # Bleu corporate
-                self.setLineWidth(2)
-                self.line(50, 800, 545, 800)
-                
-                # Numéro de page
-                self.setFont('Helvetica', 9)
-                self.setFillColorRGB(0.5, 0.5, 0.5)
-                self.drawRightString(545, 30, f"Page {page} / {page_count}")
-                
-                # Footer
-                self.setFont('Helvetica-Oblique', 8)
-                self.setFillColorRGB(0.7, 0.7, 0.7)
-                self.drawString(50, 30, "EDA-Desk PRO")
-    
-    pdf = SimpleDocTemplate(
-        output_path,
-        pagesize=A4,
-        rightMargin=50,
-        leftMargin=50,
-        topMargin=50,
-        bottomMargin=50
-    )
-    
-    story = []
-    styles = getSampleStyleSheet()
-    
-    # ═══════════════════════════════════════════════════════════════
-    # STYLES PERSONNALISÉS BLEU ÉLÉGANT
-    # ═══════════════════════════════════════════════════════════════
+# Canvas numéroté : ligne de tête, numéro de page et pied ajoutés à la sauvegarde
+class NumberedCanvas(canvas.Canvas):
+    def __init__(self, *args, **kwargs):
+        canvas.Canvas.__init__(self, *args, **kwargs)
+        self._saved_page_states = []
+
+    def showPage(self):
+        self._saved_page_states.append(dict(self.__dict__))
+        self._startPage()
+
+    def save(self):
+        num_pages = len(self._saved_page_states)
+        for state in self._saved_page_states:
+            self.__dict__.update(state)
+            self.draw_page_number(num_pages)
+            canvas.Canvas.showPage(self)
+        canvas.Canvas.save(self)
+
+    def draw_page_number(self, page_count):
+        page = self._pageNumber
+        if page > 1:  # Pas de numéro sur la page de garde
+            # Ligne bleue en haut
+            self.setStrokeColorRGB(0.16, 0.50, 0.73)  # Bleu corporate
+            self.setLineWidth(2)
+            self.line(50, 800, 545, 800)
+
+            # Numéro de page
+            self.setFont('Helvetica', 9)
+            self.setFillColorRGB(0.5, 0.5, 0.5)
+            self.drawRightString(545, 30, f"Page {page} / {page_count}")
+
+            # Footer
+            self.setFont('Helvetica-Oblique', 8)
+            self.setFillColorRGB(0.7, 0.7, 0.7)
+            self.drawString(50, 30, "EDA-Desk PRO")
+
+
+@lru_cache(maxsize=1)
+def _result_table_style() -> TableStyle:
+    """Style des tableaux de résultats PDF (même palette que le diagnostic de qualité)"""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#19376D')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#EBF5FB')]),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#BDC3C7')),
+        ('TOPPADDING', (0, 0), (-1, -1), 3),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    ])
+
+
+@lru_cache(maxsize=1)
+def _pdf_styles() -> Dict[str, ParagraphStyle]:
+    """Styles du rapport PDF, construits une fois et réutilisés par chaque export"""
+    base = getSampleStyleSheet()
+    styles = {}
     
-    # Style titre principal
-    title_style = ParagraphStyle(
+    # Titre principal
+    styles['title'] = ParagraphStyle(
         'CustomTitle',
-        parent=styles['Heading1'],
+        parent=base['Heading1'],
         fontSize=36,
         textColor=colors.HexColor('#19376D'),  # Bleu marine
         spaceAfter=20,
@@ -366,10 +537,10 @@ def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, ac
         leading=42
     )
     
-    # Style sous-titre
-    subtitle_style = ParagraphStyle(
+    # Sous-titre
+    styles['subtitle'] = ParagraphStyle(
         'CustomSubtitle',
-        parent=styles['Heading2'],
+        parent=base['Heading2'],
         fontSize=18,
         textColor=colors.HexColor('#4682B4'),  # Bleu acier
         spaceAfter=30,
@@ -377,10 +548,10 @@ def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, ac
         fontName='Helvetica-Oblique'
     )
     
-    # Style info fichier
-    fileinfo_style = ParagraphStyle(
+    # Info fichier
+    styles['fileinfo'] = ParagraphStyle(
         'FileInfo',
-        parent=styles['Normal'],
+        parent=base['Normal'],
         fontSize=14,
         textColor=colors.HexColor('#2C3E50'),
         spaceAfter=10,
@@ -388,10 +559,35 @@ def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, ac
         fontName='Helvetica-Bold'
     )
     
-    # Style heading section
-    heading_style = ParagraphStyle(
+    styles['date'] = ParagraphStyle(
+        'DateStyle',
+        parent=base['Normal'],
+        fontSize=11,
+        textColor=colors.HexColor('#6C757D'),
+        alignment=1
+    )
+    
+    styles['separator'] = ParagraphStyle(
+        'Separator',
+        parent=base['Normal'],
+        fontSize=12,
+        textColor=colors.HexColor('#2980B9'),
+        alignment=1
+    )
+    
+    styles['footer_cover'] = ParagraphStyle(
+        'FooterCover',
+        parent=base['Normal'],
+        fontSize=11,
+        textColor=colors.HexColor('#95A5A6'),
+        alignment=1,
+        fontName='Helvetica-Oblique'
+    )
+    
+    # Heading section
+    styles['heading'] = ParagraphStyle(
         'CustomHeading',
-        parent=styles['Heading2'],
+        parent=base['Heading2'],
         fontSize=18,
         textColor=colors.HexColor('#19376D'),
         spaceAfter=15,
@@ -402,10 +598,10 @@ def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, ac
         leftIndent=0
     )
     
-    # Style sous-heading
-    subheading_style = ParagraphStyle(
+    # Sous-heading
+    styles['subheading'] = ParagraphStyle(
         'CustomSubHeading',
-        parent=styles['Heading3'],
+        parent=base['Heading3'],
         fontSize=14,
         textColor=colors.HexColor('#2980B9'),
         spaceAfter=10,
@@ -413,20 +609,34 @@ def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, ac
         fontName='Helvetica-Bold'
     )
     
-    # Style texte normal
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=10,
+    styles['score'] = ParagraphStyle(
+        'ScoreDetail',
+        parent=base['Normal'],
+        fontSize=12,
         textColor=colors.HexColor('#34495E'),
-        fontName='Helvetica',
-        leading=14
+        alignment=1,
+        spaceBefore=10
+    )
+    
+    styles['analysis_num'] = ParagraphStyle(
+        'AnalysisNum',
+        parent=base['Normal'],
+        fontSize=10,
+        textColor=colors.HexColor('#2980B9'),
+        fontName='Helvetica-Bold'
     )
     
-    # Style monospace
-    mono_style = ParagraphStyle(
+    styles['line_deco'] = ParagraphStyle(
+        'LineDeco',
+        parent=base['Normal'],
+        fontSize=10,
+        textColor=colors.HexColor('#AED6F1')
+    )
+    
+    # Monospace (blocs du rapport, mis en page sans césure mot à mot)
+    styles['mono'] = ParagraphStyle(
         'MonoText',
-        parent=styles['Normal'],
+        parent=base['Normal'],
         fontName='Courier',
         fontSize=9,
         textColor=colors.HexColor('#2C3E50'),
@@ -434,56 +644,90 @@ def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, ac
         spaceAfter=5
     )
     
+    styles['final_line'] = ParagraphStyle(
+        'FinalLine',
+        parent=base['Normal'],
+        fontSize=14,
+        textColor=colors.HexColor('#2980B9'),
+        alignment=1
+    )
+    
+    styles['footer_final'] = ParagraphStyle(
+        'FooterFinal',
+        parent=base['Normal'],
+        fontSize=11,
+        textColor=colors.HexColor('#7F8C8D'),
+        alignment=1,
+        fontName='Helvetica-Oblique'
+    )
+    
+    styles['version'] = ParagraphStyle(
+        'Version',
+        parent=base['Normal'],
+        fontSize=9,
+        textColor=colors.HexColor('#BDC3C7'),
+        alignment=1
+    )
+    
+    return styles
+
+
+def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, accumulated_content: str = None,
+                              progress: Optional[ProgressCallback] = None, results: Optional[List[Dict]] = None):
+    """Export PDF avec design professionnel bleu élégant"""
+    
+    pdf = SimpleDocTemplate(
+        output_path,
+        pagesize=A4,
+        rightMargin=50,
+        leftMargin=50,
+        topMargin=50,
+        bottomMargin=50
+    )
+    
+    if progress is not None:
+        # Progression de la mise en page (nombre de flowables placés / estimé)
+        size_estimate = [1]
+        
+        def on_progress(kind, value):
+            if kind == 'SIZE_EST':
+                size_estimate[0] = max(1, value)
+            elif kind == 'PROGRESS':
+                progress(min(value, size_estimate[0]), size_estimate[0])
+        
+        pdf.setProgressCallBack(on_progress)
+    
+    story = []
+    styles = _pdf_styles()
+    
     # ═══════════════════════════════════════════════════════════════
     # PAGE DE GARDE ÉLÉGANTE
     # ═══════════════════════════════════════════════════════════════
     
     # Titre principal
-    story.append(Paragraph("RAPPORT D'ANALYSE", title_style))
+    story.append(Paragraph("RAPPORT D'ANALYSE", styles['title']))
     story.append(Spacer(1, 0.2*inch))
     
     # Sous-titre
-    story.append(Paragraph("Analyse Exploratoire des Données", subtitle_style))
+    story.append(Paragraph("Analyse Exploratoire des Données", styles['subtitle']))
     story.append(Spacer(1, 0.5*inch))
     
     # Info fichier
     file_text = f"<b>📄 {data_info.get('filename', 'N/A')}</b>"
-    story.append(Paragraph(file_text, fileinfo_style))
+    story.append(Paragraph(file_text, styles['fileinfo']))
     
     # MODIFIÉ: Seulement la date
-    date_style = ParagraphStyle(
-        'DateStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.HexColor('#6C757D'),
-        alignment=1
-    )
-    story.append(Paragraph(f"📅 {datetime.now().strftime('%d %B %Y')}", date_style))
+    story.append(Paragraph(f"📅 {datetime.now().strftime('%d %B %Y')}", styles['date']))
     
     story.append(Spacer(1, 1.5*inch))
     
     # Ligne de séparation
-    separator_line = Paragraph("━" * 70, ParagraphStyle(
-        'Separator',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=colors.HexColor('#2980B9'),
-        alignment=1
-    ))
-    story.append(separator_line)
+    story.append(Paragraph("━" * 70, styles['separator']))
     
     story.append(Spacer(1, 1*inch))
     
     # Footer page de garde
-    footer_style = ParagraphStyle(
-        'FooterCover',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.HexColor('#95A5A6'),
-        alignment=1,
-        fontName='Helvetica-Oblique'
-    )
-    story.append(Paragraph("Généré par <b><font color='#2980B9'>EDA-Desk PRO</font></b>", footer_style))
+    story.append(Paragraph("Généré par <b><font color='#2980B9'>EDA-Desk PRO</font></b>", styles['footer_cover']))
     
     # ═══════════════════════════════════════════════════════════════
     # PAGE 2 - SYNTHÈSE EXÉCUTIVE
@@ -492,7 +736,7 @@ def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, ac
     story.append(PageBreak())
     
     # Titre section
-    story.append(Paragraph("■ SYNTHÈSE EXÉCUTIVE", heading_style))
+    story.append(Paragraph("■ SYNTHÈSE EXÉCUTIVE", styles['heading']))
     story.append(Spacer(1, 0.3*inch))
     
     # Tableau des métriques avec design moderne
@@ -603,105 +847,40 @@ def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, ac
     
     # Score détaillé
     score_text = f"<b>Score de qualité : {quality_score:.1f} / 100</b>"
-    score_para_style = ParagraphStyle(
-        'ScoreDetail',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=colors.HexColor('#34495E'),
-        alignment=1,
-        spaceBefore=10
-    )
-    story.append(Paragraph(score_text, score_para_style))
+    story.append(Paragraph(score_text, styles['score']))
     
     # ═══════════════════════════════════════════════════════════════
     # ANALYSES DÉTAILLÉES
     # ═══════════════════════════════════════════════════════════════
     
-    if accumulated_content and data_info.get('analyses_count', 0) > 0:
+    if (results or accumulated_content) and data_info.get('analyses_count', 0) > 0:
         story.append(PageBreak())
-        story.append(Paragraph("■ ANALYSES DÉTAILLÉES", heading_style))
+        story.append(Paragraph("■ ANALYSES DÉTAILLÉES", styles['heading']))
         story.append(Spacer(1, 0.2*inch))
         
-        # Parser le contenu
-        lines = accumulated_content.split('\n')
         analysis_count = 0
-        current_section = []
-        
-        for line in lines:
-            line_stripped = line.strip()
-            
-            if not line_stripped or line_stripped.startswith('╔') or line_stripped.startswith('╚'):
-                continue
-            
-            # Titre d'analyse - MODIFIÉ: Supprimer l'heure
-            if 'ANALYSE #' in line:
+        for clean_title, blocks in _report_sections(accumulated_content, results):
+            if clean_title is not None:
                 analysis_count += 1
-                
-                # Ajouter section précédente
-                if current_section:
-                    section_text = '<br/>'.join(current_section)
-                    story.append(Paragraph(section_text, mono_style))
-                    current_section = []
-                
                 story.append(Spacer(1, 0.15*inch))
-                
-                # Numéro
-                num_style = ParagraphStyle(
-                    'AnalysisNum',
-                    parent=styles['Normal'],
-                    fontSize=10,
-                    textColor=colors.HexColor('#2980B9'),
-                    fontName='Helvetica-Bold'
-                )
-                story.append(Paragraph(f"● Analyse {analysis_count}", num_style))
-                
-                # Titre - NETTOYER pour enlever l'heure
-                clean_title = line.replace('═', '').replace('ANALYSE #', '').replace(str(analysis_count), '').strip()
-                
-                # Supprimer la partie avec l'heure "(à HH:MM:SS)"
-                if ' (à ' in clean_title:
-                    clean_title = clean_title.split(' (à ')[0].strip()
-                
-                story.append(Paragraph(f"▸ {clean_title}", subheading_style))
-                
-                # Ligne
-                line_para = Paragraph("━" * 60, ParagraphStyle(
-                    'LineDeco',
-                    parent=styles['Normal'],
-                    fontSize=10,
-                    textColor=colors.HexColor('#AED6F1')
-                ))
-                story.append(line_para)
+                story.append(Paragraph(f"● Analyse {analysis_count}", styles['analysis_num']))
+                story.append(Paragraph(f"▸ {escape(clean_title)}", styles['subheading']))
+                story.append(Paragraph("━" * 60, styles['line_deco']))
                 story.append(Spacer(1, 0.1*inch))
-                continue
             
-            # Contenu
-            if line_stripped.startswith('║'):
-                clean_line = line.replace('║', '').strip()
-                if clean_line:
-                    current_section.append(clean_line)
-                continue
-            
-            if line_stripped.startswith('─') or line_stripped.startswith('═'):
-                if current_section:
-                    section_text = '<br/>'.join(current_section)
-                    story.append(Paragraph(section_text, mono_style))
-                    current_section = []
-                story.append(Spacer(1, 0.05*inch))
-                continue
-            
-            if line_stripped:
-                current_section.append(line_stripped)
-        
-        # Dernière section
-        if current_section:
-            section_text = '<br/>'.join(current_section)
-            story.append(Paragraph(section_text, mono_style))
+            # Texte brut en police fixe : pas de césure mot à mot ni de balisage à interpréter
+            for i, block in enumerate(blocks):
+                if i:
+                    story.append(Spacer(1, 0.05*inch))
+                if isinstance(block, dict):
+                    story.extend(_pdf_table(block, styles))
+                else:
+                    story.append(Preformatted('\n'.join(block), styles['mono'], maxLineLength=PDF_MAX_LINE))
     
     else:
         # Fallback - Diagnostic basique
         story.append(PageBreak())
-        story.append(Paragraph("■ DIAGNOSTIC DE QUALITÉ", heading_style))
+        story.append(Paragraph("■ DIAGNOSTIC DE QUALITÉ", styles['heading']))
         story.append(Spacer(1, 0.2*inch))
         
         metrics_data = [
@@ -736,41 +915,18 @@ def export_to_pdf_masterclass(data_info: Dict, stats: Dict, output_path: str, ac
     story.append(Spacer(1, 4*inch))
     
     # Ligne finale
-    final_line = Paragraph("━" * 55, ParagraphStyle(
-        'FinalLine',
-        parent=styles['Normal'],
-        fontSize=14,
-        textColor=colors.HexColor('#2980B9'),
-        alignment=1
-    ))
-    story.append(final_line)
+    story.append(Paragraph("━" * 55, styles['final_line']))
     story.append(Spacer(1, 0.3*inch))
     
     # Footer - MODIFIÉ: Seulement la date
-    footer_final_style = ParagraphStyle(
-        'FooterFinal',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.HexColor('#7F8C8D'),
-        alignment=1,
-        fontName='Helvetica-Oblique'
-    )
-    
     footer_text = f"Rapport généré par <b><font color='#2980B9'>EDA-Desk PRO</font></b><br/>{datetime.now().strftime('%d %B %Y')}"
-    story.append(Paragraph(footer_text, footer_final_style))
+    story.append(Paragraph(footer_text, styles['footer_final']))
     
     story.append(Spacer(1, 0.3*inch))
     
     # Version
-    version_style = ParagraphStyle(
-        'Version',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#BDC3C7'),
-        alignment=1
-    )
-    story.append(Paragraph("Version 4.0 Professional Edition", version_style))
-    story.append(Paragraph("© 2024 EDA-Desk - Tous droits réservés", version_style))
+    story.append(Paragraph("Version 4.0 Professional Edition", styles['version']))
+    story.append(Paragraph("© 2024 EDA-Desk - Tous droits réservés", styles['version']))
     
     # Build PDF avec canvas personnalisé
     pdf.build(story, canvasmaker=NumberedCanvas)
\ No newline at end of file
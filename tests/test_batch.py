@@ -0,0 +1,32 @@
+import os
+
+import pandas as pd
+
+from eda_desk.batch import expand_inputs, output_stems, run_batch
+
+
+def test_output_stems_unique_names_unchanged():
+    assert output_stems(['/in/a.csv', '/in/b.xlsx']) == {'/in/a.csv': 'a', '/in/b.xlsx': 'b'}
+
+
+def test_output_stems_same_name_use_relative_path():
+    files = ['/in/data.csv', '/in/sub/data.csv', '/in/data.xlsx', '/in/sub_data_csv.csv']
+    stems = output_stems(files)
+    assert stems['/in/data.csv'] == 'data_csv'
+    assert stems['/in/sub/data.csv'] == 'sub_data_csv'
+    assert stems['/in/data.xlsx'] == 'data_xlsx'
+    assert len(set(stems.values())) == len(files)
+
+
+def test_run_batch_same_stem_in_subfolder(tmp_path):
+    (tmp_path / 'in' / 'sub').mkdir(parents=True)
+    pd.DataFrame({'x': [1, 2, 3], 'y': ['a', 'b', 'a']}).to_csv(tmp_path / 'in' / 'data.csv', index=False)
+    pd.DataFrame({'x': [4.5, 5.5], 'z': ['c', 'd']}).to_csv(tmp_path / 'in' / 'sub' / 'data.csv', index=False)
+
+    files = expand_inputs([str(tmp_path / 'in' / '**' / '*.csv')])
+    results = run_batch(files, str(tmp_path / 'out'), ['excel'], max_workers=1, history_db=None, log=lambda _: None)
+
+    outputs = [path for result in results for path in result['outputs']]
+    assert len(outputs) == 2 and len(set(outputs)) == 2
+    assert all(os.path.exists(path) for path in outputs)
+    assert sorted(os.listdir(tmp_path / 'out')) == ['export_data_csv.xlsx', 'export_sub_data_csv.xlsx']
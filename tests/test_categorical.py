@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from eda_desk.categorical import categorical_stats, format_count
+from eda_desk.sketches import Estimate
+
+
+def test_exact_counts_match_value_counts():
+    rng = np.random.default_rng(0)
+    series = pd.Series(rng.choice(['a', 'b', 'c', None], 10_000, p=[0.5, 0.3, 0.1, 0.1]))
+
+    stats = categorical_stats(series, top_k=3, chunk_rows=1_000)
+
+    exact = series.value_counts()
+    assert not stats.heavy_hitters
+    assert stats.n_missing == series.isna().sum()
+    assert stats.n_unique == Estimate(3)
+    assert [(value, count.value) for value, count in stats.top] == list(exact.items())
+    assert stats.count_error == 0
+
+
+def test_categorical_dtype_keeps_codes():
+    series = pd.Series(['x', 'y', 'x', None], dtype='category').cat.add_categories(['jamais'])
+
+    stats = categorical_stats(series)
+
+    assert stats.n_unique.value == 2
+    assert stats.top[0][0] == 'x' and stats.top[0][1].value == 2
+
+
+def test_heavy_hitter_switch_within_bounds():
+    rng = np.random.default_rng(1)
+    n = 200_000
+    frequent = rng.choice(['Paris', 'Lyon', 'Nice'], n // 2)
+    rare = np.array([f"id{i}" for i in rng.integers(0, 50_000, n - n // 2)], dtype=object)
+    series = pd.Series(np.concatenate([frequent, rare]))
+    series = series.sample(frac=1, random_state=0).reset_index(drop=True)
+
+    stats = categorical_stats(series, max_exact=1_000, capacity=200, chunk_rows=20_000)
+
+    exact = series.value_counts()
+    assert stats.heavy_hitters
+    assert stats.count_error <= n / (200 + 1)
+    assert [value for value, _ in stats.top[:3]] == list(exact.index[:3])
+    for value, count in stats.top:
+        assert abs(count.value - exact[value]) <= count.error
+    assert abs(stats.n_unique.value - exact.size) <= stats.n_unique.error
+
+
+def test_known_cardinality_switches_from_first_block():
+    series = pd.Series([f"v{i % 5_000}" for i in range(50_000)])
+
+    stats = categorical_stats(series, n_unique=5_000, max_exact=1_000, capacity=100, chunk_rows=10_000)
+
+    assert stats.heavy_hitters
+    assert stats.n_unique == Estimate(5_000)
+
+
+def test_format_count():
+    assert format_count(Estimate(1234)) == "1,234"
+    assert format_count(Estimate(1234.4, 56.2)) == "1,234 ± 56"
@@ -0,0 +1,54 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_desk.data_export import ExportCancelled, export_data, write_parquet
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_parquet_column_empty_in_first_block(tmp_path):
+    n = 1_000
+    data = pd.DataFrame({
+        'id': np.arange(n),
+        'tard': pd.Series([None] * 600 + list(range(400)), dtype=object),
+        'texte': [None] * 600 + ['a'] * 400,
+        'vide': [None] * n,
+    })
+    path = str(tmp_path / 'out.parquet')
+
+    write_parquet(data, path, chunk_rows=250)
+
+    result = pq.read_table(path).to_pandas()
+    assert result['tard'].iloc[600:].tolist() == list(range(400))
+    assert result['texte'].iloc[-1] == 'a'
+    assert result['vide'].isna().all()
+
+
+def test_parquet_mixed_object_column_written_as_text(tmp_path):
+    data = pd.DataFrame({'code': ['a', 'b'] + [1, 2], 'n': range(4)})
+    path = str(tmp_path / 'out.parquet')
+
+    write_parquet(data, path, chunk_rows=2)
+
+    assert pq.read_table(path).to_pandas()['code'].tolist() == ['a', 'b', '1', '2']
+
+
+def test_partial_file_removed_on_error_and_cancel(tmp_path):
+    data = pd.DataFrame({'x': range(10)})
+    path = tmp_path / 'out.csv.gz'
+
+    def fail(done, total):
+        raise OSError("disque plein")
+
+    with pytest.raises(OSError):
+        export_data(data, str(path), progress=fail)
+    assert not path.exists()
+
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(ExportCancelled):
+        export_data(data, str(path), cancel_event=cancel)
+    assert not path.exists()
@@ -0,0 +1,12 @@
+import pandas as pd
+
+from eda_desk.data_index import DataIndex, RowFilter
+
+
+def test_non_string_labels_sort_and_filter():
+    data = pd.DataFrame({'pays': ['fr', 'de', 'fr'], 2020: [3.0, 1.0, 2.0]})
+    index = DataIndex(data)
+
+    assert list(index.view([], (2020, True))) == [1, 2, 0]
+    assert index.count([RowFilter(2020, 'entre', '1.5')]) == 2
+    assert index.count([RowFilter('pays', '=', 'fr')]) == 2
@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_desk.analysis_cache import file_fingerprint
+from eda_desk.column_profiler import profile_columns
+from eda_desk.incremental import (AppendCSVLoader, NotAppendable, append_state_key, build_append_state,
+                                  column_moments, merge_moments, merge_profile)
+from eda_desk.snapshot_store import SnapshotStore
+
+pytest.importorskip("pyarrow")
+
+
+class History:
+    """Dernière lecture complète, comme ``HistoryManager.get_last_load``"""
+
+    def __init__(self):
+        self.last_load = None
+
+    def get_last_load(self, filepath):
+        return self.last_load
+
+
+class StateCache(dict):
+    """Cache d'états, comme ``AnalysisCache.get`` / ``put``"""
+
+    def put(self, key, value, filepath=None):
+        self[key] = value
+
+
+def frame(start, n, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'id': np.arange(start, start + n),
+        'montant': rng.normal(100, 20, n).round(2),
+        'ville': rng.choice(['Paris', 'Lyon', 'Nice', None], n),
+        'code': [f"C{i}" for i in rng.integers(0, 50_000, n)],
+        'flag': rng.choice([0, 1], n),
+    })
+
+
+class Session:
+    """Ouvertures successives d'un même fichier, comme dans l'interface"""
+
+    def __init__(self, path):
+        self.path = path
+        self.history = History()
+        self.cache = StateCache()
+        self.store = SnapshotStore(str(path.parent / 'snapshots'))
+
+    def loader(self):
+        return AppendCSVLoader(str(self.path), snapshot_store=self.store, history=self.history,
+                               state_cache=self.cache)
+
+    def open(self):
+        loader = self.loader()
+        data = loader.load()
+        profile = loader.build_profile(data)
+        # Après une lecture : état fusionnable et entrée d'historique
+        fingerprint = file_fingerprint(str(self.path))
+        merged = loader.append_result or {}
+        self.cache.put(append_state_key(fingerprint, loader.snapshot_params),
+                       build_append_state(data, profile, merged.get('moments'), merged.get('counts')))
+        self.history.last_load = {'fingerprint': fingerprint, 'byte_offset': fingerprint['size']}
+        return loader, data, profile
+
+
+@pytest.fixture
+def session(tmp_path):
+    path = tmp_path / 'data.csv'
+    frame(0, 3_000, 0).to_csv(path, index=False)
+    return Session(path)
+
+
+def append(path, data):
+    data.to_csv(path, mode='a', header=False, index=False)
+
+
+def assert_data_equal(data, full):
+    # Instantané Arrow : manquants texte relus en None, read_csv donne NaN
+    pd.testing.assert_frame_equal(data.where(data.notna(), np.nan), full)
+
+
+def assert_profile_equal(merged, full):
+    pd.testing.assert_frame_equal(merged.loc[full.index, full.columns], full, check_dtype=False)
+
+
+def test_append_matches_full_read(session):
+    session.open()
+    append(session.path, frame(3_000, 1_000, 1))
+
+    loader, data, profile = session.open()
+
+    assert loader.append_result is not None
+    assert loader.append_result['appended_rows'] == 1_000
+    full = pd.read_csv(session.path)
+    assert_data_equal(data, full)
+    assert_profile_equal(profile, profile_columns(full))
+    for col, moments in loader.append_result['moments'].items():
+        expected = column_moments(full[col])
+        assert moments.n == expected.n
+        assert moments.mean == pytest.approx(expected.mean)
+        assert moments.variance() == pytest.approx(expected.variance())
+        assert moments.skew() == pytest.approx(expected.skew())
+
+
+def test_second_append_uses_merged_state(session):
+    session.open()
+    append(session.path, frame(3_000, 500, 1))
+    session.open()
+    append(session.path, frame(3_500, 500, 2))
+
+    loader, _, profile = session.open()
+
+    assert loader.append_result['appended_rows'] == 500
+    assert_profile_equal(profile, profile_columns(pd.read_csv(session.path)))
+
+
+def test_modified_head_is_not_appendable(session):
+    session.open()
+    text = session.path.read_text().replace('Paris', 'Rouen', 1)
+    session.path.write_text(text + "9999,1.0,Lyon,C1,0\n")
+
+    with pytest.raises(NotAppendable):
+        session.loader()._load_appended()
+
+    loader, data, profile = session.open()
+    assert loader.append_result is None
+    full = pd.read_csv(session.path)
+    assert_data_equal(data, full)
+    assert_profile_equal(profile, profile_columns(full))
+
+
+def test_type_change_in_appended_rows_reads_whole_file(session):
+    session.open()
+    append(session.path, pd.DataFrame({'id': [3_000], 'montant': ['inconnu'], 'ville': ['Nice'], 'code': ['C1'],
+                                       'flag': [1]}))
+
+    with pytest.raises(NotAppendable):
+        session.loader()._load_appended()
+
+    loader, data, profile = session.open()
+    assert loader.append_result is None
+    full = pd.read_csv(session.path)
+    assert_data_equal(data, full)
+    assert not profile.at['montant', 'is_numeric']
+
+
+def test_merge_profile_recomputes_changed_columns():
+    head = frame(0, 1_000, 0)
+    old_profile = profile_columns(head)
+    state = build_append_state(head, old_profile)
+    tail = frame(1_000, 200, 1)
+    data = pd.concat([head, tail], ignore_index=True)
+    data['flag'] = data['flag'].map({0: 'non', 1: 'oui'})
+
+    profile, counts, recomputed = merge_profile(old_profile, data, len(head), state['counts'])
+
+    assert recomputed == ['flag']
+    assert_profile_equal(profile, profile_columns(data))
+    assert counts['ville'].sum() == data['ville'].notna().sum()
+
+
+def test_merge_moments_falls_back_on_infinite_values():
+    head = pd.DataFrame({'x': [1.0, 2.0, np.inf], 'y': [1.0, 2.0, 3.0]})
+    data = pd.concat([head, pd.DataFrame({'x': [4.0], 'y': [5.0]})], ignore_index=True)
+    profile = profile_columns(data)
+    old = {'x': column_moments(head['x']), 'y': column_moments(head['y'])}
+
+    moments = merge_moments(old, data, len(head), profile)
+
+    assert old['x'] is None and moments['x'] is None
+    assert moments['y'].n == 4
+    assert moments['y'].mean == pytest.approx(data['y'].mean())
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda_desk.sketches import ColumnSketch, DistinctSketch, TopValueSketch, sketch_frame
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n = 200_000
+    return pd.DataFrame({
+        'revenu': rng.lognormal(10, 1, n),
+        'ecart': rng.normal(0, 50, n),
+        'note': rng.integers(1, 6, n).astype(float),
+        'ville': pd.Series(rng.zipf(1.5, n) % 5_000).astype(str),
+    })
+
+
+def within(estimate, exact):
+    return abs(estimate.value - exact) <= estimate.error + 1e-9
+
+
+def test_quantiles_within_bounds(data):
+    sketches = sketch_frame(data, chunk_rows=50_000)
+    for col in ('revenu', 'ecart'):
+        for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+            estimate = sketches[col].quantile(q)
+            assert not estimate.exact
+            assert within(estimate, data[col].quantile(q)), (col, q)
+
+
+def test_distinct_count_within_bounds():
+    # Borne à ~95 % : on vérifie la couverture sur plusieurs colonnes
+    rng = np.random.default_rng(2)
+    hits = 0
+    for _ in range(20):
+        values = pd.Series(rng.integers(0, rng.integers(10_000, 200_000), 100_000))
+        sketch = ColumnSketch(True)
+        sketch.update(values)
+        hits += within(sketch.distinct_count(), values.nunique())
+    assert hits >= 17
+
+
+def test_distinct_count_unbiased_near_linear_counting_switch():
+    # ~2.5 × 2^14 valeurs distinctes : zone de transition de l'HyperLogLog classique
+    rng = np.random.default_rng(3)
+    errors = []
+    for _ in range(10):
+        values = np.unique(rng.integers(0, 10**12, 41_000))
+        sketch = DistinctSketch()
+        sketch.update_hashes(pd.util.hash_array(values))
+        errors.append(sketch.estimate() / values.size - 1)
+    assert abs(np.mean(errors)) < 0.01
+
+
+def test_few_numeric_values_are_exact(data):
+    sketch = sketch_frame(data, ['note'], chunk_rows=50_000)['note']
+    for q in (0.25, 0.5, 0.75):
+        assert sketch.quantile(q).exact
+        assert sketch.quantile(q).value == data['note'].quantile(q)
+    assert sketch.distinct_count().value == 5
+    assert sketch.distinct_count().exact
+
+
+def test_many_numeric_values_drop_counters(data):
+    assert sketch_frame(data, ['revenu'], chunk_rows=50_000)['revenu'].top is None
+
+
+def test_top_values_within_bounds(data):
+    sketch = sketch_frame(data, ['ville'], chunk_rows=50_000)['ville']
+    exact = data['ville'].value_counts()
+    top = sketch.top_values(10)
+    assert [value for value, _ in top[:3]] == list(exact.index[:3])
+    for value, count in top:
+        assert within(count, exact[value])
+
+
+def test_misra_gries_keeps_frequent_values():
+    rng = np.random.default_rng(1)
+    values = pd.Series(rng.zipf(1.3, 100_000))
+    top = TopValueSketch(capacity=50)
+    for start in range(0, len(values), 10_000):
+        top.update(values.iloc[start:start + 10_000])
+    exact = values.value_counts()
+    assert top.error <= len(values) / 51
+    assert set(exact[exact > top.error].index) <= set(top.values())
+
+
+def test_outlier_count_within_bounds(data):
+    sketch = ColumnSketch(True)
+    sketch.update(data['revenu'])
+    q1, q3 = data['revenu'].quantile([0.25, 0.75])
+    exact = int(((data['revenu'] < q1 - 1.5 * (q3 - q1)) | (data['revenu'] > q3 + 1.5 * (q3 - q1))).sum())
+    assert within(sketch.outlier_count(1.5), exact)
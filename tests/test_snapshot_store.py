@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from eda_desk.snapshot_store import SnapshotStore
+
+pytest.importorskip("pyarrow")
+
+
+def test_round_trip_keeps_non_string_labels(tmp_path):
+    source = tmp_path / "data.csv"
+    source.write_text("x\n")
+    data = pd.DataFrame({'pays': ['fr', 'de'], 2020: [1.5, 2.5], 2021: [3, 4]})
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+
+    assert store.save(str(source), {'sep': ','}, data)
+    loaded, meta = store.load(str(source), {'sep': ','})
+
+    assert list(loaded.columns) == ['pays', 2020, 2021]
+    pd.testing.assert_frame_equal(loaded, data)
+    assert meta['rows'] == 2
+
+
+def test_string_labels_are_not_stored(tmp_path):
+    source = tmp_path / "data.csv"
+    source.write_text("x\n")
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+
+    assert store.save(str(source), {}, pd.DataFrame({'a': [1], 'b': ['x']}))
+    loaded, meta = store.load(str(source), {})
+
+    assert meta['column_labels'] is None
+    assert list(loaded.columns) == ['a', 'b']
+
+
+def test_unrestorable_labels_skip_snapshot(tmp_path):
+    source = tmp_path / "data.csv"
+    source.write_text("x\n")
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    data = pd.DataFrame({pd.Timestamp('2020-01-01'): [1]})
+
+    assert not store.save(str(source), {}, data)
+    assert store.load(str(source), {}) is None